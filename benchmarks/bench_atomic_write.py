@@ -0,0 +1,91 @@
+# Standard Library Imports
+import tempfile
+import time
+from pathlib import Path
+
+# Third Party Imports
+from rich.console import Console
+from rich.table import Table
+
+# Local Imports
+from zenith.utils.atomic_write import FSYNC_POLICIES
+from zenith.utils.atomic_write import atomic_write_text
+
+# Sizes Of The Files Written By The Benchmark
+_SIZES: tuple[int, ...] = (1024, 64 * 1024, 1024 * 1024)
+
+# Number Of Writes Per Measurement
+_ITERATIONS: int = 50
+
+
+# Function To Measure The Cost Of Writing A File
+def measure(policy: str | None, size: int, iterations: int = _ITERATIONS) -> float:
+    """
+    Measures The Average Time Of Writing A File Of The Given Size
+
+    Args:
+        policy (str | None): The Fsync Policy, Or None For A Plain In-Place Write
+        size (int): The Size Of The File In Bytes
+        iterations (int): The Number Of Writes To Average
+
+    Returns:
+        float: The Average Time Per Write In Milliseconds
+    """
+
+    # Create The Content
+    content: str = "x" * size
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Get The Target Path
+        path: Path = Path(temp_dir) / "bench.txt"
+
+        # Start The Timer
+        start: float = time.perf_counter()
+
+        # Write The File Repeatedly
+        for _ in range(iterations):
+            # If Measuring The Plain Baseline
+            if policy is None:
+                # Write In Place
+                path.write_text(content, encoding="utf-8")
+
+            else:
+                # Write Atomically
+                atomic_write_text(path, content, fsync_policy=policy)
+
+        # Return The Average Time In Milliseconds
+        return (time.perf_counter() - start) * 1000 / iterations
+
+
+# Function To Run The Benchmark
+def run() -> None:
+    """
+    Runs The Benchmark And Prints The Cost Of Each Durability Level
+    """
+
+    # Create The Results Table
+    table: Table = Table(title="Atomic Write Cost Per Durability Level (ms Per Write)")
+    table.add_column("Mode")
+
+    # Add A Column Per Size
+    for size in _SIZES:
+        # Add The Column
+        table.add_column(f"{size // 1024} KB", justify="right")
+
+    # Measure The Plain Baseline And Each Policy
+    for policy in (None, *FSYNC_POLICIES):
+        # Add The Row
+        table.add_row(
+            "in-place (baseline)" if policy is None else f"atomic, fsync={policy}",
+            *(f"{measure(policy, size):.3f}" for size in _SIZES),
+        )
+
+    # Print The Table
+    Console().print(table)
+
+
+# If The Script Is Run Directly
+if __name__ == "__main__":
+    # Run The Benchmark
+    run()
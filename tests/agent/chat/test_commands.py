@@ -0,0 +1,212 @@
+# Standard Library Imports
+from pathlib import Path
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.chat.commands import handle_chat_command
+from zenith.agent.chat.commands import handle_compact_command
+
+
+# Test For handle_chat_command With Regular Input
+def test_handle_chat_command_not_a_command() -> None:
+    """
+    Tests That Regular Input Is Left For The Agent
+    """
+
+    # Assert The Input Is Not Handled
+    assert handle_chat_command(console=MagicMock(), user_input="please undo that") is False
+
+
+# Test For handle_chat_command With Undo Commands
+@patch("zenith.agent.chat.commands.display_system_message")
+@patch("zenith.agent.chat.commands.undo_last_turn")
+@patch("zenith.agent.chat.commands.undo_last_change")
+@patch("zenith.agent.chat.commands.get_undo_root")
+def test_handle_chat_command_undo(
+    mock_get_undo_root: MagicMock,
+    mock_undo_last_change: MagicMock,
+    mock_undo_last_turn: MagicMock,
+    mock_display_system_message: MagicMock,
+) -> None:
+    """
+    Tests That /undo And /undo-turn Restore Files And Report The Restored Paths
+
+    Args:
+        mock_get_undo_root (MagicMock): The Mock For get_undo_root
+        mock_undo_last_change (MagicMock): The Mock For undo_last_change
+        mock_undo_last_turn (MagicMock): The Mock For undo_last_turn
+        mock_display_system_message (MagicMock): The Mock For display_system_message
+    """
+
+    # Create A Mock Console
+    mock_console = MagicMock()
+
+    # Enable The Journal And Set The Restored Paths
+    mock_get_undo_root.return_value = Path(".zenith/undo")
+    mock_undo_last_change.return_value = ["/tmp/a.txt"]
+    mock_undo_last_turn.return_value = []
+
+    # Assert Both Commands Are Handled
+    assert handle_chat_command(console=mock_console, user_input=" /undo ") is True
+    assert handle_chat_command(console=mock_console, user_input="/UNDO-TURN") is True
+
+    # Assert The Results Were Displayed
+    mock_display_system_message.assert_any_call(console=mock_console, message_text="Restored 1 Path(s): /tmp/a.txt")
+    mock_display_system_message.assert_any_call(console=mock_console, message_text="Nothing To Undo.")
+
+
+# Test For handle_chat_command Errors
+@patch("zenith.agent.chat.commands.display_error_message")
+@patch("zenith.agent.chat.commands.undo_last_change")
+@patch("zenith.agent.chat.commands.get_undo_root")
+def test_handle_chat_command_undo_errors(
+    mock_get_undo_root: MagicMock,
+    mock_undo_last_change: MagicMock,
+    mock_display_error_message: MagicMock,
+) -> None:
+    """
+    Tests That A Disabled Journal And Failed Restores Are Reported As Errors
+
+    Args:
+        mock_get_undo_root (MagicMock): The Mock For get_undo_root
+        mock_undo_last_change (MagicMock): The Mock For undo_last_change
+        mock_display_error_message (MagicMock): The Mock For display_error_message
+    """
+
+    # Create A Mock Console
+    mock_console = MagicMock()
+
+    # Disable The Journal
+    mock_get_undo_root.return_value = None
+
+    # Assert The Command Is Handled With An Error
+    assert handle_chat_command(console=mock_console, user_input="/undo") is True
+    mock_display_error_message.assert_called_with(console=mock_console, error_message="The Undo Journal Is Disabled!")
+
+    # Enable The Journal And Make The Restore Fail
+    mock_get_undo_root.return_value = Path(".zenith/undo")
+    mock_undo_last_change.side_effect = PermissionError("Permission denied")
+
+    # Assert The Command Is Handled With An Error
+    assert handle_chat_command(console=mock_console, user_input="/undo") is True
+    mock_display_error_message.assert_called_with(
+        console=mock_console,
+        error_message="Failed To Undo: Permission denied",
+    )
+
+
+# Test For handle_chat_command With The Stats Command
+@patch("zenith.agent.chat.commands.display_system_message")
+@patch("zenith.agent.chat.commands.get_output_savings")
+@patch("zenith.agent.chat.commands.get_memo_stats")
+def test_handle_chat_command_stats(
+    mock_get_memo_stats: MagicMock,
+    mock_get_output_savings: MagicMock,
+    mock_display_system_message: MagicMock,
+) -> None:
+    """
+    Tests That /stats Shows The Memoized Tool Calls, Cache Hits And Output Savings Of The Last Turn
+
+    Args:
+        mock_get_memo_stats (MagicMock): The Mock For get_memo_stats
+        mock_get_output_savings (MagicMock): The Mock For get_output_savings
+        mock_display_system_message (MagicMock): The Mock For display_system_message
+    """
+
+    # Create A Mock Console
+    mock_console = MagicMock()
+
+    # Set The Stats Of A Turn Without And With Memoized Calls
+    mock_get_memo_stats.side_effect = [
+        {"turn": 1, "calls": 0, "hits": 0, "invalidated": 0, "tools": {}},
+        {
+            "turn": 2,
+            "calls": 5,
+            "hits": 2,
+            "invalidated": 1,
+            "tools": {"list_files": {"calls": 3, "hits": 2}, "search_files": {"calls": 2, "hits": 0}},
+        },
+    ]
+    mock_get_output_savings.side_effect = [
+        {"turn": 1, "tokens_before": 0, "tokens_after": 0, "tools": {}},
+        {
+            "turn": 2,
+            "tokens_before": 3000,
+            "tokens_after": 1200,
+            "tools": {"list_files": {"calls": 2, "tokens_before": 3000, "tokens_after": 1200}},
+        },
+    ]
+
+    # Assert The Command Is Handled Twice
+    assert handle_chat_command(console=mock_console, user_input="/stats") is True
+    assert handle_chat_command(console=mock_console, user_input=" /STATS") is True
+
+    # Assert The Stats Were Displayed
+    mock_display_system_message.assert_any_call(
+        console=mock_console,
+        message_text=(
+            "Turn 1: 0 Memoized Tool Call(s), 0 Cache Hit(s), 0 Invalidated\nTool Output Compaction: ~0 -> ~0 Tokens"
+        ),
+    )
+    mock_display_system_message.assert_any_call(
+        console=mock_console,
+        message_text=(
+            "Turn 2: 5 Memoized Tool Call(s), 2 Cache Hit(s), 1 Invalidated "
+            "(list_files: 2/3 Hits, search_files: 0/2 Hits)\n"
+            "Tool Output Compaction: ~3000 -> ~1200 Tokens (list_files: ~3000 -> ~1200)"
+        ),
+    )
+
+
+# Test For handle_compact_command Function
+@pytest.mark.asyncio
+@patch("zenith.agent.chat.commands.display_error_message")
+@patch("zenith.agent.chat.commands.display_system_message")
+@patch("zenith.agent.chat.commands.compact_history", new_callable=AsyncMock)
+async def test_handle_compact_command(
+    mock_compact_history: AsyncMock,
+    mock_display_system_message: MagicMock,
+    mock_display_error_message: MagicMock,
+) -> None:
+    """
+    Tests That /compact Forces A Compaction And Reports The Savings, Nothing To Do Or The Error
+
+    Args:
+        mock_compact_history (AsyncMock): The Mock For compact_history
+        mock_display_system_message (MagicMock): The Mock For display_system_message
+        mock_display_error_message (MagicMock): The Mock For display_error_message
+    """
+
+    # Create A Mock Console And Agent
+    mock_console = MagicMock()
+    mock_agent = MagicMock()
+
+    # Compact Once With Savings, Once With Nothing To Do And Once With An Error
+    mock_compact_history.side_effect = [
+        {"messages": 6, "tokens_before": 9000, "tokens_after": 1500},
+        None,
+        RuntimeError("model unavailable"),
+    ]
+    for _ in range(3):
+        await handle_compact_command(console=mock_console, agent=mock_agent)
+
+    # Assert The Agent's Context Was Compacted Even Below The Threshold
+    mock_compact_history.assert_awaited_with(mock_agent.model_context, force=True)
+
+    # Assert The Savings And The Empty Result Were Reported
+    mock_display_system_message.assert_any_call(
+        console=mock_console,
+        message_text="Summarized 6 Message(s): ~9000 -> ~1500 Tokens, Saving ~7500",
+    )
+    mock_display_system_message.assert_any_call(console=mock_console, message_text="Nothing To Compact.")
+
+    # Assert The Error Was Reported
+    mock_display_error_message.assert_called_once_with(
+        console=mock_console,
+        error_message="Failed To Compact: model unavailable",
+    )
@@ -7,6 +7,7 @@ from zenith.agent.chat.display import (
     display_closing_message,
     display_error_message,
     display_initial_message,
+    display_system_message,
     display_user_prompt,
 )
 
@@ -324,3 +325,38 @@ def test_display_error_message(mock_text: MagicMock, mock_get_current_datetime:
 
     # Assert Third Call Was With An Empty String (Line Below)
     mock_console.print.assert_any_call("")
+
+
+# Test For display_system_message Function
+@patch("zenith.agent.chat.display.get_current_datetime")
+@patch("zenith.agent.chat.display.Text")
+def test_display_system_message(mock_text: MagicMock, mock_get_current_datetime: MagicMock) -> None:
+    """
+    Tests The display_system_message Function
+
+    Args:
+        mock_text (MagicMock): The Mock For Text
+        mock_get_current_datetime (MagicMock): The Mock For get_current_datetime
+    """
+
+    # Create A Mock Console
+    mock_console = MagicMock()
+
+    # Set The Return Value For get_current_datetime
+    mock_get_current_datetime.return_value = ("2025-09-13", "12:34:56")
+
+    # Create A Mock Text Instance
+    mock_text_instance = MagicMock()
+    mock_text.return_value = mock_text_instance
+
+    # Call The Function
+    display_system_message(console=mock_console, message_text="Nothing To Undo.")
+
+    # Check The System Label And Message Styling
+    assert mock_text_instance.append.call_count == 8
+    mock_text_instance.append.assert_any_call("System", style="bold magenta")
+    mock_text_instance.append.assert_any_call("Nothing To Undo.", style="bold yellow")
+
+    # Assert The Message Is Printed Between Empty Lines
+    assert mock_console.print.call_count == 3
+    mock_console.print.assert_any_call(mock_text_instance)
@@ -0,0 +1,58 @@
+# Local Imports
+from zenith.agent.chat.markdown_stream import split_markdown_blocks
+
+
+# Test Splitting At Blank Lines
+def test_split_markdown_blocks_paragraphs() -> None:
+    """
+    Tests That Blocks Followed By A Blank Line Are Finished And The Rest Stays Open
+    """
+
+    # Split Two Finished Paragraphs And An Open One
+    finished, open_block = split_markdown_blocks("# Title\n\nFirst paragraph.\n\nStill being wri")
+
+    # Check The Split
+    assert finished == "# Title\n\nFirst paragraph.\n\n"
+    assert open_block == "Still being wri"
+
+
+# Test Nothing Is Finished Without A Blank Line
+def test_split_markdown_blocks_open() -> None:
+    """
+    Tests That Text Without A Complete Blank Line Stays Open
+    """
+
+    # Check Open Text
+    assert split_markdown_blocks("") == ("", "")
+    assert split_markdown_blocks("one line\nanother") == ("", "one line\nanother")
+    assert split_markdown_blocks("paragraph\n  ") == ("", "paragraph\n  ")
+
+
+# Test Code Fences
+def test_split_markdown_blocks_code_fences() -> None:
+    """
+    Tests That Blank Lines Inside Code Fences Do Not Split And A Closing Fence Finishes The Block
+    """
+
+    # Split An Open Code Block With A Blank Line Inside
+    text = "Intro\n\n```python\ndef f():\n\n    return 1\n"
+    assert split_markdown_blocks(text) == ("Intro\n\n", "```python\ndef f():\n\n    return 1\n")
+
+    # Split A Closed Code Block
+    text = "````\n```\n\n````\nafter"
+    assert split_markdown_blocks(text) == ("````\n```\n\n````\n", "after")
+
+    # Split A Tilde Fence That Is Not Closed By Backticks
+    text = "~~~\n```\n\n"
+    assert split_markdown_blocks(text) == ("", text)
+
+
+# Test Lines Are Split At Newlines Only
+def test_split_markdown_blocks_other_line_separators() -> None:
+    """
+    Tests That Form Feeds And Unicode Line Separators Stay Inside Their Line
+    """
+
+    # Check Separators Do Not Hide The Blank Line After A Paragraph
+    assert split_markdown_blocks("a\x0cb c\n\nnext") == ("a\x0cb c\n\n", "next")
+    assert split_markdown_blocks("a\x85\u2028b\n\n") == ("a\x85\u2028b\n\n", "")
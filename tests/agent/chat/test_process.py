@@ -77,7 +77,7 @@ async def test_process_agent_response(mock_display_agent_prompt: MagicMock, mock
     mock_agent.run_stream.assert_called_once_with(task=user_input)
 
     # Check Live display was created and used properly
-    mock_live.assert_called_once_with("", console=mock_console, auto_refresh=True, refresh_per_second=10)
+    mock_live.assert_called_once_with("", console=mock_console, auto_refresh=False)
     mock_live_instance.start.assert_called_once()
 
     # Verify that update was called with a Markdown instance
@@ -92,6 +92,50 @@ async def test_process_agent_response(mock_display_agent_prompt: MagicMock, mock
     assert mock_console.print.call_count == 1
 
 
+# Test For process_agent_response Rendering Markdown Incrementally
+@pytest.mark.asyncio
+@patch("zenith.agent.chat.process.Live")
+@patch("zenith.agent.chat.process.display_agent_prompt")
+async def test_process_agent_response_incremental_markdown(
+    mock_display_agent_prompt: MagicMock,
+    mock_live: MagicMock,
+) -> None:
+    """
+    Tests That Finished Blocks Are Printed Once And Only The Open Block Is Live
+
+    Args:
+        mock_display_agent_prompt (MagicMock): The Mock For display_agent_prompt
+        mock_live (MagicMock): The Mock For Live
+    """
+
+    # Create Mocks
+    mock_console = MagicMock()
+    mock_agent = MagicMock()
+    mock_live_instance = MagicMock()
+    mock_live.return_value = mock_live_instance
+
+    # Stream Two Paragraphs In Three Chunks
+    chunks = ["First para", "graph.\n\nSec", "ond"]
+    mock_agent.run_stream = MagicMock(
+        return_value=mock_async_generator(
+            [MagicMock(type="ModelClientStreamingChunkEvent", content=chunk) for chunk in chunks],
+        ),
+    )
+
+    # Call The Function
+    await process_agent_response(console=mock_console, agent=mock_agent, user_input="test input")
+
+    # Assert The First Paragraph Was Printed Once
+    printed = [call.args[0] for call in mock_console.print.call_args_list if call.args and call.args[0]]
+    assert len(printed) == 1
+    assert isinstance(printed[0], Markdown)
+    assert printed[0].markup == "First paragraph.\n\n"
+
+    # Assert The Chunks Were Coalesced Into One Frame Holding Only The Open Block
+    updates = [call.args[0].markup for call in mock_live_instance.update.call_args_list]
+    assert updates == ["Second"]
+
+
 # Test For process_agent_response Function With No Chunks
 @pytest.mark.asyncio
 @patch("zenith.agent.chat.process.Live")
@@ -140,3 +184,162 @@ async def test_process_agent_response_no_chunks(mock_display_agent_prompt: Magic
 
     # Assertions For Console Output
     mock_console.print.assert_called_once_with()
+
+
+# Test For process_agent_response Committing The Overlay
+@pytest.mark.asyncio
+@patch("zenith.agent.chat.process.display_error_message")
+@patch("zenith.agent.chat.process.discard_overlay")
+@patch("zenith.agent.chat.process.commit_overlay")
+async def test_process_agent_response_commits_overlay(
+    mock_commit_overlay: MagicMock,
+    mock_discard_overlay: MagicMock,
+    mock_display_error_message: MagicMock,
+) -> None:
+    """
+    Tests That Staged Files Are Committed After A Turn And That Commit Errors Are Displayed
+
+    Args:
+        mock_commit_overlay (MagicMock): The Mock For commit_overlay
+        mock_discard_overlay (MagicMock): The Mock For discard_overlay
+        mock_display_error_message (MagicMock): The Mock For display_error_message
+    """
+
+    # Create Mocks
+    mock_console = MagicMock()
+    mock_agent = MagicMock()
+    mock_agent.run_stream = MagicMock(side_effect=lambda task: mock_async_generator([]))
+
+    # Call The Function
+    await process_agent_response(console=mock_console, agent=mock_agent, user_input="test input")
+
+    # Assert The Overlay Was Committed
+    mock_commit_overlay.assert_called_once_with()
+    mock_discard_overlay.assert_not_called()
+    mock_display_error_message.assert_not_called()
+
+    # Make The Commit Fail
+    mock_commit_overlay.side_effect = OSError("Disk full")
+
+    # Call The Function Again
+    await process_agent_response(console=mock_console, agent=mock_agent, user_input="test input")
+
+    # Assert The Error Was Displayed
+    mock_display_error_message.assert_called_once_with(
+        console=mock_console,
+        error_message="Failed To Commit Staged Files: Disk full",
+    )
+
+
+# Test For process_agent_response Discarding The Overlay
+@pytest.mark.asyncio
+@patch("zenith.agent.chat.process.discard_overlay")
+@patch("zenith.agent.chat.process.commit_overlay")
+async def test_process_agent_response_discards_overlay(
+    mock_commit_overlay: MagicMock,
+    mock_discard_overlay: MagicMock,
+) -> None:
+    """
+    Tests That Staged Files Are Discarded When The Turn Fails
+
+    Args:
+        mock_commit_overlay (MagicMock): The Mock For commit_overlay
+        mock_discard_overlay (MagicMock): The Mock For discard_overlay
+    """
+
+    # Create Mocks
+    mock_console = MagicMock()
+    mock_agent = MagicMock()
+    mock_agent.run_stream = MagicMock(side_effect=RuntimeError("Stream failed"))
+
+    # With RuntimeError
+    with pytest.raises(RuntimeError):
+        # Call The Function
+        await process_agent_response(console=mock_console, agent=mock_agent, user_input="test input")
+
+    # Assert The Overlay Was Discarded, Not Committed
+    mock_discard_overlay.assert_called_once_with()
+    mock_commit_overlay.assert_not_called()
+
+
+# Test For process_agent_response Stopping The Render Task On Failure
+@pytest.mark.asyncio
+@patch("zenith.agent.chat.process.discard_overlay")
+@patch("zenith.agent.chat.process.Live")
+@patch("zenith.agent.chat.process.display_agent_prompt")
+async def test_process_agent_response_cancels_render_task(
+    mock_display_agent_prompt: MagicMock,
+    mock_live: MagicMock,
+    mock_discard_overlay: MagicMock,
+) -> None:
+    """
+    Tests That The Render Task Is Cancelled And The Live Display Stopped When The Stream Fails
+
+    Args:
+        mock_display_agent_prompt (MagicMock): The Mock For display_agent_prompt
+        mock_live (MagicMock): The Mock For Live
+        mock_discard_overlay (MagicMock): The Mock For discard_overlay
+    """
+
+    # Define A Stream That Fails After One Chunk
+    async def failing_stream() -> AsyncGenerator[MagicMock, None]:
+        # Yield A Chunk
+        yield MagicMock(type="ModelClientStreamingChunkEvent", content="partial")
+
+        # Fail
+        raise RuntimeError("Stream failed")
+
+    # Create Mocks
+    mock_agent = MagicMock()
+    mock_agent.run_stream = MagicMock(return_value=failing_stream())
+
+    # With RuntimeError
+    with pytest.raises(RuntimeError):
+        # Call The Function
+        await process_agent_response(console=MagicMock(), agent=mock_agent, user_input="test input")
+
+    # Assert The Live Display Was Stopped And The Overlay Discarded
+    mock_live.return_value.stop.assert_called_once()
+    mock_discard_overlay.assert_called_once_with()
+
+
+# Test For process_agent_response In Plain Mode
+@pytest.mark.asyncio
+@patch("zenith.agent.chat.process.Live")
+@patch("zenith.agent.chat.process.display_agent_prompt")
+async def test_process_agent_response_plain(mock_display_agent_prompt: MagicMock, mock_live: MagicMock) -> None:
+    """
+    Tests That Plain Mode Writes Raw Chunks Without The Spinner, Live Display Or Markdown
+
+    Args:
+        mock_display_agent_prompt (MagicMock): The Mock For display_agent_prompt
+        mock_live (MagicMock): The Mock For Live
+    """
+
+    # Create Mocks
+    mock_console = MagicMock()
+    mock_agent = MagicMock()
+    mock_agent.name = "test_agent"
+
+    # Stream Two Chunks And A Non-Chunk Event
+    mock_agent.run_stream = MagicMock(
+        return_value=mock_async_generator(
+            [
+                MagicMock(type="ModelClientStreamingChunkEvent", content="# Raw"),
+                MagicMock(type="TextMessage", content="ignored"),
+                MagicMock(type="ModelClientStreamingChunkEvent", content=" text"),
+            ],
+        ),
+    )
+
+    # Call The Function
+    await process_agent_response(console=mock_console, agent=mock_agent, user_input="test input", plain=True)
+
+    # Assert The Raw Chunks Were Written And Flushed
+    assert [call.args[0] for call in mock_console.file.write.call_args_list] == ["# Raw", " text"]
+    assert mock_console.file.flush.call_count == 2
+
+    # Assert The Prompt Was Shown Once And No Spinner Or Live Display Was Used
+    mock_display_agent_prompt.assert_called_once_with(console=mock_console, agent_name="test_agent")
+    mock_console.status.assert_not_called()
+    mock_live.assert_not_called()
@@ -0,0 +1,93 @@
+# Standard Library Imports
+import asyncio
+from unittest.mock import MagicMock, patch
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.chat import render_scheduler
+from zenith.agent.chat.render_scheduler import MAX_FRAME_INTERVAL
+from zenith.agent.chat.render_scheduler import render_frames
+
+
+# Test Frames Coalesce Chunks
+@pytest.mark.asyncio
+async def test_render_frames_coalesces_chunks() -> None:
+    """
+    Tests That Chunks Arriving Within One Frame Are Rendered Together And Finished Blocks Are Printed Once
+    """
+
+    # Create Mocks And The Shared State
+    mock_console = MagicMock()
+    mock_live = MagicMock()
+    chunks: list[str | None] = []
+    chunk_ready = asyncio.Event()
+
+    # Start The Render Task
+    task = asyncio.create_task(render_frames(mock_console, mock_live, chunks, chunk_ready))
+
+    # Send A Chunk And Let It Render
+    chunks.append("Hello")
+    chunk_ready.set()
+    await asyncio.sleep(0.1)
+
+    # Send Several Chunks At Once, Then End The Stream
+    chunks.extend([" world.\n", "\n", "Next", None])
+    chunk_ready.set()
+    await asyncio.wait_for(task, timeout=5)
+
+    # Assert Two Frames Were Rendered, Each Holding Only The Open Block
+    updates = [call.args[0].markup for call in mock_live.update.call_args_list]
+    assert updates == ["Hello", "Next"]
+
+    # Assert The Finished Paragraph Was Printed Once
+    printed = [call.args[0].markup for call in mock_console.print.call_args_list if call.args[0]]
+    assert printed == ["Hello world.\n\n"]
+    assert chunks == []
+
+
+# Test The Frame Interval Adapts To The Render Cost
+@pytest.mark.asyncio
+async def test_render_frames_adapts_interval() -> None:
+    """
+    Tests That A Slow Render Stretches The Time To The Next Frame, Up To The Maximum
+    """
+
+    # Create The Shared State
+    chunks: list[str | None] = ["slow"]
+    chunk_ready = asyncio.Event()
+    chunk_ready.set()
+
+    # Record The Requested Sleeps
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    # Define A Recording Sleep
+    async def record_sleep(delay: float) -> None:
+        # Record The Delay
+        sleeps.append(delay)
+
+        # Yield To The Loop
+        await real_sleep(0)
+
+    # Define A Clock Where The First Render Takes 0.2 Seconds And The Next Frame Is Checked 0.1 Seconds Later
+    clock = iter([100.0, 100.0, 100.2, 100.3, 100.3, 100.31])
+
+    # With Patched Time
+    with (
+        patch.object(render_scheduler.asyncio, "sleep", record_sleep),
+        patch.object(render_scheduler.time, "perf_counter", lambda: next(clock)),
+    ):
+        # Start The Render Task
+        task = asyncio.create_task(render_frames(MagicMock(), MagicMock(), chunks, chunk_ready))
+
+        # Let The First Frame Render, Then End The Stream
+        await real_sleep(0.1)
+        chunks.append(None)
+        chunk_ready.set()
+        await asyncio.wait_for(task, timeout=5)
+
+    # Assert The Second Frame Waited Until The Maximum Interval After The First Frame
+    assert sleeps[0] == 0.0
+    assert sleeps[1] == pytest.approx(MAX_FRAME_INTERVAL - 0.3)
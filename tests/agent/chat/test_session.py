@@ -1,11 +1,13 @@
 # Standard Library Imports
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Third Party Imports
 from openai import APITimeoutError, BadRequestError, NotFoundError
 import httpx
 
 # Local Imports
+from zenith.agent.chat import session
 from zenith.agent.chat.session import start_chat
 
 
@@ -138,10 +140,10 @@ def test_start_chat_bad_request_error(
     # Create A Mock Agent
     mock_agent = MagicMock()
 
-    # Set Up The Side Effect For asyncio.run To Raise BadRequestError
-    with patch("zenith.agent.chat.session.asyncio.run") as mock_asyncio_run:
-        # Set Up The Side Effect For asyncio.run To Raise BadRequestError
-        mock_asyncio_run.side_effect = BadRequestError(
+    # Set Up The Side Effect For process_agent_response To Raise BadRequestError
+    with patch("zenith.agent.chat.session.process_agent_response", new_callable=AsyncMock) as mock_process:
+        # Set Up The Side Effect For process_agent_response To Raise BadRequestError
+        mock_process.side_effect = BadRequestError(
             message="Invalid API Key! Please Pass A Valid API Key!",
             response=MagicMock(),
             body=MagicMock(),
@@ -200,11 +202,11 @@ def test_start_chat_api_timeout_error(
     # Create A Mock Agent
     mock_agent = MagicMock()
 
-    # Set Up The Side Effect For asyncio.run To Raise APITimeoutError
-    with patch("zenith.agent.chat.session.asyncio.run") as mock_asyncio_run:
-        # Set Up The Side Effect For asyncio.run To Raise APITimeoutError
+    # Set Up The Side Effect For process_agent_response To Raise APITimeoutError
+    with patch("zenith.agent.chat.session.process_agent_response", new_callable=AsyncMock) as mock_process:
+        # Set Up The Side Effect For process_agent_response To Raise APITimeoutError
         mock_request = MagicMock(spec=httpx.Request)
-        mock_asyncio_run.side_effect = APITimeoutError(request=mock_request)
+        mock_process.side_effect = APITimeoutError(request=mock_request)
 
         # Call The Function
         start_chat(agent=mock_agent)
@@ -259,10 +261,10 @@ def test_start_chat_not_found_error(
     # Create A Mock Agent
     mock_agent = MagicMock()
 
-    # Set Up The Side Effect For asyncio.run To Raise NotFoundError
-    with patch("zenith.agent.chat.session.asyncio.run") as mock_asyncio_run:
-        # Set Up The Side Effect For asyncio.run To Raise NotFoundError
-        mock_asyncio_run.side_effect = NotFoundError(
+    # Set Up The Side Effect For process_agent_response To Raise NotFoundError
+    with patch("zenith.agent.chat.session.process_agent_response", new_callable=AsyncMock) as mock_process:
+        # Set Up The Side Effect For process_agent_response To Raise NotFoundError
+        mock_process.side_effect = NotFoundError(
             message="Invalid Model! Please Check Model Name!",
             response=MagicMock(),
             body=MagicMock(),
@@ -338,3 +340,283 @@ def test_start_chat_keyboard_interrupt(
 
     # Assert display_closing_message Was Called
     mock_display_closing_message.assert_called_once_with(console=mock_console_instance)
+
+
+# Test For start_chat Function With A Chat Command
+@patch("zenith.agent.chat.session.process_agent_response")
+@patch("zenith.agent.chat.session.handle_chat_command")
+@patch("zenith.agent.chat.session.display_user_prompt")
+@patch("zenith.agent.chat.session.Console")
+@patch("zenith.agent.chat.session.display_initial_message")
+@patch("zenith.agent.chat.session.display_closing_message")
+def test_start_chat_chat_command(
+    mock_display_closing_message: MagicMock,
+    mock_display_initial_message: MagicMock,
+    mock_console: MagicMock,
+    mock_display_user_prompt: MagicMock,
+    mock_handle_chat_command: MagicMock,
+    mock_process_agent_response: MagicMock,
+) -> None:
+    """
+    Tests That Chat Commands Are Handled Without Calling The Agent
+
+    Args:
+        mock_display_closing_message (MagicMock): The Mock For display_closing_message
+        mock_display_initial_message (MagicMock): The Mock For display_initial_message
+        mock_console (MagicMock): The Mock For Console
+        mock_display_user_prompt (MagicMock): The Mock For display_user_prompt
+        mock_handle_chat_command (MagicMock): The Mock For handle_chat_command
+        mock_process_agent_response (MagicMock): The Mock For process_agent_response
+    """
+
+    # Create A Mock Console Instance
+    mock_console_instance = MagicMock()
+    mock_console.return_value = mock_console_instance
+
+    # Enter A Chat Command, Then Exit
+    mock_display_user_prompt.side_effect = ["/undo", "exit"]
+    mock_handle_chat_command.return_value = True
+
+    # Call The Function
+    start_chat(agent=MagicMock())
+
+    # Assert The Command Was Handled And The Agent Was Not Called
+    mock_handle_chat_command.assert_called_once_with(console=mock_console_instance, user_input="/undo")
+    mock_process_agent_response.assert_not_called()
+    mock_display_closing_message.assert_called_once_with(console=mock_console_instance)
+
+
+# Test For start_chat Reusing One Event Loop
+@patch("zenith.agent.chat.session.process_agent_response")
+@patch("zenith.agent.chat.session.display_user_prompt")
+@patch("zenith.agent.chat.session.Console")
+@patch("zenith.agent.chat.session.display_initial_message")
+@patch("zenith.agent.chat.session.display_closing_message")
+def test_start_chat_single_event_loop(
+    mock_display_closing_message: MagicMock,
+    mock_display_initial_message: MagicMock,
+    mock_console: MagicMock,
+    mock_display_user_prompt: MagicMock,
+    mock_process_agent_response: MagicMock,
+) -> None:
+    """
+    Tests That Every Turn Of A Session Runs On The Same Event Loop
+
+    Args:
+        mock_display_closing_message (MagicMock): The Mock For display_closing_message
+        mock_display_initial_message (MagicMock): The Mock For display_initial_message
+        mock_console (MagicMock): The Mock For Console
+        mock_display_user_prompt (MagicMock): The Mock For display_user_prompt
+        mock_process_agent_response (MagicMock): The Mock For process_agent_response
+    """
+
+    # Record The Loop Of Each Turn
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    # Define A Turn That Records Its Loop
+    async def record_loop(**kwargs: object) -> None:
+        # Record The Running Loop
+        loops.append(asyncio.get_running_loop())
+
+    # Run Two Turns, Then Exit
+    mock_process_agent_response.side_effect = record_loop
+    mock_display_user_prompt.side_effect = ["one", "two", "exit"]
+
+    # Call The Function In Plain Mode
+    start_chat(agent=MagicMock(), plain=True)
+
+    # Assert Plain Mode Was Passed To Every Turn
+    assert all(call.kwargs["plain"] is True for call in mock_process_agent_response.call_args_list)
+
+    # Assert Both Turns Shared One Loop
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    mock_display_closing_message.assert_called_once()
+
+
+# Test For The Compact Command And A Finished Background Compaction
+@patch("zenith.agent.chat.session.handle_compact_command", new_callable=AsyncMock)
+@patch("zenith.agent.chat.session.compact_history", new_callable=AsyncMock)
+@patch("zenith.agent.chat.session.display_system_message")
+@patch("zenith.agent.chat.session.process_agent_response")
+@patch("zenith.agent.chat.session.display_user_prompt")
+@patch("zenith.agent.chat.session.Console")
+@patch("zenith.agent.chat.session.display_initial_message")
+@patch("zenith.agent.chat.session.display_closing_message")
+def test_start_chat_compact_command(  # noqa: PLR0913
+    mock_display_closing_message: MagicMock,
+    mock_display_initial_message: MagicMock,
+    mock_console: MagicMock,
+    mock_display_user_prompt: MagicMock,
+    mock_process_agent_response: MagicMock,
+    mock_display_system_message: MagicMock,
+    mock_compact_history: AsyncMock,
+    mock_handle_compact_command: AsyncMock,
+) -> None:
+    """
+    Tests That A Finished Background Compaction Is Reported And /compact Compacts Without Calling The Agent
+
+    Args:
+        mock_display_closing_message (MagicMock): The Mock For display_closing_message
+        mock_display_initial_message (MagicMock): The Mock For display_initial_message
+        mock_console (MagicMock): The Mock For Console
+        mock_display_user_prompt (MagicMock): The Mock For display_user_prompt
+        mock_process_agent_response (MagicMock): The Mock For process_agent_response
+        mock_display_system_message (MagicMock): The Mock For display_system_message
+        mock_compact_history (AsyncMock): The Mock For compact_history
+        mock_handle_compact_command (AsyncMock): The Mock For handle_compact_command
+    """
+
+    # Create A Mock Console Instance And Agent
+    mock_console_instance = MagicMock()
+    mock_console.return_value = mock_console_instance
+    mock_agent = MagicMock()
+
+    # Run One Turn Whose History Is Compacted In The Background, Then Compact And Exit
+    mock_process_agent_response.side_effect = AsyncMock()
+    mock_compact_history.return_value = {"messages": 4, "tokens_before": 5000, "tokens_after": 1000}
+    mock_display_user_prompt.side_effect = ["one", "/compact", "exit"]
+
+    # Call The Function
+    start_chat(agent=mock_agent)
+
+    # Assert The History Was Compacted After The Turn And The Savings Were Reported
+    mock_compact_history.assert_awaited_once_with(mock_agent.model_context)
+    mock_display_system_message.assert_called_once_with(
+        console=mock_console_instance,
+        message_text="Summarized 4 Message(s): ~5000 -> ~1000 Tokens, Saving ~4000",
+    )
+
+    # Assert The Command Was Handled Without Calling The Agent Again
+    mock_handle_compact_command.assert_awaited_once_with(console=mock_console_instance, agent=mock_agent)
+    mock_process_agent_response.assert_called_once()
+    mock_display_closing_message.assert_called_once_with(console=mock_console_instance)
+
+
+# Test For A Failed Background Compaction
+@patch("zenith.agent.chat.session.compact_history", new_callable=AsyncMock)
+@patch("zenith.agent.chat.session.display_error_message")
+@patch("zenith.agent.chat.session.process_agent_response")
+@patch("zenith.agent.chat.session.display_user_prompt")
+@patch("zenith.agent.chat.session.Console")
+@patch("zenith.agent.chat.session.display_initial_message")
+@patch("zenith.agent.chat.session.display_closing_message")
+def test_start_chat_compaction_error(  # noqa: PLR0913
+    mock_display_closing_message: MagicMock,
+    mock_display_initial_message: MagicMock,
+    mock_console: MagicMock,
+    mock_display_user_prompt: MagicMock,
+    mock_process_agent_response: MagicMock,
+    mock_display_error_message: MagicMock,
+    mock_compact_history: AsyncMock,
+) -> None:
+    """
+    Tests That A Failed Background Compaction Is Reported Without Ending The Session
+
+    Args:
+        mock_display_closing_message (MagicMock): The Mock For display_closing_message
+        mock_display_initial_message (MagicMock): The Mock For display_initial_message
+        mock_console (MagicMock): The Mock For Console
+        mock_display_user_prompt (MagicMock): The Mock For display_user_prompt
+        mock_process_agent_response (MagicMock): The Mock For process_agent_response
+        mock_display_error_message (MagicMock): The Mock For display_error_message
+        mock_compact_history (AsyncMock): The Mock For compact_history
+    """
+
+    # Create A Mock Console Instance
+    mock_console_instance = MagicMock()
+    mock_console.return_value = mock_console_instance
+
+    # Run Two Turns Whose Compactions Fail, Then Exit
+    mock_process_agent_response.side_effect = AsyncMock()
+    mock_compact_history.side_effect = RuntimeError("model unavailable")
+    mock_display_user_prompt.side_effect = ["one", "two", "exit"]
+
+    # Call The Function
+    start_chat(agent=MagicMock())
+
+    # Assert The First Failure Was Reported Before The Second Turn, And Both Turns Ran
+    mock_display_error_message.assert_called_once_with(
+        console=mock_console_instance,
+        error_message="Background Compaction Failed: model unavailable",
+    )
+    assert mock_process_agent_response.call_count == 2
+    mock_display_closing_message.assert_called_once_with(console=mock_console_instance)
+
+
+# Test For Cancelling A Running Background Compaction
+@patch("zenith.agent.chat.session.compact_history")
+@patch("zenith.agent.chat.session.process_agent_response")
+@patch("zenith.agent.chat.session.display_user_prompt")
+@patch("zenith.agent.chat.session.Console")
+@patch("zenith.agent.chat.session.display_initial_message")
+@patch("zenith.agent.chat.session.display_closing_message")
+def test_start_chat_compaction_cancelled(  # noqa: PLR0913
+    mock_display_closing_message: MagicMock,
+    mock_display_initial_message: MagicMock,
+    mock_console: MagicMock,
+    mock_display_user_prompt: MagicMock,
+    mock_process_agent_response: MagicMock,
+    mock_compact_history: MagicMock,
+) -> None:
+    """
+    Tests That A Background Compaction Still Running When The Next Turn Starts Is Cancelled
+
+    Args:
+        mock_display_closing_message (MagicMock): The Mock For display_closing_message
+        mock_display_initial_message (MagicMock): The Mock For display_initial_message
+        mock_console (MagicMock): The Mock For Console
+        mock_display_user_prompt (MagicMock): The Mock For display_user_prompt
+        mock_process_agent_response (MagicMock): The Mock For process_agent_response
+        mock_compact_history (MagicMock): The Mock For compact_history
+    """
+
+    # Record The Cancelled Compactions
+    cancelled: list[bool] = []
+
+    # Define A Compaction That Never Finishes On Its Own
+    async def compact_forever(context: object) -> None:
+        try:
+            # Wait Forever
+            await asyncio.Event().wait()
+
+        except asyncio.CancelledError:
+            # Record The Cancellation
+            cancelled.append(True)
+            raise
+
+    # Run Two Turns, Then Exit
+    mock_process_agent_response.side_effect = AsyncMock()
+    mock_compact_history.side_effect = compact_forever
+    mock_display_user_prompt.side_effect = ["one", "two", "exit"]
+
+    # Call The Function
+    start_chat(agent=MagicMock())
+
+    # Assert Both Turns Ran And Both Compactions Were Cancelled
+    assert mock_process_agent_response.call_count == 2
+    assert cancelled == [True, True]
+    mock_display_closing_message.assert_called_once()
+
+
+# Test For Resolving Input Futures From The Reader Thread
+def test_resolve_threadsafe_ignores_finished_futures_and_closed_loops() -> None:
+    """
+    Tests That Input Arriving After The Future Is Cancelled Or The Loop Is Closed Is Ignored
+    """
+
+    # Create A Loop And A Cancelled Future
+    loop = asyncio.new_event_loop()
+    future = loop.create_future()
+    future.cancel()
+
+    # Resolve The Cancelled Future And Run The Callback
+    session._resolve_threadsafe(loop, future, result="late")
+    loop.run_until_complete(asyncio.sleep(0))
+
+    # Assert The Future Stayed Cancelled
+    assert future.cancelled()
+
+    # Close The Loop And Resolve Again
+    loop.close()
+    session._resolve_threadsafe(loop, future, result="late")
@@ -1,4 +1,6 @@
 # Standard Library Imports
+import inspect
+from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -8,14 +10,43 @@ from autogen_core.models import ModelFamily
 # Local Imports
 from zenith.agent.agent import create_assistant_agent
 from zenith.agent.agent import create_model_client
+from zenith.agent.token_context import DEFAULT_CONTEXT_TOKEN_BUDGET
+from zenith.agent.tools.apply_edits import apply_edits
+from zenith.agent.tools.apply_patch import apply_patch
+from zenith.agent.tools.copy_path import copy_path
 from zenith.agent.tools.list_files import list_files
 from zenith.agent.tools.make_directory import make_directory
+from zenith.agent.tools.move_path import move_path
+from zenith.agent.tools.preview_data import preview_data
 from zenith.agent.tools.read_file import read_file
 from zenith.agent.tools.read_multiple_files import read_multiple_files
+from zenith.agent.tools.scaffold import scaffold
 from zenith.agent.tools.search_files import search_files
+from zenith.agent.tools.stat_paths import stat_paths
 from zenith.agent.tools.write_file import write_file
 
 
+# Helper To Assert A Tool Was Created
+def assert_tool_created(mock_function_tool: MagicMock, func: object, name: str, description: str) -> None:
+    """
+    Asserts That FunctionTool Was Called For A Tool Wrapping The Given Function
+
+    Args:
+        mock_function_tool (MagicMock): The Mock For FunctionTool
+        func (object): The Expected Tool Function
+        name (str): The Expected Tool Name
+        description (str): The Expected Tool Description
+    """
+
+    # Find The Call For The Tool Name
+    calls = [call for call in mock_function_tool.call_args_list if call.kwargs["name"] == name]
+
+    # Assert The Tool Was Created Once With The Wrapped Function And Description
+    assert len(calls) == 1
+    assert inspect.unwrap(calls[0].kwargs["func"]) is func
+    assert calls[0].kwargs["description"] == description
+
+
 # Test For create_model_client Function
 @patch("zenith.agent.agent.OpenAIChatCompletionClient")
 def test_create_model_client(mock_client: MagicMock) -> None:
@@ -89,26 +120,32 @@ def test_create_model_client_with_defaults(mock_client: MagicMock) -> None:
 
 
 # Test For create_assistant_agent Function
+@patch("zenith.agent.agent.set_compaction_client")
+@patch("zenith.agent.agent.set_undo_root")
 @patch("zenith.agent.agent.FunctionTool")
 @patch("zenith.agent.agent.AssistantAgent")
-@patch("zenith.agent.agent.BufferedChatCompletionContext")
+@patch("zenith.agent.agent.create_token_context")
 @patch("zenith.agent.agent.ListMemory")
 @patch("zenith.agent.agent.create_model_client")
 def test_create_assistant_agent(
     mock_create_model_client: MagicMock,
     mock_list_memory: MagicMock,
-    mock_buffered_context: MagicMock,
+    mock_token_context: MagicMock,
     mock_assistant: MagicMock,
-    mock_function_tool: MagicMock
+    mock_function_tool: MagicMock,
+    mock_set_undo_root: MagicMock,
+    mock_set_compaction_client: MagicMock,
 ) -> None:
     """
     Tests The create_assistant_agent Function
 
     Args:
         mock_assistant (MagicMock): The Mock For AssistantAgent
-        mock_buffered_context (MagicMock): The Mock For BufferedChatCompletionContext
+        mock_token_context (MagicMock): The Mock For create_token_context
         mock_list_memory (MagicMock): The Mock For ListMemory
         mock_create_model_client (MagicMock): The Mock For create_model_client
+        mock_set_undo_root (MagicMock): The Mock For set_undo_root
+        mock_set_compaction_client (MagicMock): The Mock For set_compaction_client
     """
 
     # Create A Sample Configuration
@@ -139,8 +176,17 @@ def test_create_assistant_agent(
     # Assert ListMemory Was Called
     mock_list_memory.assert_called_once()
 
-    # Assert BufferedChatCompletionContext Was Called With The Correct Arguments
-    mock_buffered_context.assert_called_once_with(buffer_size=16)
+    # Assert The Model Context Gets The Default Budget For An Unknown Model
+    mock_token_context.assert_called_once_with(DEFAULT_CONTEXT_TOKEN_BUDGET)
+
+    # Assert Background Compaction Uses The Model Client Once Half The Budget Is Used
+    mock_set_compaction_client.assert_called_once_with(
+        mock_create_model_client.return_value,
+        threshold=DEFAULT_CONTEXT_TOKEN_BUDGET // 2,
+    )
+
+    # Assert The Undo Journal Defaults To .zenith/undo In The Working Directory
+    mock_set_undo_root.assert_called_once_with(Path.cwd() / ".zenith" / "undo")
 
     # Assert AssistantAgent Was Called With The Correct Arguments
     mock_assistant.assert_called_once_with(
@@ -150,13 +196,52 @@ def test_create_assistant_agent(
         model_client=mock_create_model_client.return_value,
         model_client_stream=True,
         memory=[mock_list_memory.return_value],
-        model_context=mock_buffered_context.return_value,
-        tools=[mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value],
+        model_context=mock_token_context.return_value,
+        tools=[mock_function_tool.return_value] * 14,
         max_tool_iterations=16,
     )
 
+    # Assert FunctionTool Was Called With The Correct Arguments For apply_edits
+    assert_tool_created(
+        mock_function_tool,
+        func=apply_edits,
+        name="apply_edits",
+        description=(
+            "Apply Several Replacements To One File In A Single Pass. Each Edit Has old, new And An Optional "
+            "count (Default 1, 0 For All). Edits Apply In Order, Every Anchor Is Validated Before The File Is "
+            "Written Once Atomically, And A Status Is Returned Per Edit. Pass if_match=etag From read_file To Fail "
+            "Fast If The File Changed."
+        ),
+    )
+
+    # Assert FunctionTool Was Called With The Correct Arguments For apply_patch
+    assert_tool_created(
+        mock_function_tool,
+        func=apply_patch,
+        name="apply_patch",
+        description=(
+            "Apply A Unified Diff To One Or More Files, Preferred Over Rewriting Whole Files For Small Changes. "
+            "Hunks Are Located By Their Context Even If Line Numbers Are Off, Rejected Hunks Are Reported, "
+            "And Files Can Be Created Or Deleted Via /dev/null. "
+            "if_match Maps File Paths To etag Values From read_file."
+        ),
+    )
+
+    # Assert FunctionTool Was Called With The Correct Arguments For copy_path
+    assert_tool_created(
+        mock_function_tool,
+        func=copy_path,
+        name="copy_path",
+        description=(
+            "Copy A File Or Directory To A New Path Without Reading Its Content, Using Kernel-Side Copies. "
+            "Directories Are Copied Recursively In Parallel. "
+            "Existing Target Files Are Only Replaced If overwrite Is True."
+        ),
+    )
+
     # Assert FunctionTool Was Called With The Correct Arguments
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=list_files,
         name="list_files",
         description=(
@@ -165,7 +250,8 @@ def test_create_assistant_agent(
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For make_directory
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=make_directory,
         name="make_directory",
         description=(
@@ -175,27 +261,55 @@ def test_create_assistant_agent(
         ),
     )
 
+    # Assert FunctionTool Was Called With The Correct Arguments For move_path
+    assert_tool_created(
+        mock_function_tool,
+        func=move_path,
+        name="move_path",
+        description=(
+            "Move Or Rename A File Or Directory Without Reading Its Content, Renaming It Atomically On The Same "
+            "Filesystem. Existing Target Files Are Only Replaced If overwrite Is True."
+        ),
+    )
+
+    # Assert FunctionTool Was Called With The Correct Arguments For preview_data
+    assert_tool_created(
+        mock_function_tool,
+        func=preview_data,
+        name="preview_data",
+        description=(
+            "Preview A CSV, TSV, JSON Or JSONL Data File As A Compact Schema With Inferred Column Types, "
+            "A Row Count And A Few Sample Rows, Reading Only A Bounded Prefix Of Large Files."
+        ),
+    )
+
     # Assert FunctionTool Was Called With The Correct Arguments For read_file
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=read_file,
         name="read_file",
         description=(
-            "Read The Contents Of A File, With Options For Specifying Line Ranges "
-            "And File Encoding."
+            "Read The Contents Of A File, With Options For Specifying Line Ranges And File Encoding. "
+            "Re-Reading An Unchanged File Returns A Short Stub Unless force Is True. "
+            "Results Carry An etag That Edit Tools Accept As if_match."
         ),
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For read_multiple_files
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=read_multiple_files,
         name="read_multiple_files",
         description=(
-            "Reads The Contents Of Multiple Files, With Options For Specifying Line Ranges And File Encoding."
+            "Reads The Contents Of Multiple Files, With Options For Specifying Line Ranges And File Encoding. "
+            "Re-Reading An Unchanged File Returns A Short Stub Unless force Is True. "
+            "Results Carry An etag That Edit Tools Accept As if_match."
         ),
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For search_files
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=search_files,
         name="search_files",
         description=(
@@ -204,57 +318,90 @@ def test_create_assistant_agent(
         ),
     )
 
+    # Assert FunctionTool Was Called With The Correct Arguments For scaffold
+    assert_tool_created(
+        mock_function_tool,
+        func=scaffold,
+        name="scaffold",
+        description=(
+            "Create A Tree Of Directories And Files In One Call From A Nested spec, Where A String Value Is "
+            "A File's Content And A Dictionary Value Is A Directory. Files Are Written In Parallel, Existing "
+            "Files Are Kept Unless overwrite Is True, And A Compact Status Is Returned Per Path."
+        ),
+    )
+
+    # Assert FunctionTool Was Called With The Correct Arguments For stat_paths
+    assert_tool_created(
+        mock_function_tool,
+        func=stat_paths,
+        name="stat_paths",
+        description=(
+            "Check Many Paths In One Call: For Each Path Return Whether It Exists, Its Type, Size, Modification "
+            "Time And Whether It Is Writable. Use It Instead Of Probing Paths With read_file Or list_files."
+        ),
+    )
+
     # Assert FunctionTool Was Called With The Correct Arguments For write_file
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=write_file,
         name="write_file",
         description=(
             "Write Content To A File At The Specified Path, "
             "With Options For Appending, Creating Parent Directories, "
-            "And Specifying File Encoding."
+            "And Specifying File Encoding. Pass if_match=etag From read_file To Fail Fast If The File Changed."
         ),
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For write_file
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=write_file,
         name="write_file",
         description=(
             "Write Content To A File At The Specified Path, "
             "With Options For Appending, Creating Parent Directories, "
-            "And Specifying File Encoding."
+            "And Specifying File Encoding. Pass if_match=etag From read_file To Fail Fast If The File Changed."
         ),
     )
 
 
 # Test For create_assistant_agent Function With Custom Values From Config
+@patch("zenith.agent.agent.set_compaction_client")
+@patch("zenith.agent.agent.set_undo_root")
 @patch("zenith.agent.agent.FunctionTool")
 @patch("zenith.agent.agent.AssistantAgent")
-@patch("zenith.agent.agent.BufferedChatCompletionContext")
+@patch("zenith.agent.agent.create_token_context")
 @patch("zenith.agent.agent.ListMemory")
 @patch("zenith.agent.agent.create_model_client")
 def test_create_assistant_agent_with_custom_values(
     mock_create_model_client: MagicMock,
     mock_list_memory: MagicMock,
-    mock_buffered_context: MagicMock,
+    mock_token_context: MagicMock,
     mock_assistant: MagicMock,
-    mock_function_tool: MagicMock
+    mock_function_tool: MagicMock,
+    mock_set_undo_root: MagicMock,
+    mock_set_compaction_client: MagicMock,
 ) -> None:
     """
     Tests The create_assistant_agent Function With Custom Values From Config
 
     Args:
         mock_assistant (MagicMock): The Mock For AssistantAgent
-        mock_buffered_context (MagicMock): The Mock For BufferedChatCompletionContext
+        mock_token_context (MagicMock): The Mock For create_token_context
         mock_list_memory (MagicMock): The Mock For ListMemory
         mock_create_model_client (MagicMock): The Mock For create_model_client
+        mock_set_undo_root (MagicMock): The Mock For set_undo_root
+        mock_set_compaction_client (MagicMock): The Mock For set_compaction_client
     """
 
     # Create A Sample Configuration With Custom Values
     config = {
         "zenith_openai_api_key": "test_key",
         "zenith_assistant_description": "Custom Description",
-        "zenith_assistant_system_message": "Custom System Message"
+        "zenith_assistant_system_message": "Custom System Message",
+        "zenith_context_token_budget": "5000",
+        "zenith_compaction": "false",
     }
 
     # Call The Function
@@ -269,8 +416,11 @@ def test_create_assistant_agent_with_custom_values(
     # Assert ListMemory Was Called
     mock_list_memory.assert_called_once()
 
-    # Assert BufferedChatCompletionContext Was Called With The Correct Arguments
-    mock_buffered_context.assert_called_once_with(buffer_size=16)
+    # Assert The Model Context Gets The Configured Budget
+    mock_token_context.assert_called_once_with(5000)
+
+    # Assert Background Compaction Was Disabled
+    mock_set_compaction_client.assert_called_once_with(None, threshold=2500)
 
     # Assert AssistantAgent Was Called With The Correct Arguments
     mock_assistant.assert_called_once_with(
@@ -280,13 +430,40 @@ def test_create_assistant_agent_with_custom_values(
         model_client=mock_create_model_client.return_value,
         model_client_stream=True,
         memory=[mock_list_memory.return_value],
-        model_context=mock_buffered_context.return_value,
-        tools=[mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value, mock_function_tool.return_value],
+        model_context=mock_token_context.return_value,
+        tools=[mock_function_tool.return_value] * 14,
         max_tool_iterations=16,
     )
 
+    # Assert FunctionTool Was Called With The Correct Arguments For apply_edits
+    assert_tool_created(
+        mock_function_tool,
+        func=apply_edits,
+        name="apply_edits",
+        description=(
+            "Apply Several Replacements To One File In A Single Pass. Each Edit Has old, new And An Optional "
+            "count (Default 1, 0 For All). Edits Apply In Order, Every Anchor Is Validated Before The File Is "
+            "Written Once Atomically, And A Status Is Returned Per Edit. Pass if_match=etag From read_file To Fail "
+            "Fast If The File Changed."
+        ),
+    )
+
+    # Assert FunctionTool Was Called With The Correct Arguments For apply_patch
+    assert_tool_created(
+        mock_function_tool,
+        func=apply_patch,
+        name="apply_patch",
+        description=(
+            "Apply A Unified Diff To One Or More Files, Preferred Over Rewriting Whole Files For Small Changes. "
+            "Hunks Are Located By Their Context Even If Line Numbers Are Off, Rejected Hunks Are Reported, "
+            "And Files Can Be Created Or Deleted Via /dev/null. "
+            "if_match Maps File Paths To etag Values From read_file."
+        ),
+    )
+
     # Assert FunctionTool Was Called With The Correct Arguments
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=list_files,
         name="list_files",
         description=(
@@ -295,7 +472,8 @@ def test_create_assistant_agent_with_custom_values(
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For make_directory
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=make_directory,
         name="make_directory",
         description=(
@@ -305,27 +483,44 @@ def test_create_assistant_agent_with_custom_values(
         ),
     )
 
+    # Assert FunctionTool Was Called With The Correct Arguments For preview_data
+    assert_tool_created(
+        mock_function_tool,
+        func=preview_data,
+        name="preview_data",
+        description=(
+            "Preview A CSV, TSV, JSON Or JSONL Data File As A Compact Schema With Inferred Column Types, "
+            "A Row Count And A Few Sample Rows, Reading Only A Bounded Prefix Of Large Files."
+        ),
+    )
+
     # Assert FunctionTool Was Called With The Correct Arguments For read_file
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=read_file,
         name="read_file",
         description=(
-            "Read The Contents Of A File, With Options For Specifying Line Ranges "
-            "And File Encoding."
+            "Read The Contents Of A File, With Options For Specifying Line Ranges And File Encoding. "
+            "Re-Reading An Unchanged File Returns A Short Stub Unless force Is True. "
+            "Results Carry An etag That Edit Tools Accept As if_match."
         ),
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For read_multiple_files
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=read_multiple_files,
         name="read_multiple_files",
         description=(
-            "Reads The Contents Of Multiple Files, With Options For Specifying Line Ranges And File Encoding."
+            "Reads The Contents Of Multiple Files, With Options For Specifying Line Ranges And File Encoding. "
+            "Re-Reading An Unchanged File Returns A Short Stub Unless force Is True. "
+            "Results Carry An etag That Edit Tools Accept As if_match."
         ),
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For search_files
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=search_files,
         name="search_files",
         description=(
@@ -335,12 +530,69 @@ def test_create_assistant_agent_with_custom_values(
     )
 
     # Assert FunctionTool Was Called With The Correct Arguments For write_file
-    mock_function_tool.assert_any_call(
+    assert_tool_created(
+        mock_function_tool,
         func=write_file,
         name="write_file",
         description=(
             "Write Content To A File At The Specified Path, "
             "With Options For Appending, Creating Parent Directories, "
-            "And Specifying File Encoding."
+            "And Specifying File Encoding. Pass if_match=etag From read_file To Fail Fast If The File Changed."
         ),
     )
+
+
+# Test For create_assistant_agent Function With Token And Durability Settings
+@patch("zenith.agent.agent.set_compaction_client")
+@patch("zenith.agent.agent.set_undo_root")
+@patch("zenith.agent.agent.set_overlay_enabled")
+@patch("zenith.agent.agent.set_default_fsync_policy")
+@patch("zenith.agent.agent.set_turn_token_budget")
+@patch("zenith.agent.agent.load_tiktoken_tokenizer")
+@patch("zenith.agent.agent.FunctionTool")
+@patch("zenith.agent.agent.AssistantAgent")
+@patch("zenith.agent.agent.create_model_client")
+def test_create_assistant_agent_with_token_settings(
+    mock_create_model_client: MagicMock,
+    mock_assistant: MagicMock,
+    mock_function_tool: MagicMock,
+    mock_load_tiktoken_tokenizer: MagicMock,
+    mock_set_turn_token_budget: MagicMock,
+    mock_set_default_fsync_policy: MagicMock,
+    mock_set_overlay_enabled: MagicMock,
+    mock_set_undo_root: MagicMock,
+    mock_set_compaction_client: MagicMock,
+) -> None:
+    """
+    Tests That create_assistant_agent Configures The Tokenizer, Token Budget, Fsync Policy And Overlay
+
+    Args:
+        mock_create_model_client (MagicMock): The Mock For create_model_client
+        mock_assistant (MagicMock): The Mock For AssistantAgent
+        mock_function_tool (MagicMock): The Mock For FunctionTool
+        mock_load_tiktoken_tokenizer (MagicMock): The Mock For load_tiktoken_tokenizer
+        mock_set_turn_token_budget (MagicMock): The Mock For set_turn_token_budget
+        mock_set_default_fsync_policy (MagicMock): The Mock For set_default_fsync_policy
+        mock_set_overlay_enabled (MagicMock): The Mock For set_overlay_enabled
+        mock_set_undo_root (MagicMock): The Mock For set_undo_root
+        mock_set_compaction_client (MagicMock): The Mock For set_compaction_client
+    """
+
+    # Create A Configuration With Token And Durability Settings
+    config = {
+        "zenith_tokenizer": "cl100k_base",
+        "zenith_turn_token_budget": "5000",
+        "zenith_fsync_policy": "file+dir",
+        "zenith_overlay": "True",
+        "zenith_undo": "false",
+    }
+
+    # Call The Function
+    create_assistant_agent(config)
+
+    # Assert The Tokenizer And Budget Were Configured
+    mock_load_tiktoken_tokenizer.assert_called_once_with("cl100k_base")
+    mock_set_turn_token_budget.assert_called_once_with(5000)
+    mock_set_default_fsync_policy.assert_called_once_with("file+dir")
+    mock_set_overlay_enabled.assert_called_once_with(enabled=True)
+    mock_set_undo_root.assert_called_once_with(None)
@@ -0,0 +1,250 @@
+# Standard Library Imports
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+# Third Party Imports
+import pytest
+from autogen_core import FunctionCall
+from autogen_core.model_context import UnboundedChatCompletionContext
+from autogen_core.models import AssistantMessage
+from autogen_core.models import FunctionExecutionResult
+from autogen_core.models import FunctionExecutionResultMessage
+from autogen_core.models import LLMMessage
+from autogen_core.models import SystemMessage
+from autogen_core.models import UserMessage
+
+# Local Imports
+from zenith.agent.compaction import SUMMARY_SOURCE
+from zenith.agent.compaction import compact_history
+from zenith.agent.compaction import describe_compaction
+from zenith.agent.compaction import set_compaction_client
+from zenith.agent.tools.read_cache import clear_read_cache
+from zenith.agent.tools.read_cache import lookup_unchanged_read
+from zenith.agent.tools.read_cache import record_read
+from zenith.agent.tools.turn_tracker import reset_turns
+
+
+# Helper Function To Build A History
+def build_history(turns: int) -> list[LLMMessage]:
+    """
+    Builds A History With A System Message And Several User Turns, Each With A Tool Call
+
+    Args:
+        turns (int): The Number Of User Turns
+
+    Returns:
+        list[LLMMessage]: The Messages, Oldest First
+    """
+
+    # Initialize The History With A System Message
+    messages: list[LLMMessage] = [SystemMessage(content="memory")]
+
+    # For Each Turn
+    for turn in range(turns):
+        # Add The Request, A Tool Call With Its Result And The Answer
+        messages.extend(
+            [
+                UserMessage(content=f"request {turn}", source="user"),
+                AssistantMessage(
+                    content=[FunctionCall(id=str(turn), name="read_file", arguments='{"file_path": "a.py"}')],
+                    source="Zenith",
+                ),
+                FunctionExecutionResultMessage(
+                    content=[
+                        FunctionExecutionResult(content="x" * 5000, call_id=str(turn), name="read_file", is_error=False),
+                    ],
+                ),
+                AssistantMessage(content=f"answer {turn}", source="Zenith"),
+            ],
+        )
+
+    # Return The History
+    return messages
+
+
+# Helper Function To Create A Fake Model Client
+def fake_client(summary: str = "the summary", side_effect: Any = None) -> MagicMock:
+    """
+    Creates A Model Client Whose create Returns A Fixed Summary
+
+    Args:
+        summary (str): The Summary To Return
+        side_effect (Any): An Optional Side Effect Of create
+
+    Returns:
+        MagicMock: The Fake Client
+    """
+
+    # Create The Client
+    client = MagicMock()
+    client.create = AsyncMock(return_value=MagicMock(content=summary), side_effect=side_effect)
+
+    # Return The Client
+    return client
+
+
+# Test For compact_history Function
+@pytest.mark.asyncio
+async def test_compact_history() -> None:
+    """
+    Tests That The Middle Turns Are Replaced By A Summary While The Head And Recent Turns Are Kept
+    """
+
+    # Create A Context With Four Turns
+    messages: list[LLMMessage] = build_history(4)
+    context = UnboundedChatCompletionContext(initial_messages=list(messages))
+
+    # Enable Compaction With A Fake Client
+    client = fake_client()
+    set_compaction_client(client, threshold=100)
+
+    try:
+        # Compact The History
+        result = await compact_history(context)
+
+    finally:
+        # Disable Compaction
+        set_compaction_client(None)
+
+    # Assert The Middle Turns Were Summarized With Savings
+    assert result is not None
+    assert result["messages"] == 7
+    assert result["tokens_after"] < result["tokens_before"]
+
+    # Assert The Head, Summary And Recent Turns Remain
+    stored: list[LLMMessage] = await context.get_messages()
+    assert stored[:2] == messages[:2]
+    assert stored[2] == UserMessage(content="[Summary Of The Earlier Conversation]\nthe summary", source=SUMMARY_SOURCE)
+    assert stored[3:] == messages[9:]
+
+    # Assert The Transcript Rendered Calls, Cut Short Results And Text
+    transcript: str = client.create.call_args.args[0][1].content
+    assert 'Assistant Called: read_file({"file_path": "a.py"})' in transcript
+    assert f"Tool read_file Returned: {'x' * 2000}\n\n" in transcript
+    assert "User: request 1" in transcript
+    assert "Assistant: answer 0" in transcript
+
+    # Assert The Summary Describes The Savings
+    assert describe_compaction(result) == (
+        f"Summarized 7 Message(s): ~{result['tokens_before']} -> ~{result['tokens_after']} Tokens, "
+        f"Saving ~{result['tokens_before'] - result['tokens_after']}"
+    )
+
+
+# Test For compact_history When Nothing Is Done
+@pytest.mark.asyncio
+async def test_compact_history_skipped() -> None:
+    """
+    Tests That Compaction Is Skipped When Disabled, Below The Threshold Or With Too Few Turns
+    """
+
+    # Create A Context With Three Turns
+    context = UnboundedChatCompletionContext(initial_messages=build_history(3))
+
+    # Assert Nothing Happens While Compaction Is Disabled
+    set_compaction_client(None)
+    assert await compact_history(context, force=True) is None
+
+    # Enable Compaction With A High Threshold
+    client = fake_client()
+    set_compaction_client(client, threshold=10**9)
+
+    try:
+        # Assert Nothing Happens Below The Threshold Unless Forced
+        assert await compact_history(context) is None
+        assert await compact_history(context, force=True) is not None
+
+        # Assert A History With Only Recent Turns Is Left Alone
+        assert await compact_history(UnboundedChatCompletionContext(initial_messages=build_history(2)), force=True) is None
+
+    finally:
+        # Disable Compaction
+        set_compaction_client(None)
+
+    # Assert The Model Was Only Asked Once
+    client.create.assert_awaited_once()
+
+
+# Test For compact_history When A Message Arrives Meanwhile
+@pytest.mark.asyncio
+async def test_compact_history_context_changed() -> None:
+    """
+    Tests That The Context Is Kept If A Message Was Added While The Summary Was Written
+    """
+
+    # Create A Context With Four Turns
+    messages: list[LLMMessage] = build_history(4)
+    context = UnboundedChatCompletionContext(initial_messages=list(messages))
+
+    # Define A Model Call During Which A Message Arrives
+    async def create(*args: object) -> MagicMock:
+        # Add A Message
+        await context.add_message(UserMessage(content="new", source="user"))
+
+        # Return The Summary
+        return MagicMock(content="summary")
+
+    # Enable Compaction With A Client Adding A Message
+    set_compaction_client(fake_client(side_effect=create))
+
+    try:
+        # Assert The Compaction Is Abandoned
+        assert await compact_history(context, force=True) is None
+
+    finally:
+        # Disable Compaction
+        set_compaction_client(None)
+
+    # Assert The Context Was Kept
+    assert await context.get_messages() == [*messages, UserMessage(content="new", source="user")]
+
+
+# Test For compact_history Forgetting Summarized Reads
+@pytest.mark.asyncio
+async def test_compact_history_forgets_summarized_reads() -> None:
+    """
+    Tests That Files Read In The Summarized Turns Are Read In Full Again, While Recent Reads Are Kept
+    """
+
+    # Record Reads Of Two Files
+    reset_turns()
+    clear_read_cache()
+    record_read("/p/old.py", "hash", (None, None))
+    record_read("/p/new.py", "hash", (None, None))
+
+    # Build A History Reading The First File In An Old Turn And The Second In A Recent One
+    messages: list[LLMMessage] = build_history(4)
+    messages[3] = FunctionExecutionResultMessage(
+        content=[
+            FunctionExecutionResult(
+                content=str({"path": "/p/old.py", "content": "old", "hash": "hash"}),
+                call_id="0",
+                name="read_file",
+                is_error=False,
+            ),
+        ],
+    )
+    messages[-2] = FunctionExecutionResultMessage(
+        content=[
+            FunctionExecutionResult(
+                content=str({"path": "/p/new.py", "content": "new", "hash": "hash"}),
+                call_id="3",
+                name="read_file",
+                is_error=False,
+            ),
+        ],
+    )
+
+    # Compact The History
+    set_compaction_client(fake_client())
+    try:
+        assert await compact_history(UnboundedChatCompletionContext(initial_messages=messages), force=True) is not None
+
+    finally:
+        # Disable Compaction
+        set_compaction_client(None)
+
+    # Assert Only The Summarized Read Was Forgotten
+    assert lookup_unchanged_read("/p/old.py", "hash", (None, None)) is None
+    assert lookup_unchanged_read("/p/new.py", "hash", (None, None)) == 0
@@ -0,0 +1,243 @@
+# Standard Library Imports
+import sys
+
+# Third Party Imports
+import pytest
+from autogen_core import FunctionCall
+from autogen_core.models import AssistantMessage
+from autogen_core.models import FunctionExecutionResult
+from autogen_core.models import FunctionExecutionResultMessage
+from autogen_core.models import LLMMessage
+from autogen_core.models import SystemMessage
+from autogen_core.models import UserMessage
+
+# Local Imports
+from zenith.agent.token_context import CONTEXT_WINDOW_SHARE
+from zenith.agent.token_context import DEFAULT_CONTEXT_TOKEN_BUDGET
+from zenith.agent.token_context import create_token_context
+from zenith.agent.token_context import fit_messages
+from zenith.agent.token_context import get_context_token_budget
+from zenith.agent.tools.read_cache import clear_read_cache
+from zenith.agent.tools.read_cache import lookup_unchanged_read
+from zenith.agent.tools.read_cache import record_read
+from zenith.agent.tools.turn_tracker import reset_turns
+
+
+# Helper Function To Build A Tool Call And Its Result
+def tool_pair(call_id: str, output: str) -> list[LLMMessage]:
+    """
+    Builds An Assistant Tool Call And The Message Holding Its Result
+
+    Args:
+        call_id (str): The Call ID
+        output (str): The Tool Output
+
+    Returns:
+        list[LLMMessage]: The Call And The Result
+    """
+
+    # Return The Call And The Result
+    return [
+        AssistantMessage(content=[FunctionCall(id=call_id, name="list_files", arguments="{}")], source="Zenith"),
+        FunctionExecutionResultMessage(
+            content=[FunctionExecutionResult(content=output, call_id=call_id, name="list_files", is_error=False)],
+        ),
+    ]
+
+
+# Helper Function To Build A File Read And Its Result
+def read_pair(call_id: str, path: str, content: str) -> list[LLMMessage]:
+    """
+    Builds An Assistant read_file Call And The Message Holding Its Result
+
+    Args:
+        call_id (str): The Call ID
+        path (str): The Path Of The Read File
+        content (str): The Content Of The File
+
+    Returns:
+        list[LLMMessage]: The Call And The Result
+    """
+
+    # Return The Call And The Result
+    return [
+        AssistantMessage(content=[FunctionCall(id=call_id, name="read_file", arguments="{}")], source="Zenith"),
+        FunctionExecutionResultMessage(
+            content=[
+                FunctionExecutionResult(
+                    content=str({"path": path, "content": content, "hash": "hash"}),
+                    call_id=call_id,
+                    name="read_file",
+                    is_error=False,
+                ),
+            ],
+        ),
+    ]
+
+
+# Test For get_context_token_budget Function
+def test_get_context_token_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That The Budget Is A Share Of A Known Window And The Default Otherwise
+    """
+
+    # Assert The Budget Of A Known Model Is A Share Of Its Window
+    assert get_context_token_budget("gpt-4o") == int(128000 * CONTEXT_WINDOW_SHARE)
+
+    # Assert Unknown Models Get The Default Budget
+    assert get_context_token_budget("unknown-model") == DEFAULT_CONTEXT_TOKEN_BUDGET
+
+    # Assert The Default Budget Is Used If Autogen's Private Table Of Windows Cannot Be Imported
+    monkeypatch.setitem(sys.modules, "autogen_ext.models.openai._model_info", None)
+    assert get_context_token_budget("gpt-4o") == DEFAULT_CONTEXT_TOKEN_BUDGET
+
+
+# Test For fit_messages Function Within Budget
+def test_fit_messages_within_budget() -> None:
+    """
+    Tests That Messages Within The Budget Are Returned Unchanged
+    """
+
+    # Create A Short History
+    messages: list[LLMMessage] = [UserMessage(content="hi", source="user"), *tool_pair("1", "small")]
+
+    # Assert The Messages Are Returned Unchanged
+    assert fit_messages(messages, 1000) == messages
+
+
+# Test For fit_messages Compacting Tool Outputs
+def test_fit_messages_compacts_largest_outputs_first() -> None:
+    """
+    Tests That The Largest Older Tool Output Is Compacted First, Keeping Pairs And Stored Messages Intact
+    """
+
+    # Create A History With A Huge And A Medium Tool Output
+    messages: list[LLMMessage] = [
+        SystemMessage(content="system"),
+        UserMessage(content="task", source="user"),
+        *tool_pair("1", "m" * 4000),
+        *tool_pair("2", "h" * 40000),
+        *tool_pair("3", "latest " * 10),
+    ]
+
+    # Fit The Messages Into A Budget Only Reached By Compacting The Huge Output
+    fitted: list[LLMMessage] = fit_messages(messages, 2000)
+
+    # Assert No Message Was Evicted
+    assert len(fitted) == len(messages)
+
+    # Assert Only The Huge Output Was Compacted
+    assert fitted[3].content[0].content == "m" * 4000
+    assert fitted[5].content[0].content.startswith("h" * 200 + "\n[Compacted: This ~")
+    assert "Output Of list_files Was Removed To Fit The Context" in fitted[5].content[0].content
+    assert fitted[7] is messages[7]
+
+    # Assert The Stored Messages Were Not Modified
+    assert messages[5].content[0].content == "h" * 40000
+
+
+# Test For fit_messages Evicting Units
+def test_fit_messages_evicts_oldest_units() -> None:
+    """
+    Tests That Old Units Are Evicted Whole While Pinned Messages Are Kept
+    """
+
+    # Create A History Of Several Turns
+    messages: list[LLMMessage] = [
+        SystemMessage(content="system"),
+        UserMessage(content="original task", source="user"),
+        AssistantMessage(content="a" * 2000, source="Zenith"),
+        *tool_pair("1", "tiny"),
+        UserMessage(content="b" * 2000, source="user"),
+        UserMessage(content="current request", source="user"),
+        *tool_pair("2", "latest"),
+    ]
+
+    # Fit The Messages Into A Small Budget
+    fitted: list[LLMMessage] = fit_messages(messages, 100)
+
+    # Assert The Pinned Messages And The Latest Pair Were Kept
+    assert fitted == [messages[0], messages[1], messages[6], messages[7], messages[8]]
+
+
+# Test For fit_messages With Results Not Following A Call
+def test_fit_messages_orphan_results() -> None:
+    """
+    Tests That A Result Message Without A Preceding Call Stands Alone And Can Be Evicted
+    """
+
+    # Create A History Starting With An Orphan Result
+    messages: list[LLMMessage] = [tool_pair("1", "x" * 2000)[1], AssistantMessage(content="done", source="Zenith")]
+
+    # Assert The Orphan Result Is Compacted And Then Evicted
+    assert fit_messages(messages, 10) == [messages[1]]
+
+
+# Test For The Model Context Forgetting Dropped Reads
+@pytest.mark.asyncio
+async def test_token_context_forgets_dropped_reads() -> None:
+    """
+    Tests That Getting The Messages Forgets Reads Whose Outputs Are Compacted Or Evicted, While fit_messages Forgets Nothing
+    """
+
+    # Record Reads Of Three Files
+    reset_turns()
+    clear_read_cache()
+    for path in ("/p/big.py", "/p/small.py", "/p/latest.py"):
+        record_read(path, "hash", (None, None))
+
+    # Build A History Whose Large Read Output Must Be Compacted
+    compacted: list[LLMMessage] = [
+        UserMessage(content="task", source="user"),
+        *read_pair("1", "/p/big.py", "x" * 8000),
+        *read_pair("2", "/p/latest.py", "latest"),
+    ]
+
+    # Assert Fitting The Messages Alone Forgets Nothing
+    fit_messages(compacted, 500)
+    assert lookup_unchanged_read("/p/big.py", "hash", (None, None)) == 0
+
+    # Get The Messages From A Model Context
+    context = create_token_context(500)
+    for message in compacted:
+        await context.add_message(message)
+    await context.get_messages()
+
+    # Assert Only The Compacted Read Was Forgotten
+    assert lookup_unchanged_read("/p/big.py", "hash", (None, None)) is None
+    assert lookup_unchanged_read("/p/latest.py", "hash", (None, None)) == 0
+
+    # Get The Messages Of A History Whose Small Read Must Be Evicted
+    context = create_token_context(100)
+    for message in [
+        UserMessage(content="task", source="user"),
+        *read_pair("3", "/p/small.py", "small"),
+        AssistantMessage(content="a" * 2000, source="Zenith"),
+        UserMessage(content="current request", source="user"),
+        *read_pair("4", "/p/latest.py", "latest"),
+    ]:
+        await context.add_message(message)
+    await context.get_messages()
+
+    # Assert Only The Evicted Read Was Forgotten
+    assert lookup_unchanged_read("/p/small.py", "hash", (None, None)) is None
+    assert lookup_unchanged_read("/p/latest.py", "hash", (None, None)) == 0
+
+
+# Test For create_token_context Function
+@pytest.mark.asyncio
+async def test_create_token_context() -> None:
+    """
+    Tests That The Model Context Stores Every Message But Returns Only What Fits
+    """
+
+    # Create The Model Context
+    context = create_token_context(50)
+
+    # Add A Task And A Large Old Message And A Current Request
+    await context.add_message(UserMessage(content="task", source="user"))
+    await context.add_message(AssistantMessage(content="x" * 2000, source="Zenith"))
+    await context.add_message(UserMessage(content="next", source="user"))
+
+    # Assert The Large Message Is Left Out
+    assert [message.content for message in await context.get_messages()] == ["task", "next"]
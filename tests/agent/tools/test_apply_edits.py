@@ -0,0 +1,373 @@
+# Standard Library Imports
+import importlib
+import os
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.apply_edits import apply_edits
+from zenith.agent.tools.read_file import read_file
+
+# The Module Under Test, Shadowed In The Package By The Function Of The Same Name
+apply_edits_module = importlib.import_module("zenith.agent.tools.apply_edits")
+
+
+# Test Apply Edits Function
+def test_apply_edits() -> None:
+    """
+    Tests The Apply Edits Function With Several Edits Applied In Order
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("alpha beta\nbeta gamma\nbeta delta\n", encoding="utf-8")
+
+        # Apply The Edits
+        result = apply_edits(
+            test_file,
+            [
+                {"old": "alpha", "new": "ALPHA"},
+                {"old": "beta", "new": "BETA", "count": 0},
+                {"old": "ALPHA BETA", "new": "first"},
+                {"old": "delta", "new": "omega", "count": 1},
+            ],
+        )
+
+        # Check The Result
+        assert result["success"] is True
+        assert result["path"] == str(Path(test_file).resolve())
+        assert result["encoding"] == "utf-8"
+        assert result["replacements"] == 6
+        assert result["size"] == os.path.getsize(test_file)
+        assert [edit["status"] for edit in result["edits"]] == ["applied"] * 4
+        assert [edit["replacements"] for edit in result["edits"]] == [1, 3, 1, 1]
+
+        # Check The File Content
+        assert Path(test_file).read_text(encoding="utf-8") == "first\nBETA gamma\nBETA omega\n"
+
+
+# Test Apply Edits Writes The File Once
+def test_apply_edits_single_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That The Apply Edits Function Writes The File Once Regardless Of The Number Of Edits
+    """
+
+    # Record The Writes
+    writes: list[str] = []
+
+    # Keep The Real Writer
+    real_write = apply_edits_module.overlay_write_text
+
+    # Define A Recording Writer
+    def recording_write(path: Path, content: str, **kwargs: object) -> None:
+        """
+        Records The Write And Delegates To The Real Writer
+        """
+
+        # Record The Content
+        writes.append(content)
+
+        # Delegate To The Real Writer
+        real_write(path, content, **kwargs)
+
+    # Patch The Writer
+    monkeypatch.setattr(apply_edits_module, "overlay_write_text", recording_write)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a b c d e", encoding="utf-8")
+
+        # Apply Five Edits
+        result = apply_edits(test_file, [{"old": letter, "new": letter.upper()} for letter in "abcde"])
+
+        # Check The File Was Written Once
+        assert result["success"] is True
+        assert writes == ["A B C D E"]
+
+
+# Test Apply Edits Leaves The File Untouched When An Anchor Is Missing
+def test_apply_edits_anchor_not_found() -> None:
+    """
+    Tests The Apply Edits Function With A Missing Anchor
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("one two three", encoding="utf-8")
+
+        # Apply The Edits
+        result = apply_edits(
+            test_file,
+            [
+                {"old": "one", "new": "1"},
+                {"old": "four", "new": "4"},
+                {"old": "three", "new": "3"},
+                {"old": "five", "new": "5"},
+            ],
+        )
+
+        # Check The Result
+        assert result["success"] is False
+        assert "Not Modified" in result["error"]
+        assert [edit["status"] for edit in result["edits"]] == ["applied", "not_found", "skipped", "not_found"]
+
+        # Check The File Was Not Modified
+        assert Path(test_file).read_text(encoding="utf-8") == "one two three"
+
+
+# Test Apply Edits With Too Few Occurrences
+def test_apply_edits_too_few_occurrences() -> None:
+    """
+    Tests The Apply Edits Function When An Anchor Occurs Fewer Times Than Requested
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("x y x", encoding="utf-8")
+
+        # Apply The Edit
+        result = apply_edits(test_file, [{"old": "x", "new": "z", "count": 3}])
+
+        # Check The Result
+        assert result["success"] is False
+        assert result["edits"] == [{"index": 0, "status": "too_few_occurrences", "occurrences": 2, "replacements": 0}]
+
+        # Check The File Was Not Modified
+        assert Path(test_file).read_text(encoding="utf-8") == "x y x"
+
+
+# Test Apply Edits With Malformed Edits
+def test_apply_edits_invalid_edits() -> None:
+    """
+    Tests The Apply Edits Function With Malformed Edits
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("content", encoding="utf-8")
+
+        # Apply The Edits
+        result = apply_edits(
+            test_file,
+            [
+                {"old": "", "new": "x"},
+                {"old": "content"},
+                {"old": "content", "new": "x", "count": -1},
+                {"old": "content", "new": "x"},
+            ],
+        )
+
+        # Check The Result
+        assert result["success"] is False
+        assert [edit["status"] for edit in result["edits"]] == ["invalid", "invalid", "invalid", "skipped"]
+
+        # Check The File Was Not Modified
+        assert Path(test_file).read_text(encoding="utf-8") == "content"
+
+
+# Test Apply Edits With Non-Existent File
+def test_apply_edits_non_existent_file() -> None:
+    """
+    Tests The Apply Edits Function With A Non-Existent File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # With FileNotFoundError
+        with pytest.raises(FileNotFoundError) as excinfo:
+            # Call Apply Edits
+            apply_edits(os.path.join(temp_dir, "missing.txt"), [{"old": "a", "new": "b"}])
+
+        # Check The Error Message
+        assert "File Not Found" in str(excinfo.value)
+
+
+# Test Apply Edits With Directory Path
+def test_apply_edits_directory_path() -> None:
+    """
+    Tests The Apply Edits Function With A Directory Path
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Call Apply Edits
+            apply_edits(temp_dir, [{"old": "a", "new": "b"}])
+
+        # Check The Error Message
+        assert "Path Is Not A File" in str(excinfo.value)
+
+
+# Test Apply Edits With Permission Error
+def test_apply_edits_permission_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests The Apply Edits Function With Permission Error On Read
+    """
+
+    # Define A Mock read_text Function That Raises PermissionError
+    def mock_read_text(*args: object, **kwargs: object) -> str:
+        """
+        Mock read_text Function That Raises PermissionError
+        """
+
+        # Raise The PermissionError
+        raise PermissionError("Permission denied")
+
+    # Patch Path.read_text
+    monkeypatch.setattr(Path, "read_text", mock_read_text)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create The File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).touch()
+
+        # With PermissionError
+        with pytest.raises(PermissionError) as excinfo:
+            # Call Apply Edits
+            apply_edits(test_file, [{"old": "a", "new": "b"}])
+
+        # Check The Error Message
+        assert "Permission Denied" in str(excinfo.value)
+
+
+# Test Apply Edits With Decoding Error
+def test_apply_edits_decode_error() -> None:
+    """
+    Tests The Apply Edits Function With A File That Cannot Be Decoded
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Binary File
+        test_file = os.path.join(temp_dir, "binary.bin")
+        Path(test_file).write_bytes(b"\xff\xfe\xfa")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Call Apply Edits
+            apply_edits(test_file, [{"old": "a", "new": "b"}])
+
+        # Check The Error Message
+        assert "Failed To Decode File" in str(excinfo.value)
+
+
+# Test Apply Edits With Encoding Error
+def test_apply_edits_encode_error() -> None:
+    """
+    Tests The Apply Edits Function With Replacement Text That Cannot Be Encoded
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("plain", encoding="ascii")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Call Apply Edits
+            apply_edits(test_file, [{"old": "plain", "new": "naïve"}], encoding="ascii")
+
+        # Check The Error Message And That The File Was Not Modified
+        assert "Failed To Encode Content" in str(excinfo.value)
+        assert Path(test_file).read_text(encoding="ascii") == "plain"
+
+
+# Test Apply Edits With Generic Exception
+def test_apply_edits_generic_exception(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests The Apply Edits Function With A Generic Exception On Write
+    """
+
+    # Define A Mock Writer That Raises A Generic Exception
+    def mock_write(*args: object, **kwargs: object) -> None:
+        """
+        Mock Writer That Raises A Generic Exception
+        """
+
+        # Raise The Exception
+        raise OSError("Disk full")
+
+    # Patch The Writer
+    monkeypatch.setattr(apply_edits_module, "overlay_write_text", mock_write)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("content", encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Call Apply Edits
+            apply_edits(test_file, [{"old": "content", "new": "x"}])
+
+        # Check The Error Message
+        assert "Failed To Apply Edits To File" in str(excinfo.value)
+        assert "Disk full" in str(excinfo.value)
+
+
+# Test Apply Edits With An ETag Guard
+def test_apply_edits_if_match() -> None:
+    """
+    Tests That apply_edits Honours if_match And Returns An ETag Matching A Fresh Read
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File And Read Its ETag
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a b c", encoding="utf-8")
+        etag = read_file(test_file, force=True)["etag"]
+
+        # Apply Edits With The Matching ETag
+        result = apply_edits(test_file, [{"old": "a", "new": "x"}], if_match=etag)
+
+        # Assert The New ETag Matches A Fresh Read
+        assert result["etag"] == read_file(test_file, force=True)["etag"]
+
+        # With ValueError For A Stale ETag
+        with pytest.raises(ValueError) as excinfo:
+            # Apply Edits With The Stale ETag
+            apply_edits(test_file, [{"old": "b", "new": "y"}], if_match=etag)
+
+        # Check The Error And That The File Was Not Modified
+        assert "ETag Mismatch" in str(excinfo.value)
+        assert Path(test_file).read_text(encoding="utf-8") == "x b c"
+
+
+# Test Apply Edits Skips Writes That Change Nothing
+def test_apply_edits_unchanged() -> None:
+    """
+    Tests That Edits Which Cancel Out Keep The Modification Time And Report changed=False
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File With A Fixed Modification Time
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a b", encoding="utf-8")
+        os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+
+        # Apply Edits That Cancel Out
+        result = apply_edits(test_file, [{"old": "a", "new": "x"}, {"old": "x", "new": "a"}])
+
+        # Check The File Was Not Rewritten
+        assert result["success"] is True
+        assert result["changed"] is False
+        assert os.stat(test_file).st_mtime_ns == 1_000_000_000
@@ -0,0 +1,412 @@
+# Standard Library Imports
+import importlib
+import os
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.apply_patch import apply_patch
+from zenith.agent.tools.overlay import commit_overlay
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.read_file import read_file
+
+# The Module Under Test, Shadowed In The Package By The Function Of The Same Name
+apply_patch_module = importlib.import_module("zenith.agent.tools.apply_patch")
+
+
+# Test Apply Patch Across Several Files
+def test_apply_patch_multiple_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests Applying A Patch That Modifies, Creates, Deletes And Renames Files
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Work Inside The Temporary Directory
+        monkeypatch.chdir(temp_dir)
+
+        # Create The Existing Files
+        Path("edit.txt").write_text("one\ntwo\nthree\n", encoding="utf-8")
+        Path("gone.txt").write_text("bye\n", encoding="utf-8")
+        Path("old_name.txt").write_text("same\n", encoding="utf-8")
+
+        # Define The Patch
+        patch = (
+            "--- a/edit.txt\n"
+            "+++ b/edit.txt\n"
+            "@@ -2,2 +2,2 @@\n"
+            " two\n"
+            "-three\n"
+            "+THREE\n"
+            "--- /dev/null\n"
+            "+++ b/nested/new.txt\n"
+            "@@ -0,0 +1,2 @@\n"
+            "+hello\n"
+            "+world\n"
+            "--- a/gone.txt\n"
+            "+++ /dev/null\n"
+            "@@ -1 +0,0 @@\n"
+            "-bye\n"
+            "--- a/old_name.txt\n"
+            "+++ b/new_name.txt\n"
+            "@@ -1 +1 @@\n"
+            "-same\n"
+            "+changed\n"
+        )
+
+        # Apply The Patch
+        result = apply_patch(patch)
+
+        # Check The Result
+        assert result["success"] is True
+        assert result["hunks_applied"] == 4
+        assert result["hunks_rejected"] == 0
+        assert [file["action"] for file in result["files"]] == ["modify", "create", "delete", "modify"]
+
+        # Check The Files
+        assert Path("edit.txt").read_text(encoding="utf-8") == "one\ntwo\nTHREE\n"
+        assert Path("nested/new.txt").read_text(encoding="utf-8") == "hello\nworld\n"
+        assert not Path("gone.txt").exists()
+        assert not Path("old_name.txt").exists()
+        assert Path("new_name.txt").read_text(encoding="utf-8") == "changed\n"
+
+
+# Test Apply Patch Reports Rejected Hunks
+def test_apply_patch_rejected_hunks() -> None:
+    """
+    Tests That Rejected Hunks Are Reported While Matching Hunks Are Applied
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a\nb\nc\n", encoding="utf-8")
+
+        # Define The Patch
+        patch = f"--- {test_file}\n+++ {test_file}\n@@ -1 +1 @@\n-a\n+A\n@@ -2 +2 @@\n-missing\n+x\n"
+
+        # Apply The Patch
+        result = apply_patch(patch)
+
+        # Check The Result
+        assert result["success"] is False
+        assert result["hunks_applied"] == 1
+        assert result["hunks_rejected"] == 1
+        assert result["files"][0]["rejected_hunks"] == [{"index": 1, "header": "@@ -2 +2 @@"}]
+
+        # Check The File
+        assert Path(test_file).read_text(encoding="utf-8") == "A\nb\nc\n"
+
+
+# Test Apply Patch With Lines Holding Form Feeds
+def test_apply_patch_form_feed() -> None:
+    """
+    Tests That A Line Holding A Form Feed Is Patched As One Line
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File With A Form Feed Inside A Line
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a\fb\nc\n", encoding="utf-8")
+
+        # Apply A Patch Replacing That Line
+        result = apply_patch(f"--- {test_file}\n+++ {test_file}\n@@ -1,2 +1,2 @@\n-a\fb\n+ab\n c\n")
+
+        # Check The Result And The File
+        assert result["success"] is True
+        assert Path(test_file).read_text(encoding="utf-8") == "ab\nc\n"
+
+
+# Test Apply Patch Refuses Renames Onto Existing Files And Partial Deletions
+def test_apply_patch_rename_and_partial_delete() -> None:
+    """
+    Tests That A Rename Never Replaces An Existing File And A Deletion Leaving Content Keeps The File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create Two Files
+        source = Path(temp_dir) / "x.txt"
+        target = Path(temp_dir) / "y.txt"
+        source.write_text("a\nb\n", encoding="utf-8")
+        target.write_text("keep\n", encoding="utf-8")
+
+        # Rename The First File Onto The Second
+        result = apply_patch(f"--- {source}\n+++ {target}\n@@ -1,2 +1,2 @@\n-a\n+c\n b\n")
+
+        # Assert The Rename Was Refused And Both Files Kept
+        assert result["success"] is False
+        assert "File Already Exists" in result["files"][0]["error"]
+        assert source.read_text(encoding="utf-8") == "a\nb\n"
+        assert target.read_text(encoding="utf-8") == "keep\n"
+
+        # Delete The First File With A Patch Removing Only One Line
+        result = apply_patch(f"--- {source}\n+++ /dev/null\n@@ -1,2 +1 @@\n-a\n b\n")
+
+        # Assert The Deletion Was Refused And The File Not Rewritten
+        assert result["success"] is False
+        assert result["files"][0]["changed"] is False
+        assert "Deletion Does Not Remove All Content" in result["files"][0]["error"]
+        assert source.read_text(encoding="utf-8") == "a\nb\n"
+
+
+# Test Apply Patch Creates Parent Directories Only At Commit With The Overlay
+def test_apply_patch_overlay_parents() -> None:
+    """
+    Tests That Creating A File In A New Directory Leaves The Disk Untouched Until The Overlay Is Committed
+    """
+
+    # With Temporary Directory And The Overlay Enabled
+    with tempfile.TemporaryDirectory() as temp_dir:
+        set_overlay_enabled(enabled=True)
+        try:
+            # Create A File In A New Directory
+            path = Path(temp_dir) / "new" / "file.txt"
+            assert apply_patch(f"--- /dev/null\n+++ {path}\n@@ -0,0 +1 @@\n+a\n")["success"] is True
+
+            # Assert Nothing Was Created On Disk Until The Commit
+            assert not path.parent.exists()
+            commit_overlay()
+            assert path.read_text(encoding="utf-8") == "a\n"
+
+        finally:
+            # Disable The Overlay
+            discard_overlay()
+            set_overlay_enabled(enabled=False)
+
+
+# Test Apply Patch Leaves A File Untouched When Every Hunk Is Rejected
+def test_apply_patch_all_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That A File Is Not Written When None Of Its Hunks Apply
+    """
+
+    # Define A Writer That Must Not Be Called
+    def mock_write(*args: object, **kwargs: object) -> None:
+        """
+        Mock Writer That Fails The Test
+        """
+
+        # Fail The Test
+        raise AssertionError("The File Must Not Be Written")
+
+    # Patch The Writer
+    monkeypatch.setattr(apply_patch_module, "overlay_write_text", mock_write)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a\n", encoding="utf-8")
+
+        # Apply The Patch
+        result = apply_patch(f"--- {test_file}\n+++ {test_file}\n@@ -1 +1 @@\n-z\n+y\n")
+
+        # Check The Result
+        assert result["success"] is False
+        assert result["hunks_rejected"] == 1
+
+
+# Test Apply Patch With Per-File Errors
+def test_apply_patch_file_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That Missing Files, Directories And Existing Files To Create Are Reported Per File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Work Inside The Temporary Directory
+        monkeypatch.chdir(temp_dir)
+
+        # Create A File And A Directory
+        Path("exists.txt").write_text("x\n", encoding="utf-8")
+        Path("folder").mkdir()
+
+        # Define The Patch
+        patch = (
+            "--- a/missing.txt\n+++ b/missing.txt\n@@ -1 +1 @@\n-x\n+y\n"
+            "--- a/folder\n+++ b/folder\n@@ -1 +1 @@\n-x\n+y\n"
+            "--- /dev/null\n+++ b/exists.txt\n@@ -0,0 +1 @@\n+x\n"
+        )
+
+        # Apply The Patch
+        result = apply_patch(patch)
+
+        # Check The Result
+        assert result["success"] is False
+        assert [file["path"] for file in result["files"]] == ["missing.txt", "folder", "exists.txt"]
+        assert "File Not Found" in result["files"][0]["error"]
+        assert "Path Is Not A File" in result["files"][1]["error"]
+        assert "File Already Exists" in result["files"][2]["error"]
+
+
+# Test Apply Patch With Malformed Or Empty Patches
+@pytest.mark.parametrize(
+    ("patch", "message"),
+    [
+        ("--- a/f\n+++ b/f\n@@ -1 +1 @@\n", "Failed To Parse Patch"),
+        ("just some text\n", "No File Changes Found In Patch"),
+    ],
+)
+def test_apply_patch_invalid(patch: str, message: str) -> None:
+    """
+    Tests That Malformed Or Empty Patches Raise A ValueError
+    """
+
+    # With ValueError
+    with pytest.raises(ValueError) as excinfo:
+        # Apply The Patch
+        apply_patch(patch)
+
+    # Check The Error Message
+    assert message in str(excinfo.value)
+
+
+# Test Apply Patch With Permission Error
+def test_apply_patch_permission_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests Apply Patch With Permission Error On Read
+    """
+
+    # Define A Mock read_text Function That Raises PermissionError
+    def mock_read_text(*args: object, **kwargs: object) -> str:
+        """
+        Mock read_text Function That Raises PermissionError
+        """
+
+        # Raise The PermissionError
+        raise PermissionError("Permission denied")
+
+    # Patch Path.read_text
+    monkeypatch.setattr(Path, "read_text", mock_read_text)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).touch()
+
+        # Apply The Patch
+        result = apply_patch(f"--- {test_file}\n+++ {test_file}\n@@ -1 +1 @@\n-a\n+b\n")
+
+        # Check The Error
+        assert "Permission Denied" in result["files"][0]["error"]
+
+
+# Test Apply Patch With Encoding Errors
+def test_apply_patch_encoding_errors() -> None:
+    """
+    Tests Apply Patch With Files That Cannot Be Decoded Or Content That Cannot Be Encoded
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Binary File And An ASCII File
+        binary_file = os.path.join(temp_dir, "binary.bin")
+        Path(binary_file).write_bytes(b"\xff\xfe\xfa")
+        ascii_file = os.path.join(temp_dir, "ascii.txt")
+        Path(ascii_file).write_text("a\n", encoding="ascii")
+
+        # Define The Patch
+        patch = (
+            f"--- {binary_file}\n+++ {binary_file}\n@@ -1 +1 @@\n-a\n+b\n"
+            f"--- {ascii_file}\n+++ {ascii_file}\n@@ -1 +1 @@\n-a\n+naïve\n"
+        )
+
+        # Apply The Patch
+        result = apply_patch(patch, encoding="ascii")
+
+        # Check The Errors
+        assert "Failed To Decode File" in result["files"][0]["error"]
+        assert "Failed To Encode Content" in result["files"][1]["error"]
+        assert Path(ascii_file).read_text(encoding="ascii") == "a\n"
+
+
+# Test Apply Patch With Generic Exception
+def test_apply_patch_generic_exception(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests Apply Patch With A Generic Exception On Write
+    """
+
+    # Define A Mock Writer That Raises A Generic Exception
+    def mock_write(*args: object, **kwargs: object) -> None:
+        """
+        Mock Writer That Raises A Generic Exception
+        """
+
+        # Raise The Exception
+        raise OSError("Disk full")
+
+    # Patch The Writer
+    monkeypatch.setattr(apply_patch_module, "overlay_write_text", mock_write)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a\n", encoding="utf-8")
+
+        # Apply The Patch
+        result = apply_patch(f"--- {test_file}\n+++ {test_file}\n@@ -1 +1 @@\n-a\n+b\n")
+
+        # Check The Error
+        assert "Failed To Apply Patch To File" in result["files"][0]["error"]
+        assert "Disk full" in result["files"][0]["error"]
+
+
+# Test Apply Patch With ETag Guards
+def test_apply_patch_if_match() -> None:
+    """
+    Tests That apply_patch Skips Files Whose ETag No Longer Matches And Returns New ETags
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create Two Files And Read Their ETags
+        fresh = os.path.join(temp_dir, "fresh.txt")
+        stale = os.path.join(temp_dir, "stale.txt")
+        Path(fresh).write_text("a\n", encoding="utf-8")
+        Path(stale).write_text("a\n", encoding="utf-8")
+        etags = {path: read_file(path, force=True)["etag"] for path in (fresh, stale)}
+
+        # Change One File Behind The Model's Back
+        Path(stale).write_text("a\nb\n", encoding="utf-8")
+        os.utime(stale, ns=(0, 0))
+
+        # Apply The Patch
+        patch = "".join(f"--- {path}\n+++ {path}\n@@ -1 +1 @@\n-a\n+A\n" for path in (fresh, stale))
+        result = apply_patch(patch, if_match=etags)
+
+        # Check The Results
+        assert result["files"][0]["etag"] == read_file(fresh, force=True)["etag"]
+        assert "ETag Mismatch" in result["files"][1]["error"]
+        assert Path(stale).read_text(encoding="utf-8") == "a\nb\n"
+
+
+# Test Apply Patch Skips Writes That Change Nothing
+def test_apply_patch_unchanged() -> None:
+    """
+    Tests That A Hunk Which Leaves The Content Unchanged Keeps The Modification Time
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File With A Fixed Modification Time
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a\n", encoding="utf-8")
+        os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+
+        # Apply A Patch That Replaces The Line With Itself
+        result = apply_patch(f"--- {test_file}\n+++ {test_file}\n@@ -1 +1 @@\n-a\n+a\n")
+
+        # Check The File Was Not Rewritten
+        assert result["success"] is True
+        assert result["files"][0]["changed"] is False
+        assert result["files"][0]["etag"] == read_file(test_file, force=True)["etag"]
+        assert os.stat(test_file).st_mtime_ns == 1_000_000_000
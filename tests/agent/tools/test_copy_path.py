@@ -0,0 +1,188 @@
+# Standard Library Imports
+import importlib
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.copy_path import copy_path
+from zenith.agent.tools.overlay import commit_overlay
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.overlay import staged_paths
+from zenith.agent.tools.write_file import write_file
+
+
+# Test Copying A File
+def test_copy_path_file() -> None:
+    """
+    Tests Copying A File Into A Missing Directory And Overwriting An Existing File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source File
+        root = Path(temp_dir).resolve()
+        (root / "logo.png").write_bytes(b"\x89PNG\r\n")
+
+        # Copy The File Into A Missing Directory
+        result = copy_path(str(root / "logo.png"), str(root / "assets" / "logo.png"))
+
+        # Check The Result
+        assert result["success"] is True
+        assert result["target"] == str(root / "assets" / "logo.png")
+        assert result["type"] == "file"
+        assert result["files"] == 1
+        assert result["size"] == 6
+        assert (root / "assets" / "logo.png").read_bytes() == b"\x89PNG\r\n"
+
+        # With FileExistsError
+        with pytest.raises(FileExistsError, match="Path Already Exists"):
+            # Copy Onto The Existing Copy
+            copy_path(str(root / "logo.png"), str(root / "assets" / "logo.png"))
+
+        # Copy Onto The Existing Copy With Overwriting
+        (root / "logo.png").write_bytes(b"new")
+        copy_path(str(root / "logo.png"), str(root / "assets" / "logo.png"), overwrite=True)
+
+        # Check The Copy Was Replaced
+        assert (root / "assets" / "logo.png").read_bytes() == b"new"
+
+
+# Test Copying A Directory
+def test_copy_path_directory() -> None:
+    """
+    Tests Copying A Directory Recursively And Refusing To Replace Directories
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source Tree
+        root = Path(temp_dir).resolve()
+        (root / "src" / "pkg").mkdir(parents=True)
+        (root / "src" / "pkg" / "a.py").write_text("a", encoding="utf-8")
+        (root / "src" / "b.py").write_text("bb", encoding="utf-8")
+
+        # Copy The Tree
+        result = copy_path(str(root / "src"), str(root / "backup"))
+
+        # Check The Result
+        assert result["type"] == "directory"
+        assert result["files"] == 2
+        assert result["size"] == 3
+        assert (root / "backup" / "pkg" / "a.py").read_text(encoding="utf-8") == "a"
+
+        # With FileExistsError
+        with pytest.raises(FileExistsError, match="Path Already Exists"):
+            # Copy Onto The Existing Directory
+            copy_path(str(root / "src"), str(root / "backup"), overwrite=True)
+
+        # With ValueError
+        with pytest.raises(ValueError, match="Onto Or Into Itself"):
+            # Copy The Tree Into Itself
+            copy_path(str(root / "src"), str(root / "src" / "copy"))
+
+
+# Test Copy Of A Missing Path
+def test_copy_path_missing() -> None:
+    """
+    Tests That Copying A Missing Path Raises FileNotFoundError
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # With FileNotFoundError
+        with pytest.raises(FileNotFoundError, match="Path Not Found"):
+            # Copy A Missing Path
+            copy_path(str(Path(temp_dir) / "missing.txt"), str(Path(temp_dir) / "b.txt"))
+
+
+# Test Copy Errors
+@pytest.mark.parametrize(
+    ("error", "expected", "message"),
+    [
+        (PermissionError(), PermissionError, "Permission Denied"),
+        (OSError("disk full"), ValueError, "Failed To Copy Path"),
+    ],
+)
+def test_copy_path_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    error: Exception,
+    expected: type[Exception],
+    message: str,
+) -> None:
+    """
+    Tests That Failed Copies Are Reported As PermissionError Or ValueError
+    """
+
+    # Define A Failing Copy
+    def raise_error(*args: object, **kwargs: object) -> None:
+        # Raise The Error
+        raise error
+
+    # Patch The Copy
+    monkeypatch.setattr(importlib.import_module("zenith.agent.tools.copy_path"), "copy_file", raise_error)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source File
+        root = Path(temp_dir).resolve()
+        (root / "a.txt").write_text("a", encoding="utf-8")
+
+        # With The Expected Error
+        with pytest.raises(expected, match=message):
+            # Copy The File
+            copy_path(str(root / "a.txt"), str(root / "b.txt"))
+
+
+# Test Copying With The Overlay
+def test_copy_path_with_overlay() -> None:
+    """
+    Tests That Copying A Staged File Stages The Copy And Copying Onto A Staged File Drops Its Staged Text
+    """
+
+    # Enable The Overlay
+    set_overlay_enabled(enabled=True)
+
+    try:
+        # With Temporary Directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Stage A New File And Create A Directory With A Staged File
+            root = Path(temp_dir).resolve()
+            write_file(str(root / "staged.txt"), "staged")
+            (root / "dir").mkdir()
+            write_file(str(root / "dir" / "inner.txt"), "inner")
+
+            # Copy The Staged File
+            result = copy_path(str(root / "staged.txt"), str(root / "copy.txt"))
+
+            # Check The Copy Is Staged
+            assert result["size"] == 6
+            assert not (root / "copy.txt").exists()
+            assert str(root / "copy.txt") in staged_paths()
+
+            # Copy A File On Disk Onto The Staged Copy
+            (root / "disk.txt").write_text("disk", encoding="utf-8")
+            copy_path(str(root / "disk.txt"), str(root / "copy.txt"), overwrite=True)
+
+            # Check The Copy Went To Disk And Was Unstaged
+            assert (root / "copy.txt").read_text(encoding="utf-8") == "disk"
+            assert str(root / "copy.txt") not in staged_paths()
+
+            # With ValueError
+            with pytest.raises(ValueError, match="Directory Has Staged Changes"):
+                # Copy A Directory With Staged Files
+                copy_path(str(root / "dir"), str(root / "other"))
+
+            # Commit The Overlay
+            commit_overlay()
+
+            # Check The Disk
+            assert (root / "copy.txt").read_text(encoding="utf-8") == "disk"
+
+    finally:
+        # Discard Leftovers And Disable The Overlay
+        discard_overlay()
+        set_overlay_enabled(enabled=False)
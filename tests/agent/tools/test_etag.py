@@ -0,0 +1,88 @@
+# Standard Library Imports
+import os
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.etag import check_etag
+from zenith.agent.tools.etag import current_etag
+from zenith.agent.tools.etag import etag_for_written_text
+from zenith.agent.tools.etag import make_etag
+from zenith.agent.tools.read_file import read_file
+
+
+# Test make_etag Function
+def test_make_etag() -> None:
+    """
+    Tests That An ETag Combines A Short Content Hash With The Hexadecimal Modification Time
+    """
+
+    # Assert The ETag Format
+    assert make_etag("0123456789abcdef0123", 255) == "0123456789abcdef-ff"
+
+
+# Test That read_file And current_etag Agree
+def test_current_etag_matches_read_file() -> None:
+    """
+    Tests That current_etag And etag_for_written_text Match The ETag Returned By read_file
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Write A File With CRLF Newlines
+        path = Path(temp_dir) / "file.txt"
+        path.write_bytes(b"one\r\ntwo\rthree\n")
+
+        # Read The File
+        result = read_file(str(path), force=True)
+
+        # Assert The ETags Agree
+        assert current_etag(path, "utf-8") == result["etag"]
+        assert etag_for_written_text(path, "one\r\ntwo\rthree\n") == result["etag"]
+
+        # Assert A Matching ETag Passes The Check
+        check_etag(path, result["etag"], encoding="utf-8")
+        check_etag(path, None, encoding="utf-8")
+
+
+# Test check_etag After The File Changed
+def test_check_etag_mismatch() -> None:
+    """
+    Tests That check_etag Fails When The Modification Time Or The Content Changed
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Write A File And Get Its ETag
+        path = Path(temp_dir) / "file.txt"
+        path.write_text("original", encoding="utf-8")
+        etag = current_etag(path, "utf-8")
+        mtime_ns = path.stat().st_mtime_ns
+
+        # Change The Modification Time Only
+        os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+
+        # Assert The Check Fails
+        with pytest.raises(ValueError, match="ETag Mismatch: File Changed"):
+            # Check The ETag
+            check_etag(path, etag, encoding="utf-8")
+
+        # Change The Content But Restore The Modification Time
+        path.write_text("modified", encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        # Assert The Check Fails
+        with pytest.raises(ValueError, match="ETag Mismatch: File Changed"):
+            # Check The ETag
+            check_etag(path, etag, encoding="utf-8")
+
+        # Delete The File
+        path.unlink()
+
+        # Assert The Check Fails
+        with pytest.raises(ValueError, match="ETag Mismatch: File No Longer Exists"):
+            # Check The ETag
+            check_etag(path, etag, encoding="utf-8")
@@ -0,0 +1,176 @@
+# Standard Library Imports
+import importlib
+import os
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.move_path import move_path
+from zenith.agent.tools.overlay import commit_overlay
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.write_file import write_file
+
+
+# Test Moving A File
+def test_move_path_file() -> None:
+    """
+    Tests Moving A File Into A Missing Directory And Overwriting An Existing File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create Files
+        root = Path(temp_dir).resolve()
+        (root / "a.txt").write_text("a", encoding="utf-8")
+        (root / "b.txt").write_text("b", encoding="utf-8")
+
+        # Move A File Into A Missing Directory
+        result = move_path(str(root / "a.txt"), str(root / "docs" / "a.txt"))
+
+        # Check The Result
+        assert result == {
+            "success": True,
+            "source": str(root / "a.txt"),
+            "target": str(root / "docs" / "a.txt"),
+            "type": "file",
+            "method": "rename",
+        }
+        assert not (root / "a.txt").exists()
+
+        # With FileExistsError
+        with pytest.raises(FileExistsError, match="Path Already Exists"):
+            # Move Onto An Existing File
+            move_path(str(root / "b.txt"), str(root / "docs" / "a.txt"))
+
+        # Move Onto An Existing File With Overwriting
+        move_path(str(root / "b.txt"), str(root / "docs" / "a.txt"), overwrite=True)
+
+        # Check The File Was Replaced
+        assert (root / "docs" / "a.txt").read_text(encoding="utf-8") == "b"
+        assert os.listdir(root) == ["docs"]
+
+
+# Test Moving A Directory
+def test_move_path_directory() -> None:
+    """
+    Tests Renaming A Directory And Refusing To Move It Into Itself
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Directory
+        root = Path(temp_dir).resolve()
+        (root / "old").mkdir()
+        (root / "old" / "f.txt").write_text("f", encoding="utf-8")
+
+        # Move The Directory
+        result = move_path(str(root / "old"), str(root / "new"))
+
+        # Check The Result
+        assert result["type"] == "directory"
+        assert (root / "new" / "f.txt").read_text(encoding="utf-8") == "f"
+
+        # With ValueError
+        with pytest.raises(ValueError, match="Onto Or Into Itself"):
+            # Move The Directory Into Itself
+            move_path(str(root / "new"), str(root / "new" / "sub"))
+
+
+# Test Move Of A Missing Path
+def test_move_path_missing() -> None:
+    """
+    Tests That Moving A Missing Path Raises FileNotFoundError
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # With FileNotFoundError
+        with pytest.raises(FileNotFoundError, match="Path Not Found"):
+            # Move A Missing Path
+            move_path(str(Path(temp_dir) / "missing.txt"), str(Path(temp_dir) / "b.txt"))
+
+
+# Test Move Errors
+@pytest.mark.parametrize(
+    ("error", "expected", "message"),
+    [
+        (PermissionError(), PermissionError, "Permission Denied"),
+        (OSError("disk full"), ValueError, "Failed To Move Path"),
+    ],
+)
+def test_move_path_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    error: Exception,
+    expected: type[Exception],
+    message: str,
+) -> None:
+    """
+    Tests That Failed Moves Are Reported As PermissionError Or ValueError
+    """
+
+    # Define A Failing Move
+    def raise_error(*args: object, **kwargs: object) -> None:
+        # Raise The Error
+        raise error
+
+    # Patch The Move
+    monkeypatch.setattr(importlib.import_module("zenith.agent.tools.move_path"), "move_path_on_disk", raise_error)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source File
+        root = Path(temp_dir).resolve()
+        (root / "a.txt").write_text("a", encoding="utf-8")
+
+        # With The Expected Error
+        with pytest.raises(expected, match=message):
+            # Move The File
+            move_path(str(root / "a.txt"), str(root / "b.txt"))
+
+
+# Test Moving With The Overlay
+def test_move_path_with_overlay() -> None:
+    """
+    Tests That Moving A Staged File Stages The Move And Directories With Staged Files Cannot Be Moved
+    """
+
+    # Enable The Overlay
+    set_overlay_enabled(enabled=True)
+
+    try:
+        # With Temporary Directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Create A File And Stage A Change To It
+            root = Path(temp_dir).resolve()
+            (root / "dir").mkdir()
+            (root / "dir" / "a.txt").write_text("old", encoding="utf-8")
+            write_file(str(root / "dir" / "a.txt"), "new")
+
+            # With ValueError
+            with pytest.raises(ValueError, match="Directory Has Staged Changes"):
+                # Move The Directory
+                move_path(str(root / "dir"), str(root / "other"))
+
+            # Move The Staged File
+            result = move_path(str(root / "dir" / "a.txt"), str(root / "b.txt"))
+
+            # Check The Move Is Staged
+            assert result["method"] == "staged"
+            assert (root / "dir" / "a.txt").exists()
+            assert not (root / "b.txt").exists()
+
+            # Commit The Overlay
+            commit_overlay()
+
+            # Check The Disk
+            assert not (root / "dir" / "a.txt").exists()
+            assert (root / "b.txt").read_text(encoding="utf-8") == "new"
+
+    finally:
+        # Discard Leftovers And Disable The Overlay
+        discard_overlay()
+        set_overlay_enabled(enabled=False)
@@ -0,0 +1,225 @@
+# Standard Library Imports
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.list_files import list_files
+from zenith.agent.tools.output_compaction import MAX_ITEM_CHARS
+from zenith.agent.tools.output_compaction import compact_tool_output
+from zenith.agent.tools.output_compaction import get_output_savings
+from zenith.agent.tools.output_compaction import with_output_compaction
+from zenith.agent.tools.preview_data import preview_data
+from zenith.agent.tools.read_cache import clear_read_cache
+from zenith.agent.tools.read_cache import lookup_unchanged_read
+from zenith.agent.tools.read_cache import record_read
+from zenith.agent.tools.turn_tracker import begin_turn
+from zenith.agent.tools.turn_tracker import reset_turns
+
+
+# Test For compact_tool_output With A Directory Tree
+def test_compact_tool_output_tree() -> None:
+    """
+    Tests That A list_files Tree Is Rendered As Indented Text Without Low-Value Fields
+    """
+
+    # Create A Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Nested File And A File
+        (Path(temp_dir) / "src").mkdir()
+        (Path(temp_dir) / "src" / "main.py").write_text("print(1)\n")
+        (Path(temp_dir) / "readme.md").write_text("hello")
+
+        # Compact The Listing
+        result: dict[str, Any] = compact_tool_output(list_files(temp_dir))
+
+    # Get The Lines Of The Tree
+    lines: list[str] = result["content"].splitlines()
+
+    # Assert The Root, Directory And Files Are Indented With Sizes
+    assert result["path"] == str(Path(temp_dir).resolve())
+    assert result["format"].startswith("Indented Tree")
+    assert lines[0] == f"{Path(temp_dir).name}/"
+    assert lines[1] == "  src/"
+    assert lines[2].startswith("    main.py  9  ")
+    assert lines[3].startswith("  readme.md  5  ")
+    assert "permissions" not in str(result)
+
+
+# Test For compact_tool_output With A Directory That Could Not Be Read
+def test_compact_tool_output_tree_error() -> None:
+    """
+    Tests That A Directory Error Is Shown On Its Line
+    """
+
+    # Compact A Tree With An Unreadable Directory
+    result: dict[str, Any] = compact_tool_output(
+        {"name": "root", "path": "/root", "children": [{"name": "locked", "children": [], "error": "Permission Denied"}]},
+    )
+
+    # Assert The Error Is Shown
+    assert result["content"] == "root/\n  locked/  [Permission Denied]"
+
+
+# Test For compact_tool_output With Flat Entries
+def test_compact_tool_output_table() -> None:
+    """
+    Tests That Lists Of Flat Entries Become Tables Without Repeated Keys, Names Or Low-Value Fields
+    """
+
+    # Compact A search_files Style Result
+    result: dict[str, Any] = compact_tool_output(
+        [
+            {"name": "a.py", "path": "/p/a.py", "size": 10, "size_human": "10 B", "type": "file"},
+            {"name": "b.py", "path": "/p/b.py", "size": 20, "size_human": "20 B", "type": "file", "staged": True},
+        ],
+        "search_files",
+    )
+
+    # Assert The Entries Became A Table With A Header
+    assert result == {"content": "path | size | type | staged\n/p/a.py | 10 | file | \n/p/b.py | 20 | file | True"}
+
+    # Compact A Dictionary With Nested Rows From A Tool Not Listing Files
+    nested: dict[str, Any] = compact_tool_output(
+        {"name": "rows.json", "path": "/p/rows.json", "size_human": "1 KB", "sample_rows": [{"a": 1}, {"a": 2, "b": None}]},
+        "preview_data",
+    )
+
+    # Assert The Nested Rows Became A Table And Every Field Was Kept
+    assert nested == {
+        "name": "rows.json",
+        "path": "/p/rows.json",
+        "size_human": "1 KB",
+        "sample_rows": "a | b\n1 | \n2 | ",
+    }
+
+
+# Test For compact_tool_output With Entries Holding Text
+def test_compact_tool_output_list_truncation() -> None:
+    """
+    Tests That Multi-Line Entries Stay Dictionaries And Long Texts Are Truncated With A Marker, Forgetting Their Reads
+    """
+
+    # Record Reads Of Both Files
+    clear_read_cache()
+    record_read("/p/big.txt", "hash", (None, None))
+    record_read("/p/small.txt", "hash", (None, None))
+
+    # Compact A read_multiple_files Style Result
+    result: list[Any] = compact_tool_output(
+        [
+            {"path": "/p/big.txt", "content": "x\n" * MAX_ITEM_CHARS, "hash": "hash"},
+            {"path": "/p/small.txt", "content": "a\nb\n", "hash": "hash"},
+            "not a dict",
+        ],
+        "read_multiple_files",
+    )
+
+    # Assert The Large File Was Truncated With A Marker
+    assert result[0]["content"].startswith("x\n" * (MAX_ITEM_CHARS // 2))
+    assert result[0]["content"].endswith(
+        f"[Truncated: Showing The First {MAX_ITEM_CHARS} Of {2 * MAX_ITEM_CHARS} Characters. "
+        "Request This Item Alone Or A Smaller Range For The Rest.]",
+    )
+
+    # Assert Only The Truncated Read Was Forgotten, So Reading It Again Returns The Content
+    assert lookup_unchanged_read("/p/big.txt", "hash", (None, None)) is None
+    assert lookup_unchanged_read("/p/small.txt", "hash", (None, None)) is not None
+
+    # Assert Other Items Were Kept
+    assert result[1:] == [{"path": "/p/small.txt", "content": "a\nb\n", "hash": "hash"}, "not a dict"]
+
+    # Assert Scalars And Nested Lists Of Other Values Are Kept, Dropping Fields Only From Filesystem Entries
+    assert compact_tool_output("done") == "done"
+    assert compact_tool_output({"paths": ["/p/a"], "permissions": "-rw"}, "stat_paths") == {"paths": ["/p/a"]}
+    assert compact_tool_output({"paths": ["/p/a"], "permissions": "-rw"}) == {"paths": ["/p/a"], "permissions": "-rw"}
+    assert compact_tool_output(["/p/a", "/p/b"], "search_files") == ["/p/a", "/p/b"]
+
+
+# Test For Compacting Data Rows
+def test_compact_tool_output_keeps_data_fields() -> None:
+    """
+    Tests That Data Columns Named Like Filesystem Metadata Are Kept In preview_data Outputs
+    """
+
+    # Create A CSV File With Columns Named Like Dropped Fields
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path: Path = Path(temp_dir) / "users.csv"
+        path.write_text("name,permissions,size_human\nalice,admin,1 KB\nbob,read,2 KB\n", encoding="utf-8")
+
+        # Preview The File Through Compaction
+        result: dict[str, Any] = with_output_compaction(preview_data, "preview_data")(str(path))
+
+    # Assert Every Column Of The Rows Was Kept
+    assert result["sample_rows"] == "name | permissions | size_human\nalice | admin | 1 KB\nbob | read | 2 KB"
+
+
+# Test For with_output_compaction Function
+def test_with_output_compaction() -> None:
+    """
+    Tests That Wrapped Tools Return Compacted Outputs, Keep Outputs Compaction Cannot Shrink, And Record Savings
+    """
+
+    # Start A Fresh Turn
+    reset_turns()
+    begin_turn()
+
+    # Wrap A Tool With Low-Value Fields And One Without
+    verbose = with_output_compaction(
+        lambda: [{"path": f"/p/{i}.py", "size": i, "size_human": f"{i} B", "permissions": "-rw-r--r--"} for i in range(20)],
+        "search_files",
+    )
+    small = with_output_compaction(lambda: [{"a": 1}], "stat_paths")
+
+    # Call Both
+    compacted: dict[str, Any] = verbose()
+    kept: list[dict[str, Any]] = small()
+
+    # Assert The Verbose Output Was Compacted And The Small One Kept
+    assert compacted["content"].startswith("path | size\n/p/0.py | 0\n")
+    assert kept == [{"a": 1}]
+
+    # Assert The Savings Were Recorded Per Tool
+    savings: dict[str, Any] = get_output_savings()
+    assert savings["turn"] == 1
+    assert savings["tools"]["search_files"]["calls"] == 1
+    assert savings["tools"]["search_files"]["tokens_after"] < savings["tools"]["search_files"]["tokens_before"]
+    assert savings["tools"]["stat_paths"]["tokens_after"] == savings["tools"]["stat_paths"]["tokens_before"]
+    assert savings["tokens_before"] == sum(counters["tokens_before"] for counters in savings["tools"].values())
+
+    # Assert A New Turn Starts Without Savings
+    begin_turn()
+    assert get_output_savings() == {"turn": 2, "tokens_before": 0, "tokens_after": 0, "tools": {}}
+
+
+# Test For Tables Of Values Holding The Separator
+def test_compact_tool_output_table_escaping() -> None:
+    """
+    Tests That Values Holding The Column Separator Are Escaped Instead Of Adding Columns
+    """
+
+    # Compact Entries Whose Path Holds The Separator
+    result: dict[str, Any] = compact_tool_output(
+        [{"path": "/p/a | b.py", "size": 1}, {"path": "/p/c|d.py", "size": None}],
+        "search_files",
+    )
+
+    # Assert The Separators Were Escaped
+    assert result == {"content": "path | size\n/p/a \\| b.py | 1\n/p/c\\|d.py | "}
+
+
+# Test For File Reads Staying Recognizable
+def test_compact_tool_output_reads_not_tables() -> None:
+    """
+    Tests That Single-Line File Reads And Stubs Are Never Rendered As A Table, So Their Reads Can Be Forgotten
+    """
+
+    # Get A read_multiple_files Style Result Of Single-Line Files
+    reads: list[dict[str, Any]] = [
+        {"success": True, "path": "/p/a.py", "content": "a", "hash": "hash"},
+        {"success": True, "path": "/p/b.py", "unchanged": True, "content": "Unchanged", "hash": "hash"},
+    ]
+
+    # Assert The Entries Are Kept As Dictionaries, Also If The Tool Is Unknown
+    assert compact_tool_output(reads, "read_multiple_files") == reads
+    assert compact_tool_output(reads) == reads
@@ -0,0 +1,248 @@
+# Standard Library Imports
+import os
+import tempfile
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools import overlay
+from zenith.agent.tools.apply_edits import apply_edits
+from zenith.agent.tools.apply_patch import apply_patch
+from zenith.agent.tools.overlay import commit_overlay
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.overlay import get_staged_text
+from zenith.agent.tools.overlay import has_staged_within
+from zenith.agent.tools.overlay import is_overlay_enabled
+from zenith.agent.tools.overlay import overlay_has_text
+from zenith.agent.tools.overlay import overlay_unlink
+from zenith.agent.tools.overlay import overlay_write_text
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.overlay import staged_paths
+from zenith.agent.tools.overlay import unstage
+from zenith.agent.tools.read_file import file_exists
+from zenith.agent.tools.read_file import read_file
+from zenith.agent.tools.replace_content import replace_content
+from zenith.agent.tools.write_file import write_file
+
+
+# Fixture For A Temporary Directory With The Overlay Enabled
+@pytest.fixture
+def overlay_dir() -> Generator[Path, None, None]:
+    """
+    Creates A Temporary Directory And Enables The Overlay, Discarding And Disabling It Afterwards
+
+    Returns:
+        Generator[Path, None, None]: The Path To The Temporary Directory
+    """
+
+    # Enable The Overlay
+    set_overlay_enabled(enabled=True)
+
+    try:
+        # With Temporary Directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Yield The Resolved Temporary Path
+            yield Path(temp_dir).resolve()
+
+    finally:
+        # Discard Leftovers And Disable The Overlay
+        discard_overlay()
+        set_overlay_enabled(enabled=False)
+
+
+# Test Tools Read Their Own Staged Writes
+def test_overlay_read_your_writes(overlay_dir: Path) -> None:
+    """
+    Tests That Edit Tools Stage Their Writes And Later Reads In The Same Turn See Them
+    """
+
+    # Create A File On Disk With A Fixed Modification Time
+    path = overlay_dir / "file.txt"
+    path.write_text("one\ntwo\n", encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    etag = read_file(str(path), force=True)["etag"]
+
+    # Edit The File Several Times Through Different Tools
+    etag = replace_content(str(path), "one", "ONE", if_match=etag)["etag"]
+    etag = apply_edits(str(path), [{"old": "two", "new": "TWO"}], if_match=etag)["etag"]
+    result = write_file(str(path), "\nthree", append=True, if_match=etag)
+
+    # Check The Tools See The Staged Content While The Disk Is Untouched
+    assert is_overlay_enabled() is True
+    assert result["size"] == len("ONE\nTWO\n\nthree")
+    assert read_file(str(path), force=True)["content"] == "ONE\nTWO\n\nthree"
+    assert read_file(str(path), start_line=4, force=True)["content"] == "three"
+    assert read_file(str(path), force=True)["etag"] == result["etag"]
+    assert path.read_text(encoding="utf-8") == "one\ntwo\n"
+    assert path.stat().st_mtime_ns == 1_000_000_000
+    assert staged_paths() == [str(path)]
+
+    # Commit The Overlay
+    assert commit_overlay() == [str(path)]
+
+    # Check The Disk Now Holds The Final Content
+    assert path.read_text(encoding="utf-8") == "ONE\nTWO\n\nthree"
+    assert staged_paths() == []
+
+
+# Test Staged Creations, Renames And Deletions
+def test_overlay_create_rename_delete(overlay_dir: Path) -> None:
+    """
+    Tests That Created, Renamed And Deleted Files Only Reach The Disk On Commit
+    """
+
+    # Create Files On Disk
+    (overlay_dir / "old.txt").write_text("same\n", encoding="utf-8")
+    (overlay_dir / "gone.txt").write_text("bye\n", encoding="utf-8")
+
+    # Create A New File And Append To A New File
+    write_file(str(overlay_dir / "new.txt"), "hello\n")
+    write_file(str(overlay_dir / "log.txt"), "line\n", append=True)
+
+    # Rename And Delete Through A Patch
+    patch = (
+        f"--- {overlay_dir / 'old.txt'}\n+++ {overlay_dir / 'renamed.txt'}\n@@ -1 +1 @@\n-same\n+moved\n"
+        f"--- {overlay_dir / 'gone.txt'}\n+++ /dev/null\n@@ -1 +0,0 @@\n-bye\n"
+    )
+    assert apply_patch(patch)["success"] is True
+
+    # Check The Overlay View And The Untouched Disk
+    assert file_exists(str(overlay_dir / "new.txt")) is True
+    assert file_exists(str(overlay_dir / "old.txt")) is False
+    assert read_file(str(overlay_dir / "renamed.txt"))["content"] == "moved\n"
+    assert sorted(os.listdir(overlay_dir)) == ["gone.txt", "old.txt"]
+
+    # With FileNotFoundError
+    with pytest.raises(FileNotFoundError):
+        # Read A File Staged For Deletion
+        read_file(str(overlay_dir / "gone.txt"))
+
+    # Commit The Overlay
+    commit_overlay()
+
+    # Check The Disk
+    assert sorted(os.listdir(overlay_dir)) == ["log.txt", "new.txt", "renamed.txt"]
+    assert (overlay_dir / "log.txt").read_text(encoding="utf-8") == "line\n"
+
+
+# Test Discarding The Overlay
+def test_overlay_discard(overlay_dir: Path) -> None:
+    """
+    Tests That Discarding The Overlay Drops Every Staged Change And Leaves The Disk Untouched
+    """
+
+    # Create A File On Disk
+    path = overlay_dir / "file.txt"
+    path.write_text("original", encoding="utf-8")
+
+    # Stage A Write And A Creation
+    write_file(str(path), "changed")
+    write_file(str(overlay_dir / "new.txt"), "new")
+
+    # Discard The Overlay
+    assert discard_overlay() == [str(path), str(overlay_dir / "new.txt")]
+
+    # Check The Disk And The Overlay View
+    assert read_file(str(path), force=True)["content"] == "original"
+    assert os.listdir(overlay_dir) == ["file.txt"]
+    assert commit_overlay() == []
+
+
+# Test Commit Skips Files That Did Not Change
+def test_overlay_commit_skips_unchanged(overlay_dir: Path) -> None:
+    """
+    Tests That Committing Skips Staged Text Equal To The Disk And Deletions Of Missing Files
+    """
+
+    # Create A File On Disk With A Fixed Modification Time
+    path = overlay_dir / "file.txt"
+    path.write_text("same", encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    # Stage A Change, Then Change It Back, And Delete A Missing File
+    overlay_write_text(path, "other", encoding="utf-8")
+    assert overlay_has_text(path, "other", "utf-8") is True
+    overlay_write_text(path, "same", encoding="utf-8")
+    overlay_unlink(overlay_dir / "missing.txt")
+
+    # Commit The Overlay
+    assert commit_overlay() == []
+
+    # Check The File Kept Its Modification Time
+    assert path.stat().st_mtime_ns == 1_000_000_000
+
+
+# Test Encoding Errors Surface When Staging
+def test_overlay_encode_error(overlay_dir: Path) -> None:
+    """
+    Tests That Content Which Cannot Be Encoded Fails When Staged Rather Than At Commit
+    """
+
+    # With ValueError
+    with pytest.raises(ValueError, match="Failed To Encode Content"):
+        # Write Content That Cannot Be Encoded
+        write_file(str(overlay_dir / "file.txt"), "naïve", encoding="ascii")
+
+    # Assert Nothing Was Staged
+    assert staged_paths() == []
+
+
+# Test Staging From Parallel Tool Calls
+def test_overlay_concurrent_staging(overlay_dir: Path) -> None:
+    """
+    Tests That Paths Can Be Staged From Many Threads While Others Scan The Staged Paths
+    """
+
+    # Define A Call Staging Many Files
+    def stage(worker: int) -> None:
+        for index in range(200):
+            overlay_write_text(overlay_dir / f"{worker}-{index}.txt", "x", encoding="utf-8")
+
+    # Stage From Several Threads While Scanning The Staged Paths
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(stage, worker) for worker in range(4)]
+        while not all(future.done() for future in futures):
+            has_staged_within(overlay_dir / "missing")
+            staged_paths()
+
+        # Assert No Call Failed
+        for future in futures:
+            future.result()
+
+    # Assert Every File Was Staged
+    assert len(staged_paths()) == 800
+
+
+# Test Commit Keeps Entries Staged Again Meanwhile
+def test_overlay_commit_concurrent_change(overlay_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That Committing Keeps Text Staged Again During The Commit And Skips Paths Unstaged Meanwhile
+    """
+
+    # Stage Two Files
+    first = overlay_dir / "a.txt"
+    second = overlay_dir / "b.txt"
+    overlay_write_text(first, "old", encoding="utf-8")
+    overlay_write_text(second, "b", encoding="utf-8")
+
+    # Restage The First File And Unstage The Second While The First Is Flushed
+    write = overlay.atomic_write_text
+
+    def write_and_restage(path: Path, content: str, *, encoding: str) -> None:
+        write(path, content, encoding=encoding)
+        overlay_write_text(first, "new", encoding="utf-8")
+        unstage(second)
+
+    monkeypatch.setattr(overlay, "atomic_write_text", write_and_restage)
+
+    # Commit The Overlay
+    assert commit_overlay() == [str(first)]
+
+    # Assert The Newer Text Is Still Staged And The Unstaged File Was Not Written
+    assert first.read_text(encoding="utf-8") == "old"
+    assert get_staged_text(first) == "new"
+    assert not second.exists()
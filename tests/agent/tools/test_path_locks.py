@@ -0,0 +1,122 @@
+# Standard Library Imports
+import importlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Local Imports
+from zenith.agent.tools.apply_edits import apply_edits
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.write_file import write_file
+
+# The Module Under Test, Reached For Its Held Paths
+path_locks_module = importlib.import_module("zenith.agent.tools.path_locks")
+
+
+# Test For lock_paths Function
+def test_lock_paths() -> None:
+    """
+    Tests That lock_paths Holds Each Distinct Path Only While Inside The Block
+    """
+
+    # Get Two Paths
+    first: Path = Path("/tmp/zenith-lock-first").resolve()
+    second: Path = Path("/tmp/zenith-lock-second").resolve()
+
+    # With The Locks Of Both Paths, One Given Twice
+    with lock_paths(second, first, second):
+        # Assert Both Paths Are Held
+        assert path_locks_module._held_paths == {first, second}
+
+        # Assert Another Thread Is Kept Out Of The First Path
+        assert not _try_lock(first)
+
+    # Assert Both Paths Were Released
+    assert path_locks_module._held_paths == set()
+
+
+# Test For Directory Locks Covering Their Descendants
+def test_lock_paths_directory() -> None:
+    """
+    Tests That A Locked Directory Keeps Out Calls On Paths Inside It And Calls On Its Ancestors
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Directory
+        directory: Path = Path(temp_dir).resolve() / "src"
+        directory.mkdir()
+
+        # With The Directory Locked, As move_path Does
+        with lock_paths(directory):
+            # Assert Its Descendants And Ancestors Cannot Be Locked, But Its Siblings Can
+            assert not _try_lock(directory / "pkg" / "a.py")
+            assert not _try_lock(directory.parent)
+            assert _try_lock(directory.parent / "srcfile.txt")
+
+            # Write A File Inside The Directory From Another Thread
+            thread = threading.Thread(target=write_file, args=(str(directory / "a.py"), "a"))
+            thread.start()
+            thread.join(timeout=0.1)
+
+            # Assert The Write Waits For The Directory
+            assert thread.is_alive()
+            assert not (directory / "a.py").exists()
+
+        # Assert The Write Runs Once The Directory Is Released
+        thread.join()
+        assert (directory / "a.py").read_text(encoding="utf-8") == "a"
+
+
+# Helper Function To Try Locking A Path
+def _try_lock(path: Path) -> bool:
+    """
+    Tries To Lock A Path From A Separate Thread Without Waiting
+
+    Args:
+        path (Path): The Path To Lock
+
+    Returns:
+        bool: True If The Path Could Be Locked Within 50 Milliseconds
+    """
+
+    # Initialize Whether The Path Was Locked
+    acquired: list[bool] = []
+
+    # Define A Call Locking The Path
+    def lock() -> None:
+        with lock_paths(path):
+            acquired.append(True)
+
+    # Run The Call In A Daemon Thread
+    thread = threading.Thread(target=lock, daemon=True)
+    thread.start()
+    thread.join(timeout=0.05)
+
+    # Return Whether It Got The Path
+    return acquired == [True]
+
+
+# Test For Parallel Edits Of One File
+def test_parallel_edits_are_serialized() -> None:
+    """
+    Tests That Parallel Read-Modify-Write Edits Of One File Never Lose An Update
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file: Path = Path(temp_dir) / "counter.txt"
+        test_file.write_text("\n", encoding="utf-8")
+
+        # With A Thread Pool
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Prepend One Character Per Call, In Parallel
+            results = list(
+                executor.map(lambda _: apply_edits(str(test_file), [{"old": "\n", "new": "a\n"}]), range(32)),
+            )
+
+        # Assert Every Edit Was Applied And Kept
+        assert all(result["success"] for result in results)
+        assert test_file.read_text(encoding="utf-8") == "a" * 32 + "\n"
@@ -0,0 +1,457 @@
+# Standard Library Imports
+import importlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.preview_data import preview_data
+from zenith.agent.tools.write_file import write_file
+
+# The Preview Data Module (Shadowed By The Function In The Package Namespace)
+preview_data_module = importlib.import_module("zenith.agent.tools.preview_data")
+
+
+# Test Preview Of A CSV File
+def test_preview_data_csv() -> None:
+    """
+    Tests The Preview Data Function With A CSV File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.csv")
+
+        # Write The Test File Content
+        with open(test_file, "w", encoding="utf-8", newline="") as f:
+            f.write("id,price,name,active,note\n1,1.5,alpha,true,\n2,3,beta,false,x\n3,4.25,gamma,TRUE,y\n")
+
+        # Preview The File
+        result = preview_data(test_file, sample_rows=2)
+
+        # Check The Result
+        assert result["success"] is True
+        assert result["path"] == str(Path(test_file).resolve())
+        assert result["format"] == "csv"
+        assert result["row_count"] == 3
+        assert result["row_count_estimated"] is False
+        assert result["sampled_rows"] == 3
+        assert result["sample_rows"] == [
+            {"id": "1", "price": "1.5", "name": "alpha", "active": "true", "note": ""},
+            {"id": "2", "price": "3", "name": "beta", "active": "false", "note": "x"},
+        ]
+        assert result["columns"] == [
+            {"name": "id", "type": "integer", "nullable": False},
+            {"name": "price", "type": "float", "nullable": False},
+            {"name": "name", "type": "string", "nullable": False},
+            {"name": "active", "type": "boolean", "nullable": False},
+            {"name": "note", "type": "string", "nullable": True},
+        ]
+
+
+# Test Preview Of A TSV File Without A Trailing Newline
+def test_preview_data_tsv() -> None:
+    """
+    Tests The Preview Data Function With A TSV File Without A Trailing Newline
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.tsv")
+
+        # Write The Test File Content
+        with open(test_file, "w", encoding="utf-8", newline="") as f:
+            f.write("a\tb\n1\tx\n2\t3")
+
+        # Preview The File
+        result = preview_data(test_file)
+
+        # Check The Result
+        assert result["format"] == "tsv"
+        assert result["row_count"] == 2
+        assert result["columns"] == [
+            {"name": "a", "type": "integer", "nullable": False},
+            {"name": "b", "type": "mixed", "nullable": False},
+        ]
+
+
+# Test Preview Of A JSONL File
+def test_preview_data_jsonl() -> None:
+    """
+    Tests The Preview Data Function With A JSONL File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.jsonl")
+
+        # Define The Records
+        records = [
+            {"id": 1, "tags": ["a"], "meta": {"k": 1}, "score": 1},
+            {"id": 2, "tags": [], "score": 2.5, "extra": None},
+            {"id": 3, "tags": ["b"], "meta": None, "score": 3, "flag": True},
+        ]
+
+        # Write The Test File Content
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(json.dumps(record) for record in records) + "\n\n")
+
+        # Preview The File
+        result = preview_data(test_file)
+
+        # Check The Result
+        assert result["format"] == "jsonl"
+        assert result["row_count"] == 4
+        assert result["sampled_rows"] == 3
+        assert result["sample_rows"] == records
+        assert result["columns"] == [
+            {"name": "id", "type": "integer", "nullable": False},
+            {"name": "tags", "type": "array", "nullable": False},
+            {"name": "meta", "type": "object", "nullable": True},
+            {"name": "score", "type": "float", "nullable": False},
+            {"name": "extra", "type": "null", "nullable": True},
+            {"name": "flag", "type": "boolean", "nullable": True},
+        ]
+
+
+# Test Preview Of A JSON Array File
+def test_preview_data_json_array() -> None:
+    """
+    Tests The Preview Data Function With A JSON Array Of Scalars
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.json")
+
+        # Write The Test File Content
+        Path(test_file).write_text(json.dumps(["x" * 250, "short", 1]), encoding="utf-8")
+
+        # Preview The File
+        result = preview_data(test_file, sample_rows=1)
+
+        # Check The Result
+        assert result["format"] == "json"
+        assert result["row_count"] == 3
+        assert result["row_count_estimated"] is False
+        assert result["columns"] == [{"name": "value", "type": "mixed", "nullable": False}]
+        assert result["sample_rows"] == ["x" * 200 + "… [50 More Chars]"]
+
+
+# Test Preview Of A JSON Object File
+def test_preview_data_json_object() -> None:
+    """
+    Tests The Preview Data Function With A Single JSON Object And An Explicit Format
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.txt")
+
+        # Write The Test File Content
+        Path(test_file).write_text(json.dumps({"name": "zenith", "version": 1}), encoding="utf-8")
+
+        # Preview The File With An Explicit Format
+        result = preview_data(test_file, file_format="JSON")
+
+        # Check The Result
+        assert result["row_count"] == 1
+        assert result["sample_rows"] == [{"name": "zenith", "version": 1}]
+
+
+# Test Preview Of A Large JSON Array Reading Only A Prefix
+def test_preview_data_json_prefix() -> None:
+    """
+    Tests That A JSON Array Larger Than The Sample Is Parsed From Its Prefix With An Estimated Count
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.json")
+
+        # Write 100 Records Of Equal Size
+        Path(test_file).write_text(
+            " [" + ", ".join(json.dumps({"id": i % 10, "v": "é"}) for i in range(100)) + "]",
+            encoding="utf-8",
+        )
+
+        # Preview Only The First 200 Bytes
+        result = preview_data(test_file, max_sample_bytes=200)
+
+        # Check The Result
+        assert result["row_count_estimated"] is True
+        assert 0 < result["sampled_rows"] < 100
+        assert 80 <= result["row_count"] <= 120
+        assert result["columns"][0] == {"name": "id", "type": "integer", "nullable": False}
+
+
+# Test Preview Of A Large Non-Array JSON File
+def test_preview_data_json_prefix_not_array() -> None:
+    """
+    Tests That A Truncated JSON Document That Is Not An Array Cannot Be Previewed
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.json")
+
+        # Write A Large Object
+        Path(test_file).write_text(json.dumps({"k": "v" * 500}), encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Preview Only The First 100 Bytes
+            preview_data(test_file, max_sample_bytes=100)
+
+        # Check The Error Message
+        assert "Not An Array" in str(excinfo.value)
+
+
+# Test Preview Of A Large CSV File With A Cut Prefix
+def test_preview_data_csv_prefix() -> None:
+    """
+    Tests That A CSV File Larger Than The Sample Drops The Partial Last Line
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.csv")
+
+        # Write Many Rows
+        Path(test_file).write_text("n\n" + "".join(f"{i}\n" for i in range(1000)), encoding="utf-8")
+
+        # Preview Only The First 21 Bytes
+        result = preview_data(test_file, max_sample_bytes=21)
+
+        # Check The Result
+        assert result["row_count"] == 1000
+        assert result["row_count_estimated"] is False
+        assert result["sample_rows"] == [{"n": str(i)} for i in range(5)]
+        assert result["sampled_rows"] == 9
+
+
+# Test Preview Of Rows Holding Line Separators Other Than Newlines
+def test_preview_data_unicode_line_separators() -> None:
+    """
+    Tests That Rows Are Split At Newlines Only, And A Prefix Ending At A Newline Keeps Its Last Row
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Write A JSONL File And A CSV File With Raw Line Separators Inside Values
+        jsonl_file = Path(temp_dir) / "data.jsonl"
+        jsonl_file.write_text('{"text": "a\u2028b\u0085c"}\n{"text": "d"}\n', encoding="utf-8")
+        csv_file = Path(temp_dir) / "data.csv"
+        csv_file.write_text("n,text\n1,a\u2028b\x0cc\n2,d\n", encoding="utf-8")
+
+        # Assert The Values Are Kept Whole
+        assert preview_data(str(jsonl_file))["sample_rows"] == [{"text": "a\u2028b\u0085c"}, {"text": "d"}]
+        assert preview_data(str(csv_file))["sample_rows"] == [{"n": "1", "text": "a\u2028b\x0cc"}, {"n": "2", "text": "d"}]
+
+        # Write Many Rows And Preview A Prefix Ending Exactly At A Newline
+        many_file = Path(temp_dir) / "many.csv"
+        many_file.write_text("n\n" + "".join(f"{i}\n" for i in range(1000)), encoding="utf-8")
+
+        # Assert The Last Row Of The Prefix Is Kept
+        assert preview_data(str(many_file), max_sample_bytes=20)["sampled_rows"] == 9
+
+
+# Test Preview Of A File Too Large For An Exact Row Count
+def test_preview_data_estimated_row_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That Files Above The Exact Count Limit Get An Estimated Row Count
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest MonkeyPatch Fixture
+    """
+
+    # Lower The Exact Count Limit
+    monkeypatch.setattr(preview_data_module, "_MAX_EXACT_COUNT_BYTES", 10)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "data.jsonl")
+
+        # Write 100 Lines Of Equal Size
+        Path(test_file).write_text("".join('{"n": 1}\n' for _ in range(100)), encoding="utf-8")
+
+        # Preview Only The First 90 Bytes, Exactly 10 Lines
+        result = preview_data(test_file, max_sample_bytes=90)
+
+        # Check The Result
+        assert result["row_count"] == 100
+        assert result["row_count_estimated"] is True
+        assert result["sampled_rows"] == 10
+
+
+# Test Preview Of Empty And Row-Limited Files
+def test_preview_data_empty_and_row_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests Empty Files And The Maximum Number Of Inference Rows
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest MonkeyPatch Fixture
+    """
+
+    # Lower The Inference Row Limit
+    monkeypatch.setattr(preview_data_module, "_MAX_INFERENCE_ROWS", 2)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create An Empty CSV File
+        empty_file = os.path.join(temp_dir, "empty.csv")
+        Path(empty_file).touch()
+
+        # Preview The Empty File
+        result = preview_data(empty_file)
+
+        # Check The Result
+        assert result["row_count"] == 0
+        assert result["columns"] == []
+        assert result["sample_rows"] == []
+
+        # Create A CSV File With More Rows Than The Limit
+        rows_file = os.path.join(temp_dir, "rows.csv")
+        Path(rows_file).write_text("a\n1\n2\n3\n", encoding="utf-8")
+
+        # Check Only The Limited Number Of Rows Was Parsed
+        assert preview_data(rows_file)["sampled_rows"] == 2
+
+
+# Test Preview Error Cases
+def test_preview_data_errors() -> None:
+    """
+    Tests The Preview Data Function With Missing Files, Directories And Unsupported Formats
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # With FileNotFoundError
+        with pytest.raises(FileNotFoundError) as excinfo:
+            # Preview A Missing File
+            preview_data(os.path.join(temp_dir, "missing.csv"))
+
+        # Check The Error Message
+        assert "File Not Found" in str(excinfo.value)
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Preview A Directory
+            preview_data(temp_dir)
+
+        # Check The Error Message
+        assert "Path Is Not A File" in str(excinfo.value)
+
+        # Create A Text File
+        text_file = os.path.join(temp_dir, "notes.txt")
+        Path(text_file).write_text("hello", encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Preview A File With An Unsupported Extension
+            preview_data(text_file)
+
+        # Check The Error Message
+        assert "Unsupported Data Format" in str(excinfo.value)
+
+
+# Test Preview With Read And Parse Errors
+def test_preview_data_read_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests The Preview Data Function With Decoding, Parsing And Permission Errors
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest MonkeyPatch Fixture
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File That Is Not Valid UTF-8
+        binary_file = os.path.join(temp_dir, "binary.csv")
+        Path(binary_file).write_bytes(b"a\n\xff\xfe\n")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Preview The Binary File
+            preview_data(binary_file)
+
+        # Check The Error Message
+        assert "Failed To Decode File" in str(excinfo.value)
+
+        # Create An Invalid JSONL File
+        invalid_file = os.path.join(temp_dir, "invalid.jsonl")
+        Path(invalid_file).write_text("{not json}\n", encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Preview The Invalid File
+            preview_data(invalid_file)
+
+        # Check The Error Message
+        assert "Failed To Preview Data File" in str(excinfo.value)
+
+        # Define A Mock open Function That Raises PermissionError
+        def mock_open(*args: object, **kwargs: object) -> None:
+            """
+            Mock open Function That Raises PermissionError
+            """
+
+            # Raise The PermissionError
+            raise PermissionError("Permission denied")
+
+        # Patch Path.open
+        monkeypatch.setattr(Path, "open", mock_open)
+
+        # With PermissionError
+        with pytest.raises(PermissionError) as excinfo:
+            # Preview The File
+            preview_data(invalid_file)
+
+        # Check The Error Message
+        assert "Permission Denied" in str(excinfo.value)
+
+
+# Test Previewing A Staged File
+def test_preview_data_with_overlay() -> None:
+    """
+    Tests That A File Staged In The Overlay Is Previewed As It Will Be Once The Turn Ends
+    """
+
+    # Enable The Overlay
+    set_overlay_enabled(enabled=True)
+
+    try:
+        # With Temporary Directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Stage A CSV File That Does Not Exist On Disk Yet
+            file_path = os.path.join(temp_dir, "staged.csv")
+            write_file(file_path, "id,name\n1,a\n2,b\n")
+
+            # Preview The Staged File
+            result = preview_data(file_path)
+
+            # Check The Preview
+            assert not Path(file_path).exists()
+            assert result["row_count"] == 2
+            assert result["size"] == 16
+            assert result["sample_rows"] == [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
+
+    finally:
+        # Discard Leftovers And Disable The Overlay
+        discard_overlay()
+        set_overlay_enabled(enabled=False)
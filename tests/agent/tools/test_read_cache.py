@@ -0,0 +1,144 @@
+# Local Imports
+from zenith.agent.tools.read_cache import MAX_TURN_AGE
+from zenith.agent.tools.read_cache import clear_read_cache
+from zenith.agent.tools.read_cache import forget_output_reads
+from zenith.agent.tools.read_cache import lookup_unchanged_read
+from zenith.agent.tools.read_cache import record_read
+from zenith.agent.tools.turn_tracker import begin_turn
+from zenith.agent.tools.turn_tracker import reset_turns
+
+
+# Test Lookup Without A Previous Read
+def test_lookup_unchanged_read_unknown_path() -> None:
+    """
+    Tests That A Path That Was Never Read Must Be Read
+    """
+
+    # Reset The Session State
+    reset_turns()
+    clear_read_cache()
+
+    # Assert No Previous Read Is Found
+    assert lookup_unchanged_read("/tmp/unknown.txt", "hash", (None, None)) is None
+
+
+# Test Lookup After A Read In The Same Turn
+def test_lookup_unchanged_read_same_turn() -> None:
+    """
+    Tests That An Unchanged Selection Read In The Same Turn Is Found
+    """
+
+    # Reset The Session State
+    reset_turns()
+    clear_read_cache()
+
+    # Begin A Turn And Record A Read
+    begin_turn()
+    record_read("/tmp/file.txt", "hash", (None, None))
+
+    # Assert The Previous Read Is Found
+    assert lookup_unchanged_read("/tmp/file.txt", "hash", (None, None)) == 1
+
+    # Assert A Different Selection Must Be Read
+    assert lookup_unchanged_read("/tmp/file.txt", "hash", (1, 5)) is None
+
+
+# Test Lookup After The File Changed
+def test_lookup_unchanged_read_changed_content() -> None:
+    """
+    Tests That A Changed File Must Be Read Again And Resets Its Selections
+    """
+
+    # Reset The Session State
+    reset_turns()
+    clear_read_cache()
+
+    # Record Two Selections Of The Original Content
+    record_read("/tmp/file.txt", "old", (None, None))
+    record_read("/tmp/file.txt", "old", (1, 2))
+
+    # Assert The Changed Content Must Be Read
+    assert lookup_unchanged_read("/tmp/file.txt", "new", (None, None)) is None
+
+    # Record A Read Of The New Content
+    record_read("/tmp/file.txt", "new", (None, None))
+
+    # Assert Old Selections Were Discarded
+    assert lookup_unchanged_read("/tmp/file.txt", "new", (1, 2)) is None
+    assert lookup_unchanged_read("/tmp/file.txt", "new", (None, None)) == 0
+
+
+# Test Lookup After The Read Aged Out Of The Context
+def test_lookup_unchanged_read_aged_out() -> None:
+    """
+    Tests That A Read Older Than MAX_TURN_AGE Turns Must Be Read Again
+    """
+
+    # Reset The Session State
+    reset_turns()
+    clear_read_cache()
+
+    # Record A Read In The First Turn
+    begin_turn()
+    record_read("/tmp/file.txt", "hash", (None, None))
+
+    # Advance Up To The Maximum Age
+    for _ in range(MAX_TURN_AGE):
+        # Begin The Next Turn
+        begin_turn()
+
+    # Assert The Read Is Still Considered In Context
+    assert lookup_unchanged_read("/tmp/file.txt", "hash", (None, None)) == 1
+
+    # Advance One More Turn
+    begin_turn()
+
+    # Assert The Read Has Aged Out
+    assert lookup_unchanged_read("/tmp/file.txt", "hash", (None, None)) is None
+
+
+# Test Clearing The Read Cache
+def test_clear_read_cache() -> None:
+    """
+    Tests The clear_read_cache Function
+    """
+
+    # Reset The Session State
+    reset_turns()
+    clear_read_cache()
+
+    # Record A Read
+    record_read("/tmp/file.txt", "hash", (None, None))
+
+    # Clear The Read Cache
+    clear_read_cache()
+
+    # Assert The Read Was Forgotten
+    assert lookup_unchanged_read("/tmp/file.txt", "hash", (None, None)) is None
+
+
+# Test Forgetting The Reads Of A Tool Output
+def test_forget_output_reads() -> None:
+    """
+    Tests That Reads Returned In An Output Are Forgotten, While Other Reads And Unparsable Outputs Are Ignored
+    """
+
+    # Reset The Session State
+    reset_turns()
+    clear_read_cache()
+
+    # Record Reads Of Three Files
+    for path in ("/tmp/a.txt", "/tmp/b.txt", "/tmp/c.txt"):
+        record_read(path, "hash", (None, None))
+
+    # Forget The Reads Of A read_file Output And A Wrapped read_multiple_files Output
+    forget_output_reads(str({"path": "/tmp/a.txt", "content": "a", "hash": "hash"}))
+    forget_output_reads(str({"results": [{"path": "/tmp/b.txt", "content": "b", "hash": "hash"}, {"path": "/x"}]}))
+
+    # Forget The Reads Of An Error Output
+    forget_output_reads("Error: File Not Found: /tmp/c.txt")
+
+    # Assert Only The Returned Reads Were Forgotten
+    assert lookup_unchanged_read("/tmp/a.txt", "hash", (None, None)) is None
+    assert lookup_unchanged_read("/tmp/b.txt", "hash", (None, None)) is None
+    assert lookup_unchanged_read("/tmp/c.txt", "hash", (None, None)) == 0
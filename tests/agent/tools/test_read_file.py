@@ -7,8 +7,11 @@ from pathlib import Path
 import pytest
 
 # Local Imports
+from zenith.agent.tools.read_cache import clear_read_cache
 from zenith.agent.tools.read_file import file_exists
 from zenith.agent.tools.read_file import read_file
+from zenith.agent.tools.turn_tracker import begin_turn
+from zenith.agent.tools.turn_tracker import reset_turns
 from zenith.utils.format_file_size import format_size
 
 
@@ -375,3 +378,65 @@ def test_file_exists() -> None:
 
         # Check That The Directory Is Not Considered A File
         assert file_exists(temp_dir) is False
+
+
+# Test Read File Returns A Stub For An Unchanged Re-Read
+def test_read_file_unchanged_stub() -> None:
+    """
+    Tests That Re-Reading An Unchanged File Returns A Short Stub Unless Forced
+    """
+
+    # Reset The Session State
+    reset_turns()
+    clear_read_cache()
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = os.path.join(temp_dir, "test_file.txt")
+
+        # With Test File
+        with open(test_file, "w", encoding="utf-8") as f:
+            # Write The Test File Content
+            f.write("Line 1\nLine 2\nLine 3")
+
+        # Read The File In The First Turn
+        begin_turn()
+        first = read_file(test_file)
+
+        # Read The File Again
+        second = read_file(test_file)
+
+        # Check The Stub
+        assert second["success"] is True
+        assert second["unchanged"] is True
+        assert second["hash"] == first["hash"]
+        assert "Unchanged Since Turn 1" in second["content"]
+        assert first["hash"][:12] in second["content"]
+
+        # Force A Re-Read
+        forced = read_file(test_file, force=True)
+
+        # Check The Full Content Is Returned
+        assert forced["content"] == "Line 1\nLine 2\nLine 3"
+        assert "unchanged" not in forced
+
+        # Read A Line Range For The First Time
+        ranged = read_file(test_file, start_line=2, end_line=3)
+
+        # Check The Range Is Returned And Hashes The Full File
+        assert ranged["content"] == "Line 2\nLine 3"
+        assert ranged["hash"] == first["hash"]
+
+        # Read The Same Line Range Again
+        assert read_file(test_file, start_line=2, end_line=3)["unchanged"] is True
+
+        # Modify The File
+        with open(test_file, "a", encoding="utf-8") as f:
+            # Append New Content
+            f.write("\nLine 4")
+
+        # Check The Changed File Is Read Again
+        changed = read_file(test_file)
+        assert changed["content"] == "Line 1\nLine 2\nLine 3\nLine 4"
+        assert changed["hash"] != first["hash"]
@@ -4,6 +4,7 @@ import tempfile
 from pathlib import Path
 
 # Local Imports
+from zenith.agent.tools.read_cache import clear_read_cache
 from zenith.agent.tools.read_multiple_files import read_multiple_files
 
 
@@ -126,3 +127,35 @@ def test_read_multiple_files_empty_list() -> None:
 
     # Assertions
     assert len(results) == 0
+
+
+# Test Read Multiple Files With Force
+def test_read_multiple_files_force() -> None:
+    """
+    Tests That The Read Multiple Files Function Passes force Through To read_file
+    """
+
+    # Reset The Read Cache
+    clear_read_cache()
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        file_1 = os.path.join(temp_dir, "file_1.txt")
+
+        # Write Content To File 1
+        with open(file_1, "w", encoding="utf-8") as f:
+            f.write("Content 1")
+
+        # Read The File Twice
+        read_multiple_files([file_1])
+        stub = read_multiple_files([file_1])
+
+        # Assert The Second Read Returned A Stub
+        assert stub[0]["unchanged"] is True
+
+        # Read The File Again With Force
+        forced = read_multiple_files([file_1], force=True)
+
+        # Assert The Content Was Returned
+        assert forced[0]["content"] == "Content 1"
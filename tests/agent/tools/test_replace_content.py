@@ -1,4 +1,5 @@
 # Standard Library Imports
+import importlib
 import os
 import tempfile
 from pathlib import Path
@@ -8,8 +9,12 @@ from typing import Any
 import pytest
 
 # Local Imports
+from zenith.agent.tools.read_file import read_file
 from zenith.agent.tools.replace_content import replace_content
 
+# The Module Under Test, Shadowed In The Package By The Function Of The Same Name
+replace_content_module = importlib.import_module("zenith.agent.tools.replace_content")
+
 
 # Test Replace Content Function
 def test_replace_content() -> None:
@@ -189,8 +194,8 @@ def test_replace_content_permission_error_write(monkeypatch: pytest.MonkeyPatch)
         # Raise The PermissionError
         raise PermissionError("Permission denied")
 
-    # Patch Path.write_text
-    monkeypatch.setattr(Path, "write_text", mock_write_text)
+    # Patch overlay_write_text
+    monkeypatch.setattr(replace_content_module, "overlay_write_text", mock_write_text)
 
     # With Temporary Directory
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -261,8 +266,8 @@ def test_replace_content_encoding_error_write(monkeypatch: pytest.MonkeyPatch) -
         # Raise The UnicodeEncodeError
         raise UnicodeEncodeError("utf-8", "test", 0, 1, "Invalid character")
 
-    # Patch Path.write_text
-    monkeypatch.setattr(Path, "write_text", mock_write_text)
+    # Patch overlay_write_text
+    monkeypatch.setattr(replace_content_module, "overlay_write_text", mock_write_text)
 
     # With Temporary Directory
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -334,8 +339,8 @@ def test_replace_content_generic_exception_write(monkeypatch: pytest.MonkeyPatch
         # Raise The Generic Exception
         raise RuntimeError("Generic error")
 
-    # Patch Path.write_text
-    monkeypatch.setattr(Path, "write_text", mock_write_text)
+    # Patch overlay_write_text
+    monkeypatch.setattr(replace_content_module, "overlay_write_text", mock_write_text)
 
     # With Temporary Directory
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -355,3 +360,297 @@ def test_replace_content_generic_exception_write(monkeypatch: pytest.MonkeyPatch
         # Check The Error Message
         assert "Failed To Replace Content In File" in str(excinfo.value)
         assert "Generic error" in str(excinfo.value)
+
+
+# Test Replace Content Streaming Large Files
+@pytest.mark.parametrize(
+    ("content", "old", "new", "expected"),
+    [
+        ("abcdefghij" * 3, "ghijab", "XY", "abcdefXYcdefghijabcdefghij"),
+        ("abcdefghij" * 3, "j", "", "abcdefghiabcdefghijabcdefghij"),
+        ("aaaabbbb\nline2\n", "bbbb\nli", "-", "aaaa-ne2\n"),
+    ],
+)
+def test_replace_content_streaming(
+    monkeypatch: pytest.MonkeyPatch,
+    content: str,
+    old: str,
+    new: str,
+    expected: str,
+) -> None:
+    """
+    Tests That Files Above The Threshold Are Streamed, Including Matches Spanning Chunk Boundaries
+    """
+
+    # Force Streaming With Tiny Chunks
+    monkeypatch.setattr(replace_content_module, "STREAMING_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(replace_content_module, "_STREAM_CHUNK_CHARS", 4)
+
+    # Define A Mock read_text Function That Fails If The File Is Loaded Whole
+    def mock_read_text(*args: object, **kwargs: object) -> str:
+        """
+        Mock read_text Function That Fails The Test
+        """
+
+        # Fail The Test
+        raise AssertionError("The File Must Be Streamed")
+
+    # Patch Path.read_text
+    monkeypatch.setattr(Path, "read_text", mock_read_text)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "large.txt")
+        Path(test_file).write_text(content, encoding="utf-8")
+        os.chmod(test_file, 0o640)
+
+        # Replace Content
+        result = replace_content(test_file, old, new)
+
+        # Check The Result
+        assert result["success"] is True
+        assert result["size"] == len(expected.encode("utf-8"))
+        assert Path(test_file).read_bytes().decode("utf-8") == expected
+        assert os.stat(test_file).st_mode & 0o777 == 0o640
+        assert os.listdir(temp_dir) == ["large.txt"]
+
+
+# Test Replace Content Streaming When The Old Content Is Missing
+def test_replace_content_streaming_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That A Streamed File Is Left Untouched When The Old Content Is Not Found
+    """
+
+    # Force Streaming With Tiny Chunks
+    monkeypatch.setattr(replace_content_module, "STREAMING_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(replace_content_module, "_STREAM_CHUNK_CHARS", 4)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "large.txt")
+        Path(test_file).write_text("abcdefghij", encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Call Replace Content
+            replace_content(test_file, "xyz", "new")
+
+        # Check The Error And That The File Was Not Modified
+        assert "Old Content Not Found" in str(excinfo.value)
+        assert Path(test_file).read_text(encoding="utf-8") == "abcdefghij"
+        assert os.listdir(temp_dir) == ["large.txt"]
+
+
+# Test Replace Content Modes And Counts
+@pytest.mark.parametrize(
+    ("options", "expected", "replacements"),
+    [
+        ({"count": 0}, "b-b-b", 3),
+        ({"count": 2}, "b-b-a", 2),
+        ({"count": 0, "expected_occurrences": 3}, "b-b-b", 3),
+        ({"mode": "regex", "count": 0}, "b-b-b", 3),
+        ({"mode": "regex", "count": 1, "expected_occurrences": 3}, "b-a-a", 1),
+    ],
+)
+def test_replace_content_modes(options: dict[str, Any], expected: str, replacements: int) -> None:
+    """
+    Tests Literal And Regex Modes With Counts And Occurrence Guards
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a-a-a", encoding="utf-8")
+
+        # Replace Content
+        result = replace_content(test_file, "a", "b", **options)
+
+        # Check The Result
+        assert result["replacements"] == replacements
+        assert result["mode"] == options.get("mode", "literal")
+        assert Path(test_file).read_text(encoding="utf-8") == expected
+
+
+# Test Replace Content With Regex Group References
+def test_replace_content_regex_groups() -> None:
+    """
+    Tests That Regex Mode Supports Group References In The Replacement
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.py")
+        Path(test_file).write_text("old_name(1)\nold_name(2)\n", encoding="utf-8")
+
+        # Replace Content
+        result = replace_content(test_file, r"old_name\((\d)\)", r"new_name(\1, x)", mode="regex", count=0)
+
+        # Check The Result
+        assert result["replacements"] == 2
+        assert Path(test_file).read_text(encoding="utf-8") == "new_name(1, x)\nnew_name(2, x)\n"
+
+
+# Test Replace Content With Invalid Options
+@pytest.mark.parametrize(
+    ("old", "options", "message"),
+    [
+        ("", {}, "Old Content Must Not Be Empty"),
+        ("a", {"mode": "glob"}, "Unsupported Replace Mode"),
+        ("a", {"count": -1}, "Count Must Not Be Negative"),
+        ("(", {"mode": "regex"}, "Invalid Regular Expression"),
+        ("a", {"count": 0, "expected_occurrences": 2}, "Expected 2 Occurrences But Found 3"),
+        ("z", {"mode": "regex"}, "Old Content Not Found"),
+    ],
+)
+def test_replace_content_invalid_options(old: str, options: dict[str, Any], message: str) -> None:
+    """
+    Tests That Invalid Options And Failed Guards Raise A ValueError Without Modifying The File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a-a-a", encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Call Replace Content
+            replace_content(test_file, old, "b", **options)
+
+        # Check The Error And That The File Was Not Modified
+        assert message in str(excinfo.value)
+        assert Path(test_file).read_text(encoding="utf-8") == "a-a-a"
+
+
+# Test Replace Content Streaming With Counts And Guards
+@pytest.mark.parametrize(
+    ("options", "expected", "replacements"),
+    [
+        ({"count": 0}, "XYcdeXYcdeXYcde", 3),
+        ({"count": 2, "expected_occurrences": 3}, "XYcdeXYcdeabcde", 2),
+    ],
+)
+def test_replace_content_streaming_counts(
+    monkeypatch: pytest.MonkeyPatch,
+    options: dict[str, Any],
+    expected: str,
+    replacements: int,
+) -> None:
+    """
+    Tests Streaming Replacements Of Several Occurrences With An Occurrence Guard
+    """
+
+    # Force Streaming With Tiny Chunks
+    monkeypatch.setattr(replace_content_module, "STREAMING_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(replace_content_module, "_STREAM_CHUNK_CHARS", 4)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "large.txt")
+        Path(test_file).write_text("abcde" * 3, encoding="utf-8")
+
+        # Replace Content
+        result = replace_content(test_file, "ab", "XY", **options)
+
+        # Check The Result
+        assert result["replacements"] == replacements
+        assert Path(test_file).read_text(encoding="utf-8") == expected
+
+
+# Test Replace Content Streaming With A Failed Guard
+def test_replace_content_streaming_guard(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That A Streamed File Is Left Untouched When The Occurrence Guard Fails
+    """
+
+    # Force Streaming With Tiny Chunks
+    monkeypatch.setattr(replace_content_module, "STREAMING_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(replace_content_module, "_STREAM_CHUNK_CHARS", 4)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = os.path.join(temp_dir, "large.txt")
+        Path(test_file).write_text("abcde" * 3, encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Call Replace Content
+            replace_content(test_file, "ab", "XY", count=0, expected_occurrences=4)
+
+        # Check The Error And That The File Was Not Modified
+        assert "Expected 4 Occurrences But Found 3" in str(excinfo.value)
+        assert Path(test_file).read_text(encoding="utf-8") == "abcde" * 3
+        assert os.listdir(temp_dir) == ["large.txt"]
+
+
+# Test Replace Content With An ETag Guard
+@pytest.mark.parametrize("streaming", [False, True])
+def test_replace_content_if_match(monkeypatch: pytest.MonkeyPatch, streaming: bool) -> None:
+    """
+    Tests That replace_content Honours if_match And Returns An ETag Matching A Fresh Read
+    """
+
+    # If The Streaming Path Is Tested
+    if streaming:
+        # Force Streaming
+        monkeypatch.setattr(replace_content_module, "STREAMING_THRESHOLD_BYTES", 0)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File And Read Its ETag
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("a b c", encoding="utf-8")
+        etag = read_file(test_file, force=True)["etag"]
+
+        # Replace With The Matching ETag
+        result = replace_content(test_file, "a", "x", if_match=etag)
+
+        # Assert The New ETag Matches A Fresh Read
+        assert result["etag"] == read_file(test_file, force=True)["etag"]
+
+        # With ValueError For A Stale ETag
+        with pytest.raises(ValueError) as excinfo:
+            # Replace With The Stale ETag
+            replace_content(test_file, "b", "y", if_match=etag)
+
+        # Check The Error And That The File Was Not Modified
+        assert "ETag Mismatch" in str(excinfo.value)
+        assert Path(test_file).read_text(encoding="utf-8") == "x b c"
+
+
+# Test Replace Content Skips Writes That Change Nothing
+@pytest.mark.parametrize("streaming", [False, True])
+def test_replace_content_unchanged(monkeypatch: pytest.MonkeyPatch, streaming: bool) -> None:
+    """
+    Tests That Replacing Content With Itself Keeps The Modification Time And Reports changed=False
+    """
+
+    # If The Streaming Path Is Tested
+    if streaming:
+        # Force Streaming With Tiny Chunks
+        monkeypatch.setattr(replace_content_module, "STREAMING_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr(replace_content_module, "_STREAM_CHUNK_CHARS", 4)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File With A Fixed Modification Time
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("alpha beta alpha", encoding="utf-8")
+        os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+
+        # Replace The Content With Itself
+        result = replace_content(test_file, "alpha", "alpha", count=0)
+
+        # Check The File Was Not Rewritten
+        assert result["changed"] is False
+        assert result["replacements"] == 2
+        assert result["etag"] == read_file(test_file, force=True)["etag"]
+        assert os.stat(test_file).st_mtime_ns == 1_000_000_000
+        assert os.listdir(temp_dir) == ["test_file.txt"]
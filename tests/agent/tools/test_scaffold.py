@@ -0,0 +1,184 @@
+# Standard Library Imports
+import importlib
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.scaffold import scaffold
+
+
+# Test Scaffold Creates A Nested Tree
+def test_scaffold_nested_tree() -> None:
+    """
+    Tests That Scaffold Creates Nested Directories And Files With A Status Per Path
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Scaffold A Package Into A Missing Root
+        root = Path(temp_dir).resolve() / "project"
+        result = scaffold(
+            {"pkg": {"__init__.py": "", "core": {"main.py": "print('hi')\n"}}, "README.md": "# Title\n"},
+            root=str(root),
+        )
+
+        # Check The Result
+        assert result["success"] is True
+        assert result["root"] == str(root)
+        assert result["created"] == 5
+        assert result["failed"] == 0
+        assert result["paths"] == [
+            {"path": "pkg", "type": "directory", "status": "created"},
+            {"path": "pkg/__init__.py", "type": "file", "status": "created"},
+            {"path": "pkg/core", "type": "directory", "status": "created"},
+            {"path": "pkg/core/main.py", "type": "file", "status": "created"},
+            {"path": "README.md", "type": "file", "status": "created"},
+        ]
+
+        # Check The Disk
+        assert (root / "pkg" / "core" / "main.py").read_text(encoding="utf-8") == "print('hi')\n"
+        assert (root / "README.md").read_text(encoding="utf-8") == "# Title\n"
+
+
+# Test Scaffold Keeps Or Overwrites Existing Entries
+def test_scaffold_existing_entries() -> None:
+    """
+    Tests That Existing Files Are Kept Unless overwrite Is True And Existing Directories Are Reused
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create An Existing Tree
+        root = Path(temp_dir).resolve()
+        (root / "src").mkdir()
+        (root / "src" / "app.py").write_text("old", encoding="utf-8")
+
+        # Scaffold Without Overwriting
+        result = scaffold({"src": {"app.py": "new"}}, root=str(root))
+
+        # Check The Existing Entries Were Kept
+        assert result["created"] == 0
+        assert [status["status"] for status in result["paths"]] == ["exists", "exists"]
+        assert (root / "src" / "app.py").read_text(encoding="utf-8") == "old"
+
+        # Scaffold With Overwriting
+        result = scaffold({"src": {"app.py": "new"}}, root=str(root), overwrite=True)
+
+        # Check The File Was Overwritten
+        assert result["created"] == 1
+        assert (root / "src" / "app.py").read_text(encoding="utf-8") == "new"
+
+
+# Test Scaffold Rejects Invalid And Escaping Entries
+def test_scaffold_invalid_entries() -> None:
+    """
+    Tests That Invalid Values And Paths Outside The Root Fail Without Stopping The Other Entries
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Scaffold A Spec With Bad Entries
+        root = Path(temp_dir).resolve() / "root"
+        result = scaffold({"bad.txt": 42, "../outside.txt": "x", "../out": {"a.txt": "x"}, "ok.txt": "ok"}, root=str(root))
+
+        # Check The Result
+        assert result["success"] is False
+        assert result["created"] == 1
+        assert result["failed"] == 3
+        assert result["paths"][0] == {"path": "bad.txt", "type": "file", "status": "error", "error": "Invalid Spec Entry"}
+        assert result["paths"][1]["error"] == "Path Escapes The Root"
+        assert result["paths"][2]["type"] == "directory"
+        assert result["paths"][2]["error"] == "Path Escapes The Root"
+        assert len(result["paths"]) == 4
+
+        # Check Nothing Was Written Outside The Root
+        assert not (root.parent / "outside.txt").exists()
+        assert not (root.parent / "out").exists()
+
+
+# Test Scaffold Argument Errors
+def test_scaffold_argument_errors() -> None:
+    """
+    Tests That An Empty Spec, A File Root And A Root That Cannot Be Created Raise ValueError
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File
+        file_path = Path(temp_dir) / "file.txt"
+        file_path.write_text("x", encoding="utf-8")
+
+        # With ValueError
+        with pytest.raises(ValueError, match="Scaffold Spec Must Not Be Empty"):
+            # Scaffold An Empty Spec
+            scaffold({}, root=temp_dir)
+
+        # With ValueError
+        with pytest.raises(ValueError, match="Path Is Not A Directory"):
+            # Scaffold Into A File
+            scaffold({"a.txt": ""}, root=str(file_path))
+
+        # With ValueError
+        with pytest.raises(ValueError, match="Failed To Create Directory"):
+            # Scaffold Into A Directory Below A File
+            scaffold({"a.txt": ""}, root=str(file_path / "sub"))
+
+
+# Test Scaffold Directory Errors
+def test_scaffold_directory_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That A Directory That Cannot Be Created Is Reported In Its Status
+    """
+
+    # Define A Failing mkdir
+    def raise_permission_error(*args: object, **kwargs: object) -> None:
+        # Raise The Error
+        raise PermissionError
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Patch mkdir To Fail
+        monkeypatch.setattr(Path, "mkdir", raise_permission_error)
+
+        # Scaffold A Directory
+        result = scaffold({"sub": {}}, root=temp_dir)
+
+        # Check The Result
+        assert result["success"] is False
+        assert result["paths"][0]["error"].startswith("Permission Denied")
+
+
+# Test Scaffold Write Errors
+@pytest.mark.parametrize(
+    ("error", "message"),
+    [
+        (PermissionError(), "Permission Denied"),
+        (UnicodeEncodeError("ascii", "é", 0, 1, "bad"), "Failed To Encode Content With Encoding 'ascii'"),
+        (OSError("disk full"), "Failed To Write File"),
+    ],
+)
+def test_scaffold_write_errors(monkeypatch: pytest.MonkeyPatch, error: Exception, message: str) -> None:
+    """
+    Tests That Files That Cannot Be Written Are Reported In Their Status
+    """
+
+    # Define A Failing Write
+    def raise_error(*args: object, **kwargs: object) -> None:
+        # Raise The Error
+        raise error
+
+    # Patch The Write
+    monkeypatch.setattr(importlib.import_module("zenith.agent.tools.scaffold"), "overlay_write_text", raise_error)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Scaffold A File
+        result = scaffold({"a.txt": "é"}, root=temp_dir, encoding="ascii")
+
+        # Check The Result
+        assert result["success"] is False
+        assert result["failed"] == 1
+        assert result["paths"][0]["error"].startswith(message)
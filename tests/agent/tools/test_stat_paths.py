@@ -0,0 +1,127 @@
+# Standard Library Imports
+import os
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.overlay import overlay_unlink
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.stat_paths import stat_paths
+from zenith.agent.tools.write_file import write_file
+
+
+# Test Checking Many Paths
+def test_stat_paths() -> None:
+    """
+    Tests That Files, Directories, Other Entries And Missing Paths Are Reported In Order
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File, A Directory And A FIFO
+        root = Path(temp_dir).resolve()
+        (root / "file.txt").write_text("hello", encoding="utf-8")
+        (root / "dir").mkdir()
+        os.mkfifo(root / "fifo")
+
+        # Check The Paths
+        results = stat_paths(
+            [
+                str(root / "file.txt"),
+                str(root / "dir"),
+                str(root / "fifo"),
+                str(root / "missing.txt"),
+                str(root / "file.txt" / "child"),
+                str(root / "no" / "such" / "file"),
+            ],
+        )
+
+        # Check The File
+        assert results[0]["path"] == str(root / "file.txt")
+        assert results[0]["exists"] is True
+        assert results[0]["type"] == "file"
+        assert results[0]["size"] == 5
+        assert len(results[0]["modified_time"]) == len("YYYY-MM-DD HH:MM:SS")
+        assert results[0]["writable"] is True
+
+        # Check The Directory And The FIFO
+        assert results[1]["type"] == "directory"
+        assert results[2]["type"] == "other"
+
+        # Check The Missing Paths
+        assert results[3] == {"path": str(root / "missing.txt"), "exists": False, "writable": True}
+        assert results[4]["exists"] is False
+        assert results[4]["writable"] is False
+        assert results[5]["writable"] is False
+
+
+# Test Stat Errors
+def test_stat_paths_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That A Path That Cannot Be Checked Reports An Error Without Failing The Batch
+    """
+
+    # Define A Failing stat
+    def raise_permission_error(*args: object, **kwargs: object) -> None:
+        # Raise The Error
+        raise PermissionError
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Check An Invalid Path
+        results = stat_paths(["bad\0path"])
+
+        # Check The Error
+        assert results[0]["exists"] is None
+        assert results[0]["error"].startswith("Failed To Stat Path")
+
+        # Patch stat To Be Denied
+        monkeypatch.setattr(Path, "stat", raise_permission_error)
+
+        # Check A Path
+        results = stat_paths([temp_dir])
+
+        # Check The Error
+        assert results[0]["exists"] is None
+
+
+# Test Checking Staged Paths
+def test_stat_paths_with_overlay() -> None:
+    """
+    Tests That Staged Files Are Reported As They Will Be Once The Turn Ends
+    """
+
+    # Enable The Overlay
+    set_overlay_enabled(enabled=True)
+
+    try:
+        # With Temporary Directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Stage A New File, A Change And A Deletion
+            root = Path(temp_dir).resolve()
+            (root / "edit.txt").write_text("old", encoding="utf-8")
+            (root / "gone.txt").write_text("bye", encoding="utf-8")
+            write_file(str(root / "new.txt"), "new file")
+            write_file(str(root / "edit.txt"), "changed")
+            overlay_unlink(root / "gone.txt")
+
+            # Check The Paths
+            new, edit, gone = stat_paths([str(root / "new.txt"), str(root / "edit.txt"), str(root / "gone.txt")])
+
+            # Check The Staged Entries
+            assert new["size"] == 8
+            assert new["staged"] is True
+            assert new["modified_time"] is None
+            assert new["writable"] is True
+            assert edit["size"] == 7
+            assert edit["modified_time"] is not None
+            assert gone["exists"] is False
+
+    finally:
+        # Discard Leftovers And Disable The Overlay
+        discard_overlay()
+        set_overlay_enabled(enabled=False)
@@ -0,0 +1,151 @@
+# Standard Library Imports
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.read_cache import clear_read_cache
+from zenith.agent.tools.read_file import read_file
+from zenith.agent.tools.token_budget import DEFAULT_TURN_TOKEN_BUDGET
+from zenith.agent.tools.token_budget import apply_token_budget
+from zenith.agent.tools.token_budget import get_remaining_turn_tokens
+from zenith.agent.tools.token_budget import set_turn_token_budget
+from zenith.agent.tools.token_budget import with_token_budget
+from zenith.agent.tools.turn_tracker import begin_turn
+from zenith.agent.tools.turn_tracker import reset_turns
+
+
+# Test Results Within The Budget
+def test_apply_token_budget_within_budget() -> None:
+    """
+    Tests That Results Within The Budget Carry estimated_tokens And Consume The Budget
+    """
+
+    # Begin A Fresh Turn With A Known Budget
+    set_turn_token_budget(1000)
+    begin_turn()
+
+    # Apply The Budget To A Dictionary Result
+    result = apply_token_budget({"success": True, "content": "x" * 400})
+
+    # Assert The Estimate Was Attached And Consumed
+    assert result["content"] == "x" * 400
+    assert result["estimated_tokens"] > 100
+    assert get_remaining_turn_tokens() == 1000 - result["estimated_tokens"]
+
+    # Apply The Budget To A List Result
+    listed = apply_token_budget([{"name": "a"}])
+
+    # Assert The List Was Wrapped
+    assert listed["results"] == [{"name": "a"}]
+    assert listed["estimated_tokens"] > 0
+
+    # Restore The Default Budget
+    set_turn_token_budget(DEFAULT_TURN_TOKEN_BUDGET)
+
+
+# Test Results Exceeding The Budget
+def test_apply_token_budget_truncates() -> None:
+    """
+    Tests That Results Exceeding The Remaining Budget Are Truncated With A Marker
+    """
+
+    # Begin A Fresh Turn With A Small Budget
+    set_turn_token_budget(100)
+    begin_turn()
+
+    # Apply The Budget To A Large Content Result
+    result = apply_token_budget({"success": True, "path": "/tmp/a.txt", "content": "y" * 4000})
+
+    # Assert The Content Was Truncated But The Metadata Kept
+    assert result["truncated"] is True
+    assert result["path"] == "/tmp/a.txt"
+    assert result["original_estimated_tokens"] > 1000
+    assert result["content"].startswith("y" * 300)
+    assert "[Truncated: Result Was ~" in result["content"]
+    assert len(result["content"]) < 1000
+
+    # Assert The Budget Is Exhausted
+    assert get_remaining_turn_tokens() == 0
+
+    # Apply The Budget To A Large Result Without Content And To A Small Write Result
+    exhausted = apply_token_budget({"success": True, "entries": [{"name": "b" * 40}] * 100})
+    written = apply_token_budget({"success": True, "path": "/tmp/b.txt"})
+
+    # Assert The Nested Values Were Replaced By The Marker, Keeping The Status
+    assert exhausted["truncated"] is True
+    assert exhausted["success"] is True
+    assert "entries" not in exhausted
+    assert exhausted["content"].startswith("\n[Truncated:")
+
+    # Assert The Small Result Was Kept Whole, As Truncating Would Make It Larger
+    assert written == {"success": True, "path": "/tmp/b.txt", "estimated_tokens": written["estimated_tokens"]}
+
+    # Begin A New Turn
+    begin_turn()
+
+    # Assert The Budget Was Reset
+    assert get_remaining_turn_tokens() == 100
+
+    # Restore The Default Budget
+    set_turn_token_budget(DEFAULT_TURN_TOKEN_BUDGET)
+
+
+# Test The Tool Wrapper
+def test_with_token_budget() -> None:
+    """
+    Tests That with_token_budget Preserves The Tool And Applies The Budget
+    """
+
+    # Define A Tool Function
+    def sample_tool(value: str, *, repeat: int = 1) -> dict[str, Any]:
+        """
+        Sample Tool
+        """
+
+        # Return The Repeated Value
+        return {"content": value * repeat}
+
+    # Wrap The Tool
+    wrapped = with_token_budget(sample_tool)
+
+    # Begin A Fresh Turn
+    begin_turn()
+
+    # Call The Wrapped Tool
+    result = wrapped("ab", repeat=2)
+
+    # Assert The Tool Was Wrapped And The Budget Applied
+    assert wrapped.__wrapped__ is sample_tool
+    assert wrapped.__name__ == "sample_tool"
+    assert result["content"] == "abab"
+    assert "estimated_tokens" in result
+
+
+# Test Truncated Reads Being Forgotten
+def test_apply_token_budget_forgets_truncated_reads() -> None:
+    """
+    Tests That A File Whose Content Was Truncated Is Returned In Full When Read Again
+    """
+
+    # Begin A Fresh Turn With A Small Budget
+    reset_turns()
+    clear_read_cache()
+    set_turn_token_budget(100)
+    begin_turn()
+
+    # Create A Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Large File
+        file_path: Path = Path(temp_dir) / "large.txt"
+        file_path.write_text("z" * 4000)
+
+        # Read It Through The Budget
+        assert apply_token_budget(read_file(str(file_path)))["truncated"] is True
+
+        # Begin The Next Turn With Enough Budget
+        set_turn_token_budget(DEFAULT_TURN_TOKEN_BUDGET)
+        begin_turn()
+
+        # Assert Reading Again Returns The Content Instead Of The Unchanged Stub
+        assert read_file(str(file_path))["content"] == "z" * 4000
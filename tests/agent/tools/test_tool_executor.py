@@ -0,0 +1,112 @@
+# Standard Library Imports
+import asyncio
+import inspect
+import threading
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.tool_executor import MAX_TOOL_WORKERS
+from zenith.agent.tools.tool_executor import get_tool_executor
+from zenith.agent.tools.tool_executor import raise_if_cancelled
+from zenith.agent.tools.tool_executor import run_in_tool_executor
+
+
+# Test For get_tool_executor Function
+def test_get_tool_executor() -> None:
+    """
+    Tests That get_tool_executor Creates One Bounded Thread Pool And Reuses It
+    """
+
+    # Assert The Same Bounded Thread Pool Is Returned Every Time
+    assert get_tool_executor() is get_tool_executor()
+    assert get_tool_executor()._max_workers == MAX_TOOL_WORKERS
+
+
+# Test For run_in_tool_executor Function
+@pytest.mark.asyncio
+async def test_run_in_tool_executor() -> None:
+    """
+    Tests That Wrapped Tools Keep Their Signature, Run In Parallel On The Tool Threads And Return In Call Order
+    """
+
+    # Initialize A Barrier Only Passed If Three Calls Run At Once
+    barrier = threading.Barrier(3, timeout=5)
+
+    # Define A Blocking Tool
+    def tool(name: str, *, suffix: str = "") -> str:
+        """
+        Waits For The Other Calls And Returns The Name With Its Thread
+        """
+
+        # Wait Until All Calls Are Running
+        barrier.wait()
+
+        # Return The Name, Suffix And Thread Name
+        return f"{name}{suffix}:{threading.current_thread().name.split('_')[0]}"
+
+    # Wrap The Tool
+    wrapped = run_in_tool_executor(tool)
+
+    # Assert The Wrapper Is Asynchronous And Keeps The Signature
+    assert inspect.iscoroutinefunction(wrapped)
+    assert inspect.signature(wrapped) == inspect.signature(tool)
+
+    # Run Three Calls Concurrently
+    results = await asyncio.gather(wrapped("a"), wrapped("b", suffix="!"), wrapped("c"))
+
+    # Assert The Results Come Back In Call Order From The Tool Threads
+    assert results == ["a:zenith-tool", "b!:zenith-tool", "c:zenith-tool"]
+
+
+# Test For Cooperative Cancellation Of A Running Tool
+@pytest.mark.asyncio
+async def test_run_in_tool_executor_cancellation() -> None:
+    """
+    Tests That Cancelling The Awaiting Task Stops A Running Tool At Its Next raise_if_cancelled Check
+    """
+
+    # Assert The Check Does Nothing Outside A Tool Call
+    raise_if_cancelled()
+
+    # Initialize The Events Marking That The Tool Started And Stopped
+    started = threading.Event()
+    stopped = threading.Event()
+
+    # Define A Tool That Walks Until Cancelled
+    def walk() -> None:
+        """
+        Checks For Cancellation Until Cancelled, Or Gives Up After Five Seconds
+        """
+
+        # Mark The Tool As Started
+        started.set()
+
+        try:
+            # While Not Cancelled
+            for _ in range(500):
+                # Stop If Cancelled
+                raise_if_cancelled()
+
+                # Do One Unit Of Work
+                stopped.wait(0.01)
+
+        except asyncio.CancelledError:
+            # Mark The Tool As Stopped
+            stopped.set()
+            raise
+
+    # Start The Tool And Wait Until It Runs
+    task = asyncio.create_task(run_in_tool_executor(walk)())
+    await asyncio.to_thread(started.wait, 5)
+
+    # Cancel The Task
+    task.cancel()
+
+    # Assert The Task Was Cancelled
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Assert The Tool Stopped Promptly Instead Of Running To Completion
+    assert await asyncio.to_thread(stopped.wait, 1)
@@ -0,0 +1,217 @@
+# Standard Library Imports
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools.tool_memo import clear_tool_memo
+from zenith.agent.tools.tool_memo import get_memo_stats
+from zenith.agent.tools.tool_memo import invalidate_memoized
+from zenith.agent.tools.tool_memo import with_memoization
+from zenith.agent.tools.turn_tracker import begin_turn
+from zenith.agent.tools.turn_tracker import reset_turns
+from zenith.agent.tools.write_file import write_file
+
+
+# Test For with_memoization Function
+def test_with_memoization() -> None:
+    """
+    Tests That Identical Calls In One Turn Are Memoized, Counted, And Dropped When A Turn Begins
+    """
+
+    # Start A Fresh Turn
+    reset_turns()
+    clear_tool_memo()
+    begin_turn()
+
+    # Initialize The Calls Reaching The Tool
+    calls: list[tuple[str | None, bool]] = []
+
+    # Define A Read-Only Tool
+    def list_dir(folder_path: str | None = None, *, hidden: bool = False) -> dict[str, Any]:
+        """
+        Records The Call And Returns A Mutable Result
+        """
+
+        # Record The Call
+        calls.append((folder_path, hidden))
+
+        # Return A Mutable Result
+        return {"entries": [folder_path]}
+
+    # Memoize The Tool
+    memoized = with_memoization(list_dir, "list_dir", ("folder_path",))
+
+    # Call With The Working Directory Spelled Three Ways, Changing The First Result
+    memoized()["entries"].append("changed")
+    assert memoized(".") == {"entries": [None]}
+    assert memoized(folder_path=os.getcwd(), hidden=False) == {"entries": [None]}
+
+    # Call With Different Arguments
+    memoized(".", hidden=True)
+
+    # Assert Only The Distinct Calls Reached The Tool
+    assert calls == [(None, False), (".", True)]
+
+    # Assert The Hits Were Counted
+    assert get_memo_stats() == {
+        "turn": 1,
+        "calls": 4,
+        "hits": 2,
+        "invalidated": 0,
+        "tools": {"list_dir": {"calls": 4, "hits": 2}},
+    }
+
+    # Begin A New Turn And Call Again
+    begin_turn()
+    memoized()
+
+    # Assert The New Turn Started Without Entries Or Counts
+    assert len(calls) == 3
+    assert get_memo_stats()["tools"] == {"list_dir": {"calls": 1, "hits": 0}}
+
+    # Clear The Memo
+    clear_tool_memo()
+
+    # Assert The Stats Were Cleared
+    assert get_memo_stats()["calls"] == 0
+
+
+# Test For Write-Aware Invalidation
+def test_with_memoization_invalidation() -> None:
+    """
+    Tests That Mutating Tools Drop Memoized Results Of Overlapping Paths Only
+    """
+
+    # Start A Fresh Turn
+    reset_turns()
+    clear_tool_memo()
+    begin_turn()
+
+    # Define A Read-Only Tool Listing Paths
+    def stat(paths: list[str]) -> list[bool]:
+        """
+        Returns Whether Each Path Exists
+        """
+
+        # Return Whether Each Path Exists
+        return [Path(path).exists() for path in paths]
+
+    # Memoize The Tool
+    memoized = with_memoization(stat, "stat", ("paths",))
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Get A Directory, A File Inside It And An Unrelated Directory
+        directory = os.path.join(temp_dir, "src")
+        other = os.path.join(temp_dir, "other")
+        new_file = os.path.join(directory, "new.txt")
+        os.makedirs(directory)
+        os.makedirs(other)
+
+        # Memoize Calls Covering The Directory And The Unrelated Directory
+        assert memoized([directory, new_file]) == [True, False]
+        assert memoized([other]) == [True]
+
+        # Write The File Inside The Directory
+        write_file(new_file, "content")
+
+        # Assert Only The Overlapping Result Was Dropped
+        assert memoized([directory, new_file]) == [True, True]
+        assert memoized([other]) == [True]
+        assert get_memo_stats()["invalidated"] == 1
+        assert get_memo_stats()["hits"] == 1
+
+
+# Test For Results Produced Across A Turn Boundary And Errors
+def test_with_memoization_not_stored() -> None:
+    """
+    Tests That Errors And Results Finished After The Turn Ended Are Not Memoized
+    """
+
+    # Start A Fresh Turn
+    reset_turns()
+    clear_tool_memo()
+    begin_turn()
+
+    # Initialize The Number Of Calls
+    calls: list[int] = []
+
+    # Define A Tool That Fails Once And Then Ends The Turn While Running
+    def tool(file_path: str) -> int:
+        """
+        Fails On The First Call And Begins A New Turn On The Others
+        """
+
+        # Record The Call
+        calls.append(len(calls))
+
+        # If This Is The First Call
+        if len(calls) == 1:
+            # Raise An Error
+            msg = f"Failed: {file_path}"
+            raise ValueError(msg)
+
+        # Begin A New Turn While Running
+        begin_turn()
+
+        # Return The Call Number
+        return len(calls)
+
+    # Memoize The Tool
+    memoized = with_memoization(tool, "tool", ("file_path",))
+
+    # Assert The Error Is Raised And Not Memoized
+    with pytest.raises(ValueError, match="Failed"):
+        memoized("a.txt")
+
+    # Assert The Results Are Not Memoized Across The Turn Boundary
+    assert memoized("a.txt") == 2
+    assert memoized("a.txt") == 3
+
+
+# Test For Results Produced While A Parallel Write Was Invalidated
+def test_with_memoization_concurrent_write() -> None:
+    """
+    Tests That A Result Is Not Memoized If An Overlapping Path Was Invalidated While The Tool Ran
+    """
+
+    # Start A Fresh Turn
+    reset_turns()
+    clear_tool_memo()
+    begin_turn()
+
+    # Initialize The Number Of Calls
+    calls: list[int] = []
+
+    # Define A Tool During Whose First Two Calls A Parallel Write Finishes
+    def tool(file_path: str) -> int:
+        """
+        Invalidates A Path Inside The Directory On The First Call And Outside It On The Second
+        """
+
+        # Record The Call
+        calls.append(len(calls))
+
+        # If This Is The First Or Second Call
+        if len(calls) <= 2:
+            # Finish A Write Inside Or Outside The Directory
+            invalidate_memoized(Path(file_path).resolve() / "a.txt" if len(calls) == 1 else Path("/elsewhere"))
+
+        # Return The Call Number
+        return len(calls)
+
+    # Memoize The Tool
+    memoized = with_memoization(tool, "tool", ("file_path",))
+
+    # Assert The Result Read During The Overlapping Write Is Not Memoized
+    assert memoized("src") == 1
+    assert memoized("src") == 2
+
+    # Assert The Result Read During An Unrelated Write Is Memoized
+    assert memoized("src") == 2
+    assert get_memo_stats()["hits"] == 1
@@ -0,0 +1,30 @@
+# Local Imports
+from zenith.agent.tools.turn_tracker import begin_turn
+from zenith.agent.tools.turn_tracker import get_current_turn
+from zenith.agent.tools.turn_tracker import reset_turns
+
+
+# Test For The Turn Tracker Functions
+def test_turn_tracker() -> None:
+    """
+    Tests The begin_turn, get_current_turn And reset_turns Functions
+    """
+
+    # Reset The Turn Counter
+    reset_turns()
+
+    # Assert The Counter Starts At Zero
+    assert get_current_turn() == 0
+
+    # Begin Two Turns
+    assert begin_turn() == 1
+    assert begin_turn() == 2
+
+    # Assert The Current Turn Is Tracked
+    assert get_current_turn() == 2
+
+    # Reset The Turn Counter Again
+    reset_turns()
+
+    # Assert The Counter Was Reset
+    assert get_current_turn() == 0
@@ -0,0 +1,332 @@
+# Standard Library Imports
+import importlib
+import json
+import os
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.agent.tools import undo_journal
+from zenith.agent.tools.apply_patch import apply_patch
+from zenith.agent.tools.copy_path import copy_path
+from zenith.agent.tools.make_directory import make_directory
+from zenith.agent.tools.move_path import move_path
+from zenith.agent.tools.overlay import commit_overlay
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.replace_content import replace_content
+from zenith.agent.tools.turn_tracker import begin_turn
+from zenith.agent.tools.turn_tracker import reset_turns
+from zenith.agent.tools.undo_journal import clear_undo_journal
+from zenith.agent.tools.undo_journal import get_undo_root
+from zenith.agent.tools.undo_journal import set_undo_root
+from zenith.agent.tools.undo_journal import undo_last_change
+from zenith.agent.tools.undo_journal import undo_last_turn
+from zenith.agent.tools.undo_journal import with_journal_call
+from zenith.agent.tools.write_file import write_file
+
+
+# Fixture For A Temporary Project With The Undo Journal Enabled
+@pytest.fixture
+def project() -> Generator[Path, None, None]:
+    """
+    Creates A Temporary Project With An Undo Journal, Disabling The Journal Afterwards
+
+    Returns:
+        Generator[Path, None, None]: The Path To The Temporary Project
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Get The Resolved Project Path
+        root = Path(temp_dir).resolve()
+
+        # Enable The Journal With A Fresh Turn Counter
+        reset_turns()
+        set_undo_root(root / ".zenith" / "undo")
+
+        try:
+            # Yield The Project Path
+            yield root
+
+        finally:
+            # Disable The Journal
+            set_undo_root(None)
+
+
+# Test Undoing The Last Turn
+def test_undo_last_turn(project: Path) -> None:
+    """
+    Tests That /undo-turn Restores Every File And Directory Changed In The Last Turn
+    """
+
+    # Create Files In A First Turn
+    begin_turn()
+    (project / "keep.txt").write_text("keep", encoding="utf-8")
+    write_file(str(project / "edit.txt"), "v1")
+    os.chmod(project / "edit.txt", 0o640)
+
+    # Change Several Files In A Second Turn
+    begin_turn()
+    write_file(str(project / "edit.txt"), "v2")
+    replace_content(str(project / "edit.txt"), "v2", "v3")
+    make_directory(str(project / "a" / "b"))
+    write_file(str(project / "a" / "b" / "new.txt"), "new")
+    apply_patch(f"--- {project / 'keep.txt'}\n+++ /dev/null\n@@ -1 +0,0 @@\n-keep\n\\ No newline at end of file\n")
+
+    # Undo The Second Turn
+    restored = undo_last_turn()
+
+    # Check The Files Are Back As They Were After The First Turn
+    assert restored == [
+        str(project / "edit.txt"),
+        str(project / "a" / "b"),
+        str(project / "a" / "b" / "new.txt"),
+        str(project / "keep.txt"),
+    ]
+    assert (project / "edit.txt").read_text(encoding="utf-8") == "v1"
+    assert (project / "edit.txt").stat().st_mode & 0o777 == 0o640
+    assert (project / "keep.txt").read_text(encoding="utf-8") == "keep"
+    assert not (project / "a").exists()
+
+    # Undo The First Turn, Then Nothing Is Left To Undo
+    assert undo_last_turn() == [str(project / "edit.txt")]
+    assert not (project / "edit.txt").exists()
+    assert undo_last_turn() == []
+
+
+# Test Undoing Single Changes
+def test_undo_last_change(project: Path) -> None:
+    """
+    Tests That /undo Restores One Change At A Time And Stores Identical Pre-Images Once
+    """
+
+    # Write The Same Content Back And Forth
+    begin_turn()
+    path = project / "file.txt"
+    write_file(str(path), "a")
+    write_file(str(path), "b")
+    write_file(str(path), "a")
+    write_file(str(path), "b")
+
+    # Check Identical Pre-Images Share One Object
+    objects = [obj for obj in (project / ".zenith" / "undo" / "objects").rglob("*") if obj.is_file()]
+    assert len(objects) == 2
+
+    # Undo The Changes One By One
+    assert undo_last_change() == [str(path)]
+    assert path.read_text(encoding="utf-8") == "a"
+    assert undo_last_change() == [str(path)]
+    assert path.read_text(encoding="utf-8") == "b"
+
+    # Check The Journal Was Truncated
+    journal = (project / ".zenith" / "undo" / "journal.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["kind"] for line in journal] == ["absent", "file"]
+
+
+# Test Undoing Whole Tool Calls
+def test_undo_last_change_whole_call(project: Path) -> None:
+    """
+    Tests That /undo Restores Every File Of The Last Call, Keeping The Entries Of Interleaved Calls
+    """
+
+    # Define A Call Writing Two Files With Another Call Recorded In Between
+    def write_both() -> None:
+        write_file(str(project / "a.txt"), "a")
+        with_journal_call(write_file)(str(project / "b.txt"), "b")
+        write_file(str(project / "c.txt"), "c")
+
+    # Run The Call And A Multi-File Patch
+    begin_turn()
+    with_journal_call(write_both)()
+    with_journal_call(apply_patch)(
+        f"--- /dev/null\n+++ {project / 'd.txt'}\n@@ -0,0 +1 @@\n+d\n"
+        f"--- /dev/null\n+++ {project / 'e.txt'}\n@@ -0,0 +1 @@\n+e\n",
+    )
+
+    # Undo The Patch As One Change
+    assert undo_last_change() == [str(project / "d.txt"), str(project / "e.txt")]
+    assert not (project / "d.txt").exists()
+    assert not (project / "e.txt").exists()
+
+    # Undo The Outer Call, Keeping The Interleaved Call
+    assert undo_last_change() == [str(project / "a.txt"), str(project / "c.txt")]
+    assert not (project / "a.txt").exists()
+    assert not (project / "c.txt").exists()
+    assert (project / "b.txt").read_text(encoding="utf-8") == "b"
+
+    # Undo The Interleaved Call
+    assert undo_last_change() == [str(project / "b.txt")]
+    assert undo_last_change() == []
+
+
+# Test Undoing Copies And Moves
+def test_undo_copy_and_move(project: Path) -> None:
+    """
+    Tests That Copied Trees Are Removed And Moved Paths Are Moved Back, Restoring Replaced Targets
+    """
+
+    # Create A Tree And Two Files
+    (project / "src" / "pkg").mkdir(parents=True)
+    (project / "src" / "pkg" / "a.py").write_text("a", encoding="utf-8")
+    (project / "one.txt").write_text("one", encoding="utf-8")
+    (project / "two.txt").write_text("two", encoding="utf-8")
+
+    # Copy The Tree, Move A Directory And Move A File Over Another
+    begin_turn()
+    copy_path(str(project / "src"), str(project / "backup" / "src"))
+    move_path(str(project / "src"), str(project / "lib"))
+    move_path(str(project / "one.txt"), str(project / "two.txt"), overwrite=True)
+
+    # Check Moves Are Journaled Without Storing Content
+    journal = (project / ".zenith" / "undo" / "journal.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["kind"] for line in journal] == ["directory", "tree", "move", "file", "move"]
+
+    # Undo The Turn
+    undo_last_turn()
+
+    # Check Everything Is Back
+    assert (project / "src" / "pkg" / "a.py").read_text(encoding="utf-8") == "a"
+    assert (project / "one.txt").read_text(encoding="utf-8") == "one"
+    assert (project / "two.txt").read_text(encoding="utf-8") == "two"
+    assert not (project / "lib").exists()
+    assert not (project / "backup").exists()
+
+
+# Test Undo Keeps Non-Empty Directories
+def test_undo_directory_not_empty(project: Path) -> None:
+    """
+    Tests That Undoing A Directory Creation Leaves It In Place If It Holds Untracked Files
+    """
+
+    # Create A Directory And Put A File In It Without A Tool
+    begin_turn()
+    make_directory(str(project / "dir"))
+    make_directory(str(project / "dir"))
+    (project / "dir" / "untracked.txt").write_text("x", encoding="utf-8")
+
+    # Undo The Turn
+    assert undo_last_turn() == [str(project / "dir")]
+
+    # Check The Directory Is Kept
+    assert (project / "dir" / "untracked.txt").exists()
+
+
+# Test The Journal With The Overlay Enabled
+def test_undo_with_overlay(project: Path) -> None:
+    """
+    Tests That With The Overlay Each File Is Recorded Once Per Turn, Before Its First Staged Write
+    """
+
+    # Create A File On Disk
+    path = project / "file.txt"
+    path.write_text("original", encoding="utf-8")
+
+    # Enable The Overlay
+    set_overlay_enabled(enabled=True)
+
+    try:
+        # Stage Several Writes And Commit Them
+        begin_turn()
+        write_file(str(path), "one")
+        write_file(str(path), "two")
+        commit_overlay()
+
+    finally:
+        # Disable The Overlay
+        discard_overlay()
+        set_overlay_enabled(enabled=False)
+
+    # Undo The Single Recorded Change
+    assert undo_last_change() == [str(path)]
+    assert path.read_text(encoding="utf-8") == "original"
+    assert undo_last_change() == []
+
+
+# Test Pre-Images Are Stored In Chunks
+def test_undo_chunked_pre_image(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That Pre-Images Spanning Several Chunks Round-Trip And Failed Stores Leave No Temporary Object
+    """
+
+    # Use Tiny Chunks And Create A File Spanning Several Of Them
+    monkeypatch.setattr(undo_journal, "_CHUNK_BYTES", 4)
+    path = project / "file.txt"
+    path.write_bytes(b"line one\r\nline two\n\x00binary tail")
+
+    # Change The File And Undo The Change
+    begin_turn()
+    write_file(str(path), "changed")
+    assert undo_last_change() == [str(path)]
+    assert path.read_bytes() == b"line one\r\nline two\n\x00binary tail"
+
+    # Make Compression Fail
+    def fail(*_: object) -> str:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(undo_journal, "_copy_compressed", fail)
+
+    # Assert The Change Is Refused Without Leaving A Temporary Object
+    with pytest.raises(ValueError, match="disk full"):
+        write_file(str(path), "changed")
+    assert not list((project / ".zenith" / "undo" / "objects").glob("*.tmp"))
+    assert path.read_bytes() == b"line one\r\nline two\n\x00binary tail"
+
+
+# Test Streamed Replacements Are Journaled Only When They Change The File
+def test_undo_streamed_replace(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That A Streamed Replacement Failing Its Occurrence Checks Records Nothing, While One That Succeeds Is Undone
+    """
+
+    # Stream Every Replacement
+    monkeypatch.setattr(importlib.import_module("zenith.agent.tools.replace_content"), "STREAMING_THRESHOLD_BYTES", 0)
+    path = project / "file.txt"
+    path.write_text("a a\n", encoding="utf-8")
+
+    # Fail A Replacement That Finds Nothing And One With The Wrong Number Of Occurrences
+    begin_turn()
+    with pytest.raises(ValueError, match="Old Content Not Found"):
+        replace_content(str(path), "z", "y")
+    with pytest.raises(ValueError, match="Expected 1 Occurrences But Found 2"):
+        replace_content(str(path), "a", "b", expected_occurrences=1)
+
+    # Assert Nothing Was Journaled
+    assert not (project / ".zenith" / "undo" / "journal.jsonl").exists()
+
+    # Replace Successfully And Undo It
+    replace_content(str(path), "a", "b", count=0)
+    assert path.read_text(encoding="utf-8") == "b b\n"
+    assert undo_last_change() == [str(path)]
+    assert path.read_text(encoding="utf-8") == "a a\n"
+
+
+# Test Clearing The Journal And Disabling It
+def test_clear_undo_journal(project: Path) -> None:
+    """
+    Tests That Clearing The Journal Forgets Every Change And That A Disabled Journal Records Nothing
+    """
+
+    # Record A Change And Clear The Journal
+    begin_turn()
+    write_file(str(project / "file.txt"), "content")
+    clear_undo_journal()
+
+    # Assert Nothing Is Left To Undo
+    assert undo_last_turn() == []
+    assert not (project / ".zenith" / "undo" / "objects").exists()
+
+    # Disable The Journal And Change The File
+    set_undo_root(None)
+    write_file(str(project / "file.txt"), "changed")
+    make_directory(str(project / "dir"))
+    clear_undo_journal()
+
+    # Assert Nothing Was Recorded
+    assert get_undo_root() is None
+    assert undo_last_change() == []
+    assert not (project / ".zenith" / "undo" / "journal.jsonl").exists()
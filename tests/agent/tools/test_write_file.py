@@ -1,4 +1,5 @@
 # Standard Library Imports
+import importlib
 import os
 import tempfile
 from pathlib import Path
@@ -7,6 +8,7 @@ from pathlib import Path
 import pytest
 
 # Local Imports
+from zenith.agent.tools.read_file import read_file
 from zenith.agent.tools.write_file import file_is_writable
 from zenith.agent.tools.write_file import write_file
 from zenith.utils.format_file_size import format_size
@@ -520,3 +522,91 @@ def test_write_file_direct_unicode_encode_error(monkeypatch: pytest.MonkeyPatch)
         # Check The Error Message
         error_message = str(excinfo.value)
         assert "Failed To Write File" in error_message
+
+
+# Test Write File Replaces Files Atomically
+def test_write_file_atomic_overwrite() -> None:
+    """
+    Tests That Overwriting A File Preserves Its Permissions And Leaves No Temporary Files
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File With Custom Permissions
+        test_file = os.path.join(temp_dir, "run.sh")
+        Path(test_file).write_text("echo old", encoding="utf-8")
+        os.chmod(test_file, 0o755)
+
+        # Overwrite The File
+        result = write_file(test_file, "echo new")
+
+        # Check The Result
+        assert result["success"] is True
+        assert Path(test_file).read_text(encoding="utf-8") == "echo new"
+        assert os.stat(test_file).st_mode & 0o777 == 0o755
+        assert os.listdir(temp_dir) == ["run.sh"]
+
+
+# Test Write File With An ETag Guard
+def test_write_file_if_match() -> None:
+    """
+    Tests That write_file Honours if_match And Returns ETags That Chain Across Writes
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File And Read Its ETag
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("first", encoding="utf-8")
+        etag = read_file(test_file, force=True)["etag"]
+
+        # Overwrite With The Matching ETag
+        result = write_file(test_file, "second\r\n", if_match=etag)
+
+        # Assert The New ETag Matches A Fresh Read
+        assert result["etag"] == read_file(test_file, force=True)["etag"]
+
+        # Append With The Returned ETag
+        appended = write_file(test_file, "third", append=True, if_match=result["etag"])
+
+        # Assert The Appended ETag Matches A Fresh Read
+        assert appended["etag"] == read_file(test_file, force=True)["etag"]
+
+        # With ValueError For A Stale ETag
+        with pytest.raises(ValueError) as excinfo:
+            # Write With The Stale ETag
+            write_file(test_file, "lost update", if_match=etag)
+
+        # Check The Error And That The File Was Not Modified
+        assert "ETag Mismatch" in str(excinfo.value)
+        assert Path(test_file).read_text(encoding="utf-8") == "second\nthird"
+
+
+# Test Write File Skips Identical Overwrites
+def test_write_file_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That Overwriting A File With Identical Content Keeps Its Modification Time
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File With A Fixed Modification Time
+        test_file = os.path.join(temp_dir, "test_file.txt")
+        Path(test_file).write_text("same\n", encoding="utf-8")
+        os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+        etag = read_file(test_file, force=True)["etag"]
+
+        # Patch The Writer To Fail If Called
+        monkeypatch.setattr(importlib.import_module("zenith.agent.tools.write_file"), "overlay_write_text", None)
+
+        # Overwrite With Identical Content
+        result = write_file(test_file, "same\n", if_match=etag)
+
+        # Check The File Was Not Rewritten
+        assert result["changed"] is False
+        assert result["etag"] == etag
+        assert os.stat(test_file).st_mtime_ns == 1_000_000_000
+
+        # Append Nothing, Then Something
+        assert write_file(test_file, "", append=True)["changed"] is False
+        assert write_file(test_file, "more", append=True)["changed"] is True
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 # Third Party Imports
+import pytest
 from typer.testing import CliRunner
 
 # Local Imports
@@ -361,4 +362,44 @@ def test_chat_command(
     mock_console_instance.print.assert_called_with(mock_panel_instance)
 
     # Assert start_chat Was Called With The Agent
-    mock_start_chat.assert_called_once_with(mock_agent)
+    mock_start_chat.assert_called_once_with(mock_agent, plain=False)
+
+
+# Test For The Chat Command In Plain Mode
+@pytest.mark.parametrize(("plain", "is_terminal"), [(True, True), (False, False)])
+@patch("zenith.cli.commands.start_chat")
+@patch("zenith.cli.commands.create_assistant_agent")
+@patch("zenith.cli.commands.Console")
+def test_chat_command_plain(
+    mock_console: MagicMock,
+    mock_create_assistant_agent: MagicMock,
+    mock_start_chat: MagicMock,
+    plain: bool,  # noqa: FBT001
+    is_terminal: bool,  # noqa: FBT001
+) -> None:
+    """
+    Tests That Plain Mode Is Used When Requested Or When Output Is Not A Terminal
+
+    Args:
+        mock_console (MagicMock): The Mock For Console
+        mock_create_assistant_agent (MagicMock): The Mock For create_assistant_agent
+        mock_start_chat (MagicMock): The Mock For start_chat
+        plain (bool): Whether The --plain Flag Is Passed
+        is_terminal (bool): Whether Output Is A Terminal
+    """
+
+    # Set Whether Output Is A Terminal
+    mock_console.return_value.is_terminal = is_terminal
+
+    # Create A Mock Agent
+    mock_agent = MagicMock()
+    mock_agent.name = "Zenith"
+    mock_agent.description = "Test Description"
+    mock_create_assistant_agent.return_value = mock_agent
+
+    # Call The Function
+    from zenith.cli.commands import chat
+    chat(MagicMock(obj={}), plain=plain)
+
+    # Assert start_chat Was Called In Plain Mode
+    mock_start_chat.assert_called_once_with(mock_agent, plain=True)
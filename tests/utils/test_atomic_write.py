@@ -0,0 +1,184 @@
+# Standard Library Imports
+import os
+import stat
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.utils.atomic_write import atomic_write_bytes
+from zenith.utils.atomic_write import atomic_write_text
+from zenith.utils.atomic_write import encode_text_for_write
+from zenith.utils.atomic_write import file_has_content
+from zenith.utils.atomic_write import fsync_directory
+from zenith.utils.atomic_write import get_default_fsync_policy
+from zenith.utils.atomic_write import set_default_fsync_policy
+
+
+# Test Atomic Text Writes With Every Fsync Policy
+@pytest.mark.parametrize("policy", ["none", "file", "file+dir"])
+def test_atomic_write_text_policies(policy: str) -> None:
+    """
+    Tests The atomic_write_text Function With Every Fsync Policy
+
+    Args:
+        policy (str): The Fsync Policy
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File Path
+        test_file = Path(temp_dir) / "test.txt"
+
+        # Patch os.fsync To Count Calls
+        with patch("zenith.utils.atomic_write.os.fsync", wraps=os.fsync) as mock_fsync:
+            # Write The File
+            atomic_write_text(test_file, "héllo", fsync_policy=policy)
+
+        # Assert The Content Was Written And No Temporary File Remains
+        assert test_file.read_text(encoding="utf-8") == "héllo"
+        assert os.listdir(temp_dir) == ["test.txt"]
+
+        # Assert The Expected Number Of Syncs
+        assert mock_fsync.call_count == {"none": 0, "file": 1, "file+dir": 2}[policy]
+
+
+# Test Atomic Writes Preserve Permission Bits
+def test_atomic_write_preserves_permissions() -> None:
+    """
+    Tests That Atomic Writes Preserve The Permission Bits Of An Existing File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File With Custom Permissions
+        test_file = Path(temp_dir) / "script.sh"
+        test_file.write_text("old", encoding="utf-8")
+        test_file.chmod(0o750)
+
+        # Overwrite The File With Text And Then Bytes
+        atomic_write_text(test_file, "new")
+        assert stat.S_IMODE(test_file.stat().st_mode) == 0o750
+        atomic_write_bytes(test_file, b"\x00\x01", fsync_policy="file+dir")
+
+        # Assert The Content And Permissions
+        assert test_file.read_bytes() == b"\x00\x01"
+        assert stat.S_IMODE(test_file.stat().st_mode) == 0o750
+
+
+# Test Atomic Writes Clean Up On Failure
+def test_atomic_write_cleans_up_on_failure() -> None:
+    """
+    Tests That A Failed Atomic Write Leaves The Original File Intact And Removes The Temporary File
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        test_file = Path(temp_dir) / "test.txt"
+        test_file.write_text("original", encoding="utf-8")
+
+        # With A Failing Rename
+        with patch.object(Path, "replace", side_effect=KeyboardInterrupt), pytest.raises(KeyboardInterrupt):
+            # Write The File
+            atomic_write_text(test_file, "new", fsync_policy="none")
+
+        # With A Failing Rename
+        with patch.object(Path, "replace", side_effect=OSError("Disk Full")), pytest.raises(OSError):
+            # Write The File
+            atomic_write_bytes(test_file, b"new", fsync_policy="none")
+
+        # Assert The Original File Is Intact And No Temporary File Remains
+        assert test_file.read_text(encoding="utf-8") == "original"
+        assert os.listdir(temp_dir) == ["test.txt"]
+
+
+# Test The Default Fsync Policy
+def test_default_fsync_policy() -> None:
+    """
+    Tests Setting, Getting And Validating The Default Fsync Policy
+    """
+
+    # Assert The Default Policy
+    assert get_default_fsync_policy() == "file"
+
+    # Set A Different Policy
+    set_default_fsync_policy("none")
+
+    try:
+        # Assert The Policy Was Set
+        assert get_default_fsync_policy() == "none"
+
+        # With ValueError
+        with pytest.raises(ValueError) as excinfo:
+            # Set An Invalid Policy
+            set_default_fsync_policy("always")
+
+        # Check The Error Message
+        assert "Unsupported Fsync Policy: always" in str(excinfo.value)
+
+    finally:
+        # Restore The Default Policy
+        set_default_fsync_policy("file")
+
+
+# Test fsync_directory On Platforms Without Directory Sync
+def test_fsync_directory_non_posix(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That fsync_directory Is A No-Op On Non-POSIX Platforms
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest MonkeyPatch Fixture
+    """
+
+    # Pretend To Be On Windows
+    monkeypatch.setattr("zenith.utils.atomic_write.os.name", "nt")
+
+    # With Patched os.open
+    with patch("zenith.utils.atomic_write.os.open") as mock_open:
+        # Sync A Directory
+        fsync_directory(Path(tempfile.gettempdir()))
+
+    # Assert The Directory Was Not Opened
+    mock_open.assert_not_called()
+
+
+# Test file_has_content Function
+def test_file_has_content(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That file_has_content Compares Sizes First And Then The Content Chunk By Chunk
+    """
+
+    # Compare In Tiny Chunks
+    monkeypatch.setattr("zenith.utils.atomic_write._COMPARE_CHUNK_BYTES", 2)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Test File
+        path = Path(temp_dir) / "file.txt"
+        path.write_bytes(b"hello")
+
+        # Assert The Comparisons
+        assert file_has_content(path, b"hello") is True
+        assert file_has_content(path, b"hellO") is False
+        assert file_has_content(path, b"hello!") is False
+        assert file_has_content(Path(temp_dir) / "missing.txt", b"") is False
+
+
+# Test encode_text_for_write Function
+def test_encode_text_for_write() -> None:
+    """
+    Tests That encode_text_for_write Produces The Bytes A Text Write Would Produce
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Write Text With Newlines
+        path = Path(temp_dir) / "file.txt"
+        atomic_write_text(path, "one\ntwo\n", encoding="utf-16")
+
+        # Assert The Encoded Bytes Match The File
+        assert encode_text_for_write("one\ntwo\n", "utf-16") == path.read_bytes()
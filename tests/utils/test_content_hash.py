@@ -0,0 +1,59 @@
+# Standard Library Imports
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Local Imports
+from zenith.utils.content_hash import hash_bytes
+from zenith.utils.content_hash import hash_text
+from zenith.utils.content_hash import hash_text_file
+
+
+# Test For hash_bytes Function
+def test_hash_bytes() -> None:
+    """
+    Tests The hash_bytes Function
+    """
+
+    # Hash The Same Bytes Twice
+    first = hash_bytes(b"hello")
+    second = hash_bytes(b"hello")
+
+    # Assert The Hash Is Stable And Hexadecimal
+    assert first == second
+    assert len(first) == 32
+    int(first, 16)
+
+    # Assert Different Bytes Produce Different Hashes
+    assert hash_bytes(b"hello!") != first
+
+
+# Test For hash_text Function
+def test_hash_text() -> None:
+    """
+    Tests The hash_text Function
+    """
+
+    # Assert Text Hashes Match The Hash Of Their UTF-8 Bytes
+    assert hash_text("héllo") == hash_bytes("héllo".encode())
+
+    # Assert Lone Surrogates Can Be Hashed
+    assert len(hash_text("\udcff")) == 32
+
+
+# Test For hash_text_file Function
+def test_hash_text_file() -> None:
+    """
+    Tests That hash_text_file Matches hash_text Of The Decoded Content Across Chunks
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File With CRLF Newlines And Non-ASCII Text
+        path = Path(temp_dir) / "file.txt"
+        path.write_bytes("héllo\r\nwörld\r\n".encode("latin-1"))
+
+        # Hash The File In Tiny Chunks
+        with patch("zenith.utils.content_hash._FILE_CHUNK_CHARS", 3):
+            # Assert The Hash Matches The Decoded, Newline-Normalized Text
+            assert hash_text_file(path, "latin-1") == hash_text("héllo\nwörld\n")
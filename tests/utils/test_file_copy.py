@@ -0,0 +1,240 @@
+# Standard Library Imports
+import errno
+import os
+import tempfile
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.utils import file_copy
+from zenith.utils.file_copy import copy_file
+from zenith.utils.file_copy import copy_tree
+from zenith.utils.file_copy import move_path_on_disk
+
+
+# Helper Function To Raise An OSError
+def _raise_errno(code: int) -> object:
+    """
+    Builds A Replacement For A Copy Method That Always Fails With An errno
+
+    Args:
+        code (int): The errno To Fail With
+
+    Returns:
+        object: The Failing Method
+    """
+
+    # Define The Failing Method
+    def fail(*args: object) -> int:
+        # Raise The Error
+        raise OSError(code, os.strerror(code))
+
+    # Return The Failing Method
+    return fail
+
+
+# Test Copying A File
+def test_copy_file() -> None:
+    """
+    Tests That A File Is Copied Byte For Byte With The Permission Bits Of The Source
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Binary Source File
+        source = Path(temp_dir) / "source.bin"
+        source.write_bytes(bytes(range(256)) * 1000)
+        source.chmod(0o640)
+
+        # Copy The File
+        target = Path(temp_dir) / "target.bin"
+        size = copy_file(source, target, fsync_policy="none")
+
+        # Check The Copy
+        assert size == 256_000
+        assert target.read_bytes() == source.read_bytes()
+        assert target.stat().st_mode & 0o777 == 0o640
+
+
+# Test Copy Fallbacks
+@pytest.mark.parametrize("fail_sendfile", [False, True])
+def test_copy_file_fallbacks(monkeypatch: pytest.MonkeyPatch, fail_sendfile: bool) -> None:  # noqa: FBT001
+    """
+    Tests That Copies Fall Back To sendfile And Then To Reading And Writing When Kernel Copies Fail
+    """
+
+    # Make copy_file_range Unavailable And Optionally sendfile Unsupported
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    if fail_sendfile:
+        monkeypatch.setattr(os, "sendfile", _raise_errno(errno.EINVAL))
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source File
+        source = Path(temp_dir) / "source.txt"
+        source.write_bytes(b"hello world\n" * 100_000)
+
+        # Copy The File
+        target = Path(temp_dir) / "target.txt"
+        copy_file(source, target)
+
+        # Check The Copy
+        assert target.read_bytes() == source.read_bytes()
+
+
+# Test Copy Without sendfile
+def test_copy_file_without_sendfile(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That A Platform Without sendfile Reads And Writes The Bytes
+    """
+
+    # Make Both Kernel Copies Unavailable
+    monkeypatch.setattr(os, "copy_file_range", _raise_errno(errno.EXDEV), raising=False)
+    monkeypatch.delattr(os, "sendfile", raising=False)
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source File
+        source = Path(temp_dir) / "source.txt"
+        source.write_bytes(b"data")
+
+        # Copy The File
+        target = Path(temp_dir) / "target.txt"
+        copy_file(source, target)
+
+        # Check The Copy
+        assert target.read_bytes() == b"data"
+
+
+# Test Copy Errors And Early End Of File
+def test_copy_file_errors_and_short_source(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That Real Copy Errors Propagate And A Source That Ends Early Stops The Copy
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source File
+        source = Path(temp_dir) / "source.txt"
+        source.write_bytes(b"data")
+        target = Path(temp_dir) / "target.txt"
+
+        # Make copy_file_range Fail With A Disk Error
+        monkeypatch.setattr(os, "copy_file_range", _raise_errno(errno.EIO), raising=False)
+
+        # With OSError
+        with pytest.raises(OSError, match="Input/output error"):
+            # Copy The File
+            copy_file(source, target)
+
+        # Check No Partial Copy Was Left Behind
+        assert sorted(os.listdir(temp_dir)) == ["source.txt"]
+
+        # Make copy_file_range Report The End Of The File Immediately
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+
+        # Copy The File
+        copy_file(source, target)
+
+        # Check The Copy Stopped
+        assert target.read_bytes() == b""
+
+
+# Test Copying A Tree
+def test_copy_tree() -> None:
+    """
+    Tests That A Tree Is Copied With Its Nested Directories, Files And Symbolic Links
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A Source Tree
+        source = Path(temp_dir) / "source"
+        (source / "a" / "b").mkdir(parents=True)
+        (source / "empty").mkdir()
+        (source / "top.txt").write_text("top", encoding="utf-8")
+        (source / "a" / "b" / "deep.txt").write_text("deep", encoding="utf-8")
+        (source / "link.txt").symlink_to("top.txt")
+        (source / "link_dir").symlink_to("a")
+
+        # Copy The Tree
+        target = Path(temp_dir) / "target"
+        files, size = copy_tree(source, target)
+
+        # Check The Copy
+        assert (files, size) == (2, 7)
+        assert (target / "a" / "b" / "deep.txt").read_text(encoding="utf-8") == "deep"
+        assert (target / "empty").is_dir()
+        assert (target / "link.txt").readlink() == Path("top.txt")
+        assert (target / "link_dir").is_symlink()
+
+
+# Test Moving Paths
+def test_move_path_on_disk() -> None:
+    """
+    Tests That Files And Directories Are Renamed On The Same Filesystem
+    """
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File And A Directory
+        (Path(temp_dir) / "file.txt").write_text("x", encoding="utf-8")
+        (Path(temp_dir) / "dir").mkdir()
+
+        # Move Them
+        assert move_path_on_disk(Path(temp_dir) / "file.txt", Path(temp_dir) / "moved.txt") == "rename"
+        assert move_path_on_disk(Path(temp_dir) / "dir", Path(temp_dir) / "moved") == "rename"
+
+        # Check The Result
+        assert sorted(os.listdir(temp_dir)) == ["moved", "moved.txt"]
+
+        # With FileNotFoundError
+        with pytest.raises(FileNotFoundError):
+            # Move A Missing Path
+            move_path_on_disk(Path(temp_dir) / "missing", Path(temp_dir) / "other")
+
+
+# Test Moving Across Filesystems
+def test_move_path_on_disk_across_filesystems(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests That Paths Are Copied And Deleted When They Cannot Be Renamed Across Filesystems
+    """
+
+    # Make Renames Fail As Across Filesystems
+    monkeypatch.setattr(Path, "replace", _raise_errno(errno.EXDEV))
+
+    # With Temporary Directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create A File And A Directory
+        root = Path(temp_dir)
+        (root / "file.txt").write_text("x", encoding="utf-8")
+        (root / "dir").mkdir()
+        (root / "dir" / "inner.txt").write_text("y", encoding="utf-8")
+
+        # Move Them With Atomic Writes That Do Not Rename
+        monkeypatch.setattr(file_copy, "atomic_open", _plain_open)
+        assert move_path_on_disk(root / "file.txt", root / "moved.txt") == "copy"
+        assert move_path_on_disk(root / "dir", root / "moved") == "copy"
+
+        # Check The Result
+        assert sorted(os.listdir(root)) == ["moved", "moved.txt"]
+        assert (root / "moved" / "inner.txt").read_text(encoding="utf-8") == "y"
+
+
+# Helper Function To Open A Target File Directly
+def _plain_open(path: Path, **kwargs: object) -> object:
+    """
+    Opens A Target File Directly, Standing In For atomic_open While Renames Are Patched To Fail
+
+    Args:
+        path (Path): The Target File
+        **kwargs (object): The Ignored Options
+
+    Returns:
+        object: The Open File
+    """
+
+    # Open The File
+    return path.open("xb")
@@ -0,0 +1,91 @@
+# Standard Library Imports
+import sys
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+# Local Imports
+from zenith.utils.token_estimator import estimate_tokens
+from zenith.utils.token_estimator import load_tiktoken_tokenizer
+from zenith.utils.token_estimator import set_tokenizer
+
+
+# Test For estimate_tokens With The Heuristic
+def test_estimate_tokens_heuristic() -> None:
+    """
+    Tests The estimate_tokens Function With The Heuristic Estimator
+    """
+
+    # Use The Heuristic
+    set_tokenizer(None)
+
+    # Assert ASCII Text Counts About Four Characters Per Token
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+    # Assert Non-ASCII Characters Count One Token Each
+    assert estimate_tokens("abcd日本") == 3
+
+
+# Test For estimate_tokens With An Exact Tokenizer
+def test_estimate_tokens_exact_tokenizer() -> None:
+    """
+    Tests The estimate_tokens Function With An Exact Tokenizer
+    """
+
+    # Set An Exact Tokenizer That Counts Words
+    set_tokenizer(lambda text: len(text.split()))
+
+    try:
+        # Assert The Exact Tokenizer Is Used
+        assert estimate_tokens("one two three") == 3
+
+    finally:
+        # Restore The Heuristic
+        set_tokenizer(None)
+
+
+# Test For load_tiktoken_tokenizer Function
+def test_load_tiktoken_tokenizer() -> None:
+    """
+    Tests The load_tiktoken_tokenizer Function With An Available Encoding
+    """
+
+    # Create A Mock tiktoken Module
+    mock_tiktoken = MagicMock()
+    mock_tiktoken.get_encoding.return_value.encode.return_value = [1, 2, 3, 4, 5]
+
+    # With The Mock Module Installed
+    with patch.dict(sys.modules, {"tiktoken": mock_tiktoken}):
+        # Load The Tokenizer
+        loaded = load_tiktoken_tokenizer("cl100k_base")
+
+    try:
+        # Assert The Tokenizer Was Loaded And Is Used
+        assert loaded is True
+        mock_tiktoken.get_encoding.assert_called_once_with("cl100k_base")
+        assert estimate_tokens("anything") == 5
+        mock_tiktoken.get_encoding.return_value.encode.assert_called_once_with("anything", disallowed_special=())
+
+    finally:
+        # Restore The Heuristic
+        set_tokenizer(None)
+
+
+# Test For load_tiktoken_tokenizer Function When Unavailable
+def test_load_tiktoken_tokenizer_unavailable() -> None:
+    """
+    Tests The load_tiktoken_tokenizer Function When The Encoding Cannot Be Loaded
+    """
+
+    # Create A Mock tiktoken Module That Fails To Load Encodings
+    mock_tiktoken = MagicMock()
+    mock_tiktoken.get_encoding.side_effect = OSError("Offline")
+
+    # With The Mock Module Installed
+    with patch.dict(sys.modules, {"tiktoken": mock_tiktoken}):
+        # Assert Loading Fails
+        assert load_tiktoken_tokenizer("cl100k_base") is False
+
+    # Assert The Heuristic Is Still Used
+    assert estimate_tokens("abcd") == 1
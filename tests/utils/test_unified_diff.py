@@ -0,0 +1,209 @@
+# Third Party Imports
+import pytest
+
+# Local Imports
+from zenith.utils.unified_diff import apply_hunks
+from zenith.utils.unified_diff import parse_unified_diff
+from zenith.utils.unified_diff import split_lines
+
+
+# Test Parsing A Git Style Multi-File Diff
+def test_parse_unified_diff_multiple_files() -> None:
+    """
+    Tests Parsing A Git Style Diff Touching Several Files
+    """
+
+    # Define The Patch
+    patch = (
+        "diff --git a/one.txt b/one.txt\n"
+        "index 0000000..1111111 100644\n"
+        "--- a/one.txt\n"
+        "+++ b/one.txt\n"
+        "@@ -1,2 +1,2 @@\n"
+        " keep\n"
+        "-old\n"
+        "+new\n"
+        "--- /dev/null\n"
+        "+++ b/two.txt\n"
+        "@@ -0,0 +1 @@\n"
+        "+created\n"
+    )
+
+    # Parse The Patch
+    files = parse_unified_diff(patch)
+
+    # Check The Files
+    assert [(f["old_path"], f["new_path"]) for f in files] == [("one.txt", "one.txt"), (None, "two.txt")]
+    assert files[0]["hunks"][0]["lines"] == [(" ", "keep"), ("-", "old"), ("+", "new")]
+    assert files[1]["hunks"][0]["old_count"] == 0
+    assert files[1]["hunks"][0]["new_count"] == 1
+
+
+# Test Parsing Paths Without Git Prefixes
+def test_parse_unified_diff_plain_paths() -> None:
+    """
+    Tests That Paths Without Git Prefixes Or With Timestamps Are Kept As Written
+    """
+
+    # Parse The Patch
+    files = parse_unified_diff("--- src/a.py\t2024-01-01\n+++ src/a.py\t2024-01-02\n@@ -1 +1 @@\n-x\n+y\n")
+
+    # Check The Paths
+    assert files[0]["old_path"] == "src/a.py"
+    assert files[0]["new_path"] == "src/a.py"
+
+
+# Test Parsing No Newline Markers
+def test_parse_unified_diff_no_newline_markers() -> None:
+    """
+    Tests That Only A Marker Following A New Side Line Marks The New Side
+    """
+
+    # Define The Patches
+    old_only = "--- a/f\n+++ b/f\n@@ -1 +1 @@\n-x\n\\ No newline at end of file\n+y\n"
+    new_only = "--- a/f\n+++ b/f\n@@ -1 +1 @@\n-x\n+y\n\\ No newline at end of file\n"
+
+    # Check The Markers
+    assert parse_unified_diff(old_only)[0]["hunks"][0]["new_no_newline"] is False
+    assert parse_unified_diff(new_only)[0]["hunks"][0]["new_no_newline"] is True
+
+
+# Test Parsing Blank Context Lines
+def test_parse_unified_diff_blank_context() -> None:
+    """
+    Tests That A Blank Line Inside A Hunk Is Treated As Blank Context
+    """
+
+    # Parse The Patch
+    files = parse_unified_diff("--- a/f\n+++ b/f\n@@ -1,2 +1,2 @@\n\n-x\n+y\n")
+
+    # Check The Lines
+    assert files[0]["hunks"][0]["lines"] == [(" ", ""), ("-", "x"), ("+", "y")]
+
+
+# Test Parsing Malformed Patches
+@pytest.mark.parametrize(
+    ("patch", "message"),
+    [
+        ("@@ -1 +1 @@\n-x\n+y\n", "Hunk Found Before Any File Header"),
+        ("--- a/f\n+++ b/f\n@@ bad @@\n", "Malformed Hunk Header"),
+        ("--- a/f\n+++ b/f\n@@ -1 +1 @@\n*x\n", "Malformed Hunk Line"),
+        ("--- a/f\n+++ b/f\n@@ -1 +1 @@\n-x\n-y\n", "Malformed Hunk Line"),
+        ("--- a/f\n+++ b/f\n@@ -1,2 +1,2 @@\n-x\n", "Truncated Hunk"),
+    ],
+)
+def test_parse_unified_diff_malformed(patch: str, message: str) -> None:
+    """
+    Tests That Malformed Patches Raise A ValueError
+    """
+
+    # With ValueError
+    with pytest.raises(ValueError) as excinfo:
+        # Parse The Patch
+        parse_unified_diff(patch)
+
+    # Check The Error Message
+    assert message in str(excinfo.value)
+
+
+# Test Applying Hunks With An Offset
+def test_apply_hunks_with_offset() -> None:
+    """
+    Tests That Hunks Are Located By Context When Their Line Numbers Are Off
+    """
+
+    # Define The File And Patch, Whose Header Is Three Lines Too Early
+    lines = ["a\n", "b\n", "c\n", "d\n", "e\n", "f\n"]
+    hunks = parse_unified_diff("--- a/f\n+++ b/f\n@@ -1,2 +1,2 @@\n d\n-e\n+E\n")[0]["hunks"]
+
+    # Apply The Hunks
+    patched, statuses = apply_hunks(lines, hunks)
+
+    # Check The Result
+    assert patched == ["a\n", "b\n", "c\n", "d\n", "E\n", "f\n"]
+    assert statuses == [{"index": 0, "header": "@@ -1,2 +1,2 @@", "status": "applied", "offset": 3}]
+
+
+# Test Applying Hunks With A Rejected Hunk
+def test_apply_hunks_rejected() -> None:
+    """
+    Tests That A Hunk That Cannot Be Located Is Rejected While Later Hunks Still Apply
+    """
+
+    # Define The File And Patch
+    lines = ["one\n", "two\n", "three\n"]
+    patch = "--- a/f\n+++ b/f\n@@ -1 +1 @@\n-missing\n+x\n@@ -3 +3 @@\n-three\n+3\n"
+
+    # Apply The Hunks
+    patched, statuses = apply_hunks(lines, parse_unified_diff(patch)[0]["hunks"])
+
+    # Check The Result
+    assert patched == ["one\n", "two\n", "3\n"]
+    assert [status["status"] for status in statuses] == ["rejected", "applied"]
+
+
+# Test Applying Hunks Ignoring Trailing Whitespace
+def test_apply_hunks_trailing_whitespace() -> None:
+    """
+    Tests That Context Differing Only In Trailing Whitespace Still Matches And The File's Line Is Kept
+    """
+
+    # Define The File And Patch
+    lines = ["keep   \n", "old\n"]
+    patch = "--- a/f\n+++ b/f\n@@ -1,2 +1,2 @@\n keep\n-old\n+new\n"
+
+    # Apply The Hunks
+    patched, _ = apply_hunks(lines, parse_unified_diff(patch)[0]["hunks"])
+
+    # Check The Result
+    assert patched == ["keep   \n", "new\n"]
+
+
+# Test Applying Hunks Around A Missing Final Newline
+def test_apply_hunks_no_newline_at_end() -> None:
+    """
+    Tests That Missing Final Newlines Are Honoured On Both Sides
+    """
+
+    # Define A Patch That Removes The Final Newline
+    remove = "--- a/f\n+++ b/f\n@@ -1 +1 @@\n-x\n+y\n\\ No newline at end of file\n"
+
+    # Define A Patch That Appends After A Line Without A Final Newline
+    append = "--- a/f\n+++ b/f\n@@ -1 +1,2 @@\n x\n+y\n"
+
+    # Check The Results
+    assert apply_hunks(["x\n"], parse_unified_diff(remove)[0]["hunks"])[0] == ["y"]
+    assert apply_hunks(["x"], parse_unified_diff(append)[0]["hunks"])[0] == ["x\n", "y\n"]
+
+
+# Test Applying A Hunk That Does Not Fit
+def test_apply_hunks_block_too_long() -> None:
+    """
+    Tests That A Hunk Longer Than The File Is Rejected
+    """
+
+    # Apply The Hunks
+    _, statuses = apply_hunks(["a\n"], parse_unified_diff("--- a/f\n+++ b/f\n@@ -1,2 +1 @@\n a\n-b\n")[0]["hunks"])
+
+    # Check The Result
+    assert statuses[0]["status"] == "rejected"
+
+
+# Test Lines Holding Other Line Separators
+def test_unified_diff_other_line_separators() -> None:
+    """
+    Tests That Form Feeds, Vertical Tabs And Unicode Line Separators Stay Inside Their Line
+    """
+
+    # Assert Only Newlines Split Lines, Keeping Line Endings
+    assert split_lines("a\fb\nc\u2028d\x85\n\ve") == ["a\fb\n", "c\u2028d\x85\n", "\ve"]
+    assert split_lines("") == []
+
+    # Parse And Apply A Patch Touching Such A Line, With CRLF Line Endings
+    hunks = parse_unified_diff("--- a/f\r\n+++ b/f\r\n@@ -1,2 +1,2 @@\r\n-a\fb\r\n+a\vb\r\n c\u2028d\r\n")[0]["hunks"]
+    patched, statuses = apply_hunks(split_lines("a\fb\nc\u2028d\n"), hunks)
+
+    # Check The Result
+    assert hunks[0]["lines"] == [("-", "a\fb"), ("+", "a\vb"), (" ", "c\u2028d")]
+    assert patched == ["a\vb\n", "c\u2028d\n"]
+    assert statuses[0]["status"] == "applied"
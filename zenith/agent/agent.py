@@ -1,19 +1,44 @@
+# Standard Library Imports
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
 # Third Party Imports
 from autogen_agentchat.agents import AssistantAgent
 from autogen_core.memory import ListMemory
-from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import ModelFamily
 from autogen_core.tools import FunctionTool
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 # Local Imports
+from zenith.agent.compaction import set_compaction_client
+from zenith.agent.token_context import create_token_context
+from zenith.agent.token_context import get_context_token_budget
+from zenith.agent.tools.apply_edits import apply_edits
+from zenith.agent.tools.apply_patch import apply_patch
+from zenith.agent.tools.copy_path import copy_path
 from zenith.agent.tools.list_files import list_files
 from zenith.agent.tools.make_directory import make_directory
+from zenith.agent.tools.move_path import move_path
+from zenith.agent.tools.output_compaction import with_output_compaction
+from zenith.agent.tools.overlay import set_overlay_enabled
+from zenith.agent.tools.preview_data import preview_data
 from zenith.agent.tools.read_file import read_file
 from zenith.agent.tools.read_multiple_files import read_multiple_files
 from zenith.agent.tools.replace_content import replace_content
+from zenith.agent.tools.scaffold import scaffold
 from zenith.agent.tools.search_files import search_files
+from zenith.agent.tools.stat_paths import stat_paths
+from zenith.agent.tools.token_budget import DEFAULT_TURN_TOKEN_BUDGET
+from zenith.agent.tools.token_budget import set_turn_token_budget
+from zenith.agent.tools.token_budget import with_token_budget
+from zenith.agent.tools.tool_executor import run_in_tool_executor
+from zenith.agent.tools.tool_memo import with_memoization
+from zenith.agent.tools.undo_journal import set_undo_root
+from zenith.agent.tools.undo_journal import with_journal_call
 from zenith.agent.tools.write_file import write_file
+from zenith.utils.atomic_write import set_default_fsync_policy
+from zenith.utils.token_estimator import load_tiktoken_tokenizer
 
 
 # Function To Create A Model Client
@@ -48,6 +73,42 @@ def create_model_client(config: dict[str, str]) -> OpenAIChatCompletionClient:
     )
 
 
+# Helper Function To Create A Function Tool
+def _create_tool(
+    func: Callable[..., Any],
+    name: str,
+    description: str,
+    *,
+    memo_path_args: tuple[str, ...] | None = None,
+) -> FunctionTool:
+    """
+    Creates A Function Tool Whose Results Carry Token Estimates And Respect The Per-Turn Token Budget
+
+    Each Call Runs On The Bounded Tool Thread Pool, So The Calls Of One Model Step Run In Parallel,
+    And Tags Its Undo Journal Entries With Its Own Call Id. Read-Only Tools Given memo_path_args
+    Are Memoized Within A Turn. Results Are Compacted Before The Budget Is Applied, So The Budget
+    Counts What The Model Actually Sees
+
+    Args:
+        func (Callable[..., Any]): The Tool Function
+        name (str): The Name Of The Tool
+        description (str): The Description Of The Tool
+        memo_path_args (tuple[str, ...] | None): The Path Arguments Of A Read-Only Tool To Memoize, None To Not Memoize
+
+    Returns:
+        FunctionTool: The Function Tool
+    """
+
+    # Memoize The Tool If It Is Read-Only
+    tool_func: Callable[..., Any] = func if memo_path_args is None else with_memoization(func, name, memo_path_args)
+
+    # Compact The Results, Then Apply The Token Budget
+    budgeted: Callable[..., Any] = with_token_budget(with_output_compaction(tool_func, name))
+
+    # Create And Return The Function Tool, Tagging The Journal Entries Of Each Call
+    return FunctionTool(func=run_in_tool_executor(with_journal_call(budgeted)), name=name, description=description)
+
+
 # Function To Create An Assistant Agent
 def create_assistant_agent(
     config: dict[str, str],
@@ -113,22 +174,82 @@ Begin With A Brief Analysis Of The Problem, Present Your Solution With Well-Comm
 You Are Not Just A Code Generator—You Are A Thoughtful Programming Partner Committed To Delivering Excellence In Every Solution.""",  # noqa: E501
     )
 
+    # Get The Name Of The Exact Tokenizer, If Any
+    tokenizer_name: str = config.get("zenith_tokenizer", "")
+
+    # If An Exact Tokenizer Is Configured
+    if tokenizer_name:
+        # Load It, Falling Back To The Heuristic Estimator If It Is Unavailable Offline
+        load_tiktoken_tokenizer(tokenizer_name)
+
+    # Set The Per-Turn Tool Result Token Budget
+    set_turn_token_budget(int(config.get("zenith_turn_token_budget", DEFAULT_TURN_TOKEN_BUDGET)))
+
+    # Set The Durability Of File Writes
+    set_default_fsync_policy(config.get("zenith_fsync_policy", "file"))
+
+    # Stage File Writes In Memory Until The End Of Each Turn If Configured
+    set_overlay_enabled(enabled=str(config.get("zenith_overlay", "false")).lower() == "true")
+
+    # Record Pre-Images Of Changed Files Under .zenith/undo Unless Disabled
+    undo_enabled: bool = str(config.get("zenith_undo", "true")).lower() == "true"
+    set_undo_root(Path.cwd() / ".zenith" / "undo" if undo_enabled else None)
+
     # Create The Model Client
     model_client: OpenAIChatCompletionClient = create_model_client(config)
 
+    # Get The Token Budget Of The Model Context, Defaulting To A Share Of The Model's Window
+    context_token_budget: int = int(
+        config.get("zenith_context_token_budget", "") or get_context_token_budget(config.get("zenith_model", "")),
+    )
+
+    # Summarize Older Turns In The Background Once The History Exceeds Half The Budget, Unless Disabled
+    compaction_enabled: bool = str(config.get("zenith_compaction", "true")).lower() == "true"
+    set_compaction_client(model_client if compaction_enabled else None, threshold=context_token_budget // 2)
+
     # Create The Memory
     memory: ListMemory = ListMemory()
 
     # Create The Tools Dictionary
     tools: list[FunctionTool] = [
-        FunctionTool(
+        _create_tool(
+            func=apply_edits,
+            name="apply_edits",
+            description=(
+                "Apply Several Replacements To One File In A Single Pass. Each Edit Has old, new And An Optional "
+                "count (Default 1, 0 For All). Edits Apply In Order, Every Anchor Is Validated Before The File Is "
+                "Written Once Atomically, And A Status Is Returned Per Edit. Pass if_match=etag From read_file To Fail "
+                "Fast If The File Changed."
+            ),
+        ),
+        _create_tool(
+            func=apply_patch,
+            name="apply_patch",
+            description=(
+                "Apply A Unified Diff To One Or More Files, Preferred Over Rewriting Whole Files For Small Changes. "
+                "Hunks Are Located By Their Context Even If Line Numbers Are Off, Rejected Hunks Are Reported, "
+                "And Files Can Be Created Or Deleted Via /dev/null. "
+                "if_match Maps File Paths To etag Values From read_file."
+            ),
+        ),
+        _create_tool(
+            func=copy_path,
+            name="copy_path",
+            description=(
+                "Copy A File Or Directory To A New Path Without Reading Its Content, Using Kernel-Side Copies. "
+                "Directories Are Copied Recursively In Parallel. "
+                "Existing Target Files Are Only Replaced If overwrite Is True."
+            ),
+        ),
+        _create_tool(
             func=list_files,
             name="list_files",
             description=(
                 "List All Files and Folders with Metadata in a Tree-Like Structure, Respecting .gitignore Patterns."
             ),
+            memo_path_args=("folder_path",),
         ),
-        FunctionTool(
+        _create_tool(
             func=make_directory,
             name="make_directory",
             description=(
@@ -137,41 +258,85 @@ You Are Not Just A Code Generator—You Are A Thoughtful Programming Partner Com
                 "And Handling Existing Directories."
             ),
         ),
-        FunctionTool(
+        _create_tool(
+            func=move_path,
+            name="move_path",
+            description=(
+                "Move Or Rename A File Or Directory Without Reading Its Content, Renaming It Atomically On The Same "
+                "Filesystem. Existing Target Files Are Only Replaced If overwrite Is True."
+            ),
+        ),
+        _create_tool(
+            func=preview_data,
+            name="preview_data",
+            description=(
+                "Preview A CSV, TSV, JSON Or JSONL Data File As A Compact Schema With Inferred Column Types, "
+                "A Row Count And A Few Sample Rows, Reading Only A Bounded Prefix Of Large Files."
+            ),
+            memo_path_args=("file_path",),
+        ),
+        _create_tool(
             func=read_file,
             name="read_file",
-            description=("Read The Contents Of A File, With Options For Specifying Line Ranges And File Encoding."),
+            description=(
+                "Read The Contents Of A File, With Options For Specifying Line Ranges And File Encoding. "
+                "Re-Reading An Unchanged File Returns A Short Stub Unless force Is True. "
+                "Results Carry An etag That Edit Tools Accept As if_match."
+            ),
         ),
-        FunctionTool(
+        _create_tool(
             func=read_multiple_files,
             name="read_multiple_files",
             description=(
-                "Reads The Contents Of Multiple Files, With Options For Specifying Line Ranges And File Encoding."
+                "Reads The Contents Of Multiple Files, With Options For Specifying Line Ranges And File Encoding. "
+                "Re-Reading An Unchanged File Returns A Short Stub Unless force Is True. "
+                "Results Carry An etag That Edit Tools Accept As if_match."
             ),
         ),
-        FunctionTool(
+        _create_tool(
             func=replace_content,
             name="replace_content",
             description=(
-                "Replace The First Occurrence Of Old Content With New Content In A File, "
-                "With Options For Specifying File Encoding."
+                "Replace Occurrences Of Old Content With New Content In A File In One Pass. mode Is literal Or "
+                "regex (With Group References), count Limits The Replacements (Default 1, 0 For All), And "
+                "expected_occurrences Guards Against Unexpected Matches. Returns The Number Of Replacements. "
+                "Pass if_match=etag From read_file To Fail Fast If The File Changed."
             ),
         ),
-        FunctionTool(
+        _create_tool(
+            func=scaffold,
+            name="scaffold",
+            description=(
+                "Create A Tree Of Directories And Files In One Call From A Nested spec, Where A String Value Is "
+                "A File's Content And A Dictionary Value Is A Directory. Files Are Written In Parallel, Existing "
+                "Files Are Kept Unless overwrite Is True, And A Compact Status Is Returned Per Path."
+            ),
+        ),
+        _create_tool(
             func=search_files,
             name="search_files",
             description=(
                 "Search For Files Matching A Pattern In The Specified Directory, "
                 "With Options For Case Sensitivity And File Type Filtering."
             ),
+            memo_path_args=("directory",),
+        ),
+        _create_tool(
+            func=stat_paths,
+            name="stat_paths",
+            description=(
+                "Check Many Paths In One Call: For Each Path Return Whether It Exists, Its Type, Size, Modification "
+                "Time And Whether It Is Writable. Use It Instead Of Probing Paths With read_file Or list_files."
+            ),
+            memo_path_args=("paths",),
         ),
-        FunctionTool(
+        _create_tool(
             func=write_file,
             name="write_file",
             description=(
                 "Write Content To A File At The Specified Path, "
                 "With Options For Appending, Creating Parent Directories, "
-                "And Specifying File Encoding."
+                "And Specifying File Encoding. Pass if_match=etag From read_file To Fail Fast If The File Changed."
             ),
         ),
     ]
@@ -184,7 +349,7 @@ You Are Not Just A Code Generator—You Are A Thoughtful Programming Partner Com
         model_client=model_client,
         model_client_stream=True,
         memory=[memory],
-        model_context=BufferedChatCompletionContext(buffer_size=16),
+        model_context=create_token_context(context_token_budget),
         tools=tools,
         max_tool_iterations=16,
     )
@@ -1,8 +1,10 @@
 # Local Imports
+from zenith.agent.chat.commands import handle_chat_command
 from zenith.agent.chat.display import display_agent_prompt
 from zenith.agent.chat.display import display_closing_message
 from zenith.agent.chat.display import display_error_message
 from zenith.agent.chat.display import display_initial_message
+from zenith.agent.chat.display import display_system_message
 from zenith.agent.chat.display import display_user_prompt
 from zenith.agent.chat.process import process_agent_response
 from zenith.agent.chat.session import start_chat
@@ -13,7 +15,9 @@ __all__: list[str] = [
     "display_closing_message",
     "display_error_message",
     "display_initial_message",
+    "display_system_message",
     "display_user_prompt",
+    "handle_chat_command",
     "process_agent_response",
     "start_chat",
 ]
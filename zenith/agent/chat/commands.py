@@ -0,0 +1,162 @@
+# Standard Library Imports
+from typing import Any
+
+# Third Party Imports
+from autogen_agentchat.agents import AssistantAgent
+from rich.console import Console
+
+# Local Imports
+from zenith.agent.chat.display import display_error_message
+from zenith.agent.chat.display import display_system_message
+from zenith.agent.compaction import compact_history
+from zenith.agent.compaction import describe_compaction
+from zenith.agent.tools.output_compaction import get_output_savings
+from zenith.agent.tools.tool_memo import get_memo_stats
+from zenith.agent.tools.undo_journal import get_undo_root
+from zenith.agent.tools.undo_journal import undo_last_change
+from zenith.agent.tools.undo_journal import undo_last_turn
+
+
+# Function To Handle A Chat Command
+def handle_chat_command(console: Console, user_input: str) -> bool:
+    """
+    Handles A Slash Command Typed In The Chat Instead Of Sending It To The Agent
+
+    Supported Commands Are /undo, Which Reverts The Changes Of The Last Tool Call, /undo-turn, Which Reverts
+    Every File Change Of The Last Turn That Changed Files, And /stats, Which Shows The Memoized
+    Tool Calls, Cache Hits And Tool Output Token Savings Of The Last Turn
+
+    Args:
+        console (Console): The Rich Console
+        user_input (str): The User Input
+
+    Returns:
+        bool: True If The Input Was A Chat Command And Was Handled, False Otherwise
+    """
+
+    # Get The Command
+    command: str = user_input.strip().lower()
+
+    # If The Input Is The Stats Command
+    if command == "/stats":
+        # Display The Stats Of The Last Turn
+        display_system_message(
+            console=console,
+            message_text=f"{_format_turn_stats(get_memo_stats())}\n{_format_output_savings(get_output_savings())}",
+        )
+
+        # The Command Was Handled
+        return True
+
+    # If The Input Is Not An Undo Command
+    if command not in {"/undo", "/undo-turn"}:
+        # Let The Agent Handle It
+        return False
+
+    # If The Undo Journal Is Disabled
+    if get_undo_root() is None:
+        # Display The Error
+        display_error_message(console=console, error_message="The Undo Journal Is Disabled!")
+
+        # The Command Was Handled
+        return True
+
+    try:
+        # Undo The Last Change Or The Last Turn
+        restored: list[str] = undo_last_change() if command == "/undo" else undo_last_turn()
+
+    except OSError as e:
+        # Display The Error
+        display_error_message(console=console, error_message=f"Failed To Undo: {e!s}")
+
+        # The Command Was Handled
+        return True
+
+    # Display The Restored Paths
+    display_system_message(
+        console=console,
+        message_text=f"Restored {len(restored)} Path(s): {', '.join(restored)}" if restored else "Nothing To Undo.",
+    )
+
+    # The Command Was Handled
+    return True
+
+
+# Function To Handle The Compact Command
+async def handle_compact_command(console: Console, agent: AssistantAgent) -> None:
+    """
+    Handles /compact By Summarizing The Older Turns Of The Agent's Context Now And Reporting The Savings
+
+    Args:
+        console (Console): The Rich Console
+        agent (AssistantAgent): The Assistant Agent
+    """
+
+    try:
+        # Compact The History, However Small It Is
+        result: dict[str, int] | None = await compact_history(agent.model_context, force=True)
+
+    except Exception as e:  # noqa: BLE001
+        # Display The Error
+        display_error_message(console=console, error_message=f"Failed To Compact: {e!s}")
+
+        # Done
+        return
+
+    # Display The Savings
+    display_system_message(
+        console=console,
+        message_text=describe_compaction(result) if result is not None else "Nothing To Compact.",
+    )
+
+
+# Helper Function To Format The Stats Of A Turn
+def _format_turn_stats(stats: dict[str, Any]) -> str:
+    """
+    Formats The Memoization Stats Of A Turn As One Line
+
+    Args:
+        stats (dict[str, Any]): The Stats From get_memo_stats
+
+    Returns:
+        str: The Totals Followed By The Hits And Calls Per Tool
+    """
+
+    # Format The Hits And Calls Per Tool
+    tools: str = ", ".join(
+        f"{name}: {counters['hits']}/{counters['calls']} Hits" for name, counters in stats["tools"].items()
+    )
+
+    # Return The Line
+    return (
+        f"Turn {stats['turn']}: {stats['calls']} Memoized Tool Call(s), {stats['hits']} Cache Hit(s), "
+        f"{stats['invalidated']} Invalidated" + (f" ({tools})" if tools else "")
+    )
+
+
+# Helper Function To Format The Output Savings Of A Turn
+def _format_output_savings(savings: dict[str, Any]) -> str:
+    """
+    Formats The Tool Output Token Savings Of A Turn As One Line
+
+    Args:
+        savings (dict[str, Any]): The Savings From get_output_savings
+
+    Returns:
+        str: The Total Tokens Before And After Compaction Followed By The Tokens Per Tool
+    """
+
+    # Format The Tokens Per Tool
+    tools: str = ", ".join(
+        f"{name}: ~{counters['tokens_before']} -> ~{counters['tokens_after']}"
+        for name, counters in savings["tools"].items()
+    )
+
+    # Return The Line
+    return f"Tool Output Compaction: ~{savings['tokens_before']} -> ~{savings['tokens_after']} Tokens" + (
+        f" ({tools})" if tools else ""
+    )
+
+
+# Exports
+__all__: list[str] = ["handle_chat_command", "handle_compact_command"]
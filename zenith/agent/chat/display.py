@@ -192,11 +192,50 @@ def display_error_message(console: Console, error_message: str) -> None:
     console.print("")
 
 
+# Function To Display A System Message
+def display_system_message(console: Console, message_text: str) -> None:
+    """
+    Displays A System Message, Such As The Result Of A Chat Command
+
+    Args:
+        console (Console): The Rich Console
+        message_text (str): The Message
+    """
+
+    # Get The Current Date And Time
+    date_str, time_str = get_current_datetime()
+
+    # Create A Composite Text Object With Different Colors
+    message: Text = Text()
+
+    # Add Date In Cyan
+    message.append("[", style="white")
+    message.append(date_str, style="bold cyan")
+    message.append(" ", style="white")
+
+    # Add Time In Green
+    message.append(time_str, style="bold green")
+    message.append("] ", style="white")
+
+    # Add System Label In Magenta
+    message.append("System", style="bold magenta")
+    message.append("\t: ", style="white")
+
+    # Add Message In Yellow
+    message.append(message_text, style="bold yellow")
+
+    # Print The Message
+    console.print("")
+    console.print(message)
+    console.print("")
+
+
 # Exports
 __all__: list[str] = [
     "display_agent_prompt",
     "display_closing_message",
     "display_error_message",
     "display_initial_message",
+    "display_system_message",
     "display_user_prompt",
 ]
@@ -0,0 +1,71 @@
+# Local Imports
+from zenith.utils.unified_diff import split_lines
+
+# Fence Characters That Open And Close Fenced Code Blocks
+_FENCE_CHARACTERS: tuple[str, ...] = ("`", "~")
+
+# Minimum Length Of A Code Fence
+_MIN_FENCE_LENGTH: int = 3
+
+
+# Function To Split Streamed Markdown Into Finished Blocks And The Open Block
+def split_markdown_blocks(text: str) -> tuple[str, str]:
+    """
+    Splits Streamed Markdown Into The Finished Blocks And The Trailing Block Still Being Written
+
+    A Block Is Finished Once It Is Followed By A Blank Line, Or Once Its Closing Code Fence Arrives.
+    Blank Lines Inside Fenced Code Blocks Do Not End A Block, And A Line Without Its Newline Yet Is
+    Always Part Of The Open Block. Only The Open Block Is Scanned Again When More Text Arrives, So
+    The Cost Per Chunk Does Not Grow With The Length Of The Answer
+
+    Args:
+        text (str): The Markdown Received So Far That Has Not Been Flushed Yet
+
+    Returns:
+        tuple[str, str]: The Finished Markdown, Safe To Render Once, And The Open Markdown
+    """
+
+    # Initialize The End Of The Finished Blocks And The Current Offset
+    boundary: int = 0
+    offset: int = 0
+
+    # Initialize The Open Code Fence, Empty Outside Fenced Code Blocks
+    fence: str = ""
+
+    # For Each Line, Split At Newlines Only So Other Separators Stay Inside Their Line
+    for line in split_lines(text):
+        # If The Line Is Not Complete Yet
+        if not line.endswith("\n"):
+            # It Belongs To The Open Block
+            break
+
+        # Move Past The Line
+        offset += len(line)
+
+        # Get The Line Without Indentation And Newline
+        stripped: str = line.strip()
+
+        # If Inside A Fenced Code Block
+        if fence:
+            # If The Line Closes The Fence
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                # The Code Block Is Finished
+                fence = ""
+                boundary = offset
+
+        # If The Line Opens A Fenced Code Block
+        elif stripped[:1] in _FENCE_CHARACTERS and stripped.startswith(stripped[0] * _MIN_FENCE_LENGTH):
+            # Remember The Fence, Which Closes With At Least As Many Of The Same Character
+            fence = stripped[: len(stripped) - len(stripped.lstrip(stripped[0]))]
+
+        # If The Line Is Blank
+        elif not stripped:
+            # The Previous Block Is Finished
+            boundary = offset
+
+    # Return The Finished And Open Markdown
+    return text[:boundary], text[boundary:]
+
+
+# Exports
+__all__: list[str] = ["split_markdown_blocks"]
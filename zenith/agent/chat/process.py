@@ -1,18 +1,82 @@
+# Standard Library Imports
+import asyncio
+
 # Third Party Imports
 from autogen_agentchat.agents import AssistantAgent
 from rich.console import Console
 from rich.live import Live
-from rich.markdown import Markdown
 
 # Local Imports
 from zenith.agent.chat.display import display_agent_prompt
+from zenith.agent.chat.display import display_error_message
+from zenith.agent.chat.render_scheduler import render_frames
+from zenith.agent.tools.overlay import commit_overlay
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.turn_tracker import begin_turn
 
 
 # Function To Process Agent Response
-async def process_agent_response(console: Console, agent: AssistantAgent, user_input: str) -> None:
+async def process_agent_response(
+    console: Console,
+    agent: AssistantAgent,
+    user_input: str,
+    *,
+    plain: bool = False,
+) -> None:
     """
     Processes The Agent Response Using Streaming
 
+    Files Staged In The Overlay During The Turn Are Flushed To Disk Once The Turn Completes, Or
+    Discarded If It Fails Or Is Interrupted
+
+    Args:
+        console (Console): The Rich Console
+        agent (AssistantAgent): The Assistant Agent
+        user_input (str): The User Input
+        plain (bool): Whether To Write Raw Chunks Without The Spinner, Live Display And Markdown
+    """
+
+    # Begin A New Agent Turn
+    begin_turn()
+
+    try:
+        # If Plain Output Is Requested
+        if plain:
+            # Write The Raw Chunks
+            await _stream_plain(console=console, agent=agent, user_input=user_input)
+
+        else:
+            # Render The Chunks As Markdown
+            await _stream_rich(console=console, agent=agent, user_input=user_input)
+
+    except BaseException:
+        # Discard The Files Staged During The Failed Turn
+        discard_overlay()
+
+        # Re-Raise The Error
+        raise
+
+    # Print Newline For Spacing After The Response
+    console.print()
+
+    try:
+        # Flush The Files Staged During The Turn
+        commit_overlay()
+
+    except OSError as e:
+        # Display The Error, Files That Failed To Flush Stay Staged For The Next Turn
+        display_error_message(console=console, error_message=f"Failed To Commit Staged Files: {e!s}")
+
+
+# Helper Function To Stream The Response With Rich Rendering
+async def _stream_rich(console: Console, agent: AssistantAgent, user_input: str) -> None:
+    """
+    Streams The Response Behind A Spinner, Then Renders It As Markdown In A Live Display
+
+    Chunks Are Handed To A Render Task That Draws Frames At An Adaptive Rate, So A Slow Terminal
+    Never Slows Down Draining The Stream. Finished Markdown Blocks Are Rendered Once Into The
+    Scrollback And Only The Block Still Being Written Is Re-Rendered In The Live Display
+
     Args:
         console (Console): The Rich Console
         agent (AssistantAgent): The Assistant Agent
@@ -26,11 +90,13 @@ async def process_agent_response(console: Console, agent: AssistantAgent, user_i
     # Flag To Track The First Chunk
     first_chunk = True
 
-    # Variable To Store The Full Message
-    full_message = ""
+    # Chunks Not Rendered Yet, And The Event Waking The Render Task
+    chunks: list[str | None] = []
+    chunk_ready: asyncio.Event = asyncio.Event()
 
-    # Create a Live display object (but don't start it yet)
-    live = None
+    # The Live Display And Its Render Task, Started With The First Chunk
+    live: Live | None = None
+    render_task: asyncio.Task[None] | None = None
 
     try:
         # Get The Streaming Response
@@ -51,23 +117,37 @@ async def process_agent_response(console: Console, agent: AssistantAgent, user_i
                         agent_name=agent.name,
                     )
 
-                    # Initialize the Live display
-                    live = Live("", console=console, auto_refresh=True, refresh_per_second=10)
+                    # Initialize The Live Display, Refreshed Only By The Render Task
+                    live = Live("", console=console, auto_refresh=False)
                     live.start()
 
+                    # Start The Render Task
+                    render_task = asyncio.create_task(
+                        render_frames(console=console, live=live, chunks=chunks, chunk_ready=chunk_ready),
+                    )
+
                     # Set The Flag To False
                     first_chunk = False
 
-                # Append The New Chunk To The Full Message
-                full_message += message.content
+                # Hand The Chunk To The Render Task Without Waiting For The Terminal
+                chunks.append(message.content)
+                chunk_ready.set()
 
-                # If The Live Display Is Started
-                if live:
-                    # Render The Full Message As Markdown
-                    markdown_content = Markdown(full_message)
+        # If The Render Task Is Running
+        if render_task:
+            # Mark The End Of The Stream And Wait For The Last Frame
+            chunks.append(None)
+            chunk_ready.set()
+            await render_task
 
-                    # Update The Live Display With The Markdown Content
-                    live.update(markdown_content)
+    except BaseException:
+        # If The Render Task Is Running
+        if render_task:
+            # Stop Rendering
+            render_task.cancel()
+
+        # Re-Raise The Error
+        raise
 
     finally:
         # If No Chunks Were Received
@@ -80,8 +160,36 @@ async def process_agent_response(console: Console, agent: AssistantAgent, user_i
             # Stop The Live Display
             live.stop()
 
-    # Print Newline For Spacing After The Response
-    console.print()
+
+# Helper Function To Stream The Response As Plain Text
+async def _stream_plain(console: Console, agent: AssistantAgent, user_input: str) -> None:
+    """
+    Streams The Response By Writing Each Raw Chunk Straight To The Console's File As It Arrives
+
+    Args:
+        console (Console): The Rich Console
+        agent (AssistantAgent): The Assistant Agent
+        user_input (str): The User Input
+    """
+
+    # Flag To Track The First Chunk
+    first_chunk = True
+
+    # Process The Streaming Response
+    async for message in agent.run_stream(task=user_input):
+        # Check If The Message Is A Streaming Chunk
+        if hasattr(message, "type") and message.type == "ModelClientStreamingChunkEvent":
+            # If It's The First Chunk
+            if first_chunk:
+                # Display The Agent Prompt
+                display_agent_prompt(console=console, agent_name=agent.name)
+
+                # Set The Flag To False
+                first_chunk = False
+
+            # Write And Flush The Raw Chunk
+            console.file.write(message.content)
+            console.file.flush()
 
 
 # Exports
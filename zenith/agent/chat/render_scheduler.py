@@ -0,0 +1,112 @@
+# Standard Library Imports
+import asyncio
+import time
+
+# Third Party Imports
+from rich.console import Console
+from rich.live import Live
+from rich.markdown import Markdown
+
+# Local Imports
+from zenith.agent.chat.markdown_stream import split_markdown_blocks
+
+# Shortest Time Between Frames, In Seconds (30 Frames Per Second)
+MIN_FRAME_INTERVAL: float = 1 / 30
+
+# Longest Time Between Frames, In Seconds, However Slow The Terminal Is
+MAX_FRAME_INTERVAL: float = 0.5
+
+# Share Of The Time Between Frames That Rendering May Take
+RENDER_BUDGET: float = 0.25
+
+
+# Function To Render Streamed Chunks In Frames
+async def render_frames(
+    console: Console,
+    live: Live,
+    chunks: list[str | None],
+    chunk_ready: asyncio.Event,
+) -> None:
+    """
+    Renders Streamed Chunks At A Frame Rate That Adapts To How Long Rendering Takes
+
+    The Stream Consumer Only Appends To chunks And Sets chunk_ready, So It Never Waits For The
+    Terminal. Each Frame Picks Up Every Chunk That Arrived Since The Previous One And Renders Them
+    On A Worker Thread. A None Chunk Marks The End Of The Stream: The Last Frame Is Rendered And
+    The Function Returns
+
+    Args:
+        console (Console): The Rich Console
+        live (Live): The Started Live Display
+        chunks (list[str | None]): The Chunks Not Rendered Yet, Shared With The Stream Consumer
+        chunk_ready (asyncio.Event): Set By The Stream Consumer Whenever It Appends A Chunk
+    """
+
+    # Initialize The Open Markdown Block, The Frame Interval And The Time Of The Last Frame
+    open_block: str = ""
+    interval: float = MIN_FRAME_INTERVAL
+    last_frame: float = 0.0
+
+    # While The Stream Has Not Ended
+    while True:
+        # Wait For A Chunk
+        await chunk_ready.wait()
+
+        # Wait Until The Next Frame Is Due, Letting More Chunks Arrive
+        await asyncio.sleep(max(0.0, last_frame + interval - time.perf_counter()))
+
+        # Take Every Chunk That Arrived Since The Last Frame
+        chunk_ready.clear()
+        batch: list[str | None] = chunks.copy()
+        chunks.clear()
+
+        # Render The Frame Off The Event Loop, Measuring Its Cost
+        last_frame = time.perf_counter()
+        open_block = await asyncio.to_thread(
+            _render_frame,
+            console,
+            live,
+            open_block + "".join(chunk for chunk in batch if chunk is not None),
+        )
+
+        # Adapt The Frame Interval To The Render Cost
+        interval = min(MAX_FRAME_INTERVAL, max(MIN_FRAME_INTERVAL, (time.perf_counter() - last_frame) / RENDER_BUDGET))
+
+        # If The Stream Has Ended
+        if None in batch:
+            # Done
+            return
+
+
+# Helper Function To Render One Frame
+def _render_frame(console: Console, live: Live, text: str) -> str:
+    """
+    Renders One Frame: Finished Markdown Blocks Go To The Scrollback, The Open Block To The Live Display
+
+    Args:
+        console (Console): The Rich Console
+        live (Live): The Live Display
+        text (str): The Open Block Of The Previous Frame Followed By The New Chunks
+
+    Returns:
+        str: The Markdown Block Still Open After This Frame
+    """
+
+    # Split Off The Finished Blocks
+    finished, open_block = split_markdown_blocks(text)
+
+    # If Any Block Was Finished
+    if finished.strip():
+        # Render The Finished Blocks Once, Into The Scrollback Above The Live Display
+        console.print(Markdown(finished))
+        console.print("")
+
+    # Render Only The Open Block In The Live Display
+    live.update(Markdown(open_block), refresh=True)
+
+    # Return The Open Block
+    return open_block
+
+
+# Exports
+__all__: list[str] = ["MAX_FRAME_INTERVAL", "MIN_FRAME_INTERVAL", "RENDER_BUDGET", "render_frames"]
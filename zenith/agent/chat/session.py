@@ -1,5 +1,7 @@
 # Standard Library Imports
 import asyncio
+import contextlib
+import threading
 
 # Third Party Imports
 from autogen_agentchat.agents import AssistantAgent
@@ -9,59 +11,49 @@ from openai import NotFoundError
 from rich.console import Console
 
 # Local Imports
+from zenith.agent.chat.commands import handle_chat_command
+from zenith.agent.chat.commands import handle_compact_command
 from zenith.agent.chat.display import display_closing_message
 from zenith.agent.chat.display import display_error_message
 from zenith.agent.chat.display import display_initial_message
+from zenith.agent.chat.display import display_system_message
 from zenith.agent.chat.display import display_user_prompt
 from zenith.agent.chat.process import process_agent_response
+from zenith.agent.compaction import compact_history
+from zenith.agent.compaction import describe_compaction
+from zenith.agent.tools.overlay import discard_overlay
+from zenith.agent.tools.read_cache import clear_read_cache
+from zenith.agent.tools.tool_memo import clear_tool_memo
+from zenith.agent.tools.turn_tracker import reset_turns
+from zenith.agent.tools.undo_journal import clear_undo_journal
 
 
 # Function To Start A Chat Session
-def start_chat(agent: AssistantAgent) -> None:
+def start_chat(agent: AssistantAgent, *, plain: bool = False) -> None:
     """
     Starts A Chat Session With The Assistant Agent
 
     Args:
         agent (AssistantAgent): The Assistant Agent
+        plain (bool): Whether To Write Responses As Raw Text Instead Of Rendered Markdown
     """
 
     # Create A Rich Console
     console: Console = Console()
 
+    # Start The Session With A Fresh Turn Counter, Read Cache, Tool Memo, Overlay And Undo Journal
+    reset_turns()
+    clear_read_cache()
+    clear_tool_memo()
+    discard_overlay()
+    clear_undo_journal()
+
     # Display The Initial Message
     display_initial_message(console=console)
 
-    # Start Chat Loop
-    chat_active = True
-
     try:
-        # While The Chat Is Active
-        while chat_active:
-            # Get User Input
-            user_input = display_user_prompt(console=console)
-
-            # Check If User Wants To Exit
-            if user_input.lower() in ["quit", "exit"]:
-                # Display Closing Message
-                display_closing_message(console=console)
-
-                # Exit The Loop
-                chat_active = False
-
-                # Continue The Loop
-                continue
-
-            # Add A Newline For Spacing Before Agent Response
-            console.print("")
-
-            # Process The Agent Response
-            asyncio.run(
-                process_agent_response(
-                    console=console,
-                    agent=agent,
-                    user_input=user_input,
-                ),
-            )
+        # Run The Whole Chat On One Event Loop
+        asyncio.run(_run_chat_loop(console=console, agent=agent, plain=plain))
 
     except KeyboardInterrupt:
         # Display A New Line For Better Formatting
@@ -101,6 +93,201 @@ def start_chat(agent: AssistantAgent) -> None:
         )
 
 
+# Helper Function To Run The Chat Loop
+async def _run_chat_loop(console: Console, agent: AssistantAgent, *, plain: bool) -> None:
+    """
+    Runs The Chat Loop On A Single Event Loop That Lives As Long As The Session
+
+    Keeping One Loop Lets The Model Client Reuse Its Pooled HTTP Connections Across Turns, Instead
+    Of Paying A Fresh TCP And TLS Handshake Every Turn. User Input Is Read Off The Loop, So The
+    History Can Be Compacted In The Background Meanwhile
+
+    Args:
+        console (Console): The Rich Console
+        agent (AssistantAgent): The Assistant Agent
+        plain (bool): Whether To Write Responses As Raw Text
+    """
+
+    # Initialize The Background Compaction, Started After Each Turn
+    compaction: asyncio.Task[dict[str, int] | None] | None = None
+
+    try:
+        # While The Chat Is Active
+        while True:
+            # Get User Input, While The Previous Turn Is Compacted In The Background
+            user_input: str = await _read_user_input(console=console)
+
+            # Check If User Wants To Exit
+            if user_input.lower() in ["quit", "exit"]:
+                # Display Closing Message
+                display_closing_message(console=console)
+
+                # Exit The Loop
+                return
+
+            # If The Input Is The Compact Command
+            if user_input.strip().lower() == "/compact":
+                # Settle The Background Compaction And Compact Now
+                await _settle_compaction(console=console, task=compaction)
+                compaction = None
+                await handle_compact_command(console=console, agent=agent)
+
+                # Continue The Loop
+                continue
+
+            # If The Input Is A Chat Command
+            if handle_chat_command(console=console, user_input=user_input):
+                # Continue The Loop
+                continue
+
+            # Settle The Background Compaction Before The Context Is Used
+            await _settle_compaction(console=console, task=compaction)
+
+            # Add A Newline For Spacing Before Agent Response
+            console.print("")
+
+            # Process The Agent Response
+            await process_agent_response(
+                console=console,
+                agent=agent,
+                user_input=user_input,
+                plain=plain,
+            )
+
+            # Compact The History In The Background While The User Types
+            compaction = asyncio.create_task(compact_history(agent.model_context))
+
+    finally:
+        # If A Background Compaction Was Started
+        if compaction is not None:
+            # Stop It, Retrieving Any Error So It Is Not Logged
+            compaction.cancel()
+            if compaction.done() and not compaction.cancelled():
+                compaction.exception()
+
+
+# Helper Function To Settle A Background Compaction
+async def _settle_compaction(console: Console, task: asyncio.Task[dict[str, int] | None] | None) -> None:
+    """
+    Reports A Finished Background Compaction, Or Cancels One Still Running So It Never Delays A Turn
+
+    Args:
+        console (Console): The Rich Console
+        task (asyncio.Task[dict[str, int] | None] | None): The Background Compaction, If Any
+    """
+
+    # If No Compaction Was Started
+    if task is None:
+        # Nothing To Do
+        return
+
+    # If The Compaction Is Still Running
+    if not task.done():
+        # Cancel It And Wait For It To Stop
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        # Done
+        return
+
+    try:
+        # Get The Result
+        result: dict[str, int] | None = task.result()
+
+    except Exception as e:  # noqa: BLE001
+        # Display The Error
+        display_error_message(console=console, error_message=f"Background Compaction Failed: {e!s}")
+
+        # Done
+        return
+
+    # If The History Was Compacted
+    if result is not None:
+        # Report The Savings
+        display_system_message(console=console, message_text=describe_compaction(result))
+
+
+# Helper Function To Read User Input Off The Event Loop
+async def _read_user_input(console: Console) -> str:
+    """
+    Reads The User's Input On A Daemon Thread, So The Event Loop Stays Free
+
+    A Daemon Thread Is Used Rather Than The Default Executor, Whose Shutdown Would Wait For A
+    Pending Prompt When The Session Ends With Ctrl+C
+
+    Args:
+        console (Console): The Rich Console
+
+    Returns:
+        str: The User's Input
+    """
+
+    # Get The Running Loop And A Future For The Input
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    # Define The Reader
+    def read() -> None:
+        try:
+            # Read The Input
+            result: str = display_user_prompt(console=console)
+
+        except BaseException as e:  # noqa: BLE001
+            # Hand The Error To The Loop
+            _resolve_threadsafe(loop, future, error=e)
+
+        else:
+            # Hand The Input To The Loop
+            _resolve_threadsafe(loop, future, result=result)
+
+    # Start The Reader
+    threading.Thread(target=read, name="zenith-input", daemon=True).start()
+
+    # Wait For The Input
+    return await future
+
+
+# Helper Function To Resolve A Future From Another Thread
+def _resolve_threadsafe(
+    loop: asyncio.AbstractEventLoop,
+    future: asyncio.Future[str],
+    *,
+    result: str = "",
+    error: BaseException | None = None,
+) -> None:
+    """
+    Resolves A Future From Another Thread, Ignoring Futures And Loops That Are Already Gone
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The Loop Owning The Future
+        future (asyncio.Future[str]): The Future To Resolve
+        result (str): The Result, Used If No Error Is Given
+        error (BaseException | None): The Error To Raise From The Future
+    """
+
+    # Define The Callback Run On The Loop
+    def resolve() -> None:
+        # If The Future Was Cancelled
+        if future.done():
+            # Nothing To Do
+            return
+
+        # If There Is An Error
+        if error is not None:
+            # Set The Error
+            future.set_exception(error)
+
+        else:
+            # Set The Result
+            future.set_result(result)
+
+    # With The Loop Possibly Closed
+    with contextlib.suppress(RuntimeError):
+        # Schedule The Callback
+        loop.call_soon_threadsafe(resolve)
+
+
 # Exports
 __all__: list[str] = [
     "start_chat",
@@ -0,0 +1,248 @@
+# Standard Library Imports
+from typing import Any
+
+# Third Party Imports
+from autogen_core.model_context import ChatCompletionContext
+from autogen_core.model_context import ChatCompletionContextState
+from autogen_core.models import AssistantMessage
+from autogen_core.models import ChatCompletionClient
+from autogen_core.models import FunctionExecutionResultMessage
+from autogen_core.models import LLMMessage
+from autogen_core.models import SystemMessage
+from autogen_core.models import UserMessage
+
+# Local Imports
+from zenith.agent.token_context import estimate_message_tokens
+from zenith.agent.token_context import forget_dropped_reads
+
+# Number Of Most Recent User Turns Kept Verbatim When Compacting
+KEEP_RECENT_TURNS: int = 2
+
+# Source Of The User Message Holding A Summary
+SUMMARY_SOURCE: str = "summary"
+
+# Number Of Characters Of Each Tool Output Shown To The Summarizer
+_TRANSCRIPT_OUTPUT_CHARS: int = 2000
+
+# Instructions Given To The Model When Summarizing
+_SUMMARY_PROMPT: str = (
+    "Summarize The Following Part Of A Conversation Between A User And A Coding Agent So The Agent Can Continue "
+    "Without It. Keep Decisions, Requirements, File Paths, Names, Open Problems And The Current State Of The Work. "
+    "Drop Tool Output Details That Can Be Fetched Again. Answer With The Summary Only."
+)
+
+# The Model Client Used To Summarize, None While Compaction Is Disabled
+_compaction_client: ChatCompletionClient | None = None
+
+# Estimated History Tokens Above Which Background Compaction Runs
+_compaction_threshold: int = 0
+
+
+# Function To Configure Compaction
+def set_compaction_client(client: ChatCompletionClient | None, *, threshold: int = 0) -> None:
+    """
+    Sets The Model Client Used To Summarize And The History Size That Triggers Background Compaction
+
+    Args:
+        client (ChatCompletionClient | None): The Model Client, None To Disable Compaction
+        threshold (int): The Estimated History Tokens Above Which Background Compaction Runs
+    """
+
+    # Use The Module Level Settings
+    global _compaction_client, _compaction_threshold  # noqa: PLW0603
+
+    # Set The Client And The Threshold
+    _compaction_client = client
+    _compaction_threshold = threshold
+
+
+# Function To Compact The History Of A Model Context
+async def compact_history(context: ChatCompletionContext, *, force: bool = False) -> dict[str, int] | None:
+    """
+    Replaces The Older Turns Of A Model Context With A Summary Written By The Model
+
+    Leading System Messages, The Original Task And The Last KEEP_RECENT_TURNS User Turns Are Kept
+    Verbatim, Everything In Between Is Summarized, Including Earlier Summaries. The Context Is Only
+    Replaced If No Message Was Added While The Summary Was Written
+
+    Args:
+        context (ChatCompletionContext): The Model Context
+        force (bool): Whether To Compact Even If The History Is Below The Threshold
+
+    Returns:
+        dict[str, int] | None: The Number Of Summarized Messages And The Estimated Tokens Before And
+            After, Or None If Compaction Is Disabled, Not Needed Or Nothing Can Be Summarized
+    """
+
+    # If Compaction Is Disabled
+    if _compaction_client is None:
+        # Nothing To Do
+        return None
+
+    # Get The Stored Messages
+    messages: list[LLMMessage] = await _stored_messages(context)
+
+    # Estimate The Tokens Of The History
+    tokens_before: int = sum(estimate_message_tokens(message) for message in messages)
+
+    # If The History Is Small Enough
+    if not force and tokens_before <= _compaction_threshold:
+        # Nothing To Do
+        return None
+
+    # Split The History Into The Kept Head, The Part To Summarize And The Kept Recent Turns
+    head, middle, recent = _split_history(messages)
+
+    # If Nothing Can Be Summarized
+    if not middle:
+        # Nothing To Do
+        return None
+
+    # Ask The Model For The Summary
+    result: Any = await _compaction_client.create(
+        [
+            SystemMessage(content=_SUMMARY_PROMPT),
+            UserMessage(content=_render_transcript(middle), source="user"),
+        ],
+    )
+
+    # If A Message Was Added While The Summary Was Written
+    if len(await _stored_messages(context)) != len(messages):
+        # Keep The Context, The Summary Would Drop The New Message
+        return None
+
+    # Build The Compacted History
+    compacted: list[LLMMessage] = [
+        *head,
+        UserMessage(content=f"[Summary Of The Earlier Conversation]\n{result.content}", source=SUMMARY_SOURCE),
+        *recent,
+    ]
+
+    # Replace The Stored Messages
+    await context.load_state(ChatCompletionContextState(messages=compacted).model_dump())
+
+    # Forget The Reads Whose Content Was Summarized Away
+    forget_dropped_reads(middle)
+
+    # Return The Savings
+    return {
+        "messages": len(middle),
+        "tokens_before": tokens_before,
+        "tokens_after": sum(estimate_message_tokens(message) for message in compacted),
+    }
+
+
+# Function To Describe A Compaction
+def describe_compaction(result: dict[str, int]) -> str:
+    """
+    Describes The Savings Of A Compaction In One Line
+
+    Args:
+        result (dict[str, int]): The Result Of compact_history
+
+    Returns:
+        str: The Number Of Summarized Messages And The Token Savings
+    """
+
+    # Return The Description
+    return (
+        f"Summarized {result['messages']} Message(s): ~{result['tokens_before']} -> ~{result['tokens_after']} "
+        f"Tokens, Saving ~{result['tokens_before'] - result['tokens_after']}"
+    )
+
+
+# Helper Function To Get The Stored Messages Of A Model Context
+async def _stored_messages(context: ChatCompletionContext) -> list[LLMMessage]:
+    """
+    Gets Every Stored Message Of A Model Context, Not Only Those Sent To The Model
+
+    Args:
+        context (ChatCompletionContext): The Model Context
+
+    Returns:
+        list[LLMMessage]: The Stored Messages, Oldest First
+    """
+
+    # Return The Messages Of The Saved State
+    return ChatCompletionContextState.model_validate(await context.save_state()).messages
+
+
+# Helper Function To Split The History
+def _split_history(messages: list[LLMMessage]) -> tuple[list[LLMMessage], list[LLMMessage], list[LLMMessage]]:
+    """
+    Splits The History Into The Kept Head, The Part To Summarize And The Kept Recent Turns
+
+    Args:
+        messages (list[LLMMessage]): The Stored Messages, Oldest First
+
+    Returns:
+        tuple[list[LLMMessage], list[LLMMessage], list[LLMMessage]]: The Leading System Messages And
+            Original Task, The Messages To Summarize And The Last KEEP_RECENT_TURNS User Turns
+    """
+
+    # Get The Indexes Of The User Turns, Not Counting Summaries
+    turns: list[int] = [
+        index
+        for index, message in enumerate(messages)
+        if isinstance(message, UserMessage) and message.source != SUMMARY_SOURCE
+    ]
+
+    # If There Are Not More Turns Than Are Kept
+    if len(turns) <= KEEP_RECENT_TURNS:
+        # Nothing Can Be Summarized
+        return messages, [], []
+
+    # Get The End Of The Head And The Start Of The Recent Turns
+    head_end: int = turns[0] + 1
+    recent_start: int = turns[-KEEP_RECENT_TURNS]
+
+    # Return The Three Parts
+    return messages[:head_end], messages[head_end:recent_start], messages[recent_start:]
+
+
+# Helper Function To Render Messages For The Summarizer
+def _render_transcript(messages: list[LLMMessage]) -> str:
+    """
+    Renders Messages As A Plain Transcript, With Long Tool Outputs Cut Short
+
+    Args:
+        messages (list[LLMMessage]): The Messages To Render
+
+    Returns:
+        str: One Paragraph Per Message
+    """
+
+    # Initialize The Paragraphs
+    paragraphs: list[str] = []
+
+    # For Each Message
+    for message in messages:
+        # If The Message Holds Tool Results
+        if isinstance(message, FunctionExecutionResultMessage):
+            # Render Each Result, Cut Short
+            paragraphs.extend(
+                f"Tool {result.name} Returned: {result.content[:_TRANSCRIPT_OUTPUT_CHARS]}"
+                for result in message.content
+            )
+
+        # If The Message Requests Tool Calls
+        elif isinstance(message, AssistantMessage) and isinstance(message.content, list):
+            # Render Each Call
+            paragraphs.extend(f"Assistant Called: {call.name}({call.arguments})" for call in message.content)
+
+        else:
+            # Render The Role And Content
+            paragraphs.append(f"{type(message).__name__.removesuffix('Message')}: {message.content}")
+
+    # Return The Transcript
+    return "\n\n".join(paragraphs)
+
+
+# Exports
+__all__: list[str] = [
+    "KEEP_RECENT_TURNS",
+    "SUMMARY_SOURCE",
+    "compact_history",
+    "describe_compaction",
+    "set_compaction_client",
+]
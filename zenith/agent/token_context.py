@@ -0,0 +1,382 @@
+# Third Party Imports
+from autogen_core.model_context import ChatCompletionContext
+from autogen_core.models import AssistantMessage
+from autogen_core.models import FunctionExecutionResult
+from autogen_core.models import FunctionExecutionResultMessage
+from autogen_core.models import LLMMessage
+from autogen_core.models import SystemMessage
+from autogen_core.models import UserMessage
+
+# Local Imports
+from zenith.agent.tools.read_cache import READ_TOOLS
+from zenith.agent.tools.read_cache import forget_output_reads
+from zenith.utils.token_estimator import estimate_tokens
+
+# Default Number Of Tokens The Model Context May Use When The Model's Window Is Unknown
+DEFAULT_CONTEXT_TOKEN_BUDGET: int = 32000
+
+# Share Of The Model's Context Window Given To The History, Leaving Room For The Prompt, Tools And Answer
+CONTEXT_WINDOW_SHARE: float = 0.5
+
+# Estimated Tokens Each Message Adds Beyond Its Content
+_MESSAGE_OVERHEAD_TOKENS: int = 4
+
+# Number Of Characters Of A Compacted Tool Output Kept As A Preview
+_COMPACT_PREVIEW_CHARS: int = 200
+
+
+# Function To Get The Context Token Budget Of A Model
+def get_context_token_budget(model: str) -> int:
+    """
+    Gets The Number Of Tokens The Model Context May Use For A Model
+
+    Autogen Only Ships Its Table Of Context Windows In A Private Module, So If That Module Moves,
+    The Default Budget Is Used
+
+    Args:
+        model (str): The Model Name
+
+    Returns:
+        int: A Share Of The Model's Context Window, Or The Default Budget If The Window Is Unknown
+    """
+
+    try:
+        # Third Party Imports
+        from autogen_ext.models.openai._model_info import get_token_limit  # noqa: PLC0415
+
+        # Return The Share Of The Known Context Window
+        return int(get_token_limit(model) * CONTEXT_WINDOW_SHARE)
+
+    except (ImportError, KeyError):
+        # Return The Default Budget
+        return DEFAULT_CONTEXT_TOKEN_BUDGET
+
+
+# Function To Fit Messages Into A Token Budget
+def fit_messages(messages: list[LLMMessage], token_budget: int) -> list[LLMMessage]:
+    """
+    Selects And Compacts Messages So Their Estimated Tokens Fit The Budget
+
+    Tool Calls And Their Results Are Treated As One Unit And Never Separated. While Over Budget,
+    Tool Outputs Are Compacted To A Short Preview, Largest First And Oldest First Among Equals,
+    Then Whole Units Are Evicted, Oldest First. System Messages, The Original Task, The Current
+    Request And The Latest Unit Are Always Kept. Neither The Stored Messages Nor Any Other State
+    Are Modified
+
+    Args:
+        messages (list[LLMMessage]): The Full History, Oldest First
+        token_budget (int): The Number Of Tokens The Messages May Use
+
+    Returns:
+        list[LLMMessage]: The Messages To Send To The Model, Oldest First
+    """
+
+    # Return The Fitted Messages
+    return _fit_messages(messages, token_budget)[0]
+
+
+# Function To Estimate The Tokens Of A Message
+def estimate_message_tokens(message: LLMMessage) -> int:
+    """
+    Estimates The Tokens Of A Message
+
+    Args:
+        message (LLMMessage): The Message
+
+    Returns:
+        int: The Estimated Tokens Of The Content Plus The Per-Message Overhead
+    """
+
+    # If The Message Holds Tool Results
+    if isinstance(message, FunctionExecutionResultMessage):
+        # Count The Output Of Each Result
+        return _MESSAGE_OVERHEAD_TOKENS + sum(estimate_tokens(result.content) for result in message.content)
+
+    # Count The Serialized Content
+    return _MESSAGE_OVERHEAD_TOKENS + estimate_tokens(str(message.content))
+
+
+# Function To Forget The Reads Held By Dropped Messages
+def forget_dropped_reads(messages: list[LLMMessage]) -> None:
+    """
+    Forgets The File Reads Whose Outputs Are In Messages No Longer Sent To The Model In Full
+
+    Without This, Reading Such A File Again Would Return The "Unchanged" Stub, Pointing At Content
+    The Model Can No Longer See
+
+    Args:
+        messages (list[LLMMessage]): The Dropped Or Compacted Messages
+    """
+
+    # For Each Tool Result In The Messages
+    for message in messages:
+        for result in message.content if isinstance(message, FunctionExecutionResultMessage) else []:
+            # Forget Its Reads
+            _forget_result_reads(result)
+
+
+# Function To Create A Token-Aware Model Context
+def create_token_context(token_budget: int) -> ChatCompletionContext:
+    """
+    Creates A Model Context That Keeps The Whole History But Sends Only What Fits The Token Budget
+
+    Args:
+        token_budget (int): The Number Of Tokens The Messages Sent To The Model May Use
+
+    Returns:
+        ChatCompletionContext: The Model Context
+    """
+
+    # Create And Return The Model Context
+    return _TokenBudgetContext(token_budget)
+
+
+# Model Context Fitting The History Into A Token Budget
+class _TokenBudgetContext(ChatCompletionContext):
+    """
+    Model Context Whose Messages Are Selected By fit_messages, Since Autogen Only Accepts Subclasses
+
+    Getting The Messages Also Forgets The File Reads Whose Outputs Were Compacted Or Evicted
+    """
+
+    # Initialize The Context
+    def __init__(self, token_budget: int) -> None:
+        """
+        Initializes The Context
+
+        Args:
+            token_budget (int): The Number Of Tokens The Messages Sent To The Model May Use
+        """
+
+        # Initialize The Stored Messages
+        super().__init__()
+
+        # Set The Token Budget
+        self.token_budget: int = token_budget
+
+    # Get The Messages To Send To The Model
+    async def get_messages(self) -> list[LLMMessage]:
+        """
+        Gets The Stored Messages Fitted Into The Token Budget, Forgetting The Reads Left Out
+
+        Returns:
+            list[LLMMessage]: The Messages To Send To The Model
+        """
+
+        # Fit The Messages
+        messages, dropped = _fit_messages(self._messages, self.token_budget)
+
+        # For Each Output No Longer Sent In Full
+        for result in dropped:
+            # Forget Its Reads, So Reading Those Files Again Returns Them
+            _forget_result_reads(result)
+
+        # Return The Fitted Messages
+        return messages
+
+
+# Helper Function To Fit Messages Into A Token Budget
+def _fit_messages(
+    messages: list[LLMMessage],
+    token_budget: int,
+) -> tuple[list[LLMMessage], list[FunctionExecutionResult]]:
+    """
+    Fits Messages Into A Token Budget As fit_messages Describes, Also Returning What Was Dropped
+
+    Args:
+        messages (list[LLMMessage]): The Full History, Oldest First
+        token_budget (int): The Number Of Tokens The Messages May Use
+
+    Returns:
+        tuple[list[LLMMessage], list[FunctionExecutionResult]]: The Messages To Send To The Model, And
+            The Original Tool Outputs That Were Compacted Or Evicted
+    """
+
+    # Group The Messages Into Units
+    units: list[list[LLMMessage]] = _group_units(messages)
+
+    # Estimate The Tokens Of All Messages
+    total: int = sum(estimate_message_tokens(message) for message in messages)
+
+    # If The Messages Fit
+    if total <= token_budget:
+        # Return Them Unchanged
+        return list(messages), []
+
+    # Initialize The Original Tool Outputs No Longer Sent In Full
+    dropped: list[FunctionExecutionResult] = []
+
+    # Find Every Tool Output Outside The Latest Unit, Largest First And Oldest First Among Equals
+    outputs: list[tuple[int, int, int, int]] = sorted(
+        (
+            (-estimate_tokens(result.content), unit_index, message_index, result_index)
+            for unit_index, unit in enumerate(units[:-1])
+            for message_index, message in enumerate(unit)
+            if isinstance(message, FunctionExecutionResultMessage)
+            for result_index, result in enumerate(message.content)
+        ),
+    )
+
+    # For Each Tool Output
+    for _, unit_index, message_index, result_index in outputs:
+        # If The Messages Fit
+        if total <= token_budget:
+            # Stop Compacting
+            break
+
+        # Compact The Output
+        message: FunctionExecutionResultMessage = units[unit_index][message_index]
+        compacted: FunctionExecutionResultMessage = _compact_result(message, result_index)
+
+        # Get The Saved Tokens
+        saved: int = estimate_message_tokens(message) - estimate_message_tokens(compacted)
+
+        # If The Output Is Already Smaller Than Its Preview, As Are All Remaining Outputs
+        if saved <= 0:
+            # Stop Compacting
+            break
+
+        # Keep The Compacted Message, Remember The Original Output And Count The Saved Tokens
+        units[unit_index][message_index] = compacted
+        dropped.append(message.content[result_index])
+        total -= saved
+
+    # Get The Units Holding User Messages
+    tasks: list[int] = [index for index, unit in enumerate(units) if isinstance(unit[0], UserMessage)]
+
+    # Pin System Messages, The Original Task, The Current Request And The Latest Unit
+    pinned: set[int] = {index for index, unit in enumerate(units) if isinstance(unit[0], SystemMessage)}
+    pinned.update({tasks[0], tasks[-1]} if tasks else set())
+    pinned.add(len(units) - 1)
+
+    # Initialize The Evicted Units
+    evicted: set[int] = set()
+
+    # For Each Unit, Oldest First
+    for index, unit in enumerate(units):
+        # If The Messages Fit
+        if total <= token_budget:
+            # Stop Evicting
+            break
+
+        # If The Unit Is Not Pinned
+        if index not in pinned:
+            # Evict The Unit And Remember Its Outputs
+            evicted.add(index)
+            dropped.extend(
+                result
+                for message in unit
+                if isinstance(message, FunctionExecutionResultMessage)
+                for result in message.content
+            )
+            total -= sum(estimate_message_tokens(message) for message in unit)
+
+    # Return The Kept Messages And The Dropped Outputs
+    return [message for index, unit in enumerate(units) if index not in evicted for message in unit], dropped
+
+
+# Helper Function To Group Messages Into Units
+def _group_units(messages: list[LLMMessage]) -> list[list[LLMMessage]]:
+    """
+    Groups Each Assistant Tool Call With The Results That Follow It, Every Other Message Stands Alone
+
+    Args:
+        messages (list[LLMMessage]): The Messages, Oldest First
+
+    Returns:
+        list[list[LLMMessage]]: The Units, Oldest First
+    """
+
+    # Initialize The Units
+    units: list[list[LLMMessage]] = []
+
+    # For Each Message
+    for message in messages:
+        # If The Message Holds Tool Results Following A Tool Call
+        if isinstance(message, FunctionExecutionResultMessage) and units and _is_tool_call(units[-1][0]):
+            # Add It To The Unit Of The Call
+            units[-1].append(message)
+
+        else:
+            # Start A New Unit
+            units.append([message])
+
+    # Return The Units
+    return units
+
+
+# Helper Function To Check Whether A Message Is A Tool Call
+def _is_tool_call(message: LLMMessage) -> bool:
+    """
+    Checks Whether A Message Is An Assistant Message Requesting Tool Calls
+
+    Args:
+        message (LLMMessage): The Message
+
+    Returns:
+        bool: True If The Message Requests Tool Calls
+    """
+
+    # Return Whether The Message Is An Assistant Message With Function Calls
+    return isinstance(message, AssistantMessage) and isinstance(message.content, list)
+
+
+# Helper Function To Forget The Reads Of One Tool Result
+def _forget_result_reads(result: FunctionExecutionResult) -> None:
+    """
+    Forgets The File Reads Held By A Tool Result, If It Is The Output Of A Read Tool
+
+    Args:
+        result (FunctionExecutionResult): The Tool Result
+    """
+
+    # If The Result Is The Output Of A Read Tool
+    if result.name in READ_TOOLS:
+        # Forget Its Reads
+        forget_output_reads(result.content)
+
+
+# Helper Function To Compact One Tool Output
+def _compact_result(message: FunctionExecutionResultMessage, result_index: int) -> FunctionExecutionResultMessage:
+    """
+    Copies A Tool Result Message With One Output Replaced By A Short Preview And A Marker
+
+    Args:
+        message (FunctionExecutionResultMessage): The Tool Result Message
+        result_index (int): The Index Of The Output To Compact
+
+    Returns:
+        FunctionExecutionResultMessage: The Copy With The Output Compacted
+    """
+
+    # Get The Result To Compact
+    result: FunctionExecutionResult = message.content[result_index]
+
+    # Build The Compacted Output
+    content: str = (
+        f"{result.content[:_COMPACT_PREVIEW_CHARS]}\n[Compacted: This ~{estimate_tokens(result.content)} Token "
+        f"Output Of {result.name} Was Removed To Fit The Context. Call The Tool Again If It Is Still Needed.]"
+    )
+
+    # Return The Copy
+    return message.model_copy(
+        update={
+            "content": [
+                *message.content[:result_index],
+                result.model_copy(update={"content": content}),
+                *message.content[result_index + 1 :],
+            ],
+        },
+    )
+
+
+# Exports
+__all__: list[str] = [
+    "CONTEXT_WINDOW_SHARE",
+    "DEFAULT_CONTEXT_TOKEN_BUDGET",
+    "create_token_context",
+    "estimate_message_tokens",
+    "fit_messages",
+    "forget_dropped_reads",
+    "get_context_token_budget",
+]
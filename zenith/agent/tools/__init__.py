@@ -1,19 +1,33 @@
 # Local Imports
+from zenith.agent.tools.apply_edits import apply_edits
+from zenith.agent.tools.apply_patch import apply_patch
+from zenith.agent.tools.copy_path import copy_path
 from zenith.agent.tools.list_files import list_files
 from zenith.agent.tools.make_directory import make_directory
+from zenith.agent.tools.move_path import move_path
+from zenith.agent.tools.preview_data import preview_data
 from zenith.agent.tools.read_file import read_file
 from zenith.agent.tools.read_multiple_files import read_multiple_files
 from zenith.agent.tools.replace_content import replace_content
+from zenith.agent.tools.scaffold import scaffold
 from zenith.agent.tools.search_files import search_files
+from zenith.agent.tools.stat_paths import stat_paths
 from zenith.agent.tools.write_file import write_file
 
 # Exports
 __all__: list[str] = [
+    "apply_edits",
+    "apply_patch",
+    "copy_path",
     "list_files",
     "make_directory",
+    "move_path",
+    "preview_data",
     "read_file",
     "read_multiple_files",
     "replace_content",
+    "scaffold",
     "search_files",
+    "stat_paths",
     "write_file",
 ]
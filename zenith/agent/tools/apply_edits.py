@@ -0,0 +1,219 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.etag import check_etag
+from zenith.agent.tools.etag import etag_for_written_text
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_read_text
+from zenith.agent.tools.overlay import overlay_write_text
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_pre_image
+from zenith.utils.format_file_size import format_size
+
+
+# Function To Apply Multiple Edits To A File
+def apply_edits(
+    file_path: str,
+    edits: list[dict[str, Any]],
+    *,
+    encoding: str = "utf-8",
+    if_match: str | None = None,
+) -> dict[str, Any]:
+    """
+    Applies Multiple Replacements To A File In A Single Read And A Single Atomic Write
+
+    Each Edit Is A Dictionary With "old" (The Anchor Text), "new" (The Replacement) And An Optional
+    "count" (The Number Of Occurrences To Replace, Default 1, 0 For All). Edits Are Applied In Order
+    To One In-Memory Buffer, So Later Anchors See Earlier Edits. Every Anchor Is Validated Before
+    Anything Is Written: If Any Edit Fails, The File Is Left Untouched. If The Edits Leave The Content
+    Unchanged, The File Is Not Rewritten And changed=False Is Reported
+
+    Args:
+        file_path (str): The Path To The File To Modify
+        edits (list[dict[str, Any]]): The Edits To Apply, In Order
+        encoding (str): The Encoding To Use When Reading And Writing The File
+        if_match (str | None): If Given, The File Is Only Modified If Its ETag From read_file Still Matches
+
+    Returns:
+        dict[str, Any]: A Dictionary Containing The Result, Metadata And A Status Per Edit
+
+    Raises:
+        FileNotFoundError: If The File Does Not Exist
+        PermissionError: If Permission Is Denied
+        ValueError: If The Path Is Invalid, The ETag Differs Or The File Cannot Be Decoded Or Encoded
+    """
+
+    # Convert To Absolute Path If Relative
+    abs_path: Path = Path(file_path).resolve()
+
+    # With The Path Lock, So Parallel Calls Changing The File Do Not Interleave
+    with lock_paths(abs_path):
+        # Check If The File Exists
+        if not overlay_exists(abs_path):
+            # Raise A FileNotFoundError
+            msg: str = f"File Not Found: {abs_path}"
+
+            # Raise The Error
+            raise FileNotFoundError(msg) from None
+
+        # Check If The Path Is A File
+        if not overlay_is_file(abs_path):
+            # Raise A ValueError
+            msg: str = f"Path Is Not A File: {abs_path}"
+
+            # Raise The Error
+            raise ValueError(msg) from None
+
+        try:
+            # Fail Fast If The File Changed Since It Was Read
+            check_etag(abs_path, if_match, encoding=encoding)
+
+            # Read The File Content Once
+            original: str = overlay_read_text(abs_path, encoding)
+
+            # Apply The Edits To A Buffer
+            buffer, statuses = _apply_to_buffer(original, edits)
+
+            # If Any Edit Failed
+            if any(status["status"] != "applied" for status in statuses):
+                # Return The Statuses Without Writing
+                return {
+                    "success": False,
+                    "path": str(abs_path),
+                    "error": "Not All Edits Could Be Applied, The File Was Not Modified",
+                    "edits": statuses,
+                }
+
+            # Encode The Buffer Once
+            size: int = len(buffer.encode(encoding))
+
+            # Whether The Edits Changed The Content
+            changed: bool = buffer != original
+
+            # If The Content Changed
+            if changed:
+                # Record The Pre-Image
+                record_pre_image(abs_path)
+
+                # Write The File Once, Atomically
+                overlay_write_text(abs_path, buffer, encoding=encoding)
+
+            # Return The Result
+            return {
+                "success": True,
+                "path": str(abs_path),
+                "size": size,
+                "size_human": format_size(size),
+                "encoding": encoding,
+                "replacements": sum(status["replacements"] for status in statuses),
+                "edits": statuses,
+                "changed": changed,
+                "etag": etag_for_written_text(abs_path, buffer),
+            }
+
+        except PermissionError:
+            # Handle Permission Denied Error
+            msg: str = f"Permission Denied: {abs_path}"
+
+            # Raise The Error
+            raise PermissionError(msg) from None
+
+        except UnicodeDecodeError:
+            # Handle Encoding Error During Read
+            msg: str = f"Failed To Decode File With Encoding '{encoding}': {abs_path}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from None
+
+        except UnicodeEncodeError as e:
+            # Handle Encoding Error During Write
+            msg: str = f"Failed To Encode Content With Encoding '{encoding}': {abs_path}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+        except Exception as e:
+            # Handle Other Errors
+            msg: str = f"Failed To Apply Edits To File: {abs_path}. Error: {e!s}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+
+# Helper Function To Apply Edits To An In-Memory Buffer
+def _apply_to_buffer(buffer: str, edits: list[dict[str, Any]]) -> tuple[str, list[dict[str, Any]]]:
+    """
+    Validates And Applies Edits In Order To A Buffer
+
+    Once An Edit Fails, The Remaining Edits Are Validated Against The Buffer As It Stands
+    But Reported As Skipped
+
+    Args:
+        buffer (str): The File Content
+        edits (list[dict[str, Any]]): The Edits To Apply
+
+    Returns:
+        tuple[str, list[dict[str, Any]]]: The Edited Buffer And A Status Per Edit
+    """
+
+    # Initialize The Statuses
+    statuses: list[dict[str, Any]] = []
+
+    # Whether An Earlier Edit Failed
+    failed: bool = False
+
+    # Process Each Edit
+    for index, edit in enumerate(edits):
+        # Get The Edit Fields
+        old: Any = edit.get("old")
+        new: Any = edit.get("new")
+        count: Any = edit.get("count", 1)
+
+        # If The Edit Is Malformed
+        if not isinstance(old, str) or not old or not isinstance(new, str) or not isinstance(count, int) or count < 0:
+            # Record The Invalid Edit
+            statuses.append({"index": index, "status": "invalid", "replacements": 0})
+            failed = True
+            continue
+
+        # Count The Occurrences Of The Anchor
+        occurrences: int = buffer.count(old)
+
+        # If The Anchor Does Not Occur Often Enough
+        if occurrences == 0 or occurrences < count:
+            # Record The Missing Anchor
+            statuses.append(
+                {
+                    "index": index,
+                    "status": "not_found" if occurrences == 0 else "too_few_occurrences",
+                    "occurrences": occurrences,
+                    "replacements": 0,
+                },
+            )
+            failed = True
+            continue
+
+        # If An Earlier Edit Failed
+        if failed:
+            # Skip The Edit
+            statuses.append({"index": index, "status": "skipped", "replacements": 0})
+            continue
+
+        # Get The Number Of Replacements
+        replacements: int = occurrences if count == 0 else count
+
+        # Apply The Edit
+        buffer = buffer.replace(old, new, replacements)
+
+        # Record The Applied Edit
+        statuses.append({"index": index, "status": "applied", "replacements": replacements})
+
+    # Return The Buffer And Statuses
+    return buffer, statuses
+
+
+# Exports
+__all__: list[str] = ["apply_edits"]
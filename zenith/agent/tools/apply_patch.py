@@ -0,0 +1,313 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.etag import check_etag
+from zenith.agent.tools.etag import etag_for_written_text
+from zenith.agent.tools.overlay import is_overlay_enabled
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_read_text
+from zenith.agent.tools.overlay import overlay_unlink
+from zenith.agent.tools.overlay import overlay_write_text
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_pre_image
+from zenith.utils.unified_diff import apply_hunks
+from zenith.utils.unified_diff import parse_unified_diff
+from zenith.utils.unified_diff import split_lines
+
+
+# Function To Apply A Unified Diff
+def apply_patch(
+    patch: str,
+    *,
+    encoding: str = "utf-8",
+    if_match: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """
+    Applies A Unified Diff To One Or More Files
+
+    Hunks Are Located With Context-Based Fuzzy Offset Matching, So Line Numbers In The Patch May Be
+    Off. Hunks That Cannot Be Located Are Rejected And Reported, While The Other Hunks Of The Same
+    File Are Still Applied. Each File Is Read Once And Written Once, Atomically. Files Can Be Created
+    (--- /dev/null) And Deleted (+++ /dev/null), A Deletion Only If Its Hunks Remove All Content.
+    Renames Never Replace An Existing File
+
+    Args:
+        patch (str): The Unified Diff
+        encoding (str): The Encoding To Use When Reading And Writing The Files
+        if_match (dict[str, str] | None): ETags From read_file By File Path, Files Whose ETag No Longer
+            Matches Are Not Modified
+
+    Returns:
+        dict[str, Any]: A Dictionary Containing The Overall Result And A Result Per File
+
+    Raises:
+        ValueError: If The Patch Is Malformed Or Contains No File Changes
+    """
+
+    try:
+        # Parse The Patch
+        file_patches: list[dict[str, Any]] = parse_unified_diff(patch)
+
+    except ValueError as e:
+        # Handle A Malformed Patch
+        msg: str = f"Failed To Parse Patch. Error: {e!s}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # If The Patch Contains No File Changes
+    if not file_patches:
+        # Raise A ValueError
+        msg: str = "No File Changes Found In Patch"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Key The Expected ETags By Absolute Path
+    etags: dict[Path, str] = {Path(path).resolve(): etag for path, etag in (if_match or {}).items()}
+
+    # Initialize Results List
+    results: list[dict[str, Any]] = []
+
+    # Apply Each File Patch
+    for file_patch in file_patches:
+        # Get The Paths The File Patch Changes
+        paths: list[Path] = [Path(path).resolve() for path in (file_patch["old_path"], file_patch["new_path"]) if path]
+
+        try:
+            # With The Locks Of The Paths, So Parallel Calls Changing Them Do Not Interleave
+            with lock_paths(*paths):
+                # Apply The File Patch
+                results.append(_apply_file_patch(file_patch, encoding, etags))
+
+        except (FileNotFoundError, FileExistsError, PermissionError, ValueError) as e:
+            # Append Error Result
+            results.append(
+                {
+                    "success": False,
+                    "path": file_patch["new_path"] or file_patch["old_path"],
+                    "error": str(e),
+                },
+            )
+
+    # Return The Result
+    return {
+        "success": all(result["success"] for result in results),
+        "hunks_applied": sum(result.get("hunks_applied", 0) for result in results),
+        "hunks_rejected": sum(len(result.get("rejected_hunks", [])) for result in results),
+        "files": results,
+    }
+
+
+# Helper Function To Apply The Hunks Of A Single File
+def _apply_file_patch(file_patch: dict[str, Any], encoding: str, etags: dict[Path, str]) -> dict[str, Any]:
+    """
+    Applies The Hunks Of A Single File With One Read And One Atomic Write
+
+    Args:
+        file_patch (dict[str, Any]): The File Change With old_path, new_path And hunks
+        encoding (str): The Encoding To Use When Reading And Writing The File
+        etags (dict[Path, str]): The Expected ETags By Absolute Path
+
+    Returns:
+        dict[str, Any]: A Dictionary Containing The Result For The File
+
+    Raises:
+        FileNotFoundError: If The File To Patch Does Not Exist
+        FileExistsError: If The File To Create Or Rename To Already Exists
+        PermissionError: If Permission Is Denied
+        ValueError: If The Path Is Invalid, The ETag Differs Or The File Cannot Be Decoded Or Encoded
+    """
+
+    # Get The Source And Target Paths, Which Differ For Renames
+    source_path: Path = Path(file_patch["old_path"] or file_patch["new_path"]).resolve()
+    target_path: Path = Path(file_patch["new_path"] or file_patch["old_path"]).resolve()
+
+    # Get The Action
+    action: str = _get_action(file_patch)
+
+    # Check The Paths Before Touching The File
+    _check_paths(action, source_path, target_path)
+
+    try:
+        # Fail Fast If The File Changed Since It Was Read
+        check_etag(source_path, etags.get(source_path), encoding=encoding)
+
+        # Read The File Once
+        original: str = "" if action == "create" else overlay_read_text(source_path, encoding)
+
+        # Apply The Hunks
+        patched, statuses = apply_hunks(split_lines(original), file_patch["hunks"])
+
+        # Join The Patched Lines
+        content: str = "".join(patched)
+
+        # Split The Statuses
+        applied: list[dict[str, Any]] = [status for status in statuses if status["status"] == "applied"]
+        rejected: list[dict[str, Any]] = [status for status in statuses if status["status"] == "rejected"]
+
+        # Initialize The New ETag
+        etag: str | None = None
+
+        # Whether The File Was Written Or Deleted
+        changed: bool = True
+
+        # Whether A Deletion Would Leave Content Behind, In Which Case The File Is Left Untouched
+        incomplete: bool = action == "delete" and not rejected and bool(patched)
+
+        # If A Deletion Left Nothing Behind
+        if action == "delete" and not rejected and not patched:
+            # Record The Pre-Image And Delete The File
+            record_pre_image(source_path)
+            overlay_unlink(source_path)
+
+        # If The File Is Created Or Its Content Changed
+        elif action != "delete" and (
+            (action == "create" and not rejected) or (applied and (content != original or source_path != target_path))
+        ):
+            # Create Parent Directories For New Files, Deferred To The Commit While The Overlay Is Enabled
+            if not is_overlay_enabled():
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Record The Pre-Image
+            record_pre_image(target_path)
+
+            # Write The File Once, Atomically
+            overlay_write_text(target_path, content, encoding=encoding)
+
+            # Get The New ETag From The Written Content
+            etag = etag_for_written_text(target_path, content)
+
+            # If The File Was Renamed
+            if source_path != target_path:
+                # Record The Pre-Image And Remove The Source File
+                record_pre_image(source_path)
+                overlay_unlink(source_path)
+
+        else:
+            # Nothing Was Written, So The ETag Is That Of The Unchanged File
+            changed = False
+            etag = etag_for_written_text(source_path, original)
+
+        # Return The Result, Explaining Why A File Whose Deletion Would Leave Content Behind Was Kept
+        return {
+            "success": not rejected and not incomplete,
+            "path": str(target_path),
+            "action": action,
+            "hunks_applied": len(applied),
+            "offsets": [status["offset"] for status in applied],
+            "rejected_hunks": [{"index": status["index"], "header": status["header"]} for status in rejected],
+            "changed": changed,
+            "etag": etag,
+            **({"error": f"Deletion Does Not Remove All Content, File Kept: {source_path}"} if incomplete else {}),
+        }
+
+    except PermissionError:
+        # Handle Permission Denied Error
+        msg: str = f"Permission Denied: {target_path}"
+
+        # Raise The Error
+        raise PermissionError(msg) from None
+
+    except UnicodeDecodeError:
+        # Handle Encoding Error During Read
+        msg: str = f"Failed To Decode File With Encoding '{encoding}': {source_path}"
+
+        # Raise A ValueError
+        raise ValueError(msg) from None
+
+    except UnicodeEncodeError as e:
+        # Handle Encoding Error During Write
+        msg: str = f"Failed To Encode Content With Encoding '{encoding}': {target_path}"
+
+        # Raise A ValueError
+        raise ValueError(msg) from e
+
+    except Exception as e:
+        # Handle Other Errors
+        msg: str = f"Failed To Apply Patch To File: {target_path}. Error: {e!s}"
+
+        # Raise A ValueError
+        raise ValueError(msg) from e
+
+
+# Helper Function To Get The Action Of A File Patch
+def _get_action(file_patch: dict[str, Any]) -> str:
+    """
+    Gets Whether A File Patch Creates, Deletes Or Modifies A File
+
+    Args:
+        file_patch (dict[str, Any]): The File Change With old_path And new_path
+
+    Returns:
+        str: "create", "delete" Or "modify"
+    """
+
+    # If The Old Side Is /dev/null
+    if file_patch["old_path"] is None:
+        # The File Is Created
+        return "create"
+
+    # The File Is Deleted If The New Side Is /dev/null, Otherwise Modified
+    return "delete" if file_patch["new_path"] is None else "modify"
+
+
+# Helper Function To Check The Paths Of A File Patch
+def _check_paths(action: str, source_path: Path, target_path: Path) -> None:
+    """
+    Checks That The Paths Of A File Patch Are Usable For Its Action
+
+    Args:
+        action (str): "create", "delete" Or "modify"
+        source_path (Path): The File Read From
+        target_path (Path): The File Written To
+
+    Raises:
+        FileExistsError: If The File To Create Or Rename To Already Exists
+        FileNotFoundError: If The File To Patch Does Not Exist
+        ValueError: If The Path To Patch Is Not A File
+    """
+
+    # If The File Is Created
+    if action == "create":
+        # Check If The File Already Exists
+        if overlay_exists(target_path):
+            # Raise A FileExistsError
+            msg: str = f"File Already Exists: {target_path}"
+
+            # Raise The Error
+            raise FileExistsError(msg) from None
+
+        # Nothing Else To Check
+        return
+
+    # Check If The File Exists
+    if not overlay_exists(source_path):
+        # Raise A FileNotFoundError
+        msg: str = f"File Not Found: {source_path}"
+
+        # Raise The Error
+        raise FileNotFoundError(msg) from None
+
+    # Check If The Path Is A File
+    if not overlay_is_file(source_path):
+        # Raise A ValueError
+        msg: str = f"Path Is Not A File: {source_path}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Check If A Rename Would Replace An Existing File
+    if source_path != target_path and overlay_exists(target_path):
+        # Raise A FileExistsError
+        msg: str = f"File Already Exists: {target_path}"
+
+        # Raise The Error
+        raise FileExistsError(msg) from None
+
+
+# Exports
+__all__: list[str] = ["apply_patch"]
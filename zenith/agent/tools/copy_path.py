@@ -0,0 +1,167 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.overlay import copy_staged
+from zenith.agent.tools.overlay import has_staged_within
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_size
+from zenith.agent.tools.overlay import unstage
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_new_directory
+from zenith.agent.tools.undo_journal import record_new_tree
+from zenith.agent.tools.undo_journal import record_pre_image
+from zenith.utils.file_copy import copy_file
+from zenith.utils.file_copy import copy_tree
+from zenith.utils.format_file_size import format_size
+
+
+# Function To Copy A File Or Directory
+def copy_path(source_path: str, target_path: str, *, overwrite: bool = False) -> dict[str, Any]:
+    """
+    Copies A File Or Directory Without Reading Its Content Into The Conversation
+
+    Files Are Copied By The Kernel Where Possible And Written Atomically. Directories Are Copied
+    Recursively, With Their Files Copied In Parallel. Missing Parent Directories Of The Target Are Created
+
+    Args:
+        source_path (str): The File Or Directory To Copy
+        target_path (str): The Path Of The Copy
+        overwrite (bool): Whether To Replace An Existing Target File, Directories Are Never Replaced
+
+    Returns:
+        dict[str, Any]: A Dictionary Containing The Result And Metadata
+
+    Raises:
+        FileNotFoundError: If The Source Does Not Exist
+        FileExistsError: If The Target Exists And Cannot Be Replaced
+        PermissionError: If Permission Is Denied
+        ValueError: If The Target Is Inside The Source, The Source Has Staged Changes Or The Copy Fails
+    """
+
+    # Convert To Absolute Paths If Relative
+    source: Path = Path(source_path).resolve()
+    target: Path = Path(target_path).resolve()
+
+    # With The Locks Of Both Paths, So Parallel Calls Changing Them Do Not Interleave
+    with lock_paths(source, target):
+        # Check The Paths
+        is_directory: bool = _check_paths(source, target, overwrite=overwrite)
+
+        try:
+            # If The Parent Directory Of The Target Is Missing
+            if not target.parent.exists():
+                # Record And Create It
+                record_new_directory(target.parent)
+                target.parent.mkdir(parents=True)
+
+            # If The Source Is A Directory
+            if is_directory:
+                # Record And Copy The Tree
+                record_new_tree(target)
+                files, size = copy_tree(source, target)
+
+            else:
+                # Record The Pre-Image Of The Target
+                record_pre_image(target)
+
+                # If The Source Has Staged Text
+                if copy_staged(source, target):
+                    # The Copy Is Staged Too
+                    files, size = 1, overlay_size(target)
+
+                else:
+                    # The Copy Replaces Any Staged Text Of The Target
+                    unstage(target)
+
+                    # Copy The File On Disk
+                    files, size = 1, copy_file(source, target)
+
+            # Return The Result
+            return {
+                "success": True,
+                "source": str(source),
+                "target": str(target),
+                "type": "directory" if is_directory else "file",
+                "files": files,
+                "size": size,
+                "size_human": format_size(size),
+            }
+
+        except PermissionError:
+            # Handle Permission Denied Error
+            msg: str = f"Permission Denied: {target}"
+
+            # Raise The Error
+            raise PermissionError(msg) from None
+
+        except Exception as e:
+            # Handle Other Errors
+            msg: str = f"Failed To Copy Path: {source} To {target}. Error: {e!s}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+
+# Helper Function To Check The Source And Target Of A Copy
+def _check_paths(source: Path, target: Path, *, overwrite: bool) -> bool:
+    """
+    Checks That A Source Can Be Copied To A Target
+
+    Args:
+        source (Path): The Absolute Source Path
+        target (Path): The Absolute Target Path
+        overwrite (bool): Whether An Existing Target File May Be Replaced
+
+    Returns:
+        bool: True If The Source Is A Directory
+
+    Raises:
+        FileNotFoundError: If The Source Does Not Exist
+        FileExistsError: If The Target Exists And Cannot Be Replaced
+        ValueError: If The Target Is Inside The Source Or The Source Has Staged Changes
+    """
+
+    # Check If The Source Exists
+    if not overlay_exists(source):
+        # Raise A FileNotFoundError
+        msg: str = f"Path Not Found: {source}"
+
+        # Raise The Error
+        raise FileNotFoundError(msg) from None
+
+    # Check If The Target Is The Source Or Inside It
+    if target.is_relative_to(source):
+        # Raise A ValueError
+        msg: str = f"Cannot Copy A Path Onto Or Into Itself: {target}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Get Whether The Source Is A Directory
+    is_directory: bool = source.is_dir()
+
+    # Check If The Target Exists And Cannot Be Replaced
+    if overlay_exists(target) and (is_directory or not overwrite or not overlay_is_file(target)):
+        # Raise A FileExistsError
+        msg: str = f"Path Already Exists: {target}"
+
+        # Raise The Error
+        raise FileExistsError(msg) from None
+
+    # Check If The Source Directory Has Staged Changes
+    if is_directory and has_staged_within(source):
+        # Raise A ValueError
+        msg: str = f"Directory Has Staged Changes That Are Only Written At The End Of The Turn: {source}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Return Whether The Source Is A Directory
+    return is_directory
+
+
+# Exports
+__all__: list[str] = ["copy_path"]
@@ -0,0 +1,121 @@
+# Standard Library Imports
+from pathlib import Path
+
+# Local Imports
+from zenith.agent.tools.overlay import get_staged_text
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_mtime_ns
+from zenith.utils.content_hash import hash_text
+from zenith.utils.content_hash import hash_text_file
+
+
+# Function To Make An ETag
+def make_etag(content_hash: str, mtime_ns: int) -> str:
+    """
+    Makes An ETag From A Content Hash And A Modification Time
+
+    Args:
+        content_hash (str): The Hash Of The Decoded File Content
+        mtime_ns (int): The Modification Time Of The File In Nanoseconds
+
+    Returns:
+        str: The ETag
+    """
+
+    # Combine A Short Content Hash With The Modification Time
+    return f"{content_hash[:16]}-{mtime_ns:x}"
+
+
+# Function To Get The ETag Of Text Just Written To A File
+def etag_for_written_text(abs_path: Path, text: str) -> str:
+    """
+    Gets The ETag Of A File From The Text Just Written To It, Without Reading It Back
+
+    Newlines Are Normalized As Text Mode Reading Does, So The ETag Matches What read_file Returns
+
+    Args:
+        abs_path (Path): The File That Was Written
+        text (str): The Text That Was Written
+
+    Returns:
+        str: The ETag
+    """
+
+    # Normalize Newlines As Universal Newline Reading Does
+    normalized: str = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Return The ETag
+    return make_etag(hash_text(normalized), overlay_mtime_ns(abs_path))
+
+
+# Function To Get The Current ETag Of A File
+def current_etag(abs_path: Path, encoding: str) -> str:
+    """
+    Gets The Current ETag Of A File By Hashing Its Staged Text Or Its Decoded Content In Chunks
+
+    Args:
+        abs_path (Path): The File
+        encoding (str): The Encoding Of The File
+
+    Returns:
+        str: The ETag
+    """
+
+    # Get The Staged Text
+    staged: str | None = get_staged_text(abs_path)
+
+    # If The File Is Staged In The Overlay
+    if staged is not None:
+        # Return The ETag Of The Staged Text
+        return etag_for_written_text(abs_path, staged)
+
+    # Get The Modification Time Before Reading
+    mtime_ns: int = abs_path.stat().st_mtime_ns
+
+    # Return The ETag
+    return make_etag(hash_text_file(abs_path, encoding), mtime_ns)
+
+
+# Function To Check An ETag
+def check_etag(abs_path: Path, if_match: str | None, *, encoding: str) -> None:
+    """
+    Checks That A File Still Matches The ETag It Had When It Was Read
+
+    The Modification Time Is Compared First, So Most Mismatches Fail Without Reading The File
+
+    Args:
+        abs_path (Path): The File
+        if_match (str | None): The Expected ETag, None To Skip The Check
+        encoding (str): The Encoding Of The File
+
+    Raises:
+        ValueError: If The File No Longer Exists Or Its ETag Differs
+    """
+
+    # If No ETag Was Given
+    if if_match is None:
+        # Nothing To Check
+        return
+
+    # If The File No Longer Exists
+    if not overlay_is_file(abs_path):
+        # Raise A ValueError
+        msg: str = f"ETag Mismatch: File No Longer Exists: {abs_path}"
+
+        # Raise The Error
+        raise ValueError(msg)
+
+    # Get The Expected Modification Time
+    expected_mtime: str = if_match.rpartition("-")[2]
+
+    # If The Modification Time Differs, Or It Matches But The Content Does Not
+    if expected_mtime != f"{overlay_mtime_ns(abs_path):x}" or current_etag(abs_path, encoding) != if_match:
+        # Raise A ValueError
+        msg: str = f"ETag Mismatch: File Changed Since It Was Read, Read It Again Before Editing: {abs_path}"
+
+        # Raise The Error
+        raise ValueError(msg)
+
+
+# Exports
+__all__: list[str] = ["check_etag", "current_etag", "etag_for_written_text", "make_etag"]
@@ -12,6 +12,7 @@ from typing import Any
 from dateutil import tz
 
 # Local Imports
+from zenith.agent.tools.tool_executor import raise_if_cancelled
 from zenith.utils.format_file_size import format_size
 
 # Type Checking Imports
@@ -26,6 +27,9 @@ def list_files(folder_path: str | None = None) -> dict[str, Any]:
     Lists All Files And Folders With Metadata In A Tree-Like Structure
     Respects .gitignore Patterns
 
+    The Listing Shows The Disk: Writes And Deletions Staged In The Overlay Appear Once The Turn
+    Ends, Use stat_paths To Check Staged Files
+
     Args:
         folder_path (str | None): The Path To The Folder To List, Defaults To Current Directory
 
@@ -142,6 +146,9 @@ def _build_tree(node: dict[str, Any], project_root: Path, gitignore_patterns: li
         # Return
         return
 
+    # Stop If The Tool Call Was Cancelled
+    raise_if_cancelled()
+
     # Get The Path
     path: Path = Path(node["path"])
 
@@ -2,6 +2,10 @@
 from pathlib import Path
 from typing import Any
 
+# Local Imports
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_new_directory
+
 
 # Function To Create A Directory
 def make_directory(
@@ -32,37 +36,42 @@ def make_directory(
     # Convert To Absolute Path If Relative
     abs_path: Path = Path(directory_path).resolve()
 
-    try:
-        # Create The Directory
-        abs_path.mkdir(parents=parents, exist_ok=exist_ok, mode=mode)
+    # With The Path Lock, So Parallel Calls Changing The Directory Do Not Interleave
+    with lock_paths(abs_path):
+        try:
+            # Record The Directory So It Can Be Undone
+            record_new_directory(abs_path)
+
+            # Create The Directory
+            abs_path.mkdir(parents=parents, exist_ok=exist_ok, mode=mode)
 
-        # Return Success Result
-        return {
-            "success": True,
-            "path": str(abs_path),
-            "message": f"Directory Created Successfully: {abs_path}",
-        }
+            # Return Success Result
+            return {
+                "success": True,
+                "path": str(abs_path),
+                "message": f"Directory Created Successfully: {abs_path}",
+            }
 
-    except FileExistsError:
-        # Handle Directory Already Exists Error
-        msg: str = f"Directory Already Exists: {abs_path}"
+        except FileExistsError:
+            # Handle Directory Already Exists Error
+            msg: str = f"Directory Already Exists: {abs_path}"
 
-        # Raise The Error
-        raise FileExistsError(msg) from None
+            # Raise The Error
+            raise FileExistsError(msg) from None
 
-    except PermissionError:
-        # Handle Permission Denied Error
-        msg: str = f"Permission Denied: {abs_path}"
+        except PermissionError:
+            # Handle Permission Denied Error
+            msg: str = f"Permission Denied: {abs_path}"
 
-        # Raise The Error
-        raise PermissionError(msg) from None
+            # Raise The Error
+            raise PermissionError(msg) from None
 
-    except OSError as e:
-        # Handle Other OS Errors
-        msg: str = f"Failed To Create Directory: {abs_path}. Error: {e!s}"
+        except OSError as e:
+            # Handle Other OS Errors
+            msg: str = f"Failed To Create Directory: {abs_path}. Error: {e!s}"
 
-        # Raise A ValueError
-        raise ValueError(msg) from e
+            # Raise A ValueError
+            raise ValueError(msg) from e
 
 
 # Function To Check If A Directory Exists
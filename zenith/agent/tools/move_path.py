@@ -0,0 +1,164 @@
+# Standard Library Imports
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.overlay import copy_staged
+from zenith.agent.tools.overlay import has_staged_within
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_unlink
+from zenith.agent.tools.overlay import unstage
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_move
+from zenith.agent.tools.undo_journal import record_new_directory
+from zenith.agent.tools.undo_journal import record_pre_image
+from zenith.utils.file_copy import move_path_on_disk
+
+
+# Function To Move A File Or Directory
+def move_path(source_path: str, target_path: str, *, overwrite: bool = False) -> dict[str, Any]:
+    """
+    Moves Or Renames A File Or Directory Without Reading Its Content Into The Conversation
+
+    On The Same Filesystem The Path Is Renamed Atomically. Across Filesystems It Is Copied By The
+    Kernel And The Source Is Removed. Missing Parent Directories Of The Target Are Created
+
+    Args:
+        source_path (str): The File Or Directory To Move
+        target_path (str): The New Path
+        overwrite (bool): Whether To Replace An Existing Target File, Directories Are Never Replaced
+
+    Returns:
+        dict[str, Any]: A Dictionary Containing The Result And Metadata
+
+    Raises:
+        FileNotFoundError: If The Source Does Not Exist
+        FileExistsError: If The Target Exists And Cannot Be Replaced
+        PermissionError: If Permission Is Denied
+        ValueError: If The Target Is Inside The Source, The Source Has Staged Changes Or The Move Fails
+    """
+
+    # Convert To Absolute Paths If Relative
+    source: Path = Path(source_path).resolve()
+    target: Path = Path(target_path).resolve()
+
+    # With The Locks Of Both Paths, So Parallel Calls Changing Them Do Not Interleave
+    with lock_paths(source, target):
+        # Check The Paths
+        is_directory: bool = _check_paths(source, target, overwrite=overwrite)
+
+        try:
+            # If The Parent Directory Of The Target Is Missing
+            if not target.parent.exists():
+                # Record And Create It
+                record_new_directory(target.parent)
+                target.parent.mkdir(parents=True)
+
+            # If A Target File Is Replaced
+            if overlay_exists(target):
+                # Record Its Pre-Image
+                record_pre_image(target)
+
+            # If The Source Has Staged Text
+            if copy_staged(source, target):
+                # Stage The Deletion Of The Source
+                overlay_unlink(source)
+
+                # The Move Is Staged Too
+                method: str = "staged"
+
+            else:
+                # Record The Move
+                record_move(source, target)
+
+                # The Move Replaces Any Staged Text Of The Target
+                unstage(target)
+
+                # Move The Path On Disk
+                method = move_path_on_disk(source, target)
+
+            # Return The Result
+            return {
+                "success": True,
+                "source": str(source),
+                "target": str(target),
+                "type": "directory" if is_directory else "file",
+                "method": method,
+            }
+
+        except PermissionError:
+            # Handle Permission Denied Error
+            msg: str = f"Permission Denied: {source}"
+
+            # Raise The Error
+            raise PermissionError(msg) from None
+
+        except Exception as e:
+            # Handle Other Errors
+            msg: str = f"Failed To Move Path: {source} To {target}. Error: {e!s}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+
+# Helper Function To Check The Source And Target Of A Move
+def _check_paths(source: Path, target: Path, *, overwrite: bool) -> bool:
+    """
+    Checks That A Source Can Be Moved To A Target
+
+    Args:
+        source (Path): The Absolute Source Path
+        target (Path): The Absolute Target Path
+        overwrite (bool): Whether An Existing Target File May Be Replaced
+
+    Returns:
+        bool: True If The Source Is A Directory
+
+    Raises:
+        FileNotFoundError: If The Source Does Not Exist
+        FileExistsError: If The Target Exists And Cannot Be Replaced
+        ValueError: If The Target Is Inside The Source Or The Source Has Staged Changes
+    """
+
+    # Check If The Source Exists
+    if not overlay_exists(source):
+        # Raise A FileNotFoundError
+        msg: str = f"Path Not Found: {source}"
+
+        # Raise The Error
+        raise FileNotFoundError(msg) from None
+
+    # Check If The Target Is The Source Or Inside It
+    if target.is_relative_to(source):
+        # Raise A ValueError
+        msg: str = f"Cannot Move A Path Onto Or Into Itself: {target}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Get Whether The Source Is A Directory
+    is_directory: bool = source.is_dir()
+
+    # Check If The Target Exists And Cannot Be Replaced
+    if overlay_exists(target) and (is_directory or not overwrite or not overlay_is_file(target)):
+        # Raise A FileExistsError
+        msg: str = f"Path Already Exists: {target}"
+
+        # Raise The Error
+        raise FileExistsError(msg) from None
+
+    # Check If The Source Directory Has Staged Changes
+    if is_directory and has_staged_within(source):
+        # Raise A ValueError
+        msg: str = f"Directory Has Staged Changes That Are Only Written At The End Of The Turn: {source}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Return Whether The Source Is A Directory
+    return is_directory
+
+
+# Exports
+__all__: list[str] = ["move_path"]
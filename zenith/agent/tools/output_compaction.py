@@ -0,0 +1,386 @@
+# Standard Library Imports
+import copy
+import functools
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.read_cache import READ_TOOLS
+from zenith.agent.tools.read_cache import forget_result_reads
+from zenith.agent.tools.turn_tracker import get_current_turn
+from zenith.utils.token_estimator import estimate_tokens
+
+# Fields Dropped From The Filesystem Entries Of METADATA_TOOLS, Since The Model Rarely Needs Them
+DROPPED_FIELDS: frozenset[str] = frozenset({"access_time", "permissions", "size_human"})
+
+# Tools Whose Outputs Are Filesystem Entries, The Only Outputs Fields Are Dropped From
+METADATA_TOOLS: frozenset[str] = frozenset({"list_files", "search_files", "stat_paths"})
+
+# Number Of Characters Kept Of Each Text In A List Result, So One Large Item Cannot Crowd Out The Rest
+MAX_ITEM_CHARS: int = 16000
+
+# Minimum Number Of Entries Rendered As A Table
+_MIN_TABLE_ROWS: int = 2
+
+# Description Of The Rendered Directory Tree
+_TREE_FORMAT: str = "Indented Tree, Directories End With /, Files Show Size In Bytes And Modification Time"
+
+# The Turn The Savings Belong To, And The Savings Per Tool In It
+_savings_turn: int = -1
+_savings: dict[str, dict[str, int]] = {}
+
+# Lock Guarding The Savings Against Concurrent Tool Calls
+_savings_lock: threading.Lock = threading.Lock()
+
+
+# Function To Compact A Tool Output
+def compact_tool_output(result: Any, name: str | None = None) -> Any:
+    """
+    Compacts A Tool Output Before It Enters The Model Context
+
+    Low-Value Fields Are Dropped From The Entries Of METADATA_TOOLS, Directory Trees Are Rendered
+    As Indented Text, Lists Of Flat Entries As A Table With One Header Line, And Long Texts In List
+    Results Are Truncated With An Explicit Marker. Other Payloads, Such As Data Rows, Keep Every Field.
+    File Reads Are Never Rendered As Tables, So Their Paths And Hashes Can Still Be Found When The
+    Output Later Leaves The Context
+
+    Args:
+        result (Any): The Tool Output
+        name (str | None): The Tool Name, None If Unknown
+
+    Returns:
+        Any: The Compacted Output, A Dictionary If A Tree Or Table Was Rendered
+    """
+
+    # If The Output Is A Directory Tree
+    if isinstance(result, dict) and isinstance(result.get("children"), list):
+        # Render The Tree As Text
+        return {"path": str(result.get("path")), "format": _TREE_FORMAT, "content": "\n".join(_render_tree(result))}
+
+    # If The Output Holds Filesystem Entries
+    if name in METADATA_TOOLS:
+        # Drop The Low-Value Fields Of Each Entry
+        result = [_drop_fields(entry) for entry in result] if isinstance(result, list) else _drop_fields(result)
+
+    # If The Output Is A List Of Flat Entries, And Not File Reads
+    if name not in READ_TOOLS and _is_table(result):
+        # Render The Entries As A Table
+        return {"content": _render_table(result)}
+
+    # If The Output Is A List
+    if isinstance(result, list):
+        # Compact Each Item, Truncating Long Texts
+        return [_truncate_texts(_compact_value(item)) for item in result]
+
+    # Compact The Output
+    return _compact_value(result)
+
+
+# Function To Wrap A Tool With Output Compaction
+def with_output_compaction(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """
+    Wraps A Tool Function So Its Outputs Are Compacted And The Token Savings Are Recorded
+
+    Args:
+        func (Callable[..., Any]): The Tool Function
+        name (str): The Tool Name The Savings Are Recorded Under
+
+    Returns:
+        Callable[..., Any]: The Wrapped Tool Function With The Same Signature
+    """
+
+    # Define The Wrapper
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """
+        Calls The Tool And Compacts Its Output
+        """
+
+        # Call The Tool
+        result: Any = func(*args, **kwargs)
+
+        # Compact The Output
+        compacted: Any = compact_tool_output(result, name)
+
+        # Estimate The Tokens Of Both As The Model Would See Them
+        tokens_before: int = estimate_tokens(str(result))
+        tokens_after: int = estimate_tokens(str(compacted))
+
+        # If Compacting Did Not Help
+        if tokens_after >= tokens_before:
+            # Keep The Original Output
+            compacted, tokens_after = result, tokens_before
+
+        # Record The Savings
+        _record_savings(name, tokens_before, tokens_after)
+
+        # Return The Output
+        return compacted
+
+    # Return The Wrapper
+    return wrapper
+
+
+# Function To Get The Token Savings Of The Current Turn
+def get_output_savings() -> dict[str, Any]:
+    """
+    Gets The Estimated Tool Output Tokens Before And After Compaction In The Current Turn
+
+    Returns:
+        dict[str, Any]: The Turn, The Totals And The Calls And Tokens Per Tool
+    """
+
+    # With The Savings Lock
+    with _savings_lock:
+        # Start Counting The Current Turn If It Has Changed
+        _sync_turn()
+
+        # Return The Savings
+        return {
+            "turn": _savings_turn,
+            "tokens_before": sum(counters["tokens_before"] for counters in _savings.values()),
+            "tokens_after": sum(counters["tokens_after"] for counters in _savings.values()),
+            "tools": copy.deepcopy(_savings),
+        }
+
+
+# Helper Function To Record The Savings Of One Call
+def _record_savings(name: str, tokens_before: int, tokens_after: int) -> None:
+    """
+    Adds The Tokens Of One Tool Output To The Savings Of The Current Turn
+
+    Args:
+        name (str): The Tool Name
+        tokens_before (int): The Estimated Tokens Of The Raw Output
+        tokens_after (int): The Estimated Tokens Of The Compacted Output
+    """
+
+    # With The Savings Lock
+    with _savings_lock:
+        # Start Counting The Current Turn If It Has Changed
+        _sync_turn()
+
+        # Add The Call To The Counters Of The Tool
+        counters: dict[str, int] = _savings.setdefault(name, {"calls": 0, "tokens_before": 0, "tokens_after": 0})
+        counters["calls"] += 1
+        counters["tokens_before"] += tokens_before
+        counters["tokens_after"] += tokens_after
+
+
+# Helper Function To Start Counting A New Turn
+def _sync_turn() -> None:
+    """
+    Drops The Savings Of An Earlier Turn, Called With The Savings Lock Held
+    """
+
+    # Use The Module Level Turn
+    global _savings_turn  # noqa: PLW0603
+
+    # If A New Turn Has Begun
+    if _savings_turn != get_current_turn():
+        # Start The New Turn Without Savings
+        _savings_turn = get_current_turn()
+        _savings.clear()
+
+
+# Helper Function To Compact A Value
+def _compact_value(value: Any) -> Any:
+    """
+    Renders Nested Lists Of Flat Entries As Tables, Keeping Every Field
+
+    Args:
+        value (Any): The Value To Compact
+
+    Returns:
+        Any: The Compacted Value
+    """
+
+    # If The Value Is A List Of Flat Entries
+    if _is_table(value):
+        # Render It As A Table
+        return _render_table(value)
+
+    # If The Value Is A List
+    if isinstance(value, list):
+        # Compact Each Item
+        return [_compact_value(item) for item in value]
+
+    # If The Value Is Not A Dictionary
+    if not isinstance(value, dict):
+        # Keep It
+        return value
+
+    # Return The Dictionary With Each Value Compacted
+    return {key: _compact_value(item) for key, item in value.items()}
+
+
+# Helper Function To Drop The Low-Value Fields Of A Filesystem Entry
+def _drop_fields(entry: Any) -> Any:
+    """
+    Drops The Low-Value Fields Of A Filesystem Entry, And A Name Repeating The End Of Its Path
+
+    Args:
+        entry (Any): The Entry
+
+    Returns:
+        Any: The Entry Without Those Fields, Or The Value Unchanged If It Is Not A Dictionary
+    """
+
+    # If The Entry Is Not A Dictionary
+    if not isinstance(entry, dict):
+        # Keep It
+        return entry
+
+    # Return The Entry Without Dropped Or Redundant Fields
+    return {
+        key: value
+        for key, value in entry.items()
+        if key not in DROPPED_FIELDS
+        and not (key == "name" and isinstance(entry.get("path"), str) and Path(entry["path"]).name == value)
+    }
+
+
+# Helper Function To Check Whether A Value Can Be Rendered As A Table
+def _is_table(value: Any) -> bool:
+    """
+    Checks Whether A Value Is A List Of Entries Whose Fields Are All Single-Line Scalars, None Of Them A File Read
+
+    Args:
+        value (Any): The Value
+
+    Returns:
+        bool: True If The Value Can Be Rendered As A Table
+    """
+
+    # Return Whether Every Entry Is A Dictionary Of Single-Line Scalars Without A Content Hash
+    return (
+        isinstance(value, list)
+        and len(value) >= _MIN_TABLE_ROWS
+        and all(
+            isinstance(entry, dict)
+            and "hash" not in entry
+            and all(
+                item is None or (isinstance(item, int | float | str) and "\n" not in str(item))
+                for item in entry.values()
+            )
+            for entry in value
+        )
+    )
+
+
+# Helper Function To Render Flat Entries As A Table
+def _render_table(entries: list[dict[str, Any]]) -> str:
+    """
+    Renders Flat Entries As A Header Line Followed By One Line Per Entry
+
+    Args:
+        entries (list[dict[str, Any]]): The Entries
+
+    Returns:
+        str: The Columns And Values Separated By " | ", With | In Them Escaped As \\| And Missing Values Left Empty
+    """
+
+    # Get The Columns In Order Of First Appearance
+    columns: list[str] = list(dict.fromkeys(key for entry in entries for key in entry))
+
+    # Return The Header And The Rows
+    return "\n".join(
+        [
+            " | ".join(_escape_cell(column) for column in columns),
+            *(" | ".join(_escape_cell(entry.get(column)) for column in columns) for entry in entries),
+        ],
+    )
+
+
+# Helper Function To Render One Table Cell
+def _escape_cell(value: Any) -> str:
+    """
+    Renders A Table Value, Escaping The Column Separator So Values Holding It Cannot Add Columns
+
+    Args:
+        value (Any): The Value, None For A Missing One
+
+    Returns:
+        str: The Value As Text With Each | Escaped As \\|, Empty For None
+    """
+
+    # Return The Escaped Text
+    return "" if value is None else str(value).replace("|", "\\|")
+
+
+# Helper Function To Render A Directory Tree
+def _render_tree(node: dict[str, Any], depth: int = 0) -> list[str]:
+    """
+    Renders A Directory Tree From list_files As Indented Lines
+
+    Args:
+        node (dict[str, Any]): The Node To Render
+        depth (int): The Depth Of The Node
+
+    Returns:
+        list[str]: One Line Per Node, Children Indented Below Their Directory
+    """
+
+    # Get The Indentation
+    indent: str = "  " * depth
+
+    # If The Node Is A File
+    if node.get("children") is None:
+        # Render The Name, Size And Modification Time
+        return [f"{indent}{node.get('name')}  {node.get('size')}  {node.get('modified_time')}"]
+
+    # Render The Directory, With Its Error If Any, Followed By Its Children
+    return [
+        f"{indent}{node.get('name')}/" + (f"  [{node['error']}]" if node.get("error") else ""),
+        *(line for child in node["children"] for line in _render_tree(child, depth + 1)),
+    ]
+
+
+# Helper Function To Truncate The Long Texts Of A List Item
+def _truncate_texts(item: Any) -> Any:
+    """
+    Truncates The Texts Of A List Item To MAX_ITEM_CHARS, Marking What Was Removed
+
+    A Truncated File Read Is Forgotten, So Reading The File Again Returns Its Content And Not The
+    "Unchanged" Stub
+
+    Args:
+        item (Any): The List Item
+
+    Returns:
+        Any: The Item With Each Long Top-Level Text Truncated
+    """
+
+    # If The Item Is Not A Dictionary Or Has No Long Text
+    if not isinstance(item, dict) or not any(
+        isinstance(value, str) and len(value) > MAX_ITEM_CHARS for value in item.values()
+    ):
+        # Keep It
+        return item
+
+    # Forget The Read Of The Item, If It Is One
+    forget_result_reads(item)
+
+    # Return The Item With Long Texts Truncated
+    return {
+        key: (
+            f"{value[:MAX_ITEM_CHARS]}\n[Truncated: Showing The First {MAX_ITEM_CHARS} Of {len(value)} Characters. "
+            "Request This Item Alone Or A Smaller Range For The Rest.]"
+            if isinstance(value, str) and len(value) > MAX_ITEM_CHARS
+            else value
+        )
+        for key, value in item.items()
+    }
+
+
+# Exports
+__all__: list[str] = [
+    "DROPPED_FIELDS",
+    "MAX_ITEM_CHARS",
+    "METADATA_TOOLS",
+    "compact_tool_output",
+    "get_output_savings",
+    "with_output_compaction",
+]
@@ -0,0 +1,525 @@
+# Standard Library Imports
+import io
+import threading
+from pathlib import Path
+from typing import IO
+
+# Local Imports
+from zenith.utils.atomic_write import atomic_write_text
+from zenith.utils.atomic_write import encode_text_for_write
+from zenith.utils.atomic_write import file_has_content
+
+# Whether File Tools Stage Their Writes In Memory Until The End Of The Turn
+_enabled: bool = False
+
+# Staged Files Keyed By Absolute Path, Mapped To (Text Or None For A Deletion, Encoding)
+_staged: dict[Path, tuple[str | None, str]] = {}
+
+# Lock Guarding The Staged Files Against Concurrent Tool Calls
+_staged_lock: threading.Lock = threading.Lock()
+
+
+# Function To Enable Or Disable The Overlay
+def set_overlay_enabled(*, enabled: bool) -> None:
+    """
+    Enables Or Disables The In-Memory Overlay Used By The File Tools
+
+    While Enabled, Writes Are Staged In Memory And Served To Later Reads, And Nothing Touches The
+    Disk Until commit_overlay Is Called At The End Of The Turn
+
+    Args:
+        enabled (bool): Whether Writes Are Staged In Memory
+    """
+
+    # Use The Module Level Flag
+    global _enabled  # noqa: PLW0603
+
+    # Set The Flag
+    _enabled = enabled
+
+
+# Function To Check Whether The Overlay Is Enabled
+def is_overlay_enabled() -> bool:
+    """
+    Checks Whether The In-Memory Overlay Is Enabled
+
+    Returns:
+        bool: True If Writes Are Staged In Memory, False If They Go Straight To Disk
+    """
+
+    # Return The Flag
+    return _enabled
+
+
+# Function To Get The Staged Text Of A File
+def get_staged_text(abs_path: Path) -> str | None:
+    """
+    Gets The Text Staged For A File, With Newlines Normalized As Text Mode Reading Does
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+
+    Returns:
+        str | None: The Staged Text, Or None If The File Is Not Staged Or Is Staged For Deletion
+    """
+
+    # Get The Staged Text
+    text: str | None = _get_entry(abs_path)[0]
+
+    # Return The Normalized Text, If Any
+    return None if text is None else text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+# Function To Check Whether A Path Is Staged
+def is_staged(abs_path: Path) -> bool:
+    """
+    Checks Whether A Write Or Deletion Is Staged For A Path
+
+    Args:
+        abs_path (Path): The Absolute Path
+
+    Returns:
+        bool: True If The Path Is Staged In The Overlay
+    """
+
+    # With The Staged Lock, Return Whether The Path Is Staged
+    with _staged_lock:
+        return abs_path in _staged
+
+
+# Function To Check Whether Anything Inside A Directory Is Staged
+def has_staged_within(directory: Path) -> bool:
+    """
+    Checks Whether A Write Or Deletion Is Staged For A Path Inside A Directory
+
+    Args:
+        directory (Path): The Absolute Path Of The Directory
+
+    Returns:
+        bool: True If A Path Inside The Directory Is Staged In The Overlay
+    """
+
+    # With The Staged Lock, Return Whether Any Staged Path Is Inside The Directory
+    with _staged_lock:
+        return any(path.is_relative_to(directory) for path in _staged)
+
+
+# Function To Copy Staged Text To Another Path
+def copy_staged(source: Path, target: Path) -> bool:
+    """
+    Stages The Text Staged For One File As The Text Of Another
+
+    Args:
+        source (Path): The Absolute Path Of The Staged File
+        target (Path): The Absolute Path Of The Copy
+
+    Returns:
+        bool: True If The Source Had Staged Text, False If Nothing Was Staged
+    """
+
+    # With The Staged Lock
+    with _staged_lock:
+        # If The Source Has No Staged Text
+        if _staged.get(source, (None, "utf-8"))[0] is None:
+            # Nothing To Copy
+            return False
+
+        # Stage The Same Text And Encoding
+        _staged[target] = _staged[source]
+
+    # Return Success
+    return True
+
+
+# Function To Drop The Staged Change Of A Path
+def unstage(abs_path: Path) -> None:
+    """
+    Drops Any Write Or Deletion Staged For A Path, For Tools That Change The Disk Directly
+
+    Args:
+        abs_path (Path): The Absolute Path
+    """
+
+    # With The Staged Lock, Drop The Entry
+    with _staged_lock:
+        _staged.pop(abs_path, None)
+
+
+# Function To Check Whether A Path Exists Through The Overlay
+def overlay_exists(abs_path: Path) -> bool:
+    """
+    Checks Whether A Path Exists, Taking Staged Writes And Deletions Into Account
+
+    Args:
+        abs_path (Path): The Absolute Path
+
+    Returns:
+        bool: True If The Path Exists
+    """
+
+    # If The Path Is Staged
+    if (entry := _get_staged(abs_path)) is not None:
+        # It Exists Unless It Is Staged For Deletion
+        return entry[0] is not None
+
+    # Check The Disk
+    return abs_path.exists()
+
+
+# Function To Check Whether A Path Is A File Through The Overlay
+def overlay_is_file(abs_path: Path) -> bool:
+    """
+    Checks Whether A Path Is A File, Taking Staged Writes And Deletions Into Account
+
+    Args:
+        abs_path (Path): The Absolute Path
+
+    Returns:
+        bool: True If The Path Is A File
+    """
+
+    # If The Path Is Staged
+    if (entry := _get_staged(abs_path)) is not None:
+        # It Is A File Unless It Is Staged For Deletion
+        return entry[0] is not None
+
+    # Check The Disk
+    return abs_path.is_file()
+
+
+# Function To Read Text Through The Overlay
+def overlay_read_text(abs_path: Path, encoding: str) -> str:
+    """
+    Reads The Text Of A File, Preferring Staged Text Over The Disk
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+        encoding (str): The Encoding Of The File On Disk
+
+    Returns:
+        str: The Text, With Newlines Normalized
+    """
+
+    # Get The Staged Text
+    text: str | None = get_staged_text(abs_path)
+
+    # Return The Staged Text Or Read The Disk
+    return abs_path.read_text(encoding=encoding) if text is None else text
+
+
+# Function To Open Text Through The Overlay
+def overlay_open_text(abs_path: Path, encoding: str) -> IO[str]:
+    """
+    Opens A File For Reading Text, Serving Staged Text From Memory
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+        encoding (str): The Encoding Of The File On Disk
+
+    Returns:
+        IO[str]: A Text Stream Over The Staged Text Or The File On Disk
+    """
+
+    # Get The Staged Text
+    text: str | None = get_staged_text(abs_path)
+
+    # Return A Stream Over The Staged Text Or Open The Disk
+    return abs_path.open(encoding=encoding) if text is None else io.StringIO(text)
+
+
+# Function To Open Bytes Through The Overlay
+def overlay_open_bytes(abs_path: Path) -> IO[bytes]:
+    """
+    Opens A File For Reading Bytes, Serving Staged Text From Memory Encoded As It Will Be Written
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+
+    Returns:
+        IO[bytes]: A Binary Stream Over The Staged Bytes Or The File On Disk
+    """
+
+    # Get The Staged Text And Encoding
+    text, encoding = _get_entry(abs_path)
+
+    # Return A Stream Over The Staged Bytes Or Open The Disk
+    return abs_path.open("rb") if text is None else io.BytesIO(encode_text_for_write(text, encoding))
+
+
+# Function To Write Text Through The Overlay
+def overlay_write_text(abs_path: Path, content: str, *, encoding: str) -> None:
+    """
+    Writes Text To A File, Staging It In Memory While The Overlay Is Enabled
+
+    Content Is Encoded Up Front So Encoding Errors Surface In The Tool Call, Not At Commit
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+        content (str): The Text To Write
+        encoding (str): The Encoding To Use
+
+    Raises:
+        UnicodeEncodeError: If The Content Cannot Be Encoded
+    """
+
+    # If The Overlay Is Disabled
+    if not _enabled:
+        # Atomically Replace The File
+        atomic_write_text(abs_path, content, encoding=encoding)
+
+        # Done
+        return
+
+    # Check The Content Can Be Encoded
+    content.encode(encoding)
+
+    # With The Staged Lock, Stage The Text
+    with _staged_lock:
+        _staged[abs_path] = (content, encoding)
+
+
+# Function To Delete A File Through The Overlay
+def overlay_unlink(abs_path: Path) -> None:
+    """
+    Deletes A File, Staging The Deletion While The Overlay Is Enabled
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+    """
+
+    # If The Overlay Is Enabled
+    if _enabled:
+        # With The Staged Lock, Stage The Deletion
+        with _staged_lock:
+            _staged[abs_path] = (None, "utf-8")
+
+    else:
+        # Delete The File
+        abs_path.unlink(missing_ok=True)
+
+
+# Function To Check Whether A File Already Holds Some Text
+def overlay_has_text(abs_path: Path, content: str, encoding: str) -> bool:
+    """
+    Checks Whether Writing Some Text Would Leave A File Unchanged
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+        content (str): The Text To Compare
+        encoding (str): The Encoding To Use
+
+    Returns:
+        bool: True If The File, Staged Or On Disk, Already Holds Exactly This Text
+    """
+
+    # If The Path Is Staged
+    if (entry := _get_staged(abs_path)) is not None:
+        # Compare With The Staged Text
+        return entry == (content, encoding)
+
+    # Compare Sizes And Then Bytes On Disk
+    return file_has_content(abs_path, encode_text_for_write(content, encoding))
+
+
+# Function To Get The Size Of A File Through The Overlay
+def overlay_size(abs_path: Path) -> int:
+    """
+    Gets The Size In Bytes A File Has, Or Will Have Once Its Staged Text Is Committed
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+
+    Returns:
+        int: The Size In Bytes
+    """
+
+    # If The File Is Staged
+    if (entry := _get_staged(abs_path)) is not None:
+        # Return The Encoded Size Of The Staged Text
+        return len(encode_text_for_write(entry[0] or "", entry[1]))
+
+    # Return The Size On Disk
+    return abs_path.stat().st_size
+
+
+# Function To Get The Modification Time Of A File Through The Overlay
+def overlay_mtime_ns(abs_path: Path) -> int:
+    """
+    Gets The Modification Time Of A File On Disk, Or 0 For A File That So Far Only Exists In The Overlay
+
+    Staged Writes Leave The Modification Time On Disk Untouched, So ETags Of Staged Files Differ
+    Only By Their Content Hash
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File
+
+    Returns:
+        int: The Modification Time In Nanoseconds
+    """
+
+    # If The File Only Exists In The Overlay
+    if is_staged(abs_path) and not abs_path.exists():
+        # There Is No Modification Time Yet
+        return 0
+
+    # Return The Modification Time On Disk
+    return abs_path.stat().st_mtime_ns
+
+
+# Function To List Staged Paths
+def staged_paths() -> list[str]:
+    """
+    Lists The Paths With Staged Writes Or Deletions
+
+    Returns:
+        list[str]: The Staged Paths, Sorted
+    """
+
+    # With The Staged Lock, Return The Sorted Paths
+    with _staged_lock:
+        return sorted(str(path) for path in _staged)
+
+
+# Function To Commit The Overlay
+def commit_overlay() -> list[str]:
+    """
+    Flushes Every Staged File To Disk, Each Atomically, And Clears The Overlay
+
+    Files Whose Staged Text Equals Their Content On Disk Are Skipped. Each Entry Is Removed Once It
+    Is Flushed, Unless It Was Staged Again Meanwhile, So If A Write Fails The Remaining Entries Stay Staged
+
+    Returns:
+        list[str]: The Paths That Were Written Or Deleted, Sorted
+    """
+
+    # Initialize The Changed Paths
+    changed: list[str] = []
+
+    # For Each Staged File, In Path Order
+    for abs_path in sorted(_snapshot_paths()):
+        # Get The Staged Entry
+        entry: tuple[str | None, str] | None = _get_staged(abs_path)
+
+        # If The Path Was Unstaged Meanwhile
+        if entry is None:
+            # Skip It
+            continue
+
+        # Get The Staged Text And Encoding
+        text, encoding = entry
+
+        # If The File Is Staged For Deletion
+        if text is None:
+            # If The File Exists On Disk
+            if abs_path.exists():
+                # Delete The File
+                abs_path.unlink()
+                changed.append(str(abs_path))
+
+        # If The Staged Text Differs From The Disk
+        elif not file_has_content(abs_path, encode_text_for_write(text, encoding)):
+            # Create Parent Directories And Atomically Replace The File
+            abs_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(abs_path, text, encoding=encoding)
+            changed.append(str(abs_path))
+
+        # With The Staged Lock, Remove The Flushed Entry Unless It Was Staged Again
+        with _staged_lock:
+            if _staged.get(abs_path) is entry:
+                del _staged[abs_path]
+
+    # Return The Changed Paths
+    return changed
+
+
+# Function To Discard The Overlay
+def discard_overlay() -> list[str]:
+    """
+    Discards Every Staged Write And Deletion, Leaving The Disk Untouched
+
+    Returns:
+        list[str]: The Paths Whose Staged Changes Were Discarded, Sorted
+    """
+
+    # With The Staged Lock
+    with _staged_lock:
+        # Get The Staged Paths
+        discarded: list[str] = sorted(str(path) for path in _staged)
+
+        # Clear The Overlay
+        _staged.clear()
+
+    # Return The Discarded Paths
+    return discarded
+
+
+# Helper Function To Get The Staged Entry Of A Path
+def _get_staged(abs_path: Path) -> tuple[str | None, str] | None:
+    """
+    Gets The Staged Entry Of A Path Under The Staged Lock
+
+    Args:
+        abs_path (Path): The Absolute Path
+
+    Returns:
+        tuple[str | None, str] | None: The Staged Text Or None For A Deletion, And The Encoding, Or None If Not Staged
+    """
+
+    # With The Staged Lock, Return The Entry
+    with _staged_lock:
+        return _staged.get(abs_path)
+
+
+# Helper Function To Get The Staged Entry Of A Path Or An Empty One
+def _get_entry(abs_path: Path) -> tuple[str | None, str]:
+    """
+    Gets The Staged Entry Of A Path, Or (None, "utf-8") If It Is Not Staged
+
+    Args:
+        abs_path (Path): The Absolute Path
+
+    Returns:
+        tuple[str | None, str]: The Staged Text, None If Not Staged Or Staged For Deletion, And The Encoding
+    """
+
+    # Return The Entry Or The Empty One
+    return _get_staged(abs_path) or (None, "utf-8")
+
+
+# Helper Function To Snapshot The Staged Paths
+def _snapshot_paths() -> list[Path]:
+    """
+    Copies The Staged Paths Under The Staged Lock, So They Can Be Iterated While Tools Stage More
+
+    Returns:
+        list[Path]: The Staged Paths
+    """
+
+    # With The Staged Lock, Return A Copy Of The Paths
+    with _staged_lock:
+        return list(_staged)
+
+
+# Exports
+__all__: list[str] = [
+    "commit_overlay",
+    "copy_staged",
+    "discard_overlay",
+    "get_staged_text",
+    "has_staged_within",
+    "is_overlay_enabled",
+    "is_staged",
+    "overlay_exists",
+    "overlay_has_text",
+    "overlay_is_file",
+    "overlay_mtime_ns",
+    "overlay_open_bytes",
+    "overlay_open_text",
+    "overlay_read_text",
+    "overlay_size",
+    "overlay_unlink",
+    "overlay_write_text",
+    "set_overlay_enabled",
+    "staged_paths",
+    "unstage",
+]
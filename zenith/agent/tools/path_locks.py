@@ -0,0 +1,77 @@
+# Standard Library Imports
+import contextlib
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+# Local Imports
+from zenith.agent.tools.tool_memo import invalidate_memoized
+
+# Paths Locked By Running Mutating Tool Calls
+_held_paths: set[Path] = set()
+
+# Condition Guarding The Locked Paths, Notified Whenever Paths Are Released
+_held_condition: threading.Condition = threading.Condition()
+
+
+# Function To Hold The Locks Of Several Paths
+@contextlib.contextmanager
+def lock_paths(*paths: Path) -> Iterator[None]:
+    """
+    Holds The Locks Of The Given Paths, So Mutating Tool Calls Running In Parallel Never Interleave On A Path
+
+    A Locked Directory Covers Everything Inside It, So A Call Waits While Another Holds The Path, One Of
+    Its Ancestors Or One Of Its Descendants. All Paths Are Taken At Once, So Calls Locking Overlapping
+    Sets Of Paths Cannot Deadlock. Memoized Read-Only Results Covering The Paths Are Dropped When The
+    Block Ends
+
+    Args:
+        *paths (Path): The Absolute Paths To Lock
+
+    Yields:
+        None: While The Locks Are Held
+    """
+
+    # Get The Distinct Paths
+    requested: set[Path] = set(paths)
+
+    # With The Condition, Wait Until No Requested Path Overlaps A Held One, Then Take Them All
+    with _held_condition:
+        _held_condition.wait_for(lambda: not any(_overlaps(path, held) for path in requested for held in _held_paths))
+        _held_paths.update(requested)
+
+    try:
+        try:
+            # Yield While The Locks Are Held
+            yield
+
+        finally:
+            # Drop Memoized Results That May Be Stale Now
+            invalidate_memoized(*paths)
+
+    finally:
+        # With The Condition, Release The Paths And Wake The Waiting Calls
+        with _held_condition:
+            _held_paths.difference_update(requested)
+            _held_condition.notify_all()
+
+
+# Helper Function To Check Whether Two Paths Overlap
+def _overlaps(first: Path, second: Path) -> bool:
+    """
+    Checks Whether Two Paths Are The Same Or One Is Inside The Other
+
+    Args:
+        first (Path): The First Absolute Path
+        second (Path): The Second Absolute Path
+
+    Returns:
+        bool: True If Changing One Path Can Affect The Other
+    """
+
+    # Return Whether Either Path Is Inside The Other, Which Includes Equal Paths
+    return first.is_relative_to(second) or second.is_relative_to(first)
+
+
+# Exports
+__all__: list[str] = ["lock_paths"]
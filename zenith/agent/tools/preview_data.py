@@ -0,0 +1,464 @@
+# Standard Library Imports
+import codecs
+import csv
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_open_bytes
+from zenith.agent.tools.overlay import overlay_size
+from zenith.utils.format_file_size import format_size
+from zenith.utils.unified_diff import split_lines
+
+# Supported File Extensions And Their Formats
+_FORMATS_BY_SUFFIX: dict[str, str] = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+# Size Of The Binary Chunks Used For Newline Counting
+_COUNT_CHUNK_SIZE: int = 1024 * 1024
+
+# Files Up To This Size Get An Exact Row Count, Larger Files Get An Estimate
+_MAX_EXACT_COUNT_BYTES: int = 256 * 1024 * 1024
+
+# Maximum Number Of Rows Parsed For Type Inference
+_MAX_INFERENCE_ROWS: int = 1000
+
+# Maximum Length Of A String Value In The Sample Rows
+_MAX_VALUE_LENGTH: int = 200
+
+# Regular Expressions For Inferring Types Of CSV Values
+_INTEGER_PATTERN: re.Pattern = re.compile(r"^[+-]?\d+$")
+_FLOAT_PATTERN: re.Pattern = re.compile(r"^[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?$")
+
+
+# Function To Preview A Structured Data File
+def preview_data(
+    file_path: str,
+    *,
+    file_format: str | None = None,
+    sample_rows: int = 5,
+    max_sample_bytes: int = 1024 * 1024,
+    encoding: str = "utf-8",
+) -> dict[str, Any]:
+    """
+    Previews A CSV, TSV, JSON Or JSONL File As A Compact Schema Plus A Few Sample Rows
+
+    Only A Bounded Prefix Of The File Is Parsed, And Rows Are Counted By Counting Newlines
+    Over Binary Chunks (Estimated From The Prefix For Very Large Files). Files Staged In The
+    Overlay Are Previewed As They Will Be Once The Turn Ends
+
+    Args:
+        file_path (str): The Path To The Data File
+        file_format (str | None): The Format ("csv", "tsv", "json" Or "jsonl"), Inferred From The Extension If None
+        sample_rows (int): The Number Of Sample Rows To Return
+        max_sample_bytes (int): The Maximum Number Of Bytes Parsed For The Schema And Sample
+        encoding (str): The Encoding Of The File
+
+    Returns:
+        dict[str, Any]: A Dictionary Containing The Schema, Sample Rows And Row Count
+
+    Raises:
+        FileNotFoundError: If The File Does Not Exist
+        PermissionError: If Permission Is Denied
+        ValueError: If The Path Is Invalid, The Format Is Unsupported Or The Data Cannot Be Parsed
+    """
+
+    # Convert To Absolute Path If Relative
+    abs_path: Path = Path(file_path).resolve()
+
+    # Check If The File Exists
+    if not overlay_exists(abs_path):
+        # Raise A FileNotFoundError
+        msg: str = f"File Not Found: {abs_path}"
+
+        # Raise The Error
+        raise FileNotFoundError(msg) from None
+
+    # Check If The Path Is A File
+    if not overlay_is_file(abs_path):
+        # Raise A ValueError
+        msg: str = f"Path Is Not A File: {abs_path}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Resolve The Data Format
+    data_format: str | None = file_format.lower() if file_format else _FORMATS_BY_SUFFIX.get(abs_path.suffix.lower())
+
+    # If The Format Is Not Supported
+    if data_format not in {"csv", "tsv", "json", "jsonl"}:
+        # Raise A ValueError
+        msg: str = f"Unsupported Data Format For Preview: {abs_path}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    try:
+        # Get The File Size
+        file_size: int = overlay_size(abs_path)
+
+        # Read The Bounded Prefix As Bytes
+        with overlay_open_bytes(abs_path) as f:
+            # Read The Prefix
+            prefix: bytes = f.read(max_sample_bytes)
+
+        # Whether The Prefix Covers The Whole File
+        complete: bool = len(prefix) >= file_size
+
+        # Decode The Prefix, Tolerating A Multi-Byte Character Cut At The End
+        text: str = codecs.getincrementaldecoder(encoding)().decode(prefix, final=complete)
+
+        # If The Format Is JSON
+        if data_format == "json":
+            # Parse The JSON Prefix
+            rows, row_count, estimated = _parse_json(text, complete=complete, file_size=file_size)
+
+        else:
+            # Parse The Line-Based Prefix
+            rows = _parse_lines(text, data_format, complete=complete)
+
+            # Count The Lines Of The File
+            line_count, estimated = _count_lines(abs_path, file_size, prefix)
+
+            # Exclude The Header Row From CSV And TSV Counts
+            row_count = max(0, line_count - 1) if data_format in {"csv", "tsv"} else line_count
+
+        # Return The Result
+        return {
+            "success": True,
+            "path": str(abs_path),
+            "format": data_format,
+            "size": file_size,
+            "size_human": format_size(file_size),
+            "row_count": row_count,
+            "row_count_estimated": estimated,
+            "columns": _infer_columns(rows, infer_strings=data_format in {"csv", "tsv"}),
+            "sampled_rows": len(rows),
+            "sample_rows": [_truncate_row(row) for row in rows[:sample_rows]],
+        }
+
+    except PermissionError:
+        # Handle Permission Denied Error
+        msg: str = f"Permission Denied: {abs_path}"
+
+        # Raise The Error
+        raise PermissionError(msg) from None
+
+    except UnicodeDecodeError:
+        # Handle Encoding Error
+        msg: str = f"Failed To Decode File With Encoding '{encoding}': {abs_path}"
+
+        # Raise A ValueError
+        raise ValueError(msg) from None
+
+    except Exception as e:
+        # Handle Other Errors
+        msg: str = f"Failed To Preview Data File: {abs_path}. Error: {e!s}"
+
+        # Raise A ValueError
+        raise ValueError(msg) from e
+
+
+# Helper Function To Parse Line-Based Data
+def _parse_lines(text: str, data_format: str, *, complete: bool) -> list[Any]:
+    """
+    Parses Up To _MAX_INFERENCE_ROWS Rows Of CSV, TSV Or JSONL Text
+
+    Args:
+        text (str): The Decoded Prefix Of The File
+        data_format (str): The Data Format ("csv", "tsv" Or "jsonl")
+        complete (bool): Whether The Text Covers The Whole File
+
+    Returns:
+        list[Any]: The Parsed Rows
+    """
+
+    # Split The Text Into Lines At Newlines Only, As JSON Strings And CSV Fields May Hold Other Separators
+    lines: list[str] = split_lines(text)
+
+    # If The Prefix Was Cut Mid-Line
+    if not complete and not text.endswith("\n"):
+        # Drop The Trailing Partial Line
+        lines = lines[:-1]
+
+    # If The Format Is JSONL
+    if data_format == "jsonl":
+        # Get The Non-Empty Lines Up To The Maximum Number Of Rows
+        records: list[str] = [line for line in lines if line.strip()][:_MAX_INFERENCE_ROWS]
+
+        # Parse Each Line As JSON
+        return [json.loads(line) for line in records]
+
+    # Create A Dict Reader Over The Lines
+    reader: csv.DictReader = csv.DictReader(lines, delimiter="\t" if data_format == "tsv" else ",")
+
+    # Parse Up To The Maximum Number Of Rows
+    rows: list[dict[str, Any]] = []
+    for row in reader:
+        # Add The Row
+        rows.append(row)
+
+        # If We've Parsed Enough Rows
+        if len(rows) >= _MAX_INFERENCE_ROWS:
+            # Stop Parsing
+            break
+
+    # Return The Rows
+    return rows
+
+
+# Helper Function To Parse JSON Data
+def _parse_json(text: str, *, complete: bool, file_size: int) -> tuple[list[Any], int, bool]:
+    """
+    Parses A JSON Document, Or The Leading Elements Of A Top-Level Array If The Prefix Is Incomplete
+
+    Args:
+        text (str): The Decoded Prefix Of The File
+        complete (bool): Whether The Text Covers The Whole File
+        file_size (int): The Size Of The File In Bytes
+
+    Returns:
+        tuple[list[Any], int, bool]: The Parsed Rows, The Row Count And Whether The Count Is Estimated
+    """
+
+    # If The Whole Document Is Available
+    if complete:
+        # Parse The Whole Document
+        document: Any = json.loads(text)
+
+        # Treat A Top-Level Array As Rows And Anything Else As A Single Row
+        rows: list[Any] = document if isinstance(document, list) else [document]
+
+        # Return The Rows With An Exact Count
+        return rows[:_MAX_INFERENCE_ROWS], len(rows), False
+
+    # Find The Start Of The Top-Level Value
+    position: int = len(text) - len(text.lstrip())
+
+    # If The Top-Level Value Is Not An Array
+    if not text.startswith("[", position):
+        # Raise A ValueError
+        msg: str = "Top-Level JSON Value Is Too Large To Preview And Is Not An Array"
+
+        # Raise The Error
+        raise ValueError(msg)
+
+    # Create A JSON Decoder
+    decoder: json.JSONDecoder = json.JSONDecoder()
+
+    # Move Past The Opening Bracket
+    position += 1
+
+    # Decode Array Elements Until The Prefix Runs Out
+    rows = []
+    while len(rows) < _MAX_INFERENCE_ROWS:
+        # Skip Whitespace And Separators
+        while position < len(text) and text[position] in " \t\r\n,":
+            # Advance The Position
+            position += 1
+
+        try:
+            # Decode The Next Element
+            element, position = decoder.raw_decode(text, position)
+
+        except json.JSONDecodeError:
+            # Stop At The First Incomplete Element
+            break
+
+        # Add The Element
+        rows.append(element)
+
+    # Get The Number Of Bytes Consumed By The Parsed Elements
+    consumed: int = len(text[:position].encode("utf-8", errors="surrogatepass"))
+
+    # Estimate The Number Of Elements From The Average Element Size
+    estimate: int = round(len(rows) * file_size / consumed)
+
+    # Return The Rows With An Estimated Count
+    return rows, estimate, True
+
+
+# Helper Function To Count Lines
+def _count_lines(path: Path, file_size: int, prefix: bytes) -> tuple[int, bool]:
+    """
+    Counts The Lines Of A File By Counting Newlines Over Binary Chunks
+
+    Files Larger Than _MAX_EXACT_COUNT_BYTES Are Estimated From The Line Density Of The Prefix
+
+    Args:
+        path (Path): The Path To The File
+        file_size (int): The Size Of The File In Bytes
+        prefix (bytes): The Raw Prefix Of The File
+
+    Returns:
+        tuple[int, bool]: The Line Count And Whether It Is Estimated
+    """
+
+    # If The File Is Empty
+    if file_size == 0:
+        # There Are No Lines
+        return 0, False
+
+    # If The File Is Too Large For An Exact Count
+    if file_size > _MAX_EXACT_COUNT_BYTES:
+        # Estimate From The Newline Density Of The Prefix
+        return max(1, round(prefix.count(b"\n") * file_size / len(prefix))), True
+
+    # Initialize The Newline Count
+    newlines: int = 0
+
+    # Remember The Last Byte To Detect A Missing Trailing Newline
+    last_byte: bytes = b""
+
+    # Count Newlines Chunk By Chunk
+    with overlay_open_bytes(path) as f:
+        # Read Until The End Of The File
+        while chunk := f.read(_COUNT_CHUNK_SIZE):
+            # Count The Newlines In The Chunk
+            newlines += chunk.count(b"\n")
+
+            # Remember The Last Byte
+            last_byte = chunk[-1:]
+
+    # Count A Final Line Without A Trailing Newline
+    return newlines + (0 if last_byte == b"\n" else 1), False
+
+
+# Helper Function To Get The Type Name Of A Value
+def _value_type(value: Any, *, infer_strings: bool) -> str:
+    """
+    Gets The Type Name Of A Parsed Value
+
+    Args:
+        value (Any): The Value
+        infer_strings (bool): Whether To Infer Numeric And Boolean Types From Strings (For CSV Values)
+
+    Returns:
+        str: The Type Name
+    """
+
+    # If The Value Is Missing Or Empty
+    if value is None or (infer_strings and value == ""):
+        # The Value Is Null
+        return "null"
+
+    # If The Value Is A String That Should Be Inferred
+    if infer_strings and isinstance(value, str):
+        # If The String Is An Integer
+        if _INTEGER_PATTERN.match(value):
+            # The Value Is An Integer
+            return "integer"
+
+        # If The String Is A Float
+        if _FLOAT_PATTERN.match(value):
+            # The Value Is A Float
+            return "float"
+
+        # The Value Is A Boolean Or A String
+        return "boolean" if value.lower() in {"true", "false"} else "string"
+
+    # If The Value Is A Boolean (Checked Before int, Its Superclass)
+    if isinstance(value, bool):
+        # The Value Is A Boolean
+        return "boolean"
+
+    # Map The Remaining JSON Types
+    return {int: "integer", float: "float", str: "string", list: "array", dict: "object"}.get(type(value), "string")
+
+
+# Helper Function To Infer Columns
+def _infer_columns(rows: list[Any], *, infer_strings: bool) -> list[dict[str, Any]]:
+    """
+    Infers Column Names, Types And Nullability From The Sampled Rows
+
+    Args:
+        rows (list[Any]): The Sampled Rows
+        infer_strings (bool): Whether To Infer Numeric And Boolean Types From Strings (For CSV Values)
+
+    Returns:
+        list[dict[str, Any]]: The Inferred Columns
+    """
+
+    # Map Each Column Name To The Set Of Types Seen, In Order Of First Appearance
+    column_types: dict[str, set[str]] = {}
+
+    # Process Each Row
+    for index, row in enumerate(rows):
+        # Treat Non-Object Rows As A Single "value" Column
+        record: dict[str, Any] = row if isinstance(row, dict) else {"value": row}
+
+        # Mark Previously Seen Columns That Are Missing From This Row As Null
+        for name, types in column_types.items():
+            # If The Column Is Missing
+            if name not in record:
+                # Record A Null
+                types.add("null")
+
+        # Process Each Value
+        for name, value in record.items():
+            # If The Column Is New After The First Row
+            if name not in column_types:
+                # Earlier Rows Did Not Have It
+                column_types[name] = {"null"} if index > 0 else set()
+
+            # Record The Value Type
+            column_types[name].add(_value_type(value, infer_strings=infer_strings))
+
+    # Build The Column List
+    columns: list[dict[str, Any]] = []
+    for name, types in column_types.items():
+        # Get The Non-Null Types
+        value_types: set[str] = types - {"null"}
+
+        # Widen Integers Mixed With Floats To Floats
+        if value_types == {"integer", "float"}:
+            # Use The Float Type
+            value_types = {"float"}
+
+        # Resolve The Column Type
+        column_type: str = value_types.pop() if len(value_types) == 1 else ("mixed" if value_types else "null")
+
+        # Add The Column
+        columns.append({"name": str(name), "type": column_type, "nullable": "null" in types})
+
+    # Return The Columns
+    return columns
+
+
+# Helper Function To Truncate Long Values In A Sample Row
+def _truncate_row(row: Any) -> Any:
+    """
+    Truncates Long String Values In A Sample Row To Keep The Preview Compact
+
+    Args:
+        row (Any): The Sample Row
+
+    Returns:
+        Any: The Row With Long Strings Truncated
+    """
+
+    # If The Row Is A Long String
+    if isinstance(row, str) and len(row) > _MAX_VALUE_LENGTH:
+        # Truncate The String
+        return f"{row[:_MAX_VALUE_LENGTH]}… [{len(row) - _MAX_VALUE_LENGTH} More Chars]"
+
+    # If The Row Is An Object
+    if isinstance(row, dict):
+        # Truncate Each Value
+        return {key: _truncate_row(value) for key, value in row.items()}
+
+    # Return Other Values Unchanged
+    return row
+
+
+# Exports
+__all__: list[str] = ["preview_data"]
@@ -0,0 +1,188 @@
+# Standard Library Imports
+import ast
+from collections.abc import Iterator
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.turn_tracker import get_current_turn
+
+# Maximum Number Of Turns A Previous Read Is Trusted To Stay In The Model Context, Reads Whose
+# Output Leaves The Context Earlier Are Forgotten Through forget_output_reads
+MAX_TURN_AGE: int = 1
+
+# Tools Whose Outputs Carry Recorded Reads
+READ_TOOLS: frozenset[str] = frozenset({"read_file", "read_multiple_files"})
+
+# Per-Session Read Records Keyed By Absolute Path
+_read_records: dict[str, dict[str, Any]] = {}
+
+
+# Function To Look Up An Unchanged Previous Read
+def lookup_unchanged_read(
+    path: str,
+    content_hash: str,
+    selection: tuple[int | None, int | None],
+) -> int | None:
+    """
+    Looks Up Whether The Same Selection Of An Unchanged File Was Already Read Recently
+
+    Args:
+        path (str): The Absolute Path Of The File
+        content_hash (str): The Hash Of The Current File Content
+        selection (tuple[int | None, int | None]): The Requested (start_line, end_line) Selection
+
+    Returns:
+        int | None: The Turn In Which The Selection Was Read, Or None If It Must Be Read Again
+    """
+
+    # Get The Record For The Path
+    record: dict[str, Any] | None = _read_records.get(path)
+
+    # If The File Was Never Read Or Has Changed Since
+    if record is None or record["hash"] != content_hash:
+        # The File Must Be Read Again
+        return None
+
+    # Get The Turn In Which The Selection Was Read
+    turn: int | None = record["selections"].get(selection)
+
+    # If The Selection Was Never Read Or Has Aged Out Of The Context
+    if turn is None or get_current_turn() - turn > MAX_TURN_AGE:
+        # The File Must Be Read Again
+        return None
+
+    # Return The Turn Of The Previous Read
+    return turn
+
+
+# Function To Record A Read
+def record_read(
+    path: str,
+    content_hash: str,
+    selection: tuple[int | None, int | None],
+) -> None:
+    """
+    Records That A Selection Of A File Was Returned To The Model In The Current Turn
+
+    Args:
+        path (str): The Absolute Path Of The File
+        content_hash (str): The Hash Of The File Content
+        selection (tuple[int | None, int | None]): The Returned (start_line, end_line) Selection
+    """
+
+    # Get The Record For The Path
+    record: dict[str, Any] | None = _read_records.get(path)
+
+    # If The File Was Never Read Or Has Changed Since
+    if record is None or record["hash"] != content_hash:
+        # Start A Fresh Record For The New Content
+        record = {"hash": content_hash, "selections": {}}
+        _read_records[path] = record
+
+    # Record The Turn Of The Read
+    record["selections"][selection] = get_current_turn()
+
+
+# Function To Forget The Reads Of A File
+def forget_read(path: str) -> None:
+    """
+    Forgets Every Recorded Read Of A File, So The Next Read Returns The Content Again
+
+    Args:
+        path (str): The Absolute Path Of The File
+    """
+
+    # Drop The Record For The Path
+    _read_records.pop(path, None)
+
+
+# Function To Forget The Reads Held By A Tool Output
+def forget_output_reads(output: str) -> None:
+    """
+    Forgets The Reads Whose Content Was Returned In A Tool Output That Left The Model Context
+
+    The Output Is The String The Model Saw, A Dictionary Or List Literal With One Entry Per File.
+    Outputs That Are Not Literals Are Errors, Which Never Record A Read
+
+    Args:
+        output (str): The Tool Output Of read_file Or read_multiple_files
+    """
+
+    try:
+        # Parse The Output
+        value: Any = ast.literal_eval(output)
+
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        # Nothing Was Recorded For The Output
+        return
+
+    # Forget The Reads Of The Parsed Output
+    forget_result_reads(value)
+
+
+# Function To Forget The Reads Held By A Tool Result
+def forget_result_reads(result: Any) -> None:
+    """
+    Forgets The Reads Whose Content Was Returned In A Tool Result That Will Not Reach The Model In Full
+
+    Args:
+        result (Any): The Tool Result, Whose Read Entries Carry A path And A hash
+    """
+
+    # For Each File Read In The Result
+    for path in _read_paths(result):
+        # Forget Its Reads
+        forget_read(path)
+
+
+# Helper Function To Find The Files Read In An Output
+def _read_paths(value: Any) -> Iterator[str]:
+    """
+    Finds The Paths Of The Read Results Nested In A Parsed Tool Output
+
+    Args:
+        value (Any): The Parsed Tool Output
+
+    Yields:
+        str: The Path Of Each Entry Carrying A Content Hash
+    """
+
+    # If The Value Is A List
+    if isinstance(value, list):
+        # Search Each Item
+        for item in value:
+            yield from _read_paths(item)
+
+    # If The Value Is A Dictionary
+    elif isinstance(value, dict):
+        # If The Dictionary Is A Read Result
+        if isinstance(value.get("path"), str) and "hash" in value:
+            # Yield Its Path
+            yield value["path"]
+
+        # Search Each Value
+        for item in value.values():
+            yield from _read_paths(item)
+
+
+# Function To Clear The Read Cache
+def clear_read_cache() -> None:
+    """
+    Clears All Read Records At The Start Of A New Chat Session
+    """
+
+    # Clear The Read Records
+    _read_records.clear()
+
+
+# Exports
+__all__: list[str] = [
+    "MAX_TURN_AGE",
+    "READ_TOOLS",
+    "clear_read_cache",
+    "forget_output_reads",
+    "forget_read",
+    "forget_result_reads",
+    "lookup_unchanged_read",
+    "record_read",
+]
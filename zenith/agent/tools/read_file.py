@@ -3,6 +3,15 @@ from pathlib import Path
 from typing import Any
 
 # Local Imports
+from zenith.agent.tools.etag import make_etag
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_mtime_ns
+from zenith.agent.tools.overlay import overlay_open_text
+from zenith.agent.tools.overlay import overlay_size
+from zenith.agent.tools.read_cache import lookup_unchanged_read
+from zenith.agent.tools.read_cache import record_read
+from zenith.utils.content_hash import hash_text
 from zenith.utils.format_file_size import format_size
 
 
@@ -13,15 +22,21 @@ def read_file(
     encoding: str = "utf-8",
     start_line: int | None = None,
     end_line: int | None = None,
+    force: bool = False,
 ) -> dict[str, Any]:
     """
     Reads The Contents Of A File
 
+    If The Same Selection Of The File Was Already Read In A Recent Turn And The File Is Unchanged,
+    A Short "Unchanged" Stub Is Returned Instead Of The Content. The Result Carries An etag That
+    Edit Tools Accept As if_match
+
     Args:
         file_path (str): The Path To The File To Read
         encoding (str): The Encoding To Use When Reading The File
         start_line (int | None): The Line Number To Start Reading From (1-based, Inclusive)
         end_line (int | None): The Line Number To End Reading At (1-based, Inclusive)
+        force (bool): Whether To Return The Content Even If It Is Unchanged Since A Recent Read
 
     Returns:
         dict[str, Any]: A Dictionary Containing The File Contents And Metadata
@@ -36,7 +51,7 @@ def read_file(
     abs_path: Path = Path(file_path).resolve()
 
     # Check If The File Exists
-    if not abs_path.exists():
+    if not overlay_exists(abs_path):
         # Raise A FileNotFoundError
         msg: str = f"File Not Found: {abs_path}"
 
@@ -44,7 +59,7 @@ def read_file(
         raise FileNotFoundError(msg) from None
 
     # Check If The Path Is A File
-    if not abs_path.is_file():
+    if not overlay_is_file(abs_path):
         # Raise A ValueError
         msg: str = f"Path Is Not A File: {abs_path}"
 
@@ -66,7 +81,7 @@ def read_file(
             start: int = max(1, start_line or 1) - 1  # Convert To 0-based
 
             # Read The File Line By Line
-            with abs_path.open(encoding=encoding) as f:
+            with overlay_open_text(abs_path, encoding) as f:
                 # Read All Lines
                 lines: list[str] = f.readlines()
 
@@ -88,9 +103,12 @@ def read_file(
                 # Get Selected Line Count
                 selected_line_count: int = len(selected_lines)
 
+                # Hash The Full File Content
+                content_hash: str = hash_text("".join(lines))
+
         else:
             # Read The File
-            with abs_path.open(encoding=encoding) as f:
+            with overlay_open_text(abs_path, encoding) as f:
                 # Read The File Content
                 content = f.read()
 
@@ -100,8 +118,37 @@ def read_file(
                 # Set Selected Line Count
                 selected_line_count: int = line_count
 
+                # Hash The Full File Content
+                content_hash: str = hash_text(content)
+
+        # Get The ETag Edit Tools Accept As if_match
+        etag: str = make_etag(content_hash, overlay_mtime_ns(abs_path))
+
+        # Get The Requested Selection
+        selection: tuple[int | None, int | None] = (start_line, end_line)
+
+        # Get The Turn Of A Previous Unchanged Read Unless Forced
+        previous_turn: int | None = None if force else lookup_unchanged_read(str(abs_path), content_hash, selection)
+
+        # If The Same Selection Was Already Read And Is Unchanged
+        if previous_turn is not None:
+            # Return A Short Stub Instead Of The Content
+            return {
+                "success": True,
+                "path": str(abs_path),
+                "unchanged": True,
+                "content": (
+                    f"Unchanged Since Turn {previous_turn} (Hash {content_hash[:12]}…), Use force=True To Re-Read"
+                ),
+                "hash": content_hash,
+                "etag": etag,
+            }
+
+        # Record The Read
+        record_read(str(abs_path), content_hash, selection)
+
         # Get File Size
-        file_size: int = abs_path.stat().st_size
+        file_size: int = overlay_size(abs_path)
 
         # Return The Result
         return {
@@ -113,6 +160,8 @@ def read_file(
             "line_count": line_count,
             "selected_line_count": selected_line_count,
             "encoding": encoding,
+            "hash": content_hash,
+            "etag": etag,
         }
 
     except PermissionError:
@@ -153,7 +202,7 @@ def file_exists(file_path: str) -> bool:
     abs_path: Path = Path(file_path).resolve()
 
     # Return Whether The Path Exists And Is A File
-    return abs_path.exists() and abs_path.is_file()
+    return overlay_is_file(abs_path)
 
 
 # Exports
@@ -3,6 +3,7 @@ from typing import Any
 
 # Local Imports
 from zenith.agent.tools.read_file import read_file
+from zenith.agent.tools.tool_executor import raise_if_cancelled
 
 
 # Function To Read Multiple Files
@@ -12,6 +13,7 @@ def read_multiple_files(
     encoding: str = "utf-8",
     start_line: int | None = None,
     end_line: int | None = None,
+    force: bool = False,
 ) -> list[dict[str, Any]]:
     """
     Reads The Contents Of Multiple Files
@@ -21,6 +23,7 @@ def read_multiple_files(
         encoding (str): The Encoding To Use When Reading The Files
         start_line (int | None): The Line Number To Start Reading From (1-based, Inclusive)
         end_line (int | None): The Line Number To End Reading At (1-based, Inclusive)
+        force (bool): Whether To Return File Contents Even If They Are Unchanged Since A Recent Read
 
     Returns:
         list[dict[str, Any]]: A List Of Dictionaries, Each Containing The File Contents And Metadata
@@ -31,6 +34,9 @@ def read_multiple_files(
 
     # Iterate Through File Paths
     for file_path in file_paths:
+        # Stop If The Tool Call Was Cancelled
+        raise_if_cancelled()
+
         try:
             # Read The File
             file_content: dict[str, Any] = read_file(
@@ -38,6 +44,7 @@ def read_multiple_files(
                 encoding=encoding,
                 start_line=start_line,
                 end_line=end_line,
+                force=force,
             )
 
             # Add Success Status
@@ -1,27 +1,75 @@
 # Standard Library Imports
+import contextlib
+import os
+import re
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
 from typing import Any
 
 # Local Imports
+from zenith.agent.tools.etag import check_etag
+from zenith.agent.tools.etag import current_etag
+from zenith.agent.tools.etag import etag_for_written_text
+from zenith.agent.tools.overlay import is_overlay_enabled
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_is_file
+from zenith.agent.tools.overlay import overlay_read_text
+from zenith.agent.tools.overlay import overlay_size
+from zenith.agent.tools.overlay import overlay_write_text
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_pre_image
+from zenith.utils.atomic_write import atomic_open
 from zenith.utils.format_file_size import format_size
 
+# Type Checking Imports
+if TYPE_CHECKING:
+    # Standard Library Imports
+    from contextlib import AbstractContextManager
+
+# Supported Replacement Modes
+REPLACE_MODES: tuple[str, ...] = ("literal", "regex")
+
+# Files Larger Than This Are Streamed Instead Of Being Read Into Memory
+STREAMING_THRESHOLD_BYTES: int = 16 * 1024 * 1024
+
+# Number Of Characters Read Per Chunk When Streaming
+_STREAM_CHUNK_CHARS: int = 1024 * 1024
+
 
 # Function To Replace Content In A File
-def replace_content(
+def replace_content(  # noqa: PLR0913
     file_path: str,
     old_content: str,
     new_content: str,
     *,
     encoding: str = "utf-8",
+    mode: str = "literal",
+    count: int = 1,
+    expected_occurrences: int | None = None,
+    if_match: str | None = None,
 ) -> dict[str, Any]:
     """
-    Replaces The First Occurrence Of Old Content With New Content In A File
+    Replaces Occurrences Of Old Content With New Content In A File
+
+    All Replacements Are Made In A Single str.replace Or re.subn Pass And The File Is Written Once,
+    Or Not At All If The Content Is Unchanged, Which Keeps Its Modification Time And Reports changed=False.
+    In Literal Mode, Files Above STREAMING_THRESHOLD_BYTES Are Streamed In Chunks Into A Temporary
+    File That Is Renamed Into Place, So Memory Use Is Bounded By The Chunk Size Plus The Pattern Size,
+    Unless The Overlay Is Enabled, In Which Case The Result Is Staged In Memory
 
     Args:
         file_path (str): The Path To The File To Modify
-        old_content (str): The Content To Be Replaced
-        new_content (str): The Content To Replace With
+        old_content (str): The Content To Be Replaced, Or A Regular Expression In Regex Mode
+        new_content (str): The Content To Replace With, Which May Use Group References In Regex Mode
         encoding (str): The Encoding To Use When Reading And Writing The File
+        mode (str): "literal" Or "regex"
+        count (int): The Maximum Number Of Occurrences To Replace, 0 For All
+        expected_occurrences (int | None): If Given, The File Is Only Modified If Old Content Occurs Exactly
+            This Many Times
+        if_match (str | None): If Given, The File Is Only Modified If Its ETag From read_file Still Matches
 
     Returns:
         dict[str, Any]: A Dictionary Containing The Result And Metadata
@@ -29,86 +77,382 @@ def replace_content(
     Raises:
         FileNotFoundError: If The File Does Not Exist
         PermissionError: If Permission Is Denied
-        ValueError: If The Path Is Invalid Or Old Content Not Found
+        ValueError: If The Path Or Options Are Invalid, The ETag Differs, Old Content Not Found Or The
+            Occurrences Differ
     """
 
+    # Validate The Options
+    _validate_options(old_content, mode, count)
+
     # Convert To Absolute Path If Relative
     abs_path: Path = Path(file_path).resolve()
 
-    # Check If The File Exists
-    if not abs_path.exists():
-        # Raise A FileNotFoundError
-        msg: str = f"File Not Found: {abs_path}"
+    # With The Path Lock, So Parallel Calls Changing The File Do Not Interleave
+    with lock_paths(abs_path):
+        # Check If The File Exists
+        if not overlay_exists(abs_path):
+            # Raise A FileNotFoundError
+            msg: str = f"File Not Found: {abs_path}"
+
+            # Raise The Error
+            raise FileNotFoundError(msg) from None
+
+        # Check If The Path Is A File
+        if not overlay_is_file(abs_path):
+            # Raise A ValueError
+            msg: str = f"Path Is Not A File: {abs_path}"
+
+            # Raise The Error
+            raise ValueError(msg) from None
+
+        try:
+            # Fail Fast If The File Changed Since It Was Read
+            check_etag(abs_path, if_match, encoding=encoding)
+
+            # If A Literal Replacement Targets A File Too Large To Hold In Memory, And No Overlay Holds It Anyway
+            if mode == "literal" and not is_overlay_enabled() and abs_path.stat().st_size > STREAMING_THRESHOLD_BYTES:
+                # Stream The Replacement, Which Records The Pre-Image Once The Occurrences Are Checked
+                replacements: int = _stream_replace(
+                    abs_path,
+                    old_content,
+                    new_content,
+                    encoding=encoding,
+                    count=count,
+                    expected_occurrences=expected_occurrences,
+                )
+
+                # Replacing Text With Itself Leaves The File Unchanged
+                changed: bool = old_content != new_content
+
+                # Get The New ETag By Hashing The Streamed File
+                etag: str = current_etag(abs_path, encoding)
+
+            else:
+                # Replace In Memory
+                replacements, changed, etag = _replace_in_memory(
+                    abs_path,
+                    old_content,
+                    new_content,
+                    encoding=encoding,
+                    mode=mode,
+                    count=count,
+                    expected_occurrences=expected_occurrences,
+                )
+
+            # Get New File Size
+            file_size: int = overlay_size(abs_path)
+
+            # Return The Result
+            return {
+                "success": True,
+                "path": str(abs_path),
+                "size": file_size,
+                "size_human": format_size(file_size),
+                "encoding": encoding,
+                "mode": mode,
+                "replaced": True,
+                "replacements": replacements,
+                "changed": changed,
+                "etag": etag,
+            }
+
+        except PermissionError:
+            # Handle Permission Denied Error
+            msg: str = f"Permission Denied: {abs_path}"
+
+            # Raise The Error
+            raise PermissionError(msg) from None
+
+        except UnicodeDecodeError:
+            # Handle Encoding Error During Read
+            msg: str = f"Failed To Decode File With Encoding '{encoding}': {abs_path}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from None
+
+        except UnicodeEncodeError as e:
+            # Handle Encoding Error During Write
+            msg: str = f"Failed To Encode Content With Encoding '{encoding}': {abs_path}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+        except Exception as e:
+            # Handle Other Errors
+            msg: str = f"Failed To Replace Content In File: {abs_path}. Error: {e!s}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+
+# Helper Function To Validate The Replacement Options
+def _validate_options(old_content: str, mode: str, count: int) -> None:
+    """
+    Validates The Replacement Options
+
+    Args:
+        old_content (str): The Content To Be Replaced
+        mode (str): The Replacement Mode
+        count (int): The Maximum Number Of Occurrences To Replace
+
+    Raises:
+        ValueError: If Old Content Is Empty, The Mode Is Unsupported Or The Count Is Negative
+    """
+
+    # If The Old Content Is Empty
+    if not old_content:
+        # Raise A ValueError
+        msg: str = "Old Content Must Not Be Empty"
 
         # Raise The Error
-        raise FileNotFoundError(msg) from None
+        raise ValueError(msg)
 
-    # Check If The Path Is A File
-    if not abs_path.is_file():
+    # If The Mode Is Not Supported
+    if mode not in REPLACE_MODES:
         # Raise A ValueError
-        msg: str = f"Path Is Not A File: {abs_path}"
+        msg: str = f"Unsupported Replace Mode: {mode}. Expected One Of: {', '.join(REPLACE_MODES)}"
 
         # Raise The Error
-        raise ValueError(msg) from None
+        raise ValueError(msg)
+
+    # If The Count Is Negative
+    if count < 0:
+        # Raise A ValueError
+        msg: str = f"Count Must Not Be Negative: {count}"
+
+        # Raise The Error
+        raise ValueError(msg)
+
+
+# Helper Function To Replace Content In Memory
+def _replace_in_memory(  # noqa: PLR0913
+    abs_path: Path,
+    old_content: str,
+    new_content: str,
+    *,
+    encoding: str,
+    mode: str,
+    count: int,
+    expected_occurrences: int | None,
+) -> tuple[int, bool, str]:
+    """
+    Replaces Content By Reading The Whole File, Replacing In One Pass And Writing It Back Once
+
+    Args:
+        abs_path (Path): The File To Modify
+        old_content (str): The Content Or Regular Expression To Be Replaced
+        new_content (str): The Content To Replace With
+        encoding (str): The Encoding To Use When Reading And Writing The File
+        mode (str): "literal" Or "regex"
+        count (int): The Maximum Number Of Occurrences To Replace, 0 For All
+        expected_occurrences (int | None): The Exact Number Of Occurrences Required, If Any
+
+    Returns:
+        tuple[int, bool, str]: The Number Of Replacements Made, Whether The File Changed And The New ETag
+
+    Raises:
+        ValueError: If The Regular Expression Is Invalid, Old Content Not Found Or The Occurrences Differ
+    """
 
-    try:
-        # Read The Entire File Content
-        original_content: str = abs_path.read_text(encoding=encoding)
+    # Read The Entire File Content
+    original_content: str = overlay_read_text(abs_path, encoding)
+
+    # If The Replacement Is Literal
+    if mode == "literal":
+        # Count The Occurrences
+        occurrences: int = original_content.count(old_content)
+
+        # Check The Occurrences Before Replacing
+        _check_occurrences(abs_path, occurrences, expected_occurrences)
 
         # Perform The Replacement
-        modified_content: str = original_content.replace(old_content, new_content, 1)
+        modified_content: str = original_content.replace(old_content, new_content, count or -1)
+
+        # Get The Number Of Replacements
+        replacements: int = min(count or occurrences, occurrences)
+
+    else:
+        try:
+            # Compile The Pattern
+            pattern: re.Pattern[str] = re.compile(old_content)
 
-        # If The Old Content Was Not Found
-        if original_content == modified_content:
+        except re.error as e:
             # Raise A ValueError
-            msg: str = f"Old Content Not Found In File: {abs_path}"
+            msg: str = f"Invalid Regular Expression: {e!s}"
 
             # Raise The Error
-            raise ValueError(msg) from None  # noqa: TRY301
+            raise ValueError(msg) from None
 
-        # Write The Modified Content Back To The File
-        abs_path.write_text(modified_content, encoding=encoding)
+        # Perform The Replacement
+        modified_content, replacements = pattern.subn(new_content, original_content, count=count)
 
-        # Get New File Size
-        file_size: int = abs_path.stat().st_size
+        # Get The Occurrences, Which Need A Separate Scan Only When Some Matches Were Left In Place
+        occurrences = (
+            sum(1 for _ in pattern.finditer(original_content))
+            if count and expected_occurrences is not None
+            else replacements
+        )
 
-        # Return The Result
-        return {
-            "success": True,
-            "path": str(abs_path),
-            "size": file_size,
-            "size_human": format_size(file_size),
-            "encoding": encoding,
-            "replaced": True,
-        }
+        # Check The Occurrences
+        _check_occurrences(abs_path, occurrences, expected_occurrences)
 
-    except PermissionError:
-        # Handle Permission Denied Error
-        msg: str = f"Permission Denied: {abs_path}"
+    # Whether The Replacement Changed The Content
+    changed: bool = modified_content != original_content
 
-        # Raise The Error
-        raise PermissionError(msg) from None
+    # If The Content Changed
+    if changed:
+        # Record The Pre-Image
+        record_pre_image(abs_path)
 
-    except UnicodeDecodeError:
-        # Handle Encoding Error During Read
-        msg: str = f"Failed To Decode File With Encoding '{encoding}': {abs_path}"
+        # Stage Or Atomically Write The Modified Content
+        overlay_write_text(abs_path, modified_content, encoding=encoding)
 
-        # Raise A ValueError
-        raise ValueError(msg) from None
+    # Return The Number Of Replacements, Whether The File Changed And The New ETag
+    return replacements, changed, etag_for_written_text(abs_path, modified_content)
+
+
+# Helper Function To Replace Content By Streaming The File
+def _stream_replace(  # noqa: PLR0913
+    abs_path: Path,
+    old_content: str,
+    new_content: str,
+    *,
+    encoding: str,
+    count: int,
+    expected_occurrences: int | None,
+) -> int:
+    """
+    Replaces Literal Occurrences Of Old Content By Streaming The File Through A Temporary File
+
+    Each Chunk Is Searched Together With The Tail Of The Previous One, Which Is Kept Back So An
+    Occurrence Spanning A Chunk Boundary Is Still Found. If Old And New Content Are Equal, The
+    Occurrences Are Only Counted And The File Is Not Rewritten. The Pre-Image Is Recorded Only Once
+    The Occurrences Are Checked, Just Before The Temporary File Replaces The Target
+
+    Args:
+        abs_path (Path): The File To Modify
+        old_content (str): The Content To Be Replaced
+        new_content (str): The Content To Replace With
+        encoding (str): The Encoding To Use When Reading And Writing The File
+        count (int): The Maximum Number Of Occurrences To Replace, 0 For All
+        expected_occurrences (int | None): The Exact Number Of Occurrences Required, If Any
+
+    Returns:
+        int: The Number Of Replacements Made
+
+    Raises:
+        ValueError: If Old Content Is Not Found Or The Occurrences Differ, Leaving The File Untouched
+    """
+
+    # Number Of Characters Kept Back Between Chunks
+    overlap: int = len(old_content) - 1
+
+    # Initialize The Counters
+    occurrences: int = 0
+    replacements: int = 0
 
-    except UnicodeEncodeError as e:
-        # Handle Encoding Error During Write
-        msg: str = f"Failed To Encode Content With Encoding '{encoding}': {abs_path}"
+    # Write To A Temporary File That Replaces The Target On Success, Or Discard The Output If Nothing Changes
+    target_context: AbstractContextManager[IO[Any]] = (
+        atomic_open(abs_path, encoding=encoding) if old_content != new_content else _discarding_writer(encoding)
+    )
 
+    # With The Target, And The Source File Closed Before The Target Replaces It
+    with target_context as target, abs_path.open(encoding=encoding) as source:
+        # Initialize The Search Window
+        window: str = ""
+
+        # Read Each Chunk
+        while chunk := source.read(_STREAM_CHUNK_CHARS):
+            # Search The Carried Tail Together With The Chunk
+            window += chunk
+            position: int = 0
+
+            # Find Each Occurrence In The Window
+            while (index := window.find(old_content, position)) != -1:
+                # Count The Occurrence
+                occurrences += 1
+
+                # Write The Text Before It, Then The Replacement If Still Within The Count
+                target.write(window[position:index])
+                target.write(new_content if count == 0 or replacements < count else old_content)
+                replacements += count == 0 or replacements < count
+                position = index + len(old_content)
+
+            # Write All But The Tail That Could Start An Occurrence
+            split: int = max(position, len(window) - overlap)
+            target.write(window[position:split])
+            window = window[split:]
+
+            # If The Count Is Reached And Nothing Else Needs Counting
+            if count and replacements == count and expected_occurrences is None:
+                # Copy The Rest Unchanged
+                target.write(window)
+                shutil.copyfileobj(source, target, _STREAM_CHUNK_CHARS)
+                window = ""
+
+        # Write The Final Tail
+        target.write(window)
+
+        # Check The Occurrences, Discarding The Temporary File On Failure
+        _check_occurrences(abs_path, occurrences, expected_occurrences)
+
+        # If The Replacement Changes The File
+        if old_content != new_content:
+            # Record The Pre-Image Before The Temporary File Replaces The Target
+            record_pre_image(abs_path)
+
+    # Return The Number Of Replacements
+    return replacements
+
+
+# Helper Function To Open A Writer That Discards Its Output
+@contextlib.contextmanager
+def _discarding_writer(encoding: str) -> Iterator[IO[Any]]:
+    """
+    Opens A Text Writer On The Null Device, Used When Streaming Would Not Change The File
+
+    Args:
+        encoding (str): The Encoding To Write With
+
+    Yields:
+        IO[Any]: The Writer
+    """
+
+    # With The Null Device Open For Writing
+    with Path(os.devnull).open("w", encoding=encoding) as f:
+        # Let The Caller Write
+        yield f
+
+
+# Helper Function To Check The Number Of Occurrences
+def _check_occurrences(abs_path: Path, occurrences: int, expected_occurrences: int | None) -> None:
+    """
+    Checks That Old Content Was Found And, If Required, Found Exactly The Expected Number Of Times
+
+    Args:
+        abs_path (Path): The File Being Modified
+        occurrences (int): The Number Of Occurrences Found
+        expected_occurrences (int | None): The Exact Number Of Occurrences Required, If Any
+
+    Raises:
+        ValueError: If Old Content Was Not Found Or The Occurrences Differ
+    """
+
+    # If The Old Content Was Not Found
+    if occurrences == 0:
         # Raise A ValueError
-        raise ValueError(msg) from e
+        msg: str = f"Old Content Not Found In File: {abs_path}"
 
-    except Exception as e:
-        # Handle Other Errors
-        msg: str = f"Failed To Replace Content In File: {abs_path}. Error: {e!s}"
+        # Raise The Error
+        raise ValueError(msg)
 
+    # If The Occurrences Differ From The Expected Number
+    if expected_occurrences is not None and occurrences != expected_occurrences:
         # Raise A ValueError
-        raise ValueError(msg) from e
+        msg: str = f"Expected {expected_occurrences} Occurrences But Found {occurrences} In File: {abs_path}"
+
+        # Raise The Error
+        raise ValueError(msg)
 
 
 # Exports
@@ -0,0 +1,240 @@
+# Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_write_text
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_new_directory
+from zenith.agent.tools.undo_journal import record_pre_image
+
+# Maximum Number Of Files Written Concurrently
+MAX_WRITE_WORKERS: int = 8
+
+
+# Function To Scaffold A Tree Of Directories And Files
+def scaffold(
+    spec: dict[str, Any],
+    *,
+    root: str = ".",
+    encoding: str = "utf-8",
+    overwrite: bool = False,
+) -> dict[str, Any]:
+    """
+    Creates A Tree Of Directories And Files In One Call
+
+    The Spec Maps Names To Either A String (The Content Of A File) Or A Nested Dictionary (A
+    Directory). Directories Are Created First, Then The Files Are Written Atomically In Parallel On
+    A Thread Pool. Existing Files Are Left Alone Unless overwrite Is True
+
+    Args:
+        spec (dict[str, Any]): The Nested Spec Of Directories And Files, E.g. {"pkg": {"__init__.py": ""}}
+        root (str): The Directory The Spec Is Created In
+        encoding (str): The Encoding To Use When Writing Files
+        overwrite (bool): Whether To Overwrite Files That Already Exist
+
+    Returns:
+        dict[str, Any]: The Counts And A Compact Status Per Path, Relative To The Root
+
+    Raises:
+        ValueError: If The Spec Is Empty Or The Root Is Not A Directory Or Cannot Be Created
+    """
+
+    # If The Spec Is Empty
+    if not spec:
+        # Raise A ValueError
+        msg: str = "Scaffold Spec Must Not Be Empty"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Convert To Absolute Path If Relative
+    root_path: Path = Path(root).resolve()
+
+    # Check If The Root Is A File
+    if root_path.exists() and not root_path.is_dir():
+        # Raise A ValueError
+        msg: str = f"Path Is Not A Directory: {root_path}"
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Create The Root If It Is Missing
+    root_status: dict[str, Any] = _make_directory(root_path)
+
+    # If The Root Could Not Be Created
+    if root_status["status"] == "error":
+        # Raise A ValueError
+        msg: str = root_status["error"]
+
+        # Raise The Error
+        raise ValueError(msg) from None
+
+    # Flatten The Spec, Parents Before Children
+    entries: list[tuple[Path, Any]] = list(_flatten(spec, root_path))
+
+    # With The Locks Of The Files, So Parallel Calls Changing Them Do Not Interleave
+    with lock_paths(*(path for path, content in entries if isinstance(content, str))):
+        # Initialize The Statuses And The Files To Write
+        statuses: list[dict[str, Any]] = []
+        files: list[tuple[dict[str, Any], Path, str]] = []
+
+        # For Each Entry
+        for path, content in entries:
+            # Get The Status Of The Entry
+            status: dict[str, Any] = {
+                "path": path.relative_to(root_path).as_posix() if path.is_relative_to(root_path) else str(path),
+                "type": "directory" if isinstance(content, dict) else "file",
+            }
+            statuses.append(status)
+
+            # If The Entry Is Neither A Directory Nor A File, Or Escapes The Root
+            if not isinstance(content, (dict, str)) or not path.is_relative_to(root_path):
+                # Record The Error
+                status["status"] = "error"
+                status["error"] = "Invalid Spec Entry" if path.is_relative_to(root_path) else "Path Escapes The Root"
+
+            # If The Entry Is A Directory
+            elif isinstance(content, dict):
+                # Create The Directory
+                status.update(_make_directory(path))
+
+            # If The File Exists And Must Not Be Overwritten
+            elif overlay_exists(path) and not overwrite:
+                # Skip The File
+                status["status"] = "exists"
+
+            else:
+                # Record The Pre-Image Up Front, Keeping Journal Writes Sequential, And Queue The File
+                record_pre_image(path)
+                files.append((status, path, content))
+
+        # Write The Files In Parallel
+        with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as executor:
+            # For Each File And Its Result, In Spec Order
+            for (status, _, _), result in zip(
+                files,
+                executor.map(lambda file: _write_file(file[1], file[2], encoding), files),
+                strict=True,
+            ):
+                # Record The Result
+                status.update(result)
+
+    # Count The Failures
+    failed: int = sum(1 for status in statuses if status["status"] == "error")
+
+    # Return The Result
+    return {
+        "success": failed == 0,
+        "root": str(root_path),
+        "created": sum(1 for status in statuses if status["status"] == "created"),
+        "failed": failed,
+        "paths": statuses,
+    }
+
+
+# Helper Function To Flatten A Spec
+def _flatten(spec: dict[str, Any], base: Path) -> list[tuple[Path, Any]]:
+    """
+    Flattens A Nested Spec Into (Path, Content) Pairs, Each Directory Before Its Children
+
+    Args:
+        spec (dict[str, Any]): The Nested Spec
+        base (Path): The Directory The Spec Is Relative To
+
+    Returns:
+        list[tuple[Path, Any]]: The Absolute Paths And Their Content, A dict For Directories
+    """
+
+    # Initialize The Entries
+    entries: list[tuple[Path, Any]] = []
+
+    # For Each Name In The Spec
+    for name, content in spec.items():
+        # Get The Normalized Path
+        path: Path = (base / name).resolve()
+
+        # Add The Entry
+        entries.append((path, content))
+
+        # If The Entry Is A Directory Inside The Base
+        if isinstance(content, dict) and path.is_relative_to(base):
+            # Add Its Children
+            entries.extend(_flatten(content, path))
+
+    # Return The Entries
+    return entries
+
+
+# Helper Function To Create One Directory
+def _make_directory(path: Path) -> dict[str, Any]:
+    """
+    Creates One Directory Of The Spec, Recording It In The Undo Journal
+
+    Args:
+        path (Path): The Directory To Create
+
+    Returns:
+        dict[str, Any]: The Status And, On Failure, The Error
+    """
+
+    # If The Directory Already Exists
+    if path.is_dir():
+        # Nothing To Do
+        return {"status": "exists"}
+
+    try:
+        # Record And Create The Directory
+        record_new_directory(path)
+        path.mkdir(parents=True)
+
+    except PermissionError:
+        # Return The Error
+        return {"status": "error", "error": f"Permission Denied: {path}"}
+
+    except OSError as e:
+        # Return The Error
+        return {"status": "error", "error": f"Failed To Create Directory: {path}. Error: {e!s}"}
+
+    # Return The Status
+    return {"status": "created"}
+
+
+# Helper Function To Write One File
+def _write_file(path: Path, content: str, encoding: str) -> dict[str, Any]:
+    """
+    Writes One File Of The Spec Atomically, Or Stages It In The Overlay
+
+    Args:
+        path (Path): The File To Write
+        content (str): The Content Of The File
+        encoding (str): The Encoding To Use
+
+    Returns:
+        dict[str, Any]: The Status And, On Failure, The Error
+    """
+
+    try:
+        # Write The File
+        overlay_write_text(path, content, encoding=encoding)
+
+    except PermissionError:
+        # Return The Error
+        return {"status": "error", "error": f"Permission Denied: {path}"}
+
+    except UnicodeEncodeError:
+        # Return The Error
+        return {"status": "error", "error": f"Failed To Encode Content With Encoding '{encoding}': {path}"}
+
+    except Exception as e:  # noqa: BLE001
+        # Return The Error
+        return {"status": "error", "error": f"Failed To Write File: {path}. Error: {e!s}"}
+
+    # Return The Status
+    return {"status": "created"}
+
+
+# Exports
+__all__: list[str] = ["MAX_WRITE_WORKERS", "scaffold"]
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 # Local Imports
+from zenith.agent.tools.tool_executor import raise_if_cancelled
 from zenith.utils.format_file_size import format_size
 
 # Type Checking Imports
@@ -29,6 +30,9 @@ def search_files(  # noqa: PLR0913
     """
     Searches For Files Matching A Pattern In The Specified Directory
 
+    The Search Covers The Disk: Writes And Deletions Staged In The Overlay Appear Once The Turn
+    Ends, Use stat_paths To Check Staged Files
+
     Args:
         search_pattern (str): The Pattern To Search For
         directory (str | None): The Directory To Search In, Defaults To Current Directory
@@ -260,6 +264,9 @@ def _search_directory(  # noqa: PLR0913
         list[dict[str, Any]]: A List Of Matching Files With Metadata
     """
 
+    # Stop If The Tool Call Was Cancelled
+    raise_if_cancelled()
+
     # Initialize Results
     results: list[dict[str, Any]] = []
 
@@ -0,0 +1,150 @@
+# Standard Library Imports
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Third Party Imports
+from dateutil import tz
+
+# Local Imports
+from zenith.agent.tools.overlay import is_staged
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_size
+
+# Maximum Number Of Paths Checked Concurrently
+MAX_STAT_WORKERS: int = 16
+
+
+# Function To Check Many Paths At Once
+def stat_paths(paths: list[str]) -> list[dict[str, Any]]:
+    """
+    Checks Whether Many Paths Exist And Gets Their Type, Size, Modification Time And Writability
+
+    The Paths Are Checked In Parallel On A Thread Pool, So Hundreds Of Paths Cost One Call. Files
+    Staged In The Overlay Are Reported As They Will Be Once The Turn Ends
+
+    Args:
+        paths (list[str]): The Paths To Check
+
+    Returns:
+        list[dict[str, Any]]: One Entry Per Path, In The Given Order
+    """
+
+    # With A Thread Pool
+    with ThreadPoolExecutor(max_workers=MAX_STAT_WORKERS) as executor:
+        # Check The Paths In Parallel
+        return list(executor.map(_stat_path, paths))
+
+
+# Helper Function To Check One Path
+def _stat_path(path: str) -> dict[str, Any]:
+    """
+    Checks One Path
+
+    Args:
+        path (str): The Path To Check
+
+    Returns:
+        dict[str, Any]: Whether The Path Exists And, If So, Its Type, Size And Modification Time, Or The Error
+    """
+
+    # Get The Path
+    abs_path: Path = Path(path)
+
+    try:
+        # Convert To Absolute Path If Relative
+        abs_path = abs_path.resolve()
+
+        # If The Path Is Staged In The Overlay
+        if is_staged(abs_path):
+            # Report The Staged File
+            return _staged_entry(abs_path)
+
+        # Get The Path Stats
+        stats: os.stat_result = abs_path.stat()
+
+    except (FileNotFoundError, NotADirectoryError):
+        # Report The Missing Path
+        return {"path": str(abs_path), "exists": False, "writable": _parent_writable(abs_path)}
+
+    except (OSError, ValueError) as e:
+        # Report The Error
+        return {"path": str(abs_path), "exists": None, "error": f"Failed To Stat Path: {abs_path}. Error: {e!s}"}
+
+    # Return The Entry
+    return {
+        "path": str(abs_path),
+        "exists": True,
+        "type": "directory" if stat.S_ISDIR(stats.st_mode) else "file" if stat.S_ISREG(stats.st_mode) else "other",
+        "size": stats.st_size,
+        "modified_time": _format_time(stats.st_mtime),
+        "writable": os.access(abs_path, os.W_OK),
+    }
+
+
+# Helper Function To Report A Staged File
+def _staged_entry(abs_path: Path) -> dict[str, Any]:
+    """
+    Reports A Path Whose Write Or Deletion Is Staged In The Overlay
+
+    Args:
+        abs_path (Path): The Staged Path
+
+    Returns:
+        dict[str, Any]: The Entry As The Path Will Be Once The Overlay Is Committed
+    """
+
+    # If The Path Is Staged For Deletion
+    if not overlay_exists(abs_path):
+        # Report The Missing Path
+        return {"path": str(abs_path), "exists": False, "writable": _parent_writable(abs_path)}
+
+    # Return The Entry, With The Modification Time On Disk If The File Exists There
+    return {
+        "path": str(abs_path),
+        "exists": True,
+        "type": "file",
+        "size": overlay_size(abs_path),
+        "modified_time": _format_time(abs_path.stat().st_mtime) if abs_path.exists() else None,
+        "writable": os.access(abs_path, os.W_OK) if abs_path.exists() else _parent_writable(abs_path),
+        "staged": True,
+    }
+
+
+# Helper Function To Check Whether A Missing Path Could Be Created
+def _parent_writable(abs_path: Path) -> bool:
+    """
+    Checks Whether The Parent Directory Of A Missing Path Exists And Is Writable
+
+    Args:
+        abs_path (Path): The Missing Path
+
+    Returns:
+        bool: True If The Path Could Be Created
+    """
+
+    # Return Whether The Parent Is A Writable Directory
+    return abs_path.parent.is_dir() and os.access(abs_path.parent, os.W_OK)
+
+
+# Helper Function To Format A Modification Time
+def _format_time(timestamp: float) -> str:
+    """
+    Formats A Timestamp As list_files Does
+
+    Args:
+        timestamp (float): The Timestamp In Seconds
+
+    Returns:
+        str: The Local Time As YYYY-MM-DD HH:MM:SS
+    """
+
+    # Return The Formatted Local Time
+    return datetime.fromtimestamp(timestamp=timestamp, tz=tz.tzlocal()).strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Exports
+__all__: list[str] = ["MAX_STAT_WORKERS", "stat_paths"]
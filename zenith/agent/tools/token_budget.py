@@ -0,0 +1,200 @@
+# Standard Library Imports
+import functools
+import threading
+from collections.abc import Callable
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.read_cache import forget_result_reads
+from zenith.agent.tools.turn_tracker import get_current_turn
+from zenith.utils.token_estimator import estimate_tokens
+
+# Default Number Of Tool Result Tokens Allowed Per Turn
+DEFAULT_TURN_TOKEN_BUDGET: int = 64000
+
+# The Configured Per-Turn Budget
+_turn_token_budget: int = DEFAULT_TURN_TOKEN_BUDGET
+
+# The Turn The Used Tokens Belong To, And The Tokens Used In It
+_budget_turn: int = -1
+_used_tokens: int = 0
+
+# Lock Guarding The Usage Counters Against Concurrent Tool Calls
+_budget_lock: threading.Lock = threading.Lock()
+
+
+# Function To Set The Per-Turn Token Budget
+def set_turn_token_budget(tokens: int) -> None:
+    """
+    Sets The Number Of Tool Result Tokens Allowed Per Turn
+
+    Args:
+        tokens (int): The Per-Turn Token Budget
+    """
+
+    # Use The Module Level Budget
+    global _turn_token_budget  # noqa: PLW0603
+
+    # Set The Budget
+    _turn_token_budget = tokens
+
+
+# Function To Get The Remaining Tokens Of The Current Turn
+def get_remaining_turn_tokens() -> int:
+    """
+    Gets The Number Of Tool Result Tokens Still Available In The Current Turn
+
+    Returns:
+        int: The Remaining Tokens
+    """
+
+    # Use The Module Level Usage Counters
+    global _budget_turn, _used_tokens  # noqa: PLW0603
+
+    # If A New Turn Has Begun Since The Last Tool Result
+    if _budget_turn != get_current_turn():
+        # Start Counting The New Turn
+        _budget_turn = get_current_turn()
+        _used_tokens = 0
+
+    # Return The Remaining Tokens
+    return max(0, _turn_token_budget - _used_tokens)
+
+
+# Function To Apply The Token Budget To A Tool Result
+def apply_token_budget(result: Any) -> Any:
+    """
+    Attaches estimated_tokens To A Tool Result And Truncates It If It Exceeds The Remaining Turn Budget
+
+    Truncation Cuts The content Field, Or The Nested Values If There Is None, And Keeps Every Other
+    Field, So Status And Errors Stay Visible. Results That Truncation Would Not Shrink Are Returned
+    Whole, And The Reads Of A Truncated Result Are Forgotten So The Files Can Be Read Again
+
+    Args:
+        result (Any): The Tool Result
+
+    Returns:
+        Any: The Result As A Dictionary With estimated_tokens (List Results Are Wrapped Under "results")
+    """
+
+    # Use The Module Level Usage Counter
+    global _used_tokens  # noqa: PLW0603
+
+    # Wrap List Results So They Can Carry Metadata
+    annotated: dict[str, Any] = dict(result) if isinstance(result, dict) else {"results": result}
+
+    # Estimate The Tokens Of The Result As The Model Will See It
+    tokens: int = estimate_tokens(str(annotated))
+
+    # With The Budget Lock
+    with _budget_lock:
+        # Get The Remaining Budget
+        remaining: int = get_remaining_turn_tokens()
+
+        # Reserve The Tokens Of The Result, Or All That Remain If It Does Not Fit
+        _used_tokens += min(tokens, remaining)
+
+    # If The Result Fits The Budget
+    if tokens <= remaining:
+        # Attach The Estimate
+        annotated["estimated_tokens"] = tokens
+
+        # Return The Result
+        return annotated
+
+    # Truncate The Content Field If There Is One, Otherwise The Nested Values, Keeping Status And Error Fields
+    content: Any = annotated.get("content")
+    truncated: dict[str, Any] = (
+        {**annotated, "content": _truncate_text(content, tokens, remaining)}
+        if isinstance(content, str)
+        else {
+            **{key: value for key, value in annotated.items() if not isinstance(value, dict | list)},
+            "content": _truncate_text(
+                str({key: value for key, value in annotated.items() if isinstance(value, dict | list)}),
+                tokens,
+                remaining,
+            ),
+        }
+    )
+
+    # Estimate The Tokens Of The Truncated Result
+    truncated_tokens: int = estimate_tokens(str(truncated))
+
+    # If Truncating Would Not Make The Result Smaller, As For Small Results Once The Budget Is Used Up
+    if truncated_tokens >= tokens:
+        # Attach The Estimate
+        annotated["estimated_tokens"] = tokens
+
+        # Return The Whole Result
+        return annotated
+
+    # Forget The Reads Of The Result, So Reading The Files Again Returns The Content
+    forget_result_reads(annotated)
+
+    # Return The Truncated Result
+    return {
+        **truncated,
+        "truncated": True,
+        "original_estimated_tokens": tokens,
+        "estimated_tokens": truncated_tokens,
+    }
+
+
+# Helper Function To Truncate A Text
+def _truncate_text(text: str, tokens: int, remaining: int) -> str:
+    """
+    Truncates A Text So The Whole Result Fits Within The Remaining Tokens
+
+    Args:
+        text (str): The Text To Truncate
+        tokens (int): The Estimated Tokens Of The Whole Result
+        remaining (int): The Remaining Tokens Of The Turn
+
+    Returns:
+        str: The Truncated Text With An Explicit Marker
+    """
+
+    # Keep The Share Of The Text That Fits The Remaining Budget
+    kept: str = text[: len(text) * remaining // tokens]
+
+    # Return The Kept Text With A Marker
+    return (
+        f"{kept}\n[Truncated: Result Was ~{tokens} Tokens But Only {remaining} Tokens Remain In This Turn's Budget. "
+        "Request A Smaller Range Or Continue In The Next Turn.]"
+    )
+
+
+# Function To Wrap A Tool With The Token Budget
+def with_token_budget(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps A Tool Function So Its Results Carry estimated_tokens And Respect The Per-Turn Budget
+
+    Args:
+        func (Callable[..., Any]): The Tool Function
+
+    Returns:
+        Callable[..., Any]: The Wrapped Tool Function With The Same Signature
+    """
+
+    # Define The Wrapper
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """
+        Calls The Tool And Applies The Token Budget To Its Result
+        """
+
+        # Call The Tool And Apply The Budget
+        return apply_token_budget(func(*args, **kwargs))
+
+    # Return The Wrapper
+    return wrapper
+
+
+# Exports
+__all__: list[str] = [
+    "DEFAULT_TURN_TOKEN_BUDGET",
+    "apply_token_budget",
+    "get_remaining_turn_tokens",
+    "set_turn_token_budget",
+    "with_token_budget",
+]
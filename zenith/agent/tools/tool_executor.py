@@ -0,0 +1,139 @@
+# Standard Library Imports
+import asyncio
+import contextvars
+import functools
+import threading
+from collections.abc import Awaitable
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# Maximum Number Of Tool Calls Running Concurrently
+MAX_TOOL_WORKERS: int = 8
+
+# The Thread Pool Running Tool Calls, Created On First Use
+_tool_executor: ThreadPoolExecutor | None = None
+
+# The Cancellation Flag Of The Tool Call Running In The Current Thread
+_cancel_flag: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar("cancel_flag", default=None)
+
+
+# Function To Get The Tool Thread Pool
+def get_tool_executor() -> ThreadPoolExecutor:
+    """
+    Gets The Bounded Thread Pool Tool Calls Run On, Creating It On First Use
+
+    Returns:
+        ThreadPoolExecutor: The Tool Thread Pool
+    """
+
+    # Use The Module Level Thread Pool
+    global _tool_executor  # noqa: PLW0603
+
+    # If The Thread Pool Does Not Exist Yet
+    if _tool_executor is None:
+        # Create The Thread Pool
+        _tool_executor = ThreadPoolExecutor(max_workers=MAX_TOOL_WORKERS, thread_name_prefix="zenith-tool")
+
+    # Return The Thread Pool
+    return _tool_executor
+
+
+# Function To Stop A Cancelled Tool Call
+def raise_if_cancelled() -> None:
+    """
+    Stops The Tool Call Running In The Current Thread If It Was Cancelled
+
+    Long Read-Only Tools Call This Between Units Of Work, Such As Once Per Directory Of A Walk,
+    So A Cancelled Call Stops Promptly Instead Of Running To Completion. Outside A Tool Call It Does Nothing
+
+    Raises:
+        asyncio.CancelledError: If The Tool Call Was Cancelled
+    """
+
+    # Get The Cancellation Flag Of The Current Tool Call
+    flag: threading.Event | None = _cancel_flag.get()
+
+    # If The Tool Call Was Cancelled
+    if flag is not None and flag.is_set():
+        # Raise A CancelledError, Which Tools Do Not Catch
+        msg: str = "Tool Call Cancelled"
+
+        # Raise The Error
+        raise asyncio.CancelledError(msg) from None
+
+
+# Function To Run A Tool On The Tool Thread Pool
+def run_in_tool_executor(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """
+    Wraps A Synchronous Tool Function So Each Call Runs On The Bounded Tool Thread Pool
+
+    The Agent Gathers The Tool Calls Of A Model Step, So Calls Of The Same Step Run In Parallel
+    And Their Results Still Come Back In Call Order. Mutating Tools Lock The Paths They Change.
+    If The Awaiting Task Is Cancelled, For Example By Ctrl-C, A Call Not Started Yet Never Runs
+    And A Running Call Stops At Its Next raise_if_cancelled Check
+
+    Args:
+        func (Callable[..., Any]): The Tool Function
+
+    Returns:
+        Callable[..., Awaitable[Any]]: The Asynchronous Tool Function With The Same Signature
+    """
+
+    # Define The Wrapper
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """
+        Runs The Tool On The Tool Thread Pool Without Blocking The Event Loop
+        """
+
+        # Create The Cancellation Flag Of This Call
+        flag: threading.Event = threading.Event()
+
+        try:
+            # Run The Tool And Return Its Result
+            return await asyncio.get_running_loop().run_in_executor(
+                get_tool_executor(),
+                functools.partial(_run_with_flag, flag, func, *args, **kwargs),
+            )
+
+        except asyncio.CancelledError:
+            # Ask The Running Tool To Stop
+            flag.set()
+
+            # Re-Raise The Cancellation
+            raise
+
+    # Return The Wrapper
+    return wrapper
+
+
+# Helper Function To Run A Tool With Its Cancellation Flag
+def _run_with_flag(flag: threading.Event, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Runs A Tool In A Worker Thread With Its Cancellation Flag Visible To raise_if_cancelled
+
+    Args:
+        flag (threading.Event): The Cancellation Flag Of The Call
+        func (Callable[..., Any]): The Tool Function
+        *args (Any): The Positional Arguments Of The Call
+        **kwargs (Any): The Keyword Arguments Of The Call
+
+    Returns:
+        Any: The Result Of The Tool
+    """
+
+    # Set The Flag For This Thread
+    token: contextvars.Token[threading.Event | None] = _cancel_flag.set(flag)
+
+    try:
+        # Run The Tool
+        return func(*args, **kwargs)
+
+    finally:
+        # Clear The Flag Before The Thread Runs Another Call
+        _cancel_flag.reset(token)
+
+
+# Exports
+__all__: list[str] = ["MAX_TOOL_WORKERS", "get_tool_executor", "raise_if_cancelled", "run_in_tool_executor"]
@@ -0,0 +1,248 @@
+# Standard Library Imports
+import copy
+import functools
+import inspect
+import json
+import threading
+from collections.abc import Callable
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.turn_tracker import get_current_turn
+
+# Memoized Results Of The Current Turn, Keyed By Tool Name And Normalized Arguments, With The Paths They Cover
+_memo_entries: dict[tuple[str, str], tuple[tuple[Path, ...], Any]] = {}
+
+# Calls And Cache Hits Of The Current Turn, By Tool Name
+_memo_stats: dict[str, dict[str, int]] = {}
+
+# Number Of Entries Invalidated By Writes In The Current Turn
+_invalidated: int = 0
+
+# The Turn The Entries And Counters Belong To
+_memo_turn: int = -1
+
+# Number Of Invalidations So Far, Snapshotted By Each Call Before The Tool Runs
+_generation: int = 0
+
+# The Generation And Changed Paths Of Each Invalidation In The Current Turn
+_invalidations: list[tuple[int, tuple[Path, ...]]] = []
+
+# Lock Guarding The Entries And Counters Against Concurrent Tool Calls
+_memo_lock: threading.Lock = threading.Lock()
+
+
+# Function To Memoize A Read-Only Tool Within A Turn
+def with_memoization(func: Callable[..., Any], name: str, path_args: tuple[str, ...]) -> Callable[..., Any]:
+    """
+    Wraps A Read-Only Tool So Repeated Calls With The Same Arguments In One Turn Reuse The First Result
+
+    Arguments Are Normalized Before Keying: Defaults Are Filled In And The Path Arguments Are
+    Resolved, So "." And The Absolute Working Directory Share An Entry. Entries Live Until The
+    Turn Ends Or A Mutating Tool Changes A Path Inside, Or Containing, One Of Their Paths. A Result
+    Is Not Memoized If Such A Change Was Invalidated While The Tool Ran, As It May Be Stale
+
+    Args:
+        func (Callable[..., Any]): The Read-Only Tool Function
+        name (str): The Name Of The Tool
+        path_args (tuple[str, ...]): The Arguments Holding A Path Or A List Of Paths, None Meaning The Working Directory
+
+    Returns:
+        Callable[..., Any]: The Wrapped Tool Function With The Same Signature
+    """
+
+    # Get The Signature Used To Normalize Arguments
+    signature: inspect.Signature = inspect.signature(func)
+
+    # Define The Wrapper
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """
+        Returns The Memoized Result Of An Identical Call In This Turn, Or Calls The Tool And Memoizes It
+        """
+
+        # Bind The Arguments And Fill In The Defaults
+        bound: inspect.BoundArguments = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+
+        # Initialize The Normalized Arguments And The Paths They Cover
+        arguments: dict[str, Any] = dict(bound.arguments)
+        paths: list[Path] = []
+
+        # For Each Path Argument
+        for arg in path_args:
+            # Resolve Each Of Its Paths
+            resolved: list[Path] = [
+                Path(value or ".").resolve()
+                for value in (arguments[arg] if isinstance(arguments[arg], list) else [arguments[arg]])
+            ]
+            arguments[arg] = [str(path) for path in resolved]
+            paths.extend(resolved)
+
+        # Get The Key Of The Call
+        key: tuple[str, str] = (name, json.dumps(arguments, sort_keys=True, default=str))
+
+        # With The Memo Lock
+        with _memo_lock:
+            # Start Counting The Current Turn And Count The Call
+            _sync_turn()
+            counters: dict[str, int] = _memo_stats.setdefault(name, {"calls": 0, "hits": 0})
+            counters["calls"] += 1
+
+            # Get The Memoized Entry, If Any, And Snapshot The Turn And Generation
+            entry: tuple[tuple[Path, ...], Any] | None = _memo_entries.get(key)
+            turn: int = _memo_turn
+            generation: int = _generation
+
+            # If The Call Was Memoized
+            if entry is not None:
+                # Count The Hit
+                counters["hits"] += 1
+
+        # If The Call Was Memoized
+        if entry is not None:
+            # Return A Copy, So Later Stages Cannot Change The Memoized Result
+            return copy.deepcopy(entry[1])
+
+        # Call The Tool
+        result: Any = func(*args, **kwargs)
+
+        # With The Memo Lock
+        with _memo_lock:
+            # If The Turn Has Not Ended And No Overlapping Path Was Invalidated Meanwhile
+            if _memo_turn == turn == get_current_turn() and not any(
+                _overlaps(paths, changed)
+                for changed_generation, changed in _invalidations
+                if changed_generation > generation
+            ):
+                # Memoize A Copy Of The Result
+                _memo_entries[key] = (tuple(paths), copy.deepcopy(result))
+
+        # Return The Result
+        return result
+
+    # Return The Wrapper
+    return wrapper
+
+
+# Function To Invalidate Memoized Results Covering Changed Paths
+def invalidate_memoized(*paths: Path) -> int:
+    """
+    Drops The Memoized Results Whose Paths Are Inside, Equal To Or Contain Any Of The Changed Paths
+
+    Args:
+        *paths (Path): The Absolute Paths Changed By A Mutating Tool
+
+    Returns:
+        int: The Number Of Results Dropped
+    """
+
+    # Use The Module Level Invalidation Counter And Generation
+    global _invalidated, _generation  # noqa: PLW0603
+
+    # With The Memo Lock
+    with _memo_lock:
+        # Start The Current Turn If It Has Changed
+        _sync_turn()
+
+        # Record The Invalidation, So Calls Running Now Do Not Memoize Stale Results
+        _generation += 1
+        _invalidations.append((_generation, paths))
+
+        # Find The Entries Overlapping A Changed Path
+        stale: list[tuple[str, str]] = [
+            key for key, (entry_paths, _) in _memo_entries.items() if _overlaps(entry_paths, paths)
+        ]
+
+        # For Each Stale Entry
+        for key in stale:
+            # Drop The Entry
+            del _memo_entries[key]
+
+        # Count The Dropped Entries
+        _invalidated += len(stale)
+
+    # Return The Number Of Dropped Entries
+    return len(stale)
+
+
+# Function To Get The Memoization Stats Of The Current Turn
+def get_memo_stats() -> dict[str, Any]:
+    """
+    Gets The Tool Calls, Cache Hits And Invalidations Of The Current Turn
+
+    Returns:
+        dict[str, Any]: The Turn, The Totals And The Calls And Hits Per Memoized Tool
+    """
+
+    # With The Memo Lock
+    with _memo_lock:
+        # Start Counting The Current Turn If It Has Changed
+        _sync_turn()
+
+        # Return The Stats
+        return {
+            "turn": _memo_turn,
+            "calls": sum(counters["calls"] for counters in _memo_stats.values()),
+            "hits": sum(counters["hits"] for counters in _memo_stats.values()),
+            "invalidated": _invalidated,
+            "tools": copy.deepcopy(_memo_stats),
+        }
+
+
+# Function To Clear The Memoized Results
+def clear_tool_memo() -> None:
+    """
+    Clears The Memoized Results And Stats At The Start Of A New Chat Session
+    """
+
+    # Use The Module Level Turn
+    global _memo_turn  # noqa: PLW0603
+
+    # With The Memo Lock
+    with _memo_lock:
+        # Forget The Turn, So The Next Call Starts Afresh
+        _memo_turn = -1
+        _sync_turn()
+
+
+# Helper Function To Start Counting A New Turn
+def _sync_turn() -> None:
+    """
+    Drops The Entries And Counters Of An Earlier Turn, Called With The Memo Lock Held
+    """
+
+    # Use The Module Level Turn And Invalidation Counter
+    global _memo_turn, _invalidated  # noqa: PLW0603
+
+    # If A New Turn Has Begun
+    if _memo_turn != get_current_turn():
+        # Start The New Turn Without Entries Or Counts
+        _memo_turn = get_current_turn()
+        _memo_entries.clear()
+        _memo_stats.clear()
+        _invalidations.clear()
+        _invalidated = 0
+
+
+# Helper Function To Check Whether Two Sets Of Paths Overlap
+def _overlaps(first: Sequence[Path], second: Sequence[Path]) -> bool:
+    """
+    Checks Whether A Path Of One Set Is Inside, Equal To Or Contains A Path Of The Other
+
+    Args:
+        first (Sequence[Path]): The First Absolute Paths
+        second (Sequence[Path]): The Second Absolute Paths
+
+    Returns:
+        bool: True If Changing A Path Of One Set Can Affect A Path Of The Other
+    """
+
+    # Return Whether Any Pair Of Paths Overlaps
+    return any(path.is_relative_to(other) or other.is_relative_to(path) for path in first for other in second)
+
+
+# Exports
+__all__: list[str] = ["clear_tool_memo", "get_memo_stats", "invalidate_memoized", "with_memoization"]
@@ -0,0 +1,51 @@
+# Module Level Turn Counter
+_current_turn: int = 0
+
+
+# Function To Begin A New Agent Turn
+def begin_turn() -> int:
+    """
+    Advances The Turn Counter At The Start Of A New User Message
+
+    Returns:
+        int: The Number Of The Turn That Just Began
+    """
+
+    # Use The Module Level Turn Counter
+    global _current_turn  # noqa: PLW0603
+
+    # Advance The Turn Counter
+    _current_turn += 1
+
+    # Return The New Turn Number
+    return _current_turn
+
+
+# Function To Get The Current Agent Turn
+def get_current_turn() -> int:
+    """
+    Gets The Number Of The Current Agent Turn
+
+    Returns:
+        int: The Current Turn Number, 0 Before The First Turn
+    """
+
+    # Return The Current Turn Number
+    return _current_turn
+
+
+# Function To Reset The Turn Counter
+def reset_turns() -> None:
+    """
+    Resets The Turn Counter At The Start Of A New Chat Session
+    """
+
+    # Use The Module Level Turn Counter
+    global _current_turn  # noqa: PLW0603
+
+    # Reset The Turn Counter
+    _current_turn = 0
+
+
+# Exports
+__all__: list[str] = ["begin_turn", "get_current_turn", "reset_turns"]
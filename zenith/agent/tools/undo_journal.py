@@ -0,0 +1,515 @@
+# Standard Library Imports
+import contextvars
+import functools
+import json
+import shutil
+import threading
+import uuid
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+# Local Imports
+from zenith.agent.tools.overlay import is_staged
+from zenith.agent.tools.turn_tracker import get_current_turn
+from zenith.utils.atomic_write import atomic_open
+from zenith.utils.atomic_write import atomic_write_text
+from zenith.utils.content_hash import create_hasher
+from zenith.utils.file_copy import move_path_on_disk
+
+# The Name Of The Journal File Inside The Undo Directory
+_JOURNAL_NAME: str = "journal.jsonl"
+
+# The Name Of The Content-Addressed Object Store Inside The Undo Directory
+_OBJECTS_NAME: str = "objects"
+
+# Number Of Bytes Hashed And Compressed Per Chunk, So Pre-Images Of Large Files Use Bounded Memory
+_CHUNK_BYTES: int = 1024 * 1024
+
+# The Undo Directory, None While The Journal Is Disabled
+_undo_root: Path | None = None
+
+# Lock Keeping Journal Writes From Parallel Tool Calls Whole Lines
+_journal_lock: threading.Lock = threading.Lock()
+
+# The Id Of The Tool Call Running In The Current Thread, Shared By All Entries It Records
+_call_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("undo_call_id", default=None)
+
+
+# Function To Set The Undo Directory
+def set_undo_root(root: Path | None) -> None:
+    """
+    Sets The Directory Holding The Undo Journal, Or Disables The Journal
+
+    Args:
+        root (Path | None): The Undo Directory, Usually .zenith/undo, Or None To Disable Journaling
+    """
+
+    # Use The Module Level Root
+    global _undo_root  # noqa: PLW0603
+
+    # Set The Root
+    _undo_root = root
+
+
+# Function To Get The Undo Directory
+def get_undo_root() -> Path | None:
+    """
+    Gets The Directory Holding The Undo Journal
+
+    Returns:
+        Path | None: The Undo Directory, Or None If Journaling Is Disabled
+    """
+
+    # Return The Root
+    return _undo_root
+
+
+# Function To Wrap A Tool So Its Journal Entries Share A Call Id
+def with_journal_call(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps A Tool Function So Every Entry One Call Records Carries The Same Call Id
+
+    Tools Such As apply_patch, scaffold And copy_path Record Several Entries Per Call, And Parallel
+    Calls Interleave Theirs, So undo_last_change Uses The Call Id To Undo Exactly One Call
+
+    Args:
+        func (Callable[..., Any]): The Tool Function
+
+    Returns:
+        Callable[..., Any]: The Wrapped Tool Function With The Same Signature
+    """
+
+    # Define The Wrapper
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """
+        Calls The Tool With A Fresh Call Id
+        """
+
+        # Set A Fresh Call Id For This Thread
+        token: contextvars.Token[str | None] = _call_id.set(uuid.uuid4().hex)
+
+        try:
+            # Call The Tool
+            return func(*args, **kwargs)
+
+        finally:
+            # Clear The Call Id Before The Thread Runs Another Call
+            _call_id.reset(token)
+
+    # Return The Wrapper
+    return wrapper
+
+
+# Function To Record The Pre-Image Of A File
+def record_pre_image(abs_path: Path) -> None:
+    """
+    Records The Content Of A File Before A Tool Modifies, Creates Or Deletes It
+
+    The Content Is Stored Once, zlib-Compressed, Under Its Hash, So Repeated Snapshots Of The Same
+    Content Cost Nothing. The File Is Hashed And Compressed In Chunks, So Memory Stays Bounded
+    Even For Files replace_content Streams. Files Already Staged In The Overlay Are Skipped, As
+    Their Pre-Image For The Turn Was Recorded When They Were First Staged
+
+    Args:
+        abs_path (Path): The Absolute Path Of The File About To Change
+    """
+
+    # If Journaling Is Disabled Or The File Is Already Staged
+    if _undo_root is None or is_staged(abs_path):
+        # Nothing To Record
+        return
+
+    # If The File Does Not Exist Yet
+    if not abs_path.is_file():
+        # Record That Undoing Means Deleting It
+        _append_entry(_undo_root, {"path": str(abs_path), "kind": "absent"})
+
+        # Done
+        return
+
+    # Store The Content Under Its Hash
+    digest: str = _store_object(_undo_root, abs_path)
+
+    # Record The Entry
+    _append_entry(
+        _undo_root,
+        {"path": str(abs_path), "kind": "file", "object": digest, "mode": abs_path.stat().st_mode & 0o7777},
+    )
+
+
+# Function To Record A Directory About To Be Created
+def record_new_directory(abs_path: Path) -> None:
+    """
+    Records A Directory Before make_directory Creates It, Along With Its Topmost Missing Parent
+
+    Args:
+        abs_path (Path): The Absolute Path Of The Directory About To Be Created
+    """
+
+    # If Journaling Is Disabled Or The Directory Already Exists
+    if _undo_root is None or abs_path.exists():
+        # Nothing To Record
+        return
+
+    # Find The Topmost Missing Ancestor
+    top: Path = abs_path
+    while not top.parent.exists():
+        # Move Up One Level
+        top = top.parent
+
+    # Record The Entry
+    _append_entry(_undo_root, {"path": str(abs_path), "kind": "directory", "top": str(top)})
+
+
+# Function To Record A Directory Tree About To Be Copied
+def record_new_tree(abs_path: Path) -> None:
+    """
+    Records A Directory Tree Before copy_path Creates It, So Undoing Removes The Whole Copy
+
+    Args:
+        abs_path (Path): The Absolute Path Of The Tree About To Be Created, Whose Parent Exists
+    """
+
+    # If Journaling Is Disabled Or The Path Already Exists
+    if _undo_root is None or abs_path.exists():
+        # Nothing To Record
+        return
+
+    # Record The Entry
+    _append_entry(_undo_root, {"path": str(abs_path), "kind": "tree"})
+
+
+# Function To Record A Path About To Be Moved
+def record_move(source: Path, target: Path) -> None:
+    """
+    Records A File Or Directory Before move_path Moves It, So Undoing Moves It Back
+
+    Nothing Is Copied Into The Object Store, So Recording A Move Costs The Same For Any Size
+
+    Args:
+        source (Path): The Absolute Path Being Moved
+        target (Path): The Absolute Path It Is Moved To
+    """
+
+    # If Journaling Is Disabled
+    if _undo_root is None:
+        # Nothing To Record
+        return
+
+    # Record The Entry
+    _append_entry(_undo_root, {"path": str(target), "kind": "move", "source": str(source)})
+
+
+# Function To Undo The Last Change
+def undo_last_change() -> list[str]:
+    """
+    Restores Every File And Directory Changed By The Most Recent Recorded Tool Call
+
+    Entries Of Parallel Calls Recorded In Between Are Kept, As Are Earlier Calls
+
+    Returns:
+        list[str]: The Restored Paths, Empty If There Is Nothing To Undo
+    """
+
+    # Read The Journal
+    entries: list[dict[str, Any]] = _read_entries()
+
+    # If There Is Nothing To Undo
+    if _undo_root is None or not entries:
+        # Nothing Is Restored
+        return []
+
+    # Undo The Entries Of The Last Call
+    return _undo_entries(
+        _undo_root,
+        entries,
+        [index for index, entry in enumerate(entries) if entry["call"] == entries[-1]["call"]],
+    )
+
+
+# Function To Undo The Last Turn
+def undo_last_turn() -> list[str]:
+    """
+    Restores Every File And Directory Changed During The Most Recent Turn That Changed Anything
+
+    Entries Are Undone Newest First, So Each File Ends Up As It Was Before The Turn
+
+    Returns:
+        list[str]: The Restored Paths, Empty If There Is Nothing To Undo
+    """
+
+    # Read The Journal
+    entries: list[dict[str, Any]] = _read_entries()
+
+    # Find Where The Last Turn Starts
+    start: int = len(entries)
+    while start > 0 and entries[start - 1]["turn"] == entries[-1]["turn"]:
+        # Move Back One Entry
+        start -= 1
+
+    # Undo The Entries Of The Last Turn, If Any
+    return _undo_entries(_undo_root, entries, list(range(start, len(entries)))) if _undo_root and entries else []
+
+
+# Function To Clear The Undo Journal
+def clear_undo_journal() -> None:
+    """
+    Deletes The Journal And Every Stored Pre-Image At The Start Of A New Chat Session
+    """
+
+    # If Journaling Is Enabled
+    if _undo_root is not None:
+        # Remove The Journal And The Object Store
+        (_undo_root / _JOURNAL_NAME).unlink(missing_ok=True)
+        shutil.rmtree(_undo_root / _OBJECTS_NAME, ignore_errors=True)
+
+
+# Helper Function To Append A Journal Entry
+def _append_entry(root: Path, entry: dict[str, Any]) -> None:
+    """
+    Appends An Entry For The Current Turn And Tool Call To The Journal
+
+    Outside A Wrapped Tool Call, Each Entry Gets Its Own Call Id
+
+    Args:
+        root (Path): The Undo Directory
+        entry (dict[str, Any]): The Entry Without Its Turn
+    """
+
+    # Get The Journal Path
+    journal_path: Path = root / _JOURNAL_NAME
+
+    # Create The Undo Directory
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # With The Journal Lock, Append The Entry As One JSON Line
+    with _journal_lock, journal_path.open("a", encoding="utf-8") as f:
+        # Write The Entry
+        f.write(json.dumps({"turn": get_current_turn(), "call": _call_id.get() or uuid.uuid4().hex, **entry}) + "\n")
+
+
+# Helper Function To Store The Content Of A File In The Object Store
+def _store_object(root: Path, abs_path: Path) -> str:
+    """
+    Hashes And Compresses A File In Chunks Into A Temporary Object, Then Moves It Under Its Hash
+
+    Args:
+        root (Path): The Undo Directory
+        abs_path (Path): The Absolute Path Of The File
+
+    Returns:
+        str: The Content Address Of The File
+    """
+
+    # Get A Unique Temporary Object Path
+    objects: Path = root / _OBJECTS_NAME
+    temp_path: Path = objects / f".{uuid.uuid4().hex[:12]}.tmp"
+
+    try:
+        # Create The Object Store
+        objects.mkdir(parents=True, exist_ok=True)
+
+        # With The File And The Temporary Object Open
+        with abs_path.open("rb") as source, atomic_open(temp_path, binary=True) as target:
+            # Hash And Compress The File, At The Fastest Level
+            digest: str = _copy_compressed(source, target)
+
+        # Get The Object Path
+        object_path: Path = objects / digest[:2] / digest
+
+        # If The Content Is Already Stored
+        if object_path.exists():
+            # Drop The Duplicate
+            temp_path.unlink()
+
+        else:
+            # Move The Object Under Its Hash
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.replace(object_path)
+
+    except BaseException:
+        # Remove The Temporary Object
+        temp_path.unlink(missing_ok=True)
+
+        # Re-Raise The Error
+        raise
+
+    # Return The Content Address
+    return digest
+
+
+# Helper Function To Hash And Compress A Stream
+def _copy_compressed(source: IO[bytes], target: IO[bytes]) -> str:
+    """
+    Copies A Stream zlib-Compressed Into Another, Hashing The Uncompressed Bytes On The Way
+
+    Args:
+        source (IO[bytes]): The Stream To Read
+        target (IO[bytes]): The Stream To Write The Compressed Bytes To
+
+    Returns:
+        str: The Hash Of The Uncompressed Bytes, As hash_bytes Computes It
+    """
+
+    # Create The Hasher And The Compressor
+    hasher = create_hasher()
+    compressor = zlib.compressobj(1)
+
+    # For Each Chunk Of The Source
+    while chunk := source.read(_CHUNK_BYTES):
+        # Hash And Compress The Chunk
+        hasher.update(chunk)
+        target.write(compressor.compress(chunk))
+
+    # Write The End Of The Compressed Stream
+    target.write(compressor.flush())
+
+    # Return The Hash
+    return hasher.hexdigest()
+
+
+# Helper Function To Read The Journal Entries
+def _read_entries() -> list[dict[str, Any]]:
+    """
+    Reads The Journal Entries, Oldest First
+
+    Returns:
+        list[dict[str, Any]]: The Entries, Empty If Journaling Is Disabled Or Nothing Was Recorded
+    """
+
+    # If Journaling Is Disabled Or Nothing Was Recorded
+    if _undo_root is None or not (_undo_root / _JOURNAL_NAME).is_file():
+        # There Are No Entries
+        return []
+
+    # Parse One Entry Per Line
+    return [json.loads(line) for line in (_undo_root / _JOURNAL_NAME).read_text(encoding="utf-8").splitlines()]
+
+
+# Helper Function To Undo Journal Entries
+def _undo_entries(root: Path, entries: list[dict[str, Any]], indexes: list[int]) -> list[str]:
+    """
+    Undoes The Given Entries, Newest First, And Removes Them From The Journal
+
+    If A Restore Fails, The Journal Keeps Exactly The Entries That Were Not Undone
+
+    Args:
+        root (Path): The Undo Directory
+        entries (list[dict[str, Any]]): All Journal Entries
+        indexes (list[int]): The Indexes Of The Entries To Undo, Oldest First
+
+    Returns:
+        list[str]: The Restored Paths, In The Order They Were First Changed
+    """
+
+    # Initialize The Undone Entries
+    undone: set[int] = set()
+
+    try:
+        # For Each Entry To Undo, Newest First
+        for index in reversed(indexes):
+            # Restore The Entry
+            _restore_entry(root, entries[index])
+
+            # Drop The Entry
+            undone.add(index)
+
+    finally:
+        # If Any Entry Was Undone
+        if undone:
+            # With The Journal Lock, Rewrite The Journal Without The Undone Entries
+            with _journal_lock:
+                atomic_write_text(
+                    root / _JOURNAL_NAME,
+                    "".join(json.dumps(entry) + "\n" for index, entry in enumerate(entries) if index not in undone),
+                )
+
+    # Return The Restored Paths, Once Each
+    return list(dict.fromkeys(entries[index]["path"] for index in indexes))
+
+
+# Helper Function To Restore One Journal Entry
+def _restore_entry(root: Path, entry: dict[str, Any]) -> None:
+    """
+    Restores The Path Of A Journal Entry To Its Recorded State
+
+    Args:
+        root (Path): The Undo Directory
+        entry (dict[str, Any]): The Journal Entry
+    """
+
+    # Get The Path
+    path: Path = Path(entry["path"])
+
+    # If The File Existed Before The Change
+    if entry["kind"] == "file":
+        # Write The Stored Content Back Atomically, Decompressing It In Chunks
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with (
+            (root / _OBJECTS_NAME / entry["object"][:2] / entry["object"]).open("rb") as source,
+            atomic_open(path, binary=True) as target,
+        ):
+            # Create The Decompressor
+            decompressor = zlib.decompressobj()
+
+            # For Each Compressed Chunk
+            while chunk := source.read(_CHUNK_BYTES):
+                # Write The Decompressed Bytes
+                target.write(decompressor.decompress(chunk))
+
+            # Write The Rest
+            target.write(decompressor.flush())
+
+        # Restore The Permission Bits
+        path.chmod(entry["mode"])
+
+    # If The File Did Not Exist Before The Change
+    elif entry["kind"] == "absent":
+        # Delete The File
+        path.unlink(missing_ok=True)
+
+    # If A Directory Tree Was Copied
+    elif entry["kind"] == "tree":
+        # Remove The Copy
+        shutil.rmtree(path, ignore_errors=True)
+
+    # If The Path Was Moved
+    elif entry["kind"] == "move":
+        # Move It Back
+        source: Path = Path(entry["source"])
+        source.parent.mkdir(parents=True, exist_ok=True)
+        move_path_on_disk(path, source)
+
+    else:
+        # Remove The Created Directories Up To The Topmost One, As Long As They Are Empty
+        top: Path = Path(entry["top"])
+        while path.is_dir() and not any(path.iterdir()):
+            # Remove The Directory
+            path.rmdir()
+
+            # If The Topmost Created Directory Was Removed
+            if path == top:
+                # Stop
+                break
+
+            # Move Up One Level
+            path = path.parent
+
+
+# Exports
+__all__: list[str] = [
+    "clear_undo_journal",
+    "get_undo_root",
+    "record_move",
+    "record_new_directory",
+    "record_new_tree",
+    "record_pre_image",
+    "set_undo_root",
+    "undo_last_change",
+    "undo_last_turn",
+    "with_journal_call",
+]
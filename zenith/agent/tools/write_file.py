@@ -4,27 +4,46 @@ from pathlib import Path
 from typing import Any
 
 # Local Imports
+from zenith.agent.tools.etag import check_etag
+from zenith.agent.tools.etag import current_etag
+from zenith.agent.tools.etag import etag_for_written_text
+from zenith.agent.tools.overlay import is_overlay_enabled
+from zenith.agent.tools.overlay import overlay_exists
+from zenith.agent.tools.overlay import overlay_has_text
+from zenith.agent.tools.overlay import overlay_read_text
+from zenith.agent.tools.overlay import overlay_size
+from zenith.agent.tools.overlay import overlay_write_text
+from zenith.agent.tools.path_locks import lock_paths
+from zenith.agent.tools.undo_journal import record_pre_image
+from zenith.utils.atomic_write import get_default_fsync_policy
 from zenith.utils.format_file_size import format_size
 
 
 # Function To Write File Contents
-def write_file(
+def write_file(  # noqa: PLR0913
     file_path: str,
     content: str,
     *,
     encoding: str = "utf-8",
     create_parents: bool = False,
     append: bool = False,
+    if_match: str | None = None,
 ) -> dict[str, Any]:
     """
     Writes Content To A File
 
+    Overwrites Are Atomic: The Content Is Written To A Temporary File In The Same Directory And
+    Renamed Over The Target, Preserving Its Permission Bits. Appends Are Written In Place. An
+    Overwrite With Identical Content Is Skipped, Keeping The Modification Time, And Reports changed=False.
+    While The Overlay Is Enabled, Writes Are Staged In Memory Until The End Of The Turn
+
     Args:
         file_path (str): The Path To The File To Write
         content (str): The Content To Write To The File
         encoding (str): The Encoding To Use When Writing The File
         create_parents (bool): Whether To Create Parent Directories If They Don't Exist
         append (bool): Whether To Append To The File Instead Of Overwriting
+        if_match (str | None): If Given, The File Is Only Written If Its ETag From read_file Still Matches
 
     Returns:
         dict[str, Any]: A Dictionary Containing The Result And Metadata
@@ -32,68 +51,130 @@ def write_file(
     Raises:
         FileNotFoundError: If The Parent Directory Does Not Exist And create_parents Is False
         PermissionError: If Permission Is Denied
-        ValueError: If The Path Is Invalid
+        ValueError: If The Path Is Invalid Or The ETag Differs
     """
 
     # Convert To Absolute Path If Relative
     abs_path: Path = Path(file_path).resolve()
 
-    # Check If Parent Directory Exists
-    if not abs_path.parent.exists():
-        # If We Should Create Parent Directories
-        if create_parents:
-            # Create Parent Directories
-            abs_path.parent.mkdir(parents=True, exist_ok=True)
-
-        else:
-            # Raise A FileNotFoundError
-            msg: str = f"Parent Directory Not Found: {abs_path.parent}"
+    # With The Path Lock, So Parallel Calls Changing The File Do Not Interleave
+    with lock_paths(abs_path):
+        # Check If Parent Directory Exists
+        if not abs_path.parent.exists():
+            # If We Should Create Parent Directories
+            if create_parents:
+                # Create Parent Directories
+                abs_path.parent.mkdir(parents=True, exist_ok=True)
+
+            else:
+                # Raise A FileNotFoundError
+                msg: str = f"Parent Directory Not Found: {abs_path.parent}"
+
+                # Raise The Error
+                raise FileNotFoundError(msg) from None
+
+        try:
+            # Fail Fast If The File Changed Since It Was Read
+            check_etag(abs_path, if_match, encoding=encoding)
+
+            # Whether The File Changes: An Append Of Nothing Or An Identical Overwrite Does Not
+            changed: bool = (
+                bool(content) or not overlay_exists(abs_path)
+                if append
+                else not overlay_has_text(abs_path, content, encoding)
+            )
+
+            # If The File Changes
+            if changed:
+                # Record The Pre-Image
+                record_pre_image(abs_path)
+
+            # If We Should Append To A File Staged In The Overlay
+            if append and is_overlay_enabled():
+                # Get The Appended Text
+                text: str = (overlay_read_text(abs_path, encoding) if overlay_exists(abs_path) else "") + content
+
+                # Stage The Appended Text
+                overlay_write_text(abs_path, text, encoding=encoding)
+
+                # Get The New ETag From The Staged Text
+                etag: str = etag_for_written_text(abs_path, text)
+
+            # If We Should Append
+            elif append:
+                # Append To The File In Place
+                _append_in_place(abs_path, content, encoding)
+
+                # Get The New ETag By Hashing The Appended File
+                etag = current_etag(abs_path, encoding)
+
+            else:
+                # If The File Would Change
+                if changed:
+                    # Atomically Replace The File, Or Stage It In The Overlay
+                    overlay_write_text(abs_path, content, encoding=encoding)
+
+                # Get The New ETag From The Written Content
+                etag = etag_for_written_text(abs_path, content)
+
+            # Get File Size
+            file_size: int = overlay_size(abs_path)
+
+            # Return The Result
+            return {
+                "success": True,
+                "path": str(abs_path),
+                "size": file_size,
+                "size_human": format_size(file_size),
+                "encoding": encoding,
+                "append": append,
+                "changed": changed,
+                "etag": etag,
+            }
+
+        except PermissionError:
+            # Handle Permission Denied Error
+            msg: str = f"Permission Denied: {abs_path}"
 
             # Raise The Error
-            raise FileNotFoundError(msg) from None
-
-    try:
-        # Determine The Write Mode
-        mode: str = "a" if append else "w"
-
-        # Write The File
-        with abs_path.open(mode=mode, encoding=encoding) as f:
-            # Write The Content
-            f.write(content)
-
-        # Get File Size
-        file_size: int = abs_path.stat().st_size
-
-        # Return The Result
-        return {
-            "success": True,
-            "path": str(abs_path),
-            "size": file_size,
-            "size_human": format_size(file_size),
-            "encoding": encoding,
-            "append": append,
-        }
-
-    except PermissionError:
-        # Handle Permission Denied Error
-        msg: str = f"Permission Denied: {abs_path}"
-
-        # Raise The Error
-        raise PermissionError(msg) from None
-
-    except UnicodeEncodeError as e:
-        # Handle Encoding Error
-        msg: str = f"Failed To Encode Content With Encoding '{encoding}': {abs_path}"
-
-        # Raise A ValueError
-        raise ValueError(msg) from e
-
-    except Exception as e:
-        # Handle Other Errors
-        msg: str = f"Failed To Write File: {abs_path}. Error: {e!s}"
-
-        # Raise A ValueError
-        raise ValueError(msg) from e
+            raise PermissionError(msg) from None
+
+        except UnicodeEncodeError as e:
+            # Handle Encoding Error
+            msg: str = f"Failed To Encode Content With Encoding '{encoding}': {abs_path}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+        except Exception as e:
+            # Handle Other Errors
+            msg: str = f"Failed To Write File: {abs_path}. Error: {e!s}"
+
+            # Raise A ValueError
+            raise ValueError(msg) from e
+
+
+# Helper Function To Append To A File In Place
+def _append_in_place(abs_path: Path, content: str, encoding: str) -> None:
+    """
+    Appends Content To A File In Place, Syncing It To Disk Unless The Fsync Policy Is "none"
+
+    Args:
+        abs_path (Path): The File To Append To
+        content (str): The Content To Append
+        encoding (str): The Encoding To Use
+    """
+
+    # Open The File For Appending
+    with abs_path.open(mode="a", encoding=encoding) as f:
+        # Write The Content
+        f.write(content)
+
+        # If The Data Must Be Durable
+        if get_default_fsync_policy() != "none":
+            # Flush And Sync The Data To Disk
+            f.flush()
+            os.fsync(f.fileno())
 
 
 # Function To Check If A File Is Writable
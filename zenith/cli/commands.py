@@ -126,12 +126,21 @@ def main(
 @app.command("chat")
 def chat(
     ctx: typer.Context,
+    *,
+    plain: Annotated[
+        bool,
+        typer.Option(
+            "--plain",
+            help="Write Raw Responses Without Spinner, Live Display Or Markdown. Implied When Output Is Not A TTY.",
+        ),
+    ] = False,
 ) -> None:
     """
     Start A Chat Session With The Zenith AI Assistant
 
     Args:
         ctx (typer.Context): The Typer Context
+        plain (bool): A Flag To Write Raw Responses, Also Chosen When Output Is Not A Terminal
     """
 
     # Create A Rich Console
@@ -174,8 +183,8 @@ def chat(
     # Print The Panel
     console.print(panel)
 
-    # Start The Chat Session
-    start_chat(agent)
+    # Start The Chat Session, In Plain Mode When Output Is Not A Terminal
+    start_chat(agent, plain=plain or not console.is_terminal)
 
 
 # Exports
@@ -1,15 +1,35 @@
 # Local Imports
+from zenith.utils.atomic_write import atomic_write_bytes
+from zenith.utils.atomic_write import atomic_write_text
 from zenith.utils.config_loader import load_config
 from zenith.utils.config_loader import load_env_config
 from zenith.utils.config_loader import load_json_config
+from zenith.utils.content_hash import hash_bytes
+from zenith.utils.content_hash import hash_text
+from zenith.utils.content_hash import hash_text_file
 from zenith.utils.datetime_utils import get_current_datetime
 from zenith.utils.format_file_size import format_size
+from zenith.utils.token_estimator import estimate_tokens
+from zenith.utils.token_estimator import load_tiktoken_tokenizer
+from zenith.utils.token_estimator import set_tokenizer
+from zenith.utils.unified_diff import apply_hunks
+from zenith.utils.unified_diff import parse_unified_diff
 
 # Exports
 __all__: list[str] = [
+    "apply_hunks",
+    "atomic_write_bytes",
+    "atomic_write_text",
+    "estimate_tokens",
     "format_size",
     "get_current_datetime",
+    "hash_bytes",
+    "hash_text",
+    "hash_text_file",
     "load_config",
     "load_env_config",
     "load_json_config",
+    "load_tiktoken_tokenizer",
+    "parse_unified_diff",
+    "set_tokenizer",
 ]
@@ -0,0 +1,313 @@
+# Standard Library Imports
+import contextlib
+import os
+import stat
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+# Supported Fsync Policies, From Fastest To Most Durable
+FSYNC_POLICIES: tuple[str, ...] = ("none", "file", "file+dir")
+
+# The Fsync Policy Used When None Is Given
+_default_fsync_policy: str = "file"
+
+# Number Of Bytes Compared Per Chunk When Checking File Content
+_COMPARE_CHUNK_BYTES: int = 1024 * 1024
+
+
+# Function To Set The Default Fsync Policy
+def set_default_fsync_policy(policy: str) -> None:
+    """
+    Sets The Fsync Policy Used By Atomic Writes When None Is Given
+
+    Args:
+        policy (str): The Fsync Policy ("none", "file" Or "file+dir")
+
+    Raises:
+        ValueError: If The Policy Is Not Supported
+    """
+
+    # Use The Module Level Default
+    global _default_fsync_policy  # noqa: PLW0603
+
+    # Set The Validated Policy
+    _default_fsync_policy = _validate_fsync_policy(policy)
+
+
+# Function To Get The Default Fsync Policy
+def get_default_fsync_policy() -> str:
+    """
+    Gets The Fsync Policy Used By Atomic Writes When None Is Given
+
+    Returns:
+        str: The Default Fsync Policy
+    """
+
+    # Return The Default Policy
+    return _default_fsync_policy
+
+
+# Function To Open A File For Atomic Replacement
+@contextlib.contextmanager
+def atomic_open(
+    path: Path,
+    *,
+    binary: bool = False,
+    encoding: str = "utf-8",
+    fsync_policy: str | None = None,
+) -> Iterator[IO[Any]]:
+    """
+    Opens A Temporary File That Atomically Replaces The Target When The Block Exits Normally
+
+    The Temporary File Is Created In The Same Directory And Renamed Over The Target With os.replace,
+    So Readers See Either The Old Or The New Content, Never A Truncated File. The Permission Bits Of
+    An Existing Target Are Preserved. If The Block Raises, The Temporary File Is Removed And The
+    Target Is Left Untouched
+
+    Args:
+        path (Path): The Path Of The File To Write
+        binary (bool): Whether To Open The Temporary File In Binary Mode
+        encoding (str): The Encoding To Use In Text Mode
+        fsync_policy (str | None): "none", "file" (Fsync The Data) Or "file+dir" (Also Fsync The
+            Directory Entry), Defaults To The Configured Policy
+
+    Yields:
+        IO[Any]: The Temporary File
+
+    Raises:
+        ValueError: If The Fsync Policy Is Not Supported
+    """
+
+    # Resolve The Fsync Policy
+    policy: str = _validate_fsync_policy(fsync_policy or _default_fsync_policy)
+
+    # Get A Unique Temporary Path Next To The Target
+    temp_path: Path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:12]}.tmp")
+
+    try:
+        # Open The Temporary File, Failing If It Already Exists
+        with temp_path.open("xb") if binary else temp_path.open("x", encoding=encoding) as f:
+            # Let The Caller Write The Content
+            yield f
+
+            # If The Data Must Be Durable
+            if policy != "none":
+                # Flush And Sync The Data To Disk
+                f.flush()
+                os.fsync(f.fileno())
+
+        # Move The Temporary File Into Place
+        _replace_into_place(temp_path, path, policy)
+
+    except BaseException:
+        # Remove The Temporary File
+        temp_path.unlink(missing_ok=True)
+
+        # Re-Raise The Error
+        raise
+
+
+# Function To Atomically Write Text To A File
+def atomic_write_text(
+    path: Path,
+    content: str,
+    *,
+    encoding: str = "utf-8",
+    fsync_policy: str | None = None,
+) -> None:
+    """
+    Atomically Replaces A File With The Given Text
+
+    Args:
+        path (Path): The Path Of The File To Write
+        content (str): The Text To Write
+        encoding (str): The Encoding To Use When Writing The File
+        fsync_policy (str | None): "none", "file" Or "file+dir", Defaults To The Configured Policy
+
+    Raises:
+        ValueError: If The Fsync Policy Is Not Supported
+    """
+
+    # With The Temporary File
+    with atomic_open(path, encoding=encoding, fsync_policy=fsync_policy) as f:
+        # Write The Content
+        f.write(content)
+
+
+# Function To Atomically Write Bytes To A File
+def atomic_write_bytes(path: Path, data: bytes, *, fsync_policy: str | None = None) -> None:
+    """
+    Atomically Replaces A File With The Given Bytes
+
+    Args:
+        path (Path): The Path Of The File To Write
+        data (bytes): The Bytes To Write
+        fsync_policy (str | None): "none", "file" Or "file+dir", Defaults To The Configured Policy
+
+    Raises:
+        ValueError: If The Fsync Policy Is Not Supported
+    """
+
+    # With The Temporary File
+    with atomic_open(path, binary=True, fsync_policy=fsync_policy) as f:
+        # Write The Data
+        f.write(data)
+
+
+# Function To Check Whether A File Already Holds Some Bytes
+def file_has_content(path: Path, data: bytes) -> bool:
+    """
+    Checks Whether A File Already Holds Exactly The Given Bytes
+
+    The Sizes Are Compared First, So Most Changed Files Are Detected Without Being Read. Files Of
+    Equal Size Are Compared Chunk By Chunk, Stopping At The First Difference
+
+    Args:
+        path (Path): The File To Check
+        data (bytes): The Bytes To Compare Against
+
+    Returns:
+        bool: True If The File Exists And Holds Exactly The Given Bytes
+    """
+
+    # If The File Is Missing Or Its Size Differs
+    if not path.is_file() or path.stat().st_size != len(data):
+        # The Content Differs
+        return False
+
+    # With The File Open In Binary Mode
+    with path.open("rb") as f:
+        # Compare Each Chunk
+        for offset in range(0, len(data), _COMPARE_CHUNK_BYTES):
+            # If The Chunk Differs
+            if f.read(_COMPARE_CHUNK_BYTES) != data[offset : offset + _COMPARE_CHUNK_BYTES]:
+                # The Content Differs
+                return False
+
+    # The Content Is Identical
+    return True
+
+
+# Function To Encode Text As Text Mode Writing Would
+def encode_text_for_write(content: str, encoding: str) -> bytes:
+    """
+    Encodes Text Into The Exact Bytes A Text Mode Write Produces, Including Newline Translation
+
+    Args:
+        content (str): The Text
+        encoding (str): The Encoding
+
+    Returns:
+        bytes: The Encoded Bytes
+    """
+
+    # Translate Newlines As Text Mode Writing Does On This Platform
+    translated: str = content.replace("\n", os.linesep) if os.linesep != "\n" else content
+
+    # Return The Encoded Bytes
+    return translated.encode(encoding)
+
+
+# Function To Sync A Directory Entry
+def fsync_directory(directory: Path) -> None:
+    """
+    Syncs A Directory So That Renames And New Entries In It Survive A Crash
+
+    Directories Cannot Be Opened For Syncing On Windows, Where This Is A No-Op
+
+    Args:
+        directory (Path): The Directory To Sync
+    """
+
+    # If The Platform Cannot Sync Directories
+    if os.name != "posix":
+        # Nothing To Do
+        return
+
+    # Open The Directory
+    fd: int = os.open(directory, os.O_RDONLY)
+
+    try:
+        # Sync The Directory
+        os.fsync(fd)
+
+    finally:
+        # Close The Directory
+        os.close(fd)
+
+
+# Helper Function To Move A Temporary File Into Place
+def _replace_into_place(temp_path: Path, path: Path, policy: str) -> None:
+    """
+    Copies The Permission Bits Of The Target To The Temporary File And Renames It Over The Target
+
+    Args:
+        temp_path (Path): The Temporary File
+        path (Path): The Target File
+        policy (str): The Fsync Policy
+    """
+
+    try:
+        # Get The Permission Bits Of The Existing Target
+        mode: int | None = stat.S_IMODE(path.stat().st_mode)
+
+    except FileNotFoundError:
+        # A New File Keeps The Default Permissions
+        mode = None
+
+    # If The Target Exists
+    if mode is not None:
+        # Preserve Its Permission Bits
+        temp_path.chmod(mode)
+
+    # Atomically Replace The Target
+    temp_path.replace(path)
+
+    # If The Directory Entry Must Be Durable
+    if policy == "file+dir":
+        # Sync The Directory
+        fsync_directory(path.parent)
+
+
+# Helper Function To Validate An Fsync Policy
+def _validate_fsync_policy(policy: str) -> str:
+    """
+    Validates An Fsync Policy
+
+    Args:
+        policy (str): The Fsync Policy
+
+    Returns:
+        str: The Validated Policy
+
+    Raises:
+        ValueError: If The Policy Is Not Supported
+    """
+
+    # If The Policy Is Not Supported
+    if policy not in FSYNC_POLICIES:
+        # Raise A ValueError
+        msg: str = f"Unsupported Fsync Policy: {policy}. Expected One Of: {', '.join(FSYNC_POLICIES)}"
+
+        # Raise The Error
+        raise ValueError(msg)
+
+    # Return The Policy
+    return policy
+
+
+# Exports
+__all__: list[str] = [
+    "FSYNC_POLICIES",
+    "atomic_open",
+    "atomic_write_bytes",
+    "atomic_write_text",
+    "encode_text_for_write",
+    "file_has_content",
+    "fsync_directory",
+    "get_default_fsync_policy",
+    "set_default_fsync_policy",
+]
@@ -0,0 +1,85 @@
+# Standard Library Imports
+import hashlib
+from pathlib import Path
+
+# Size Of The Digests In Bytes
+_DIGEST_SIZE: int = 16
+
+# Number Of Characters Hashed Per Chunk When Hashing A File
+_FILE_CHUNK_CHARS: int = 1024 * 1024
+
+
+# Function To Create A Hasher
+def create_hasher() -> hashlib.blake2b:
+    """
+    Creates A Hasher Whose Hex Digest Matches hash_bytes Of Everything Fed To It, For Hashing In Chunks
+
+    Returns:
+        hashlib.blake2b: The Empty Hasher
+    """
+
+    # Return A BLAKE2b Hasher With The Digest Size Of hash_bytes
+    return hashlib.blake2b(digest_size=_DIGEST_SIZE)
+
+
+# Function To Hash Raw Bytes
+def hash_bytes(data: bytes) -> str:
+    """
+    Computes A Fast, Stable Content Hash For Raw Bytes
+
+    Args:
+        data (bytes): The Bytes To Hash
+
+    Returns:
+        str: The Hexadecimal Digest Of The Bytes
+    """
+
+    # Hash The Bytes With BLAKE2b And Return The Hex Digest
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).hexdigest()
+
+
+# Function To Hash Text
+def hash_text(text: str) -> str:
+    """
+    Computes A Fast, Stable Content Hash For Text
+
+    Args:
+        text (str): The Text To Hash
+
+    Returns:
+        str: The Hexadecimal Digest Of The Text
+    """
+
+    # Encode The Text And Hash The Resulting Bytes
+    return hash_bytes(text.encode("utf-8", errors="surrogatepass"))
+
+
+# Function To Hash The Text Of A File
+def hash_text_file(path: Path, encoding: str) -> str:
+    """
+    Hashes The Decoded Text Of A File In Chunks, Giving The Same Digest As hash_text Of The Whole Text
+
+    Args:
+        path (Path): The File To Hash
+        encoding (str): The Encoding Of The File
+
+    Returns:
+        str: The Hexadecimal Digest Of The Text
+    """
+
+    # Create The Hasher
+    hasher: hashlib.blake2b = create_hasher()
+
+    # With The File Open In Text Mode
+    with path.open(encoding=encoding) as f:
+        # Hash Each Chunk
+        while chunk := f.read(_FILE_CHUNK_CHARS):
+            # Encode And Hash The Chunk
+            hasher.update(chunk.encode("utf-8", errors="surrogatepass"))
+
+    # Return The Hex Digest
+    return hasher.hexdigest()
+
+
+# Exports
+__all__: list[str] = ["create_hasher", "hash_bytes", "hash_text", "hash_text_file"]
@@ -0,0 +1,260 @@
+# Standard Library Imports
+import errno
+import os
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Local Imports
+from zenith.utils.atomic_write import atomic_open
+
+# Maximum Number Of Files Copied Concurrently When Copying A Tree
+MAX_COPY_WORKERS: int = 8
+
+# Errors Meaning A Kernel Copy Is Not Supported For These Files, So The Next Method Should Be Tried
+_FALLBACK_ERRNOS: frozenset[int] = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.EPERM},
+)
+
+# Number Of Bytes Read Per Chunk When No Kernel Copy Is Available
+_READ_CHUNK_BYTES: int = 1024 * 1024
+
+
+# Function To Copy A File Without Passing Its Bytes Through Python
+def copy_file(source: Path, target: Path, *, fsync_policy: str | None = None) -> int:
+    """
+    Atomically Copies A File, Letting The Kernel Move The Bytes Where Possible
+
+    The Bytes Are Copied With os.copy_file_range, Which Can Share Extents On Copy-On-Write
+    Filesystems, Falling Back To os.sendfile And Finally To A Chunked Read And Write. The Copy Is
+    Written To A Temporary File And Renamed Over The Target, Which Gets The Permission Bits Of The Source
+
+    Args:
+        source (Path): The File To Copy
+        target (Path): The Path Of The Copy
+        fsync_policy (str | None): "none", "file" Or "file+dir", Defaults To The Configured Policy
+
+    Returns:
+        int: The Number Of Bytes Copied
+    """
+
+    # With The Source Open In Binary Mode
+    with source.open("rb") as src:
+        # Get The Size And Permission Bits Of The Source
+        source_stat: os.stat_result = os.fstat(src.fileno())
+
+        # With The Temporary Target File
+        with atomic_open(target, binary=True, fsync_policy=fsync_policy) as dst:
+            # Copy The Bytes
+            _copy_descriptor(src.fileno(), dst.fileno(), source_stat.st_size)
+
+    # Give The Copy The Permission Bits Of The Source
+    target.chmod(stat.S_IMODE(source_stat.st_mode))
+
+    # Return The Number Of Bytes Copied
+    return source_stat.st_size
+
+
+# Function To Copy A Directory Tree In Parallel
+def copy_tree(source: Path, target: Path, *, fsync_policy: str | None = None) -> tuple[int, int]:
+    """
+    Copies A Directory Tree, Creating The Directories First And Then Copying The Files In Parallel
+
+    Symbolic Links Are Recreated As Links Rather Than Followed
+
+    Args:
+        source (Path): The Directory To Copy
+        target (Path): The Path Of The Copy, Which Must Not Exist Yet
+        fsync_policy (str | None): "none", "file" Or "file+dir", Defaults To The Configured Policy
+
+    Returns:
+        tuple[int, int]: The Number Of Files And The Number Of Bytes Copied
+    """
+
+    # Create The Target Directory
+    target.mkdir(parents=True)
+
+    # Initialize The Files To Copy
+    files: list[tuple[Path, Path]] = []
+
+    # For Each Directory In The Source, Top Down
+    for directory, directory_names, file_names in os.walk(source):
+        # Get The Matching Target Directory
+        target_directory: Path = target / Path(directory).relative_to(source)
+
+        # For Each Entry Of The Directory
+        for name in [*directory_names, *file_names]:
+            # Get The Source And Target Paths
+            source_path: Path = Path(directory) / name
+            target_path: Path = target_directory / name
+
+            # If The Entry Is A Symbolic Link
+            if source_path.is_symlink():
+                # Recreate The Link
+                target_path.symlink_to(source_path.readlink())
+
+            # If The Entry Is A Directory
+            elif name in directory_names:
+                # Create The Directory
+                target_path.mkdir()
+
+            else:
+                # Queue The File
+                files.append((source_path, target_path))
+
+    # With A Thread Pool
+    with ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as executor:
+        # Copy The Files In Parallel
+        sizes: list[int] = list(
+            executor.map(lambda pair: copy_file(pair[0], pair[1], fsync_policy=fsync_policy), files),
+        )
+
+    # Return The Counts
+    return len(files), sum(sizes)
+
+
+# Function To Move A Path, Renaming It When Possible
+def move_path_on_disk(source: Path, target: Path) -> str:
+    """
+    Moves A File Or Directory, Renaming It On The Same Filesystem And Copying It Across Filesystems
+
+    Args:
+        source (Path): The Path To Move
+        target (Path): The New Path, Replaced If It Is An Existing File
+
+    Returns:
+        str: "rename" If The Path Was Renamed, "copy" If It Was Copied And Then Deleted
+    """
+
+    try:
+        # Rename The Path, Which Is Atomic On The Same Filesystem
+        source.replace(target)
+
+    except OSError as e:
+        # If The Paths Are On The Same Filesystem
+        if e.errno != errno.EXDEV:
+            # Re-Raise The Error
+            raise
+
+    else:
+        # The Path Was Renamed
+        return "rename"
+
+    # If The Source Is A Directory
+    if source.is_dir() and not source.is_symlink():
+        # Copy The Tree And Remove The Source
+        copy_tree(source, target)
+        shutil.rmtree(source)
+
+    else:
+        # Copy The File And Remove The Source
+        copy_file(source, target)
+        source.unlink()
+
+    # The Path Was Copied
+    return "copy"
+
+
+# Helper Function To Copy Between File Descriptors
+def _copy_descriptor(source_fd: int, target_fd: int, size: int) -> None:
+    """
+    Copies size Bytes From The Current Position Of One File Descriptor To Another
+
+    Each Method Continues From Where The Previous One Stopped, As All Of Them Advance The File Positions
+
+    Args:
+        source_fd (int): The Source File Descriptor
+        target_fd (int): The Target File Descriptor
+        size (int): The Number Of Bytes To Copy
+    """
+
+    # Initialize The Number Of Bytes Copied
+    copied: int = 0
+
+    # For Each Kernel Copy Method, Fastest First
+    for method in (_copy_file_range, _sendfile):
+        try:
+            # While Bytes Remain
+            while copied < size:
+                # Copy The Next Block
+                count: int = method(source_fd, target_fd, size - copied)
+
+                # If The Source Ended Early
+                if count == 0:
+                    # Done
+                    return
+
+                # Count The Bytes
+                copied += count
+
+        except OSError as e:
+            # If The Error Does Not Mean The Method Is Unsupported
+            if e.errno not in _FALLBACK_ERRNOS:
+                # Re-Raise The Error
+                raise
+
+        else:
+            # Done
+            return
+
+    # While The Source Has More Bytes
+    while chunk := os.read(source_fd, _READ_CHUNK_BYTES):
+        # Write The Chunk
+        os.write(target_fd, chunk)
+
+
+# Helper Function To Copy With copy_file_range
+def _copy_file_range(source_fd: int, target_fd: int, count: int) -> int:
+    """
+    Copies Up To count Bytes With os.copy_file_range
+
+    Args:
+        source_fd (int): The Source File Descriptor
+        target_fd (int): The Target File Descriptor
+        count (int): The Maximum Number Of Bytes To Copy
+
+    Returns:
+        int: The Number Of Bytes Copied
+
+    Raises:
+        OSError: With ENOSYS If The Platform Has No copy_file_range
+    """
+
+    # If The Platform Has No copy_file_range
+    if not hasattr(os, "copy_file_range"):
+        # Raise An OSError
+        raise OSError(errno.ENOSYS, "copy_file_range Is Not Available")
+
+    # Copy The Bytes
+    return os.copy_file_range(source_fd, target_fd, count)
+
+
+# Helper Function To Copy With sendfile
+def _sendfile(source_fd: int, target_fd: int, count: int) -> int:
+    """
+    Copies Up To count Bytes With os.sendfile
+
+    Args:
+        source_fd (int): The Source File Descriptor
+        target_fd (int): The Target File Descriptor
+        count (int): The Maximum Number Of Bytes To Copy
+
+    Returns:
+        int: The Number Of Bytes Copied
+
+    Raises:
+        OSError: With ENOSYS If The Platform Has No sendfile
+    """
+
+    # If The Platform Has No sendfile
+    if not hasattr(os, "sendfile"):
+        # Raise An OSError
+        raise OSError(errno.ENOSYS, "sendfile Is Not Available")
+
+    # Copy The Bytes
+    return os.sendfile(target_fd, source_fd, None, count)
+
+
+# Exports
+__all__: list[str] = ["MAX_COPY_WORKERS", "copy_file", "copy_tree", "move_path_on_disk"]
@@ -0,0 +1,89 @@
+# Standard Library Imports
+import math
+from collections.abc import Callable
+
+# Average Number Of ASCII Characters Per Token For Code And English Text
+_ASCII_CHARS_PER_TOKEN: float = 4.0
+
+# Exact Tokenizer Used Instead Of The Heuristic When Set
+_tokenizer: Callable[[str], int] | None = None
+
+
+# Function To Estimate The Number Of Tokens In A Text
+def estimate_tokens(text: str) -> int:
+    """
+    Estimates The Number Of Tokens In A Text
+
+    Uses The Exact Tokenizer If One Was Set, Otherwise A Fast Local Heuristic That Counts
+    About Four ASCII Characters Per Token And One Token Per Non-ASCII Character
+
+    Args:
+        text (str): The Text To Estimate
+
+    Returns:
+        int: The Estimated Number Of Tokens
+    """
+
+    # If An Exact Tokenizer Is Available
+    if _tokenizer is not None:
+        # Count The Tokens Exactly
+        return _tokenizer(text)
+
+    # Count The Non-ASCII Characters
+    non_ascii: int = len(text) - len(text.encode("ascii", errors="ignore"))
+
+    # Estimate The Tokens
+    return math.ceil((len(text) - non_ascii) / _ASCII_CHARS_PER_TOKEN) + non_ascii
+
+
+# Function To Set The Exact Tokenizer
+def set_tokenizer(tokenizer: Callable[[str], int] | None) -> None:
+    """
+    Sets The Exact Tokenizer Used By estimate_tokens
+
+    Args:
+        tokenizer (Callable[[str], int] | None): A Function Returning The Token Count Of A Text, None For The Heuristic
+    """
+
+    # Use The Module Level Tokenizer
+    global _tokenizer  # noqa: PLW0603
+
+    # Set The Tokenizer
+    _tokenizer = tokenizer
+
+
+# Function To Load A tiktoken Tokenizer
+def load_tiktoken_tokenizer(encoding_name: str) -> bool:
+    """
+    Sets A tiktoken Encoding As The Exact Tokenizer If It Can Be Loaded
+
+    tiktoken Downloads Encoding Files On First Use, So For Offline Use They Must Already
+    Be In Its Cache (See The TIKTOKEN_CACHE_DIR Environment Variable)
+
+    Args:
+        encoding_name (str): The Name Of The tiktoken Encoding (e.g. "cl100k_base")
+
+    Returns:
+        bool: True If The Tokenizer Was Loaded, False If The Heuristic Stays In Use
+    """
+
+    try:
+        # Third Party Imports
+        import tiktoken  # noqa: PLC0415
+
+        # Load The Encoding
+        encoding = tiktoken.get_encoding(encoding_name)
+
+    except Exception:  # noqa: BLE001
+        # Keep Using The Heuristic
+        return False
+
+    # Set The Exact Tokenizer
+    set_tokenizer(lambda text: len(encoding.encode(text, disallowed_special=())))
+
+    # Return Success
+    return True
+
+
+# Exports
+__all__: list[str] = ["estimate_tokens", "load_tiktoken_tokenizer", "set_tokenizer"]
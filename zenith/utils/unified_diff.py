@@ -0,0 +1,389 @@
+# Standard Library Imports
+import re
+from typing import Any
+
+# Regular Expression Matching A Hunk Header
+_HUNK_HEADER: re.Pattern[str] = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+# Path Used By Unified Diffs For A Missing Side Of A Created Or Deleted File
+_DEV_NULL: str = "/dev/null"
+
+
+# Function To Parse A Unified Diff
+def parse_unified_diff(patch: str) -> list[dict[str, Any]]:
+    """
+    Parses A Unified Diff Into Per-File Changes
+
+    Lines Outside File Headers And Hunks (Such As "diff --git" Or "index" Lines) Are Ignored. Git Style
+    "a/" And "b/" Prefixes Are Stripped, And A /dev/null Side Is Returned As None
+
+    Args:
+        patch (str): The Unified Diff
+
+    Returns:
+        list[dict[str, Any]]: One Dictionary Per File With old_path, new_path And hunks
+
+    Raises:
+        ValueError: If A Hunk Is Malformed, Truncated Or Appears Before A File Header
+    """
+
+    # Split The Patch Into Lines At Newlines Only, Dropping The Line Endings
+    lines: list[str] = [line.removesuffix("\n").removesuffix("\r") for line in split_lines(patch)]
+
+    # Initialize The File Changes
+    files: list[dict[str, Any]] = []
+
+    # Start At The First Line
+    index: int = 0
+
+    # Process Each Line
+    while index < len(lines):
+        # Get The Line
+        line: str = lines[index]
+
+        # If The Line Starts A File Header
+        if line.startswith("--- ") and index + 1 < len(lines) and lines[index + 1].startswith("+++ "):
+            # Add The File Change
+            files.append(_parse_file_header(line, lines[index + 1]))
+
+            # Skip The Header
+            index += 2
+
+        # If The Line Starts A Hunk
+        elif line.startswith("@@"):
+            # If No File Header Was Seen
+            if not files:
+                # Raise A ValueError
+                msg: str = f"Hunk Found Before Any File Header: {line}"
+
+                # Raise The Error
+                raise ValueError(msg)
+
+            # Parse The Hunk
+            hunk, index = _parse_hunk(lines, index)
+
+            # Add The Hunk To The Current File
+            files[-1]["hunks"].append(hunk)
+
+        else:
+            # Skip The Line
+            index += 1
+
+    # Return The File Changes
+    return files
+
+
+# Function To Split A Text Into Lines
+def split_lines(text: str) -> list[str]:
+    """
+    Splits A Text Into Lines At "\n" Only, Keeping The Line Endings
+
+    Unlike str.splitlines, Form Feeds, Vertical Tabs And Unicode Line Separators Stay Inside Their
+    Line, As They Do For diff And patch
+
+    Args:
+        text (str): The Text
+
+    Returns:
+        list[str]: The Lines, Each Ending With "\n" Except Possibly The Last
+    """
+
+    # Split After Each Newline, Dropping The Empty Remainder Of A Text Ending With One
+    return [line for line in re.split(r"(?<=\n)", text) if line]
+
+
+# Function To Apply Hunks To The Lines Of A File
+def apply_hunks(lines: list[str], hunks: list[dict[str, Any]]) -> tuple[list[str], list[dict[str, Any]]]:
+    """
+    Applies Hunks To The Lines Of A File With Context-Based Fuzzy Offset Matching
+
+    Each Hunk Is Searched For Outward From The Line Its Header Names, First Ignoring Only Line Endings
+    And Then Also Trailing Whitespace. Hunks That Cannot Be Located Are Rejected And Skipped
+
+    Args:
+        lines (list[str]): The Lines Of The File, With Line Endings
+        hunks (list[dict[str, Any]]): The Hunks To Apply, In Order
+
+    Returns:
+        tuple[list[str], list[dict[str, Any]]]: The Patched Lines And A Status Per Hunk
+    """
+
+    # Initialize The Output And Statuses
+    output: list[str] = []
+    statuses: list[dict[str, Any]] = []
+
+    # The First Line Not Yet Copied And The Offset Observed So Far
+    cursor: int = 0
+    offset: int = 0
+
+    # Process Each Hunk
+    for index, hunk in enumerate(hunks):
+        # Get The Lines The Hunk Expects To Find
+        old: list[str] = [text for tag, text in hunk["lines"] if tag != "+"]
+
+        # Get The Position The Header Names (An Empty Old Side Inserts After The Named Line)
+        base: int = hunk["old_start"] if hunk["old_count"] == 0 else hunk["old_start"] - 1
+
+        # Locate The Hunk
+        position: int | None = _find_lines(lines, old, base + offset, cursor)
+
+        # If The Hunk Cannot Be Located
+        if position is None:
+            # Reject The Hunk
+            statuses.append({"index": index, "header": hunk["header"], "status": "rejected"})
+            continue
+
+        # Copy The Lines Before The Hunk
+        output.extend(lines[cursor:position])
+
+        # Emit The Hunk, Keeping The File's Own Context Lines
+        for tag, text in hunk["lines"]:
+            # If The Line Is Context
+            if tag == " ":
+                # Keep The File's Line
+                output.append(_with_newline(lines[position]))
+                position += 1
+
+            # If The Line Is Removed
+            elif tag == "-":
+                # Skip The File's Line
+                position += 1
+
+            else:
+                # Add The New Line
+                output.append(f"{text}\n")
+
+        # If The New Side Ends Without A Newline
+        if hunk["new_no_newline"] and output:
+            # Drop The Final Newline
+            output[-1] = output[-1].removesuffix("\n")
+
+        # Continue After The Hunk
+        cursor = position
+        offset = position - len(old) - base
+
+        # Record The Applied Hunk
+        statuses.append({"index": index, "header": hunk["header"], "status": "applied", "offset": offset})
+
+    # Copy The Remaining Lines
+    output.extend(lines[cursor:])
+
+    # Return The Patched Lines And Statuses
+    return output, statuses
+
+
+# Helper Function To Parse A File Header
+def _parse_file_header(old_line: str, new_line: str) -> dict[str, Any]:
+    """
+    Parses The "---" And "+++" Lines Of A File Header
+
+    Args:
+        old_line (str): The "---" Line
+        new_line (str): The "+++" Line
+
+    Returns:
+        dict[str, Any]: The File Change With old_path, new_path And An Empty hunks List
+    """
+
+    # Get The Paths Without Any Trailing Timestamp
+    old_path: str | None = old_line[4:].split("\t", 1)[0].strip()
+    new_path: str | None = new_line[4:].split("\t", 1)[0].strip()
+
+    # Map /dev/null To None
+    old_path = None if old_path == _DEV_NULL else old_path
+    new_path = None if new_path == _DEV_NULL else new_path
+
+    # If Every Present Side Carries Its Git Style Prefix
+    if (old_path is None or old_path.startswith("a/")) and (new_path is None or new_path.startswith("b/")):
+        # Strip The Prefixes
+        old_path = old_path and old_path[2:]
+        new_path = new_path and new_path[2:]
+
+    # Return The File Change
+    return {"old_path": old_path, "new_path": new_path, "hunks": []}
+
+
+# Helper Function To Parse A Hunk
+def _parse_hunk(lines: list[str], index: int) -> tuple[dict[str, Any], int]:
+    """
+    Parses A Hunk Starting At Its Header Line
+
+    Args:
+        lines (list[str]): The Lines Of The Patch
+        index (int): The Index Of The Hunk Header
+
+    Returns:
+        tuple[dict[str, Any], int]: The Hunk And The Index Of The First Line After It
+
+    Raises:
+        ValueError: If The Hunk Header Or A Hunk Line Is Malformed, Or The Hunk Is Truncated
+    """
+
+    # Match The Header
+    header: str = lines[index]
+    match: re.Match[str] | None = _HUNK_HEADER.match(header)
+
+    # If The Header Is Malformed
+    if match is None:
+        # Raise A ValueError
+        msg: str = f"Malformed Hunk Header: {header}"
+
+        # Raise The Error
+        raise ValueError(msg)
+
+    # Get The Ranges, Where An Omitted Count Means One Line
+    old_start, old_count, new_start, new_count = (int(value) if value is not None else 1 for value in match.groups())
+
+    # Initialize The Hunk
+    hunk: dict[str, Any] = {
+        "header": header,
+        "old_start": old_start,
+        "old_count": old_count,
+        "new_start": new_start,
+        "new_count": new_count,
+        "lines": [],
+        "new_no_newline": False,
+    }
+
+    # Lines Still Expected On Each Side
+    old_remaining: int = old_count
+    new_remaining: int = new_count
+
+    # Move Past The Header
+    index += 1
+
+    # Process The Hunk Body
+    while index < len(lines):
+        # Get The Line, Treating A Blank Line As Blank Context
+        line: str = lines[index] or " "
+
+        # If The Line Marks A Missing Newline At The End Of The Previous Line
+        if line.startswith("\\"):
+            # If The Previous Line Belongs To The New Side
+            if hunk["lines"] and hunk["lines"][-1][0] != "-":
+                # Record The Missing Newline
+                hunk["new_no_newline"] = True
+
+            # Move To The Next Line
+            index += 1
+            continue
+
+        # If Both Sides Are Complete
+        if old_remaining == 0 and new_remaining == 0:
+            # Stop At The End Of The Hunk
+            break
+
+        # Get The Tag And Text
+        tag, text = line[0], line[1:]
+
+        # If The Tag Is Not Valid Or Its Side Is Already Complete
+        if (tag not in " -+") or (tag != "+" and old_remaining == 0) or (tag != "-" and new_remaining == 0):
+            # Raise A ValueError
+            msg: str = f"Malformed Hunk Line In {header}: {line}"
+
+            # Raise The Error
+            raise ValueError(msg)
+
+        # Count The Line Against Its Sides
+        old_remaining -= tag != "+"
+        new_remaining -= tag != "-"
+
+        # Add The Line
+        hunk["lines"].append((tag, text))
+
+        # Move To The Next Line
+        index += 1
+
+    # If The Patch Ended Inside The Hunk
+    if old_remaining or new_remaining:
+        # Raise A ValueError
+        msg: str = f"Truncated Hunk: {header}"
+
+        # Raise The Error
+        raise ValueError(msg)
+
+    # Return The Hunk And The Next Index
+    return hunk, index
+
+
+# Helper Function To Locate Lines In A File
+def _find_lines(lines: list[str], expected: list[str], start: int, lower: int) -> int | None:
+    """
+    Finds The Position Of A Block Of Lines, Searching Outward From A Starting Position
+
+    Args:
+        lines (list[str]): The Lines Of The File
+        expected (list[str]): The Lines To Find, Without Line Endings
+        start (int): The Position To Search Outward From
+        lower (int): The Lowest Allowed Position
+
+    Returns:
+        int | None: The Position Of The Block, Or None If It Cannot Be Found
+    """
+
+    # Get The Highest Position The Block Can Start At
+    upper: int = len(lines) - len(expected)
+
+    # If The Block Cannot Fit
+    if upper < lower:
+        # The Block Cannot Be Found
+        return None
+
+    # Clamp The Starting Position
+    start = min(max(start, lower), upper)
+
+    # First Ignore Only Line Endings, Then Also Trailing Whitespace
+    for relaxed in (False, True):
+        # Normalize The Expected Lines
+        wanted: list[str] = [_normalize(text, relaxed=relaxed) for text in expected]
+
+        # Search Outward From The Starting Position
+        for distance in range(max(start - lower, upper - start) + 1):
+            # Try Before And After The Starting Position
+            for candidate in dict.fromkeys((start - distance, start + distance)):
+                # If The Block Matches At The Candidate Position
+                if lower <= candidate <= upper and all(
+                    _normalize(lines[candidate + k], relaxed=relaxed) == text for k, text in enumerate(wanted)
+                ):
+                    # Return The Position
+                    return candidate
+
+    # The Block Cannot Be Found
+    return None
+
+
+# Helper Function To Normalize A Line For Matching
+def _normalize(line: str, *, relaxed: bool) -> str:
+    """
+    Normalizes A Line For Matching
+
+    Args:
+        line (str): The Line
+        relaxed (bool): Whether To Also Ignore Trailing Whitespace
+
+    Returns:
+        str: The Line Without Its Line Ending, And Without Trailing Whitespace If Relaxed
+    """
+
+    # Return The Normalized Line
+    return line.rstrip() if relaxed else line.rstrip("\r\n")
+
+
+# Helper Function To Ensure A Line Ends With A Newline
+def _with_newline(line: str) -> str:
+    """
+    Ensures A Line Ends With A Newline
+
+    Args:
+        line (str): The Line
+
+    Returns:
+        str: The Line With A Trailing Newline
+    """
+
+    # Return The Line With A Newline
+    return line if line.endswith("\n") else f"{line}\n"
+
+
+# Exports
+__all__: list[str] = ["apply_hunks", "parse_unified_diff", "split_lines"]